@@ -0,0 +1,342 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Generate synthetic squeak datasets for the benchmarks.
+
+A dataset has a set of authors, some of them followed, and squeaks spread
+over a range of blocks. Some squeaks are replies to recent squeaks, which
+makes reply trees, and some are resqueaks. A fraction of the squeaks are
+unlocked, liked, offered for sale, or bought, and the squeaks of the
+signing profiles get sent offers and received payments.
+
+Signing the squeaks is the slow part, so it can be spread over a pool of
+worker processes.
+"""
+import multiprocessing
+import os
+import random
+import time
+
+from bitcoin.core import CBlockHeader
+from squeak.core import CResqueak
+from squeak.core import CSqueak
+from squeak.core.keys import SqueakPrivateKey
+
+from squeaknode.core.lightning_address import LightningAddressHostPort
+from squeaknode.core.peer_address import Network
+from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.peers import create_saved_peer
+from squeaknode.core.profiles import create_contact_profile
+from squeaknode.core.profiles import create_signing_profile
+from squeaknode.core.received_offer import ReceivedOffer
+from squeaknode.core.received_payment import ReceivedPayment
+from squeaknode.core.sent_offer import SentOffer
+from squeaknode.core.sent_payment import SentPayment
+from squeaknode.core.squeaks import get_hash
+from squeaknode.core.squeaks import make_resqueak_with_block
+from squeaknode.core.squeaks import make_squeak_with_block
+
+
+DEFAULT_NUM_AUTHORS = 1000
+DEFAULT_NUM_SIGNING_AUTHORS = 5
+DEFAULT_NUM_PEERS = 20
+DEFAULT_SQUEAKS_PER_BLOCK = 10
+DEFAULT_FOLLOW_FRACTION = 0.2
+DEFAULT_REPLY_FRACTION = 0.3
+DEFAULT_RESQUEAK_FRACTION = 0.05
+DEFAULT_UNLOCK_FRACTION = 0.2
+DEFAULT_LIKE_FRACTION = 0.02
+DEFAULT_OFFER_FRACTION = 0.05
+DEFAULT_PAYMENT_FRACTION = 0.05
+DEFAULT_BATCH_SIZE = 1000
+
+# Replies and resqueaks point to one of the most recent squeaks, so that
+# threads are spread over a small range of blocks, as they are on a
+# live node.
+RECENT_SQUEAKS_WINDOW = 1000
+GENESIS_TIME_S = 1231006505
+BLOCK_INTERVAL_S = 600
+PEER_PORT = 8555
+PRICE_MSAT = 1000
+
+WORDS = [
+    "bitcoin", "block", "lightning", "node", "squeak", "payment", "channel",
+    "invoice", "relay", "peer", "signature", "key", "hash", "reply", "thread",
+    "profile", "follow", "like", "market", "price", "coffee", "weather",
+    "music", "garden", "river", "mountain", "city", "train", "book", "movie",
+    "morning", "evening", "summer", "winter", "friend", "family", "school",
+    "work", "dinner", "breakfast", "soccer", "chess", "code", "python",
+    "database", "query", "index", "cache", "server", "network", "privacy",
+    "freedom", "news", "science", "space", "ocean", "forest", "storm", "sun",
+    "moon", "star", "cat", "dog", "bird",
+]
+
+
+def make_content(rng):
+    num_words = rng.randint(5, 30)
+    return " ".join(rng.choice(WORDS) for _ in range(num_words))
+
+
+def get_block_header(block_height):
+    return CBlockHeader(nTime=GENESIS_TIME_S + block_height * BLOCK_INTERVAL_S)
+
+
+def make_squeak_task(task):
+    """ Sign one squeak or resqueak. Runs in the worker processes, so the
+    arguments and the results are plain bytes.
+    """
+    private_key_bytes, content, block_height, reply_hash, resqueak_hash = task
+    private_key = SqueakPrivateKey.from_bytes(private_key_bytes)
+    block_hash = os.urandom(32)
+    if resqueak_hash is not None:
+        resqueak = make_resqueak_with_block(
+            private_key,
+            resqueak_hash,
+            block_height,
+            block_hash,
+            replyto_hash=reply_hash,
+        )
+        return resqueak.serialize(), None
+    squeak, secret_key = make_squeak_with_block(
+        private_key,
+        content,
+        block_height,
+        block_hash,
+        replyto_hash=reply_hash,
+    )
+    return squeak.serialize(), secret_key
+
+
+def deserialize_squeak(squeak_bytes, secret_key):
+    if secret_key is None:
+        return CResqueak.deserialize(squeak_bytes)
+    return CSqueak.deserialize(squeak_bytes)
+
+
+def random_bytes(rng, n):
+    return bytes(rng.getrandbits(8) for _ in range(n))
+
+
+def insert_profiles(squeak_db, rng, num_authors, num_signing_authors, follow_fraction):
+    private_keys = [SqueakPrivateKey.generate() for _ in range(num_authors)]
+    for i, private_key in enumerate(private_keys):
+        if i < num_signing_authors:
+            profile = create_signing_profile(
+                "signing_{}".format(i), private_key)
+            squeak_db.insert_profile(profile)
+        else:
+            profile = create_contact_profile(
+                "author_{}".format(i), private_key.get_public_key())
+            profile_id = squeak_db.insert_profile(profile)
+            if rng.random() < follow_fraction:
+                squeak_db.set_profile_following(profile_id, True)
+    return private_keys
+
+
+def insert_peers(squeak_db, num_peers):
+    peer_addresses = []
+    for i in range(num_peers):
+        peer_address = PeerAddress(
+            network=Network.IPV4,
+            host="10.0.{}.{}".format(i // 256, i % 256),
+            port=PEER_PORT,
+        )
+        squeak_db.insert_peer(
+            create_saved_peer("peer_{}".format(i), peer_address, PEER_PORT),
+        )
+        peer_addresses.append(peer_address)
+    return peer_addresses
+
+
+def insert_squeak_extras(
+        squeak_db,
+        rng,
+        squeak_hash,
+        content,
+        secret_key,
+        is_signing_author,
+        peer_addresses,
+        unlock_fraction,
+        like_fraction,
+        offer_fraction,
+        payment_fraction,
+        settle_index,
+):
+    """ Unlock, like, and add offers and payments for one squeak.
+
+    Return the next settle index for received payments.
+    """
+    if rng.random() < like_fraction:
+        squeak_db.set_squeak_liked(squeak_hash)
+    if secret_key is None:
+        return settle_index
+    peer_address = rng.choice(peer_addresses)
+    now_s = int(time.time())
+    if is_signing_author or rng.random() < unlock_fraction:
+        squeak_db.set_squeak_secret_key(squeak_hash, secret_key)
+        squeak_db.set_squeak_decrypted_content(squeak_hash, content)
+        if not is_signing_author and rng.random() < payment_fraction:
+            squeak_db.insert_sent_payment(SentPayment(
+                sent_payment_id=None,
+                created_time_ms=None,
+                peer_address=peer_address,
+                squeak_hash=squeak_hash,
+                payment_hash=random_bytes(rng, 32),
+                secret_key=secret_key,
+                price_msat=PRICE_MSAT,
+                node_pubkey=random_bytes(rng, 33).hex(),
+                valid=True,
+            ))
+    elif rng.random() < offer_fraction:
+        squeak_db.insert_received_offer(ReceivedOffer(
+            received_offer_id=None,
+            squeak_hash=squeak_hash,
+            price_msat=PRICE_MSAT,
+            payment_hash=random_bytes(rng, 32),
+            nonce=random_bytes(rng, 32),
+            payment_point=random_bytes(rng, 33),
+            invoice_timestamp=now_s,
+            invoice_expiry=3600,
+            payment_request="lnbench{}".format(squeak_hash.hex()),
+            destination=random_bytes(rng, 33).hex(),
+            lightning_address=LightningAddressHostPort(
+                host=peer_address.host,
+                port=9735,
+            ),
+            peer_address=peer_address,
+            paid=False,
+        ))
+    if is_signing_author and rng.random() < payment_fraction:
+        payment_hash = random_bytes(rng, 32)
+        squeak_db.insert_sent_offer(SentOffer(
+            sent_offer_id=None,
+            squeak_hash=squeak_hash,
+            payment_hash=payment_hash,
+            nonce=random_bytes(rng, 32),
+            price_msat=PRICE_MSAT,
+            payment_request="lnbench{}".format(payment_hash.hex()),
+            invoice_time=now_s,
+            invoice_expiry=3600,
+            peer_address=peer_address,
+            paid=True,
+        ))
+        squeak_db.insert_received_payment(ReceivedPayment(
+            received_payment_id=None,
+            created_time_ms=None,
+            squeak_hash=squeak_hash,
+            payment_hash=payment_hash,
+            price_msat=PRICE_MSAT,
+            settle_index=settle_index,
+            peer_address=peer_address,
+        ))
+        settle_index += 1
+    return settle_index
+
+
+def generate_dataset(
+        squeak_db,
+        num_squeaks,
+        num_authors=DEFAULT_NUM_AUTHORS,
+        num_signing_authors=DEFAULT_NUM_SIGNING_AUTHORS,
+        num_peers=DEFAULT_NUM_PEERS,
+        squeaks_per_block=DEFAULT_SQUEAKS_PER_BLOCK,
+        follow_fraction=DEFAULT_FOLLOW_FRACTION,
+        reply_fraction=DEFAULT_REPLY_FRACTION,
+        resqueak_fraction=DEFAULT_RESQUEAK_FRACTION,
+        unlock_fraction=DEFAULT_UNLOCK_FRACTION,
+        like_fraction=DEFAULT_LIKE_FRACTION,
+        offer_fraction=DEFAULT_OFFER_FRACTION,
+        payment_fraction=DEFAULT_PAYMENT_FRACTION,
+        batch_size=DEFAULT_BATCH_SIZE,
+        workers=1,
+        seed=0,
+):
+    """ Fill an initialized squeak db with a synthetic dataset. """
+    rng = random.Random(seed)
+    private_keys = insert_profiles(
+        squeak_db,
+        rng,
+        num_authors,
+        num_signing_authors,
+        follow_fraction,
+    )
+    private_key_bytes = [key.to_bytes() for key in private_keys]
+    peer_addresses = insert_peers(squeak_db, num_peers)
+    recent_hashes = []
+    settle_index = 1
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        for start in range(0, num_squeaks, batch_size):
+            tasks = []
+            authors = []
+            for i in range(start, min(start + batch_size, num_squeaks)):
+                # Skew the authors, so that a few authors have most squeaks.
+                author = int(num_authors * rng.random() ** 2)
+                reply_hash = None
+                resqueak_hash = None
+                if recent_hashes and rng.random() < reply_fraction:
+                    reply_hash = rng.choice(recent_hashes)
+                if recent_hashes and rng.random() < resqueak_fraction:
+                    resqueak_hash = rng.choice(recent_hashes)
+                tasks.append((
+                    private_key_bytes[author],
+                    make_content(rng),
+                    i // squeaks_per_block,
+                    reply_hash,
+                    resqueak_hash,
+                ))
+                authors.append(author)
+            if pool is not None:
+                results = pool.map(make_squeak_task, tasks, chunksize=50)
+            else:
+                results = [make_squeak_task(task) for task in tasks]
+            squeaks = [
+                deserialize_squeak(squeak_bytes, secret_key)
+                for squeak_bytes, secret_key in results
+            ]
+            squeak_db.insert_squeaks([
+                (squeak, get_block_header(task[2]))
+                for squeak, task in zip(squeaks, tasks)
+            ])
+            for squeak, task, author, (_, secret_key) in zip(squeaks, tasks, authors, results):
+                squeak_hash = get_hash(squeak)
+                settle_index = insert_squeak_extras(
+                    squeak_db,
+                    rng,
+                    squeak_hash,
+                    task[1],
+                    secret_key,
+                    author < num_signing_authors,
+                    peer_addresses,
+                    unlock_fraction,
+                    like_fraction,
+                    offer_fraction,
+                    payment_fraction,
+                    settle_index,
+                )
+                recent_hashes.append(squeak_hash)
+            del recent_hashes[:-RECENT_SQUEAKS_WINDOW]
+            print("Generated {}/{} squeaks".format(
+                start + len(tasks), num_squeaks), flush=True)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
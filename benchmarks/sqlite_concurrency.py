@@ -0,0 +1,171 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark concurrent reads and writes on a sqlite database file.
+
+Runs the same workload against an engine with the default settings and
+an engine with the `[db]` performance profile, and prints the throughput
+of each. The profile is also run with as many readers as the threads of
+one timeline download, to check that the connection pool does not make
+them wait.
+
+Usage:
+    python -m benchmarks.sqlite_concurrency --writers 4 --readers 8
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+
+from bitcoin.core import CBlockHeader
+from squeak.core.keys import SqueakPrivateKey
+
+from squeaknode.config.config import SqueaknodeConfig
+from squeaknode.core.squeaks import make_squeak_with_block
+from squeaknode.db.db_engine import get_engine
+from squeaknode.db.squeak_db import SqueakDb
+
+
+def gen_squeaks(num_squeaks, num_authors):
+    private_keys = [SqueakPrivateKey.generate() for _ in range(num_authors)]
+    squeaks = []
+    for i in range(num_squeaks):
+        private_key = private_keys[i % num_authors]
+        squeak, _ = make_squeak_with_block(
+            private_key,
+            "benchmark squeak {}".format(i),
+            i // 10,
+            os.urandom(32),
+        )
+        squeaks.append((squeak, CBlockHeader(nTime=i)))
+    return squeaks, [key.get_public_key() for key in private_keys]
+
+
+def run_workload(squeak_db, squeaks, public_keys, num_writers, num_readers, duration_s):
+    counts = Counter()
+    counts_lock = threading.Lock()
+    stop_event = threading.Event()
+    squeaks_iter = iter(squeaks)
+    squeaks_lock = threading.Lock()
+
+    def record(name):
+        with counts_lock:
+            counts[name] += 1
+
+    def write():
+        while not stop_event.is_set():
+            with squeaks_lock:
+                item = next(squeaks_iter, None)
+            if item is None:
+                return
+            try:
+                squeak_db.insert_squeak(*item)
+                record("writes")
+            except Exception:
+                record("write_errors")
+
+    def read(i):
+        public_key = public_keys[i % len(public_keys)]
+        while not stop_event.is_set():
+            try:
+                squeak_db.get_squeak_entries_for_public_key(
+                    public_key, limit=20, last_entry=None)
+                squeak_db.lookup_squeaks(
+                    public_keys=[public_key],
+                    min_block=0,
+                    max_block=None,
+                    reply_to_hash=None,
+                    include_locked=True,
+                )
+                record("reads")
+            except Exception:
+                record("read_errors")
+
+    threads = [threading.Thread(target=write) for _ in range(num_writers)]
+    threads += [threading.Thread(target=read, args=(i,))
+                for i in range(num_readers)]
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration_s)
+    stop_event.set()
+    for thread in threads:
+        thread.join()
+    elapsed_s = time.perf_counter() - start_time
+    return counts, elapsed_s
+
+
+def run_benchmark(name, db_config, args, squeaks, public_keys, num_readers=None):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        connection_string = "sqlite:///{}".format(
+            os.path.join(tmp_dir, "benchmark.db"))
+        engine = get_engine(connection_string, db_config)
+        squeak_db = SqueakDb(engine)
+        squeak_db.init()
+        counts, elapsed_s = run_workload(
+            squeak_db,
+            squeaks,
+            public_keys,
+            args.writers,
+            num_readers or args.readers,
+            args.duration_s,
+        )
+        engine.dispose()
+    print("{:<12} writes/s: {:>8.1f}  reads/s: {:>8.1f}  write errors: {:>5}  read errors: {:>5}".format(
+        name,
+        counts["writes"] / elapsed_s,
+        counts["reads"] / elapsed_s,
+        counts["write_errors"],
+        counts["read_errors"],
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--duration-s", type=float, default=10)
+    parser.add_argument("--squeaks", type=int, default=20000)
+    parser.add_argument("--authors", type=int, default=20)
+    parser.add_argument("--download-threads", type=int, default=50)
+    args = parser.parse_args()
+
+    print("Generating {} squeaks...".format(args.squeaks))
+    squeaks, public_keys = gen_squeaks(args.squeaks, args.authors)
+
+    config = SqueaknodeConfig()
+    config.read()
+    run_benchmark("default", None, args, squeaks, public_keys)
+    run_benchmark("profile", config.db, args, squeaks, public_keys)
+    run_benchmark(
+        "download",
+        config.db,
+        args,
+        squeaks,
+        public_keys,
+        num_readers=args.download_threads,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark the SqueakDb list, lookup and summary queries at scale.
+
+Generates synthetic datasets (see `benchmarks.dataset`) with 10k, 100k
+and 1M squeaks, times each query method against them, and compares the
+median time of each method with the stored baselines. A method is
+reported as a regression when it is slower than its baseline by more
+than the tolerance, and the command then exits with status 1.
+
+The generated sqlite databases are kept in the data dir and reused by
+later runs. For postgres, the `--postgres-url` template is formatted
+with the dataset size, and each of those databases must already exist
+(for example `createdb squeaknode_bench_10000`).
+
+Usage:
+    python -m benchmarks.squeak_db_suite --sizes 10000 --backends sqlite
+    python -m benchmarks.squeak_db_suite --sizes 10000 --update-baselines
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from benchmarks.dataset import generate_dataset
+from squeaknode.config.config import SqueaknodeConfig
+from squeaknode.db.db_engine import get_engine
+from squeaknode.db.squeak_db import SqueakDb
+
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+DEFAULT_DATA_DIR = os.path.join(
+    os.path.expanduser("~"), ".squeaknode-benchmarks")
+DEFAULT_POSTGRES_URL = "postgresql://postgres@localhost/squeaknode_bench_{size}"
+BASELINES_PATH = os.path.join(
+    os.path.dirname(__file__), "baselines", "squeak_db.json")
+PAGE_SIZE = 20
+SEARCH_TEXT = "bitcoin lightning"
+OLD_SQUEAK_INTERVAL_S = 3600
+
+
+def get_squeak_db(backend, size, args, db_config):
+    if backend == "sqlite":
+        os.makedirs(args.data_dir, exist_ok=True)
+        connection_string = "sqlite:///{}".format(
+            os.path.join(args.data_dir, "squeaks-{}.db".format(size)))
+    else:
+        connection_string = args.postgres_url.format(size=size)
+    engine = get_engine(connection_string, db_config)
+    squeak_db = SqueakDb(engine)
+    squeak_db.init()
+    if squeak_db.get_number_of_squeaks() == 0:
+        print("Generating dataset with {} squeaks for {}...".format(
+            size, backend))
+        generate_dataset(squeak_db, size, workers=args.workers)
+    return squeak_db
+
+
+def get_sample_inputs(squeak_db):
+    """ Pick the squeaks, authors and peers that the queries are run
+    with from the dataset.
+    """
+    author = squeak_db.get_following_profiles()[0].public_key
+    seller = squeak_db.get_signing_profiles()[0].public_key
+    entries = squeak_db.get_squeak_entries_for_public_key(
+        author, limit=1000, last_entry=None)
+    thread_root = max(entries, key=lambda entry: entry.num_replies)
+    descendants = squeak_db.get_thread_descendant_squeak_entries(
+        thread_root.squeak_hash, limit=1000, last_entry=None)
+    thread_leaf = descendants[-1] if descendants else thread_root
+    sent_payments = squeak_db.get_sent_payments(limit=1, last_sent_payment=None)
+    received_payments = squeak_db.get_received_payments(
+        limit=1, last_received_payment=None)
+    return dict(
+        author=author,
+        seller=seller,
+        squeak_hash=entries[0].squeak_hash,
+        block_height=entries[0].block_height,
+        thread_root_hash=thread_root.squeak_hash,
+        thread_leaf_hash=thread_leaf.squeak_hash,
+        peer_address=squeak_db.get_peers()[0].address,
+        bought_squeak_hash=(
+            sent_payments[0].squeak_hash if sent_payments
+            else entries[0].squeak_hash
+        ),
+        sold_squeak_hash=(
+            received_payments[0].squeak_hash if received_payments
+            else entries[0].squeak_hash
+        ),
+    )
+
+
+def get_cases(squeak_db, inputs):
+    """ Return the name and a function that runs the query for each
+    benchmarked method.
+    """
+    db = squeak_db
+    return [
+        ("get_squeak", lambda: db.get_squeak(inputs["squeak_hash"])),
+        ("get_squeak_entry", lambda: db.get_squeak_entry(inputs["squeak_hash"])),
+        ("get_timeline_squeak_entries",
+         lambda: db.get_timeline_squeak_entries(PAGE_SIZE, None)),
+        ("get_liked_squeak_entries",
+         lambda: db.get_liked_squeak_entries(PAGE_SIZE, None)),
+        ("get_squeak_entries_for_public_key",
+         lambda: db.get_squeak_entries_for_public_key(
+             inputs["author"], PAGE_SIZE, None)),
+        ("get_squeak_entries_for_text_search",
+         lambda: db.get_squeak_entries_for_text_search(
+             SEARCH_TEXT, PAGE_SIZE, None)),
+        ("get_thread_ancestor_squeak_entries",
+         lambda: db.get_thread_ancestor_squeak_entries(
+             inputs["thread_leaf_hash"])),
+        ("get_thread_descendant_squeak_entries",
+         lambda: db.get_thread_descendant_squeak_entries(
+             inputs["thread_root_hash"], PAGE_SIZE, None)),
+        ("get_thread_conversation_squeak_entries",
+         lambda: db.get_thread_conversation_squeak_entries(
+             inputs["thread_leaf_hash"], PAGE_SIZE, None)),
+        ("get_thread_reply_squeak_entries",
+         lambda: db.get_thread_reply_squeak_entries(
+             inputs["thread_root_hash"], PAGE_SIZE, None)),
+        ("lookup_squeaks",
+         lambda: db.lookup_squeaks(
+             [inputs["author"]], 0, None, None, include_locked=True)),
+        ("get_number_of_squeaks", db.get_number_of_squeaks),
+        ("number_of_squeaks_with_public_key_with_block_height",
+         lambda: db.number_of_squeaks_with_public_key_with_block_height(
+             inputs["author"], inputs["block_height"])),
+        ("get_number_of_squeaks_by_public_key_and_block_height",
+         lambda: db.get_number_of_squeaks_by_public_key_and_block_height(
+             None, inputs["block_height"] - 10, inputs["block_height"])),
+        ("get_old_squeaks_to_delete",
+         lambda: db.get_old_squeaks_to_delete(OLD_SQUEAK_INTERVAL_S)),
+        ("get_profiles", db.get_profiles),
+        ("get_following_profiles", db.get_following_profiles),
+        ("get_peers", db.get_peers),
+        ("get_received_offers",
+         lambda: db.get_received_offers(inputs["squeak_hash"])),
+        ("get_sent_offers", db.get_sent_offers),
+        ("get_sent_payments", lambda: db.get_sent_payments(PAGE_SIZE, None)),
+        ("get_sent_payments_for_squeak",
+         lambda: db.get_sent_payments_for_squeak(
+             inputs["bought_squeak_hash"], PAGE_SIZE, None)),
+        ("get_sent_payments_for_pubkey",
+         lambda: db.get_sent_payments_for_pubkey(
+             inputs["author"], PAGE_SIZE, None)),
+        ("get_sent_payments_for_peer",
+         lambda: db.get_sent_payments_for_peer(
+             inputs["peer_address"], PAGE_SIZE, None)),
+        ("get_received_payments",
+         lambda: db.get_received_payments(PAGE_SIZE, None)),
+        ("get_received_payments_for_squeak",
+         lambda: db.get_received_payments_for_squeak(
+             inputs["sold_squeak_hash"], PAGE_SIZE, None)),
+        ("get_received_payments_for_pubkey",
+         lambda: db.get_received_payments_for_pubkey(
+             inputs["seller"], PAGE_SIZE, None)),
+        ("get_received_payments_for_peer",
+         lambda: db.get_received_payments_for_peer(
+             inputs["peer_address"], PAGE_SIZE, None)),
+        ("get_received_payments_from_index",
+         lambda: db.get_received_payments_from_index(0, PAGE_SIZE)),
+        ("get_received_payment_summary", db.get_received_payment_summary),
+        ("get_sent_payment_summary", db.get_sent_payment_summary),
+        ("get_received_payment_summary_for_squeak",
+         lambda: db.get_received_payment_summary_for_squeak(
+             inputs["sold_squeak_hash"])),
+        ("get_sent_payment_summary_for_squeak",
+         lambda: db.get_sent_payment_summary_for_squeak(
+             inputs["bought_squeak_hash"])),
+        ("get_received_payment_summary_for_pubkey",
+         lambda: db.get_received_payment_summary_for_pubkey(inputs["seller"])),
+        ("get_sent_payment_summary_for_pubkey",
+         lambda: db.get_sent_payment_summary_for_pubkey(inputs["author"])),
+        ("get_received_payment_summary_for_peer",
+         lambda: db.get_received_payment_summary_for_peer(
+             inputs["peer_address"])),
+        ("get_sent_payment_summary_for_peer",
+         lambda: db.get_sent_payment_summary_for_peer(
+             inputs["peer_address"])),
+    ]
+
+
+def time_case(fn, repeat):
+    fn()
+    times_ms = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        fn()
+        times_ms.append((time.perf_counter() - start_time) * 1000)
+    return statistics.median(times_ms)
+
+
+def load_baselines(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baselines(path, baselines):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def run_suite(squeak_db, repeat, baselines, tolerance):
+    """ Time each case, print it next to its baseline, and return the
+    results and the names of the regressed methods.
+    """
+    inputs = get_sample_inputs(squeak_db)
+    results = {}
+    regressions = []
+    print("{:<55} {:>10} {:>10} {:>7}".format(
+        "method", "median ms", "baseline", "ratio"))
+    for name, fn in get_cases(squeak_db, inputs):
+        median_ms = time_case(fn, repeat)
+        results[name] = round(median_ms, 3)
+        baseline_ms = baselines.get(name)
+        if baseline_ms:
+            ratio = median_ms / baseline_ms
+            status = "REGRESSION" if ratio > tolerance else ""
+            if status:
+                regressions.append(name)
+            print("{:<55} {:>10.3f} {:>10.3f} {:>7.2f} {}".format(
+                name, median_ms, baseline_ms, ratio, status).rstrip())
+        else:
+            print("{:<55} {:>10.3f} {:>10} {:>7}".format(
+                name, median_ms, "-", "-"))
+    return results, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--backends", nargs="+", default=["sqlite"],
+                        choices=["sqlite", "postgres"])
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR)
+    parser.add_argument("--postgres-url", default=DEFAULT_POSTGRES_URL)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="Slowdown ratio over the baseline that counts as a regression.")
+    parser.add_argument("--baselines", default=BASELINES_PATH)
+    parser.add_argument("--update-baselines", action="store_true",
+                        help="Store the measured times as the new baselines.")
+    args = parser.parse_args()
+
+    config = SqueaknodeConfig()
+    config.read()
+    baselines = load_baselines(args.baselines)
+    all_regressions = []
+    for backend in args.backends:
+        for size in args.sizes:
+            print("\n{} with {} squeaks".format(backend, size))
+            squeak_db = get_squeak_db(backend, size, args, config.db)
+            size_baselines = baselines.get(backend, {}).get(str(size), {})
+            results, regressions = run_suite(
+                squeak_db, args.repeat, size_baselines, args.tolerance)
+            squeak_db.engine.dispose()
+            all_regressions += [
+                "{} {} {}".format(backend, size, name) for name in regressions
+            ]
+            baselines.setdefault(backend, {})[str(size)] = results
+
+    if args.update_baselines:
+        save_baselines(args.baselines, baselines)
+        print("\nSaved baselines to {}".format(args.baselines))
+    elif all_regressions:
+        print("\nRegressions:\n{}".format("\n".join(all_regressions)))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
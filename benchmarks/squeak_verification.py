@@ -0,0 +1,108 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark the squeak signature verification pool.
+
+Signs a set of squeaks, then verifies them in batches with
+`SqueakVerifier` at each of the given numbers of worker processes, and
+prints the verified squeaks per second. The worker processes are started
+before timing.
+
+The squeaks are verified both from their serialized bytes and as
+deserialized squeaks, which is how `SqueakStore.save_squeaks` verifies
+the squeaks that the downloader fetched.
+
+Usage:
+    python -m benchmarks.squeak_verification --squeaks 800 --workers 1 2 4 8
+"""
+import argparse
+import multiprocessing
+import os
+import time
+
+from squeak.core.keys import SqueakPrivateKey
+
+from benchmarks.dataset import make_squeak_task
+from squeaknode.core.squeaks import deserialize_squeak
+from squeaknode.node.squeak_verifier import SqueakVerifier
+
+
+def sign_squeaks(num_squeaks, workers):
+    private_key_bytes = SqueakPrivateKey.generate().to_bytes()
+    tasks = [
+        (private_key_bytes, "squeak {}".format(i), i, None, None)
+        for i in range(num_squeaks)
+    ]
+    with multiprocessing.Pool(workers) as pool:
+        results = pool.map(make_squeak_task, tasks, chunksize=50)
+    return [squeak_bytes for squeak_bytes, _ in results]
+
+
+def time_verification(squeaks, num_workers, batch_size, verify_fn_name):
+    squeak_verifier = SqueakVerifier(num_workers)
+    verify_fn = getattr(squeak_verifier, verify_fn_name)
+    try:
+        # Start the worker processes before timing.
+        verify_fn(squeaks[:num_workers * 2])
+        start_time = time.perf_counter()
+        num_verified = 0
+        for i in range(0, len(squeaks), batch_size):
+            batch = squeaks[i:i + batch_size]
+            num_verified += len(verify_fn(batch))
+        elapsed_s = time.perf_counter() - start_time
+    finally:
+        squeak_verifier.shutdown()
+    assert num_verified == len(squeaks)
+    return num_verified / elapsed_s
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--squeaks", type=int, default=800)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print("cpu count: {}".format(os.cpu_count()))
+    serialized_squeaks = sign_squeaks(args.squeaks, os.cpu_count() or 1)
+    squeaks = [
+        deserialize_squeak(squeak_bytes)
+        for squeak_bytes in serialized_squeaks
+    ]
+    for num_workers in args.workers:
+        serialized_squeaks_per_s = time_verification(
+            serialized_squeaks,
+            num_workers,
+            args.batch_size,
+            "verify_serialized_squeaks",
+        )
+        squeaks_per_s = time_verification(
+            squeaks,
+            num_workers,
+            args.batch_size,
+            "verify_squeaks",
+        )
+        print("{:>2} workers: {:>8.1f} serialized squeaks/s  {:>8.1f} squeaks/s".format(
+            num_workers, serialized_squeaks_per_s, squeaks_per_s))
+
+
+if __name__ == "__main__":
+    main()
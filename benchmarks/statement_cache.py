@@ -0,0 +1,89 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark the per-call overhead of the squeak entry list queries.
+
+Calls `get_timeline_squeak_entries` on an in-memory database, once
+with the prebuilt statements cleared before every call (so the statement
+is built from scratch each time) and once with the prebuilt statement
+reused, and prints the average time per call of each. The database is
+empty by default, so the numbers measure statement building and execution
+overhead rather than row parsing.
+
+Usage:
+    python -m benchmarks.statement_cache --calls 2000
+"""
+import argparse
+import time
+
+from sqlalchemy import create_engine
+
+from benchmarks.sqlite_concurrency import gen_squeaks
+from squeaknode.core.profiles import create_contact_profile
+from squeaknode.db.squeak_db import SqueakDb
+
+
+def setup_db(num_squeaks, num_authors):
+    engine = create_engine("sqlite://")
+    squeak_db = SqueakDb(engine)
+    squeak_db.init()
+    squeaks, public_keys = gen_squeaks(num_squeaks, num_authors)
+    for squeak, block_header in squeaks:
+        squeak_db.insert_squeak(squeak, block_header)
+    for i, public_key in enumerate(public_keys):
+        profile_id = squeak_db.insert_profile(
+            create_contact_profile("author {}".format(i), public_key),
+        )
+        squeak_db.set_profile_following(profile_id, True)
+    return squeak_db
+
+
+def time_calls(squeak_db, num_calls, limit, clear_statements):
+    elapsed_s = 0.0
+    for _ in range(num_calls):
+        if clear_statements:
+            squeak_db._statements.clear()
+        start_time = time.perf_counter()
+        squeak_db.get_timeline_squeak_entries(limit=limit, last_entry=None)
+        elapsed_s += time.perf_counter() - start_time
+    return elapsed_s / num_calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--squeaks", type=int, default=0)
+    parser.add_argument("--authors", type=int, default=5)
+    args = parser.parse_args()
+
+    squeak_db = setup_db(args.squeaks, args.authors)
+    # Warm up the engine and the compiled cache before timing.
+    time_calls(squeak_db, 100, args.limit, False)
+
+    for name, clear_statements in [("rebuilt", True), ("prebuilt", False)]:
+        per_call_s = time_calls(
+            squeak_db, args.calls, args.limit, clear_statements)
+        print("{:<10} per call: {:>8.1f} us".format(name, per_call_s * 1e6))
+
+
+if __name__ == "__main__":
+    main()
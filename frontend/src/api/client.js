@@ -226,6 +226,7 @@ export const getNetwork = () => {
 export const getTimelineSqueaks = (limit, lastSqueak) => {
     console.log('Calling getTimelineSqueaks');
     const request = new GetTimelineSqueakDisplaysRequest();
+    request.setProfileImagesByReference(true);
     request.setLimit(limit);
     if (lastSqueak) {
       request.setLastEntry(lastSqueak);
@@ -241,6 +242,7 @@ export const getTimelineSqueaks = (limit, lastSqueak) => {
 export const getSqueak = (squeakHash) => {
     console.log('Calling getSqueak');
     const request = new GetSqueakDisplayRequest();
+    request.setProfileImagesByReference(true);
     request.setSqueakHash(squeakHash);
     const deser = GetSqueakDisplayReply.deserializeBinary;
     return baseRequest({
@@ -253,6 +255,7 @@ export const getSqueak = (squeakHash) => {
 export const getAncestorSqueaks = (squeakHash) => {
     console.log('Calling getAncestorSqueaks');
     const request = new GetAncestorSqueakDisplaysRequest();
+    request.setProfileImagesByReference(true);
     request.setSqueakHash(squeakHash);
     const deser = GetAncestorSqueakDisplaysReply.deserializeBinary;
     return baseRequest({
@@ -265,6 +268,7 @@ export const getAncestorSqueaks = (squeakHash) => {
 export const getReplySqueaks = (squeakHash, limit, lastSqueak) => {
     console.log('Calling getAncestorSqueaks');
     const request = new GetReplySqueakDisplaysRequest();
+    request.setProfileImagesByReference(true);
     request.setSqueakHash(squeakHash);
     request.setLimit(limit);
     if (lastSqueak) {
@@ -281,6 +285,7 @@ export const getReplySqueaks = (squeakHash, limit, lastSqueak) => {
 export const getProfileSqueaks = (pubkey, limit, lastSqueak) => {
     console.log('Calling getProfileSqueaks');
     const request = new GetPubKeySqueakDisplaysRequest();
+    request.setProfileImagesByReference(true);
     request.setPubkey(pubkey);
     request.setLimit(limit);
     if (lastSqueak) {
@@ -570,6 +575,7 @@ export const getReceivedPaymentsForPeer = (network, host, port, limit, lastRecei
 export const getSearchSqueaks = (searchText, limit, lastSqueak) => {
     console.log('Calling getSearchSqueaks');
     const request = new GetSearchSqueakDisplaysRequest();
+    request.setProfileImagesByReference(true);
     request.setSearchText(searchText);
     request.setLimit(limit);
     if (lastSqueak) {
@@ -1,8 +1,15 @@
+import { web_host_port } from '../api/client';
+
 function getImageSrcString(imageBase64) {
   return `data:image/jpeg;base64,${imageBase64}`;
 }
 
 export function getProfileImageSrcString(squeakProfile) {
   const profileImage = squeakProfile.getProfileImage();
+  const profileImageId = squeakProfile.getProfileImageId();
+  if (!profileImage && profileImageId) {
+    // Images loaded by reference are cached by the browser.
+    return `${web_host_port}/profileimage/${profileImageId}`;
+  }
   return getImageSrcString(profileImage);
 }
@@ -414,6 +414,17 @@ def test_set_profile_image(admin_stub, contact_profile_id, random_image, random_
     assert squeak_profile.profile_image == random_image_base64_string
     assert squeak_profile.has_custom_profile_image
 
+    # Get the profile image by id
+    get_profile_images_response = admin_stub.GetProfileImages(
+        squeak_admin_pb2.GetProfileImagesRequest(
+            profile_image_ids=[squeak_profile.profile_image_id],
+        )
+    )
+    assert len(get_profile_images_response.profile_images) == 1
+    profile_image = get_profile_images_response.profile_images[0]
+    assert profile_image.profile_image_id == squeak_profile.profile_image_id
+    assert profile_image.profile_image == random_image_base64_string
+
     # Clear the profile image
     admin_stub.ClearSqueakProfileImage(
         squeak_admin_pb2.ClearSqueakProfileImageRequest(
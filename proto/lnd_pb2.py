@@ -0,0 +1,607 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: proto/lnd.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'proto/lnd.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0fproto/lnd.proto\x12\x05lnrpc\"\xa2\x01\n\x04Utxo\x12(\n\x0c\x61\x64\x64ress_type\x18\x01 \x01(\x0e\x32\x12.lnrpc.AddressType\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x12\n\namount_sat\x18\x03 \x01(\x03\x12\x11\n\tpk_script\x18\x04 \x01(\t\x12!\n\x08outpoint\x18\x05 \x01(\x0b\x32\x0f.lnrpc.OutPoint\x12\x15\n\rconfirmations\x18\x06 \x01(\x03\"\xd6\x01\n\x0bTransaction\x12\x0f\n\x07tx_hash\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x03\x12\x19\n\x11num_confirmations\x18\x03 \x01(\x05\x12\x12\n\nblock_hash\x18\x04 \x01(\t\x12\x14\n\x0c\x62lock_height\x18\x05 \x01(\x05\x12\x12\n\ntime_stamp\x18\x06 \x01(\x03\x12\x12\n\ntotal_fees\x18\x07 \x01(\x03\x12\x16\n\x0e\x64\x65st_addresses\x18\x08 \x03(\t\x12\x12\n\nraw_tx_hex\x18\t \x01(\t\x12\r\n\x05label\x18\n \x01(\t\"S\n\x16GetTransactionsRequest\x12\x14\n\x0cstart_height\x18\x01 \x01(\x05\x12\x12\n\nend_height\x18\x02 \x01(\x05\x12\x0f\n\x07\x61\x63\x63ount\x18\x03 \x01(\t\">\n\x12TransactionDetails\x12(\n\x0ctransactions\x18\x01 \x03(\x0b\x32\x12.lnrpc.Transaction\"M\n\x08\x46\x65\x65Limit\x12\x0f\n\x05\x66ixed\x18\x01 \x01(\x03H\x00\x12\x14\n\nfixed_msat\x18\x03 \x01(\x03H\x00\x12\x11\n\x07percent\x18\x02 \x01(\x03H\x00\x42\x07\n\x05limit\"\x8a\x04\n\x0bSendRequest\x12\x0c\n\x04\x64\x65st\x18\x01 \x01(\x0c\x12\x17\n\x0b\x64\x65st_string\x18\x02 \x01(\tB\x02\x18\x01\x12\x0b\n\x03\x61mt\x18\x03 \x01(\x03\x12\x10\n\x08\x61mt_msat\x18\x0c \x01(\x03\x12\x14\n\x0cpayment_hash\x18\x04 \x01(\x0c\x12\x1f\n\x13payment_hash_string\x18\x05 \x01(\tB\x02\x18\x01\x12\x17\n\x0fpayment_request\x18\x06 \x01(\t\x12\x18\n\x10\x66inal_cltv_delta\x18\x07 \x01(\x05\x12\"\n\tfee_limit\x18\x08 \x01(\x0b\x32\x0f.lnrpc.FeeLimit\x12\x1c\n\x10outgoing_chan_id\x18\t \x01(\x04\x42\x02\x30\x01\x12\x17\n\x0flast_hop_pubkey\x18\r \x01(\x0c\x12\x12\n\ncltv_limit\x18\n \x01(\r\x12\x46\n\x13\x64\x65st_custom_records\x18\x0b \x03(\x0b\x32).lnrpc.SendRequest.DestCustomRecordsEntry\x12\x1a\n\x12\x61llow_self_payment\x18\x0e \x01(\x08\x12(\n\rdest_features\x18\x0f \x03(\x0e\x32\x11.lnrpc.FeatureBit\x12\x14\n\x0cpayment_addr\x18\x10 \x01(\x0c\x1a\x38\n\x16\x44\x65stCustomRecordsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x04\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\"z\n\x0cSendResponse\x12\x15\n\rpayment_error\x18\x01 \x01(\t\x12\x18\n\x10payment_preimage\x18\x02 \x01(\x0c\x12#\n\rpayment_route\x18\x03 \x01(\x0b\x32\x0c.lnrpc.Route\x12\x14\n\x0cpayment_hash\x18\x04 \x01(\x0c\"n\n\x12SendToRouteRequest\x12\x14\n\x0cpayment_hash\x18\x01 \x01(\x0c\x12\x1f\n\x13payment_hash_string\x18\x02 \x01(\tB\x02\x18\x01\x12\x1b\n\x05route\x18\x04 \x01(\x0b\x32\x0c.lnrpc.RouteJ\x04\x08\x03\x10\x04\"\xb5\x02\n\x14\x43hannelAcceptRequest\x12\x13\n\x0bnode_pubkey\x18\x01 \x01(\x0c\x12\x12\n\nchain_hash\x18\x02 \x01(\x0c\x12\x17\n\x0fpending_chan_id\x18\x03 \x01(\x0c\x12\x13\n\x0b\x66unding_amt\x18\x04 \x01(\x04\x12\x10\n\x08push_amt\x18\x05 \x01(\x04\x12\x12\n\ndust_limit\x18\x06 \x01(\x04\x12\x1b\n\x13max_value_in_flight\x18\x07 \x01(\x04\x12\x17\n\x0f\x63hannel_reserve\x18\x08 \x01(\x04\x12\x10\n\x08min_htlc\x18\t \x01(\x04\x12\x12\n\nfee_per_kw\x18\n \x01(\x04\x12\x11\n\tcsv_delay\x18\x0b \x01(\r\x12\x1a\n\x12max_accepted_htlcs\x18\x0c \x01(\r\x12\x15\n\rchannel_flags\x18\r \x01(\r\"\xf4\x01\n\x15\x43hannelAcceptResponse\x12\x0e\n\x06\x61\x63\x63\x65pt\x18\x01 \x01(\x08\x12\x17\n\x0fpending_chan_id\x18\x02 \x01(\x0c\x12\r\n\x05\x65rror\x18\x03 \x01(\t\x12\x18\n\x10upfront_shutdown\x18\x04 \x01(\t\x12\x11\n\tcsv_delay\x18\x05 \x01(\r\x12\x13\n\x0breserve_sat\x18\x06 \x01(\x04\x12\x1a\n\x12in_flight_max_msat\x18\x07 \x01(\x04\x12\x16\n\x0emax_htlc_count\x18\x08 \x01(\r\x12\x13\n\x0bmin_htlc_in\x18\t \x01(\x04\x12\x18\n\x10min_accept_depth\x18\n \x01(\r\"n\n\x0c\x43hannelPoint\x12\x1c\n\x12\x66unding_txid_bytes\x18\x01 \x01(\x0cH\x00\x12\x1a\n\x10\x66unding_txid_str\x18\x02 \x01(\tH\x00\x12\x14\n\x0coutput_index\x18\x03 \x01(\rB\x0e\n\x0c\x66unding_txid\"F\n\x08OutPoint\x12\x12\n\ntxid_bytes\x18\x01 \x01(\x0c\x12\x10\n\x08txid_str\x18\x02 \x01(\t\x12\x14\n\x0coutput_index\x18\x03 \x01(\r\"0\n\x10LightningAddress\x12\x0e\n\x06pubkey\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t\"\xcf\x01\n\x12\x45stimateFeeRequest\x12\x41\n\x0c\x41\x64\x64rToAmount\x18\x01 \x03(\x0b\x32+.lnrpc.EstimateFeeRequest.AddrToAmountEntry\x12\x13\n\x0btarget_conf\x18\x02 \x01(\x05\x12\x11\n\tmin_confs\x18\x03 \x01(\x05\x12\x19\n\x11spend_unconfirmed\x18\x04 \x01(\x08\x1a\x33\n\x11\x41\x64\x64rToAmountEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\"_\n\x13\x45stimateFeeResponse\x12\x0f\n\x07\x66\x65\x65_sat\x18\x01 \x01(\x03\x12 \n\x14\x66\x65\x65rate_sat_per_byte\x18\x02 \x01(\x03\x42\x02\x18\x01\x12\x15\n\rsat_per_vbyte\x18\x03 \x01(\x04\"\x89\x02\n\x0fSendManyRequest\x12>\n\x0c\x41\x64\x64rToAmount\x18\x01 \x03(\x0b\x32(.lnrpc.SendManyRequest.AddrToAmountEntry\x12\x13\n\x0btarget_conf\x18\x03 \x01(\x05\x12\x15\n\rsat_per_vbyte\x18\x04 \x01(\x04\x12\x18\n\x0csat_per_byte\x18\x05 \x01(\x03\x42\x02\x18\x01\x12\r\n\x05label\x18\x06 \x01(\t\x12\x11\n\tmin_confs\x18\x07 \x01(\x05\x12\x19\n\x11spend_unconfirmed\x18\x08 \x01(\x08\x1a\x33\n\x11\x41\x64\x64rToAmountEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\" \n\x10SendManyResponse\x12\x0c\n\x04txid\x18\x01 \x01(\t\"\xc5\x01\n\x10SendCoinsRequest\x12\x0c\n\x04\x61\x64\x64r\x18\x01 \x01(\t\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x03\x12\x13\n\x0btarget_conf\x18\x03 \x01(\x05\x12\x15\n\rsat_per_vbyte\x18\x04 \x01(\x04\x12\x18\n\x0csat_per_byte\x18\x05 \x01(\x03\x42\x02\x18\x01\x12\x10\n\x08send_all\x18\x06 \x01(\x08\x12\r\n\x05label\x18\x07 \x01(\t\x12\x11\n\tmin_confs\x18\x08 \x01(\x05\x12\x19\n\x11spend_unconfirmed\x18\t \x01(\x08\"!\n\x11SendCoinsResponse\x12\x0c\n\x04txid\x18\x01 \x01(\t\"K\n\x12ListUnspentRequest\x12\x11\n\tmin_confs\x18\x01 \x01(\x05\x12\x11\n\tmax_confs\x18\x02 \x01(\x05\x12\x0f\n\x07\x61\x63\x63ount\x18\x03 \x01(\t\"1\n\x13ListUnspentResponse\x12\x1a\n\x05utxos\x18\x01 \x03(\x0b\x32\x0b.lnrpc.Utxo\"F\n\x11NewAddressRequest\x12 \n\x04type\x18\x01 \x01(\x0e\x32\x12.lnrpc.AddressType\x12\x0f\n\x07\x61\x63\x63ount\x18\x02 \x01(\t\"%\n\x12NewAddressResponse\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\"6\n\x12SignMessageRequest\x12\x0b\n\x03msg\x18\x01 \x01(\x0c\x12\x13\n\x0bsingle_hash\x18\x02 \x01(\x08\"(\n\x13SignMessageResponse\x12\x11\n\tsignature\x18\x01 \x01(\t\"6\n\x14VerifyMessageRequest\x12\x0b\n\x03msg\x18\x01 \x01(\x0c\x12\x11\n\tsignature\x18\x02 \x01(\t\"6\n\x15VerifyMessageResponse\x12\r\n\x05valid\x18\x01 \x01(\x08\x12\x0e\n\x06pubkey\x18\x02 \x01(\t\"Z\n\x12\x43onnectPeerRequest\x12%\n\x04\x61\x64\x64r\x18\x01 \x01(\x0b\x32\x17.lnrpc.LightningAddress\x12\x0c\n\x04perm\x18\x02 \x01(\x08\x12\x0f\n\x07timeout\x18\x03 \x01(\x04\"\x15\n\x13\x43onnectPeerResponse\"(\n\x15\x44isconnectPeerRequest\x12\x0f\n\x07pub_key\x18\x01 \x01(\t\"\x18\n\x16\x44isconnectPeerResponse\"\xa5\x01\n\x04HTLC\x12\x10\n\x08incoming\x18\x01 \x01(\x08\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x03\x12\x11\n\thash_lock\x18\x03 \x01(\x0c\x12\x19\n\x11\x65xpiration_height\x18\x04 \x01(\r\x12\x12\n\nhtlc_index\x18\x05 \x01(\x04\x12\x1a\n\x12\x66orwarding_channel\x18\x06 \x01(\x04\x12\x1d\n\x15\x66orwarding_htlc_index\x18\x07 \x01(\x04\"\xaa\x01\n\x12\x43hannelConstraints\x12\x11\n\tcsv_delay\x18\x01 \x01(\r\x12\x18\n\x10\x63han_reserve_sat\x18\x02 \x01(\x04\x12\x16\n\x0e\x64ust_limit_sat\x18\x03 \x01(\x04\x12\x1c\n\x14max_pending_amt_msat\x18\x04 \x01(\x04\x12\x15\n\rmin_htlc_msat\x18\x05 \x01(\x04\x12\x1a\n\x12max_accepted_htlcs\x18\x06 \x01(\r\"\xb0\x06\n\x07\x43hannel\x12\x0e\n\x06\x61\x63tive\x18\x01 \x01(\x08\x12\x15\n\rremote_pubkey\x18\x02 \x01(\t\x12\x15\n\rchannel_point\x18\x03 \x01(\t\x12\x13\n\x07\x63han_id\x18\x04 \x01(\x04\x42\x02\x30\x01\x12\x10\n\x08\x63\x61pacity\x18\x05 \x01(\x03\x12\x15\n\rlocal_balance\x18\x06 \x01(\x03\x12\x16\n\x0eremote_balance\x18\x07 \x01(\x03\x12\x12\n\ncommit_fee\x18\x08 \x01(\x03\x12\x15\n\rcommit_weight\x18\t \x01(\x03\x12\x12\n\nfee_per_kw\x18\n \x01(\x03\x12\x19\n\x11unsettled_balance\x18\x0b \x01(\x03\x12\x1b\n\x13total_satoshis_sent\x18\x0c \x01(\x03\x12\x1f\n\x17total_satoshis_received\x18\r \x01(\x03\x12\x13\n\x0bnum_updates\x18\x0e \x01(\x04\x12\"\n\rpending_htlcs\x18\x0f \x03(\x0b\x32\x0b.lnrpc.HTLC\x12\x15\n\tcsv_delay\x18\x10 \x01(\rB\x02\x18\x01\x12\x0f\n\x07private\x18\x11 \x01(\x08\x12\x11\n\tinitiator\x18\x12 \x01(\x08\x12\x19\n\x11\x63han_status_flags\x18\x13 \x01(\t\x12\"\n\x16local_chan_reserve_sat\x18\x14 \x01(\x03\x42\x02\x18\x01\x12#\n\x17remote_chan_reserve_sat\x18\x15 \x01(\x03\x42\x02\x18\x01\x12\x1d\n\x11static_remote_key\x18\x16 \x01(\x08\x42\x02\x18\x01\x12.\n\x0f\x63ommitment_type\x18\x1a \x01(\x0e\x32\x15.lnrpc.CommitmentType\x12\x10\n\x08lifetime\x18\x17 \x01(\x03\x12\x0e\n\x06uptime\x18\x18 \x01(\x03\x12\x15\n\rclose_address\x18\x19 \x01(\t\x12\x17\n\x0fpush_amount_sat\x18\x1b \x01(\x04\x12\x13\n\x0bthaw_height\x18\x1c \x01(\r\x12\x34\n\x11local_constraints\x18\x1d \x01(\x0b\x32\x19.lnrpc.ChannelConstraints\x12\x35\n\x12remote_constraints\x18\x1e \x01(\x0b\x32\x19.lnrpc.ChannelConstraints\"z\n\x13ListChannelsRequest\x12\x13\n\x0b\x61\x63tive_only\x18\x01 \x01(\x08\x12\x15\n\rinactive_only\x18\x02 \x01(\x08\x12\x13\n\x0bpublic_only\x18\x03 \x01(\x08\x12\x14\n\x0cprivate_only\x18\x04 \x01(\x08\x12\x0c\n\x04peer\x18\x05 \x01(\x0c\"8\n\x14ListChannelsResponse\x12 \n\x08\x63hannels\x18\x0b \x03(\x0b\x32\x0e.lnrpc.Channel\"\xa9\x04\n\x13\x43hannelCloseSummary\x12\x15\n\rchannel_point\x18\x01 \x01(\t\x12\x13\n\x07\x63han_id\x18\x02 \x01(\x04\x42\x02\x30\x01\x12\x12\n\nchain_hash\x18\x03 \x01(\t\x12\x17\n\x0f\x63losing_tx_hash\x18\x04 \x01(\t\x12\x15\n\rremote_pubkey\x18\x05 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x06 \x01(\x03\x12\x14\n\x0c\x63lose_height\x18\x07 \x01(\r\x12\x17\n\x0fsettled_balance\x18\x08 \x01(\x03\x12\x1b\n\x13time_locked_balance\x18\t \x01(\x03\x12:\n\nclose_type\x18\n \x01(\x0e\x32&.lnrpc.ChannelCloseSummary.ClosureType\x12(\n\x0eopen_initiator\x18\x0b \x01(\x0e\x32\x10.lnrpc.Initiator\x12)\n\x0f\x63lose_initiator\x18\x0c \x01(\x0e\x32\x10.lnrpc.Initiator\x12&\n\x0bresolutions\x18\r \x03(\x0b\x32\x11.lnrpc.Resolution\"\x8a\x01\n\x0b\x43losureType\x12\x15\n\x11\x43OOPERATIVE_CLOSE\x10\x00\x12\x15\n\x11LOCAL_FORCE_CLOSE\x10\x01\x12\x16\n\x12REMOTE_FORCE_CLOSE\x10\x02\x12\x10\n\x0c\x42REACH_CLOSE\x10\x03\x12\x14\n\x10\x46UNDING_CANCELED\x10\x04\x12\r\n\tABANDONED\x10\x05\"\xb2\x01\n\nResolution\x12.\n\x0fresolution_type\x18\x01 \x01(\x0e\x32\x15.lnrpc.ResolutionType\x12)\n\x07outcome\x18\x02 \x01(\x0e\x32\x18.lnrpc.ResolutionOutcome\x12!\n\x08outpoint\x18\x03 \x01(\x0b\x32\x0f.lnrpc.OutPoint\x12\x12\n\namount_sat\x18\x04 \x01(\x04\x12\x12\n\nsweep_txid\x18\x05 \x01(\t\"\x94\x01\n\x15\x43losedChannelsRequest\x12\x13\n\x0b\x63ooperative\x18\x01 \x01(\x08\x12\x13\n\x0blocal_force\x18\x02 \x01(\x08\x12\x14\n\x0cremote_force\x18\x03 \x01(\x08\x12\x0e\n\x06\x62reach\x18\x04 \x01(\x08\x12\x18\n\x10\x66unding_canceled\x18\x05 \x01(\x08\x12\x11\n\tabandoned\x18\x06 \x01(\x08\"F\n\x16\x43losedChannelsResponse\x12,\n\x08\x63hannels\x18\x01 \x03(\x0b\x32\x1a.lnrpc.ChannelCloseSummary\"\xef\x03\n\x04Peer\x12\x0f\n\x07pub_key\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\x12\x12\n\nbytes_sent\x18\x04 \x01(\x04\x12\x12\n\nbytes_recv\x18\x05 \x01(\x04\x12\x10\n\x08sat_sent\x18\x06 \x01(\x03\x12\x10\n\x08sat_recv\x18\x07 \x01(\x03\x12\x0f\n\x07inbound\x18\x08 \x01(\x08\x12\x11\n\tping_time\x18\t \x01(\x03\x12\'\n\tsync_type\x18\n \x01(\x0e\x32\x14.lnrpc.Peer.SyncType\x12+\n\x08\x66\x65\x61tures\x18\x0b \x03(\x0b\x32\x19.lnrpc.Peer.FeaturesEntry\x12\'\n\x06\x65rrors\x18\x0c \x03(\x0b\x32\x17.lnrpc.TimestampedError\x12\x12\n\nflap_count\x18\r \x01(\x05\x12\x14\n\x0clast_flap_ns\x18\x0e \x01(\x03\x12\x19\n\x11last_ping_payload\x18\x0f \x01(\x0c\x1a?\n\rFeaturesEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\x1d\n\x05value\x18\x02 \x01(\x0b\x32\x0e.lnrpc.Feature:\x02\x38\x01\"P\n\x08SyncType\x12\x10\n\x0cUNKNOWN_SYNC\x10\x00\x12\x0f\n\x0b\x41\x43TIVE_SYNC\x10\x01\x12\x10\n\x0cPASSIVE_SYNC\x10\x02\x12\x0f\n\x0bPINNED_SYNC\x10\x03\"4\n\x10TimestampedError\x12\x11\n\ttimestamp\x18\x01 \x01(\x04\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"(\n\x10ListPeersRequest\x12\x14\n\x0clatest_error\x18\x01 \x01(\x08\"/\n\x11ListPeersResponse\x12\x1a\n\x05peers\x18\x01 \x03(\x0b\x32\x0b.lnrpc.Peer\"\x17\n\x15PeerEventSubscription\"v\n\tPeerEvent\x12\x0f\n\x07pub_key\x18\x01 \x01(\t\x12(\n\x04type\x18\x02 \x01(\x0e\x32\x1a.lnrpc.PeerEvent.EventType\".\n\tEventType\x12\x0f\n\x0bPEER_ONLINE\x10\x00\x12\x10\n\x0cPEER_OFFLINE\x10\x01\"\x10\n\x0eGetInfoRequest\"\x96\x04\n\x0fGetInfoResponse\x12\x0f\n\x07version\x18\x0e \x01(\t\x12\x13\n\x0b\x63ommit_hash\x18\x14 \x01(\t\x12\x17\n\x0fidentity_pubkey\x18\x01 \x01(\t\x12\r\n\x05\x61lias\x18\x02 \x01(\t\x12\r\n\x05\x63olor\x18\x11 \x01(\t\x12\x1c\n\x14num_pending_channels\x18\x03 \x01(\r\x12\x1b\n\x13num_active_channels\x18\x04 \x01(\r\x12\x1d\n\x15num_inactive_channels\x18\x0f \x01(\r\x12\x11\n\tnum_peers\x18\x05 \x01(\r\x12\x14\n\x0c\x62lock_height\x18\x06 \x01(\r\x12\x12\n\nblock_hash\x18\x08 \x01(\t\x12\x1d\n\x15\x62\x65st_header_timestamp\x18\r \x01(\x03\x12\x17\n\x0fsynced_to_chain\x18\t \x01(\x08\x12\x17\n\x0fsynced_to_graph\x18\x12 \x01(\x08\x12\x13\n\x07testnet\x18\n \x01(\x08\x42\x02\x18\x01\x12\x1c\n\x06\x63hains\x18\x10 \x03(\x0b\x32\x0c.lnrpc.Chain\x12\x0c\n\x04uris\x18\x0c \x03(\t\x12\x36\n\x08\x66\x65\x61tures\x18\x13 \x03(\x0b\x32$.lnrpc.GetInfoResponse.FeaturesEntry\x1a?\n\rFeaturesEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\x1d\n\x05value\x18\x02 \x01(\x0b\x32\x0e.lnrpc.Feature:\x02\x38\x01J\x04\x08\x0b\x10\x0c\"\x18\n\x16GetRecoveryInfoRequest\"]\n\x17GetRecoveryInfoResponse\x12\x15\n\rrecovery_mode\x18\x01 \x01(\x08\x12\x19\n\x11recovery_finished\x18\x02 \x01(\x08\x12\x10\n\x08progress\x18\x03 \x01(\x01\"\'\n\x05\x43hain\x12\r\n\x05\x63hain\x18\x01 \x01(\t\x12\x0f\n\x07network\x18\x02 \x01(\t\"U\n\x12\x43onfirmationUpdate\x12\x11\n\tblock_sha\x18\x01 \x01(\x0c\x12\x14\n\x0c\x62lock_height\x18\x02 \x01(\x05\x12\x16\n\x0enum_confs_left\x18\x03 \x01(\r\"?\n\x11\x43hannelOpenUpdate\x12*\n\rchannel_point\x18\x01 \x01(\x0b\x32\x13.lnrpc.ChannelPoint\";\n\x12\x43hannelCloseUpdate\x12\x14\n\x0c\x63losing_txid\x18\x01 \x01(\x0c\x12\x0f\n\x07success\x18\x02 \x01(\x08\"\xb0\x01\n\x13\x43loseChannelRequest\x12*\n\rchannel_point\x18\x01 \x01(\x0b\x32\x13.lnrpc.ChannelPoint\x12\r\n\x05\x66orce\x18\x02 \x01(\x08\x12\x13\n\x0btarget_conf\x18\x03 \x01(\x05\x12\x18\n\x0csat_per_byte\x18\x04 \x01(\x03\x42\x02\x18\x01\x12\x18\n\x10\x64\x65livery_address\x18\x05 \x01(\t\x12\x15\n\rsat_per_vbyte\x18\x06 \x01(\x04\"}\n\x11\x43loseStatusUpdate\x12-\n\rclose_pending\x18\x01 \x01(\x0b\x32\x14.lnrpc.PendingUpdateH\x00\x12/\n\nchan_close\x18\x03 \x01(\x0b\x32\x19.lnrpc.ChannelCloseUpdateH\x00\x42\x08\n\x06update\"3\n\rPendingUpdate\x12\x0c\n\x04txid\x18\x01 \x01(\x0c\x12\x14\n\x0coutput_index\x18\x02 \x01(\r\"T\n\x13ReadyForPsbtFunding\x12\x17\n\x0f\x66unding_address\x18\x01 \x01(\t\x12\x16\n\x0e\x66unding_amount\x18\x02 \x01(\x03\x12\x0c\n\x04psbt\x18\x03 \x01(\x0c\"\xad\x01\n\x17\x42\x61tchOpenChannelRequest\x12)\n\x08\x63hannels\x18\x01 \x03(\x0b\x32\x17.lnrpc.BatchOpenChannel\x12\x13\n\x0btarget_conf\x18\x02 \x01(\x05\x12\x15\n\rsat_per_vbyte\x18\x03 \x01(\x03\x12\x11\n\tmin_confs\x18\x04 \x01(\x05\x12\x19\n\x11spend_unconfirmed\x18\x05 \x01(\x08\x12\r\n\x05label\x18\x06 \x01(\t\"\xf9\x01\n\x10\x42\x61tchOpenChannel\x12\x13\n\x0bnode_pubkey\x18\x01 \x01(\x0c\x12\x1c\n\x14local_funding_amount\x18\x02 \x01(\x03\x12\x10\n\x08push_sat\x18\x03 \x01(\x03\x12\x0f\n\x07private\x18\x04 \x01(\x08\x12\x15\n\rmin_htlc_msat\x18\x05 \x01(\x03\x12\x18\n\x10remote_csv_delay\x18\x06 \x01(\r\x12\x15\n\rclose_address\x18\x07 \x01(\t\x12\x17\n\x0fpending_chan_id\x18\x08 \x01(\x0c\x12.\n\x0f\x63ommitment_type\x18\t \x01(\x0e\x32\x15.lnrpc.CommitmentType\"J\n\x18\x42\x61tchOpenChannelResponse\x12.\n\x10pending_channels\x18\x01 \x03(\x0b\x32\x14.lnrpc.PendingUpdate\"\xfa\x03\n\x12OpenChannelRequest\x12\x15\n\rsat_per_vbyte\x18\x01 \x01(\x04\x12\x13\n\x0bnode_pubkey\x18\x02 \x01(\x0c\x12\x1e\n\x12node_pubkey_string\x18\x03 \x01(\tB\x02\x18\x01\x12\x1c\n\x14local_funding_amount\x18\x04 \x01(\x03\x12\x10\n\x08push_sat\x18\x05 \x01(\x03\x12\x13\n\x0btarget_conf\x18\x06 \x01(\x05\x12\x18\n\x0csat_per_byte\x18\x07 \x01(\x03\x42\x02\x18\x01\x12\x0f\n\x07private\x18\x08 \x01(\x08\x12\x15\n\rmin_htlc_msat\x18\t \x01(\x03\x12\x18\n\x10remote_csv_delay\x18\n \x01(\r\x12\x11\n\tmin_confs\x18\x0b \x01(\x05\x12\x19\n\x11spend_unconfirmed\x18\x0c \x01(\x08\x12\x15\n\rclose_address\x18\r \x01(\t\x12(\n\x0c\x66unding_shim\x18\x0e \x01(\x0b\x32\x12.lnrpc.FundingShim\x12\'\n\x1fremote_max_value_in_flight_msat\x18\x0f \x01(\x04\x12\x18\n\x10remote_max_htlcs\x18\x10 \x01(\r\x12\x15\n\rmax_local_csv\x18\x11 \x01(\r\x12.\n\x0f\x63ommitment_type\x18\x12 \x01(\x0e\x32\x15.lnrpc.CommitmentType\"\xc3\x01\n\x10OpenStatusUpdate\x12,\n\x0c\x63han_pending\x18\x01 \x01(\x0b\x32\x14.lnrpc.PendingUpdateH\x00\x12-\n\tchan_open\x18\x03 \x01(\x0b\x32\x18.lnrpc.ChannelOpenUpdateH\x00\x12/\n\tpsbt_fund\x18\x05 \x01(\x0b\x32\x1a.lnrpc.ReadyForPsbtFundingH\x00\x12\x17\n\x0fpending_chan_id\x18\x04 \x01(\x0c\x42\x08\n\x06update\"3\n\nKeyLocator\x12\x12\n\nkey_family\x18\x01 \x01(\x05\x12\x11\n\tkey_index\x18\x02 \x01(\x05\"J\n\rKeyDescriptor\x12\x15\n\rraw_key_bytes\x18\x01 \x01(\x0c\x12\"\n\x07key_loc\x18\x02 \x01(\x0b\x32\x11.lnrpc.KeyLocator\"\xb0\x01\n\rChanPointShim\x12\x0b\n\x03\x61mt\x18\x01 \x01(\x03\x12\'\n\nchan_point\x18\x02 \x01(\x0b\x32\x13.lnrpc.ChannelPoint\x12\'\n\tlocal_key\x18\x03 \x01(\x0b\x32\x14.lnrpc.KeyDescriptor\x12\x12\n\nremote_key\x18\x04 \x01(\x0c\x12\x17\n\x0fpending_chan_id\x18\x05 \x01(\x0c\x12\x13\n\x0bthaw_height\x18\x06 \x01(\r\"J\n\x08PsbtShim\x12\x17\n\x0fpending_chan_id\x18\x01 \x01(\x0c\x12\x11\n\tbase_psbt\x18\x02 \x01(\x0c\x12\x12\n\nno_publish\x18\x03 \x01(\x08\"l\n\x0b\x46undingShim\x12/\n\x0f\x63han_point_shim\x18\x01 \x01(\x0b\x32\x14.lnrpc.ChanPointShimH\x00\x12$\n\tpsbt_shim\x18\x02 \x01(\x0b\x32\x0f.lnrpc.PsbtShimH\x00\x42\x06\n\x04shim\",\n\x11\x46undingShimCancel\x12\x17\n\x0fpending_chan_id\x18\x01 \x01(\x0c\"X\n\x11\x46undingPsbtVerify\x12\x13\n\x0b\x66unded_psbt\x18\x01 \x01(\x0c\x12\x17\n\x0fpending_chan_id\x18\x02 \x01(\x0c\x12\x15\n\rskip_finalize\x18\x03 \x01(\x08\"Y\n\x13\x46undingPsbtFinalize\x12\x13\n\x0bsigned_psbt\x18\x01 \x01(\x0c\x12\x17\n\x0fpending_chan_id\x18\x02 \x01(\x0c\x12\x14\n\x0c\x66inal_raw_tx\x18\x03 \x01(\x0c\"\xe5\x01\n\x14\x46undingTransitionMsg\x12+\n\rshim_register\x18\x01 \x01(\x0b\x32\x12.lnrpc.FundingShimH\x00\x12/\n\x0bshim_cancel\x18\x02 \x01(\x0b\x32\x18.lnrpc.FundingShimCancelH\x00\x12/\n\x0bpsbt_verify\x18\x03 \x01(\x0b\x32\x18.lnrpc.FundingPsbtVerifyH\x00\x12\x33\n\rpsbt_finalize\x18\x04 \x01(\x0b\x32\x1a.lnrpc.FundingPsbtFinalizeH\x00\x42\t\n\x07trigger\"\x16\n\x14\x46undingStateStepResp\"\x86\x01\n\x0bPendingHTLC\x12\x10\n\x08incoming\x18\x01 \x01(\x08\x12\x0e\n\x06\x61mount\x18\x02 \x01(\x03\x12\x10\n\x08outpoint\x18\x03 \x01(\t\x12\x17\n\x0fmaturity_height\x18\x04 \x01(\r\x12\x1b\n\x13\x62locks_til_maturity\x18\x05 \x01(\x05\x12\r\n\x05stage\x18\x06 \x01(\r\"\x18\n\x16PendingChannelsRequest\"\xcc\r\n\x17PendingChannelsResponse\x12\x1b\n\x13total_limbo_balance\x18\x01 \x01(\x03\x12P\n\x15pending_open_channels\x18\x02 \x03(\x0b\x32\x31.lnrpc.PendingChannelsResponse.PendingOpenChannel\x12R\n\x18pending_closing_channels\x18\x03 \x03(\x0b\x32,.lnrpc.PendingChannelsResponse.ClosedChannelB\x02\x18\x01\x12Y\n\x1epending_force_closing_channels\x18\x04 \x03(\x0b\x32\x31.lnrpc.PendingChannelsResponse.ForceClosedChannel\x12R\n\x16waiting_close_channels\x18\x05 \x03(\x0b\x32\x32.lnrpc.PendingChannelsResponse.WaitingCloseChannel\x1a\xb8\x02\n\x0ePendingChannel\x12\x17\n\x0fremote_node_pub\x18\x01 \x01(\t\x12\x15\n\rchannel_point\x18\x02 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x03 \x01(\x03\x12\x15\n\rlocal_balance\x18\x04 \x01(\x03\x12\x16\n\x0eremote_balance\x18\x05 \x01(\x03\x12\x1e\n\x16local_chan_reserve_sat\x18\x06 \x01(\x03\x12\x1f\n\x17remote_chan_reserve_sat\x18\x07 \x01(\x03\x12#\n\tinitiator\x18\x08 \x01(\x0e\x32\x10.lnrpc.Initiator\x12.\n\x0f\x63ommitment_type\x18\t \x01(\x0e\x32\x15.lnrpc.CommitmentType\x12\x1f\n\x17num_forwarding_packages\x18\n \x01(\x03\x1a\xb0\x01\n\x12PendingOpenChannel\x12>\n\x07\x63hannel\x18\x01 \x01(\x0b\x32-.lnrpc.PendingChannelsResponse.PendingChannel\x12\x1b\n\x13\x63onfirmation_height\x18\x02 \x01(\r\x12\x12\n\ncommit_fee\x18\x04 \x01(\x03\x12\x15\n\rcommit_weight\x18\x05 \x01(\x03\x12\x12\n\nfee_per_kw\x18\x06 \x01(\x03\x1a\xad\x01\n\x13WaitingCloseChannel\x12>\n\x07\x63hannel\x18\x01 \x01(\x0b\x32-.lnrpc.PendingChannelsResponse.PendingChannel\x12\x15\n\rlimbo_balance\x18\x02 \x01(\x03\x12?\n\x0b\x63ommitments\x18\x03 \x01(\x0b\x32*.lnrpc.PendingChannelsResponse.Commitments\x1a\xb7\x01\n\x0b\x43ommitments\x12\x12\n\nlocal_txid\x18\x01 \x01(\t\x12\x13\n\x0bremote_txid\x18\x02 \x01(\t\x12\x1b\n\x13remote_pending_txid\x18\x03 \x01(\t\x12\x1c\n\x14local_commit_fee_sat\x18\x04 \x01(\x04\x12\x1d\n\x15remote_commit_fee_sat\x18\x05 \x01(\x04\x12%\n\x1dremote_pending_commit_fee_sat\x18\x06 \x01(\x04\x1a\x65\n\rClosedChannel\x12>\n\x07\x63hannel\x18\x01 \x01(\x0b\x32-.lnrpc.PendingChannelsResponse.PendingChannel\x12\x14\n\x0c\x63losing_txid\x18\x02 \x01(\t\x1a\xff\x02\n\x12\x46orceClosedChannel\x12>\n\x07\x63hannel\x18\x01 \x01(\x0b\x32-.lnrpc.PendingChannelsResponse.PendingChannel\x12\x14\n\x0c\x63losing_txid\x18\x02 \x01(\t\x12\x15\n\rlimbo_balance\x18\x03 \x01(\x03\x12\x17\n\x0fmaturity_height\x18\x04 \x01(\r\x12\x1b\n\x13\x62locks_til_maturity\x18\x05 \x01(\x05\x12\x19\n\x11recovered_balance\x18\x06 \x01(\x03\x12)\n\rpending_htlcs\x18\x08 \x03(\x0b\x32\x12.lnrpc.PendingHTLC\x12M\n\x06\x61nchor\x18\t \x01(\x0e\x32=.lnrpc.PendingChannelsResponse.ForceClosedChannel.AnchorState\"1\n\x0b\x41nchorState\x12\t\n\x05LIMBO\x10\x00\x12\r\n\tRECOVERED\x10\x01\x12\x08\n\x04LOST\x10\x02\"\x1a\n\x18\x43hannelEventSubscription\"\x93\x04\n\x12\x43hannelEventUpdate\x12&\n\x0copen_channel\x18\x01 \x01(\x0b\x32\x0e.lnrpc.ChannelH\x00\x12\x34\n\x0e\x63losed_channel\x18\x02 \x01(\x0b\x32\x1a.lnrpc.ChannelCloseSummaryH\x00\x12-\n\x0e\x61\x63tive_channel\x18\x03 \x01(\x0b\x32\x13.lnrpc.ChannelPointH\x00\x12/\n\x10inactive_channel\x18\x04 \x01(\x0b\x32\x13.lnrpc.ChannelPointH\x00\x12\x34\n\x14pending_open_channel\x18\x06 \x01(\x0b\x32\x14.lnrpc.PendingUpdateH\x00\x12\x35\n\x16\x66ully_resolved_channel\x18\x07 \x01(\x0b\x32\x13.lnrpc.ChannelPointH\x00\x12\x32\n\x04type\x18\x05 \x01(\x0e\x32$.lnrpc.ChannelEventUpdate.UpdateType\"\x92\x01\n\nUpdateType\x12\x10\n\x0cOPEN_CHANNEL\x10\x00\x12\x12\n\x0e\x43LOSED_CHANNEL\x10\x01\x12\x12\n\x0e\x41\x43TIVE_CHANNEL\x10\x02\x12\x14\n\x10INACTIVE_CHANNEL\x10\x03\x12\x18\n\x14PENDING_OPEN_CHANNEL\x10\x04\x12\x1a\n\x16\x46ULLY_RESOLVED_CHANNEL\x10\x05\x42\t\n\x07\x63hannel\"N\n\x14WalletAccountBalance\x12\x19\n\x11\x63onfirmed_balance\x18\x01 \x01(\x03\x12\x1b\n\x13unconfirmed_balance\x18\x02 \x01(\x03\"\x16\n\x14WalletBalanceRequest\"\x85\x02\n\x15WalletBalanceResponse\x12\x15\n\rtotal_balance\x18\x01 \x01(\x03\x12\x19\n\x11\x63onfirmed_balance\x18\x02 \x01(\x03\x12\x1b\n\x13unconfirmed_balance\x18\x03 \x01(\x03\x12I\n\x0f\x61\x63\x63ount_balance\x18\x04 \x03(\x0b\x32\x30.lnrpc.WalletBalanceResponse.AccountBalanceEntry\x1aR\n\x13\x41\x63\x63ountBalanceEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12*\n\x05value\x18\x02 \x01(\x0b\x32\x1b.lnrpc.WalletAccountBalance:\x02\x38\x01\"#\n\x06\x41mount\x12\x0b\n\x03sat\x18\x01 \x01(\x04\x12\x0c\n\x04msat\x18\x02 \x01(\x04\"\x17\n\x15\x43hannelBalanceRequest\"\xe4\x02\n\x16\x43hannelBalanceResponse\x12\x13\n\x07\x62\x61lance\x18\x01 \x01(\x03\x42\x02\x18\x01\x12 \n\x14pending_open_balance\x18\x02 \x01(\x03\x42\x02\x18\x01\x12$\n\rlocal_balance\x18\x03 \x01(\x0b\x32\r.lnrpc.Amount\x12%\n\x0eremote_balance\x18\x04 \x01(\x0b\x32\r.lnrpc.Amount\x12.\n\x17unsettled_local_balance\x18\x05 \x01(\x0b\x32\r.lnrpc.Amount\x12/\n\x18unsettled_remote_balance\x18\x06 \x01(\x0b\x32\r.lnrpc.Amount\x12\x31\n\x1apending_open_local_balance\x18\x07 \x01(\x0b\x32\r.lnrpc.Amount\x12\x32\n\x1bpending_open_remote_balance\x18\x08 \x01(\x0b\x32\r.lnrpc.Amount\"\xd0\x04\n\x12QueryRoutesRequest\x12\x0f\n\x07pub_key\x18\x01 \x01(\t\x12\x0b\n\x03\x61mt\x18\x02 \x01(\x03\x12\x10\n\x08\x61mt_msat\x18\x0c \x01(\x03\x12\x18\n\x10\x66inal_cltv_delta\x18\x04 \x01(\x05\x12\"\n\tfee_limit\x18\x05 \x01(\x0b\x32\x0f.lnrpc.FeeLimit\x12\x15\n\rignored_nodes\x18\x06 \x03(\x0c\x12-\n\rignored_edges\x18\x07 \x03(\x0b\x32\x12.lnrpc.EdgeLocatorB\x02\x18\x01\x12\x16\n\x0esource_pub_key\x18\x08 \x01(\t\x12\x1b\n\x13use_mission_control\x18\t \x01(\x08\x12&\n\rignored_pairs\x18\n \x03(\x0b\x32\x0f.lnrpc.NodePair\x12\x12\n\ncltv_limit\x18\x0b \x01(\r\x12M\n\x13\x64\x65st_custom_records\x18\r \x03(\x0b\x32\x30.lnrpc.QueryRoutesRequest.DestCustomRecordsEntry\x12\x1c\n\x10outgoing_chan_id\x18\x0e \x01(\x04\x42\x02\x30\x01\x12\x17\n\x0flast_hop_pubkey\x18\x0f \x01(\x0c\x12%\n\x0broute_hints\x18\x10 \x03(\x0b\x32\x10.lnrpc.RouteHint\x12(\n\rdest_features\x18\x11 \x03(\x0e\x32\x11.lnrpc.FeatureBit\x1a\x38\n\x16\x44\x65stCustomRecordsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x04\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01J\x04\x08\x03\x10\x04\"$\n\x08NodePair\x12\x0c\n\x04\x66rom\x18\x01 \x01(\x0c\x12\n\n\x02to\x18\x02 \x01(\x0c\"@\n\x0b\x45\x64geLocator\x12\x16\n\nchannel_id\x18\x01 \x01(\x04\x42\x02\x30\x01\x12\x19\n\x11\x64irection_reverse\x18\x02 \x01(\x08\"I\n\x13QueryRoutesResponse\x12\x1c\n\x06routes\x18\x01 \x03(\x0b\x32\x0c.lnrpc.Route\x12\x14\n\x0csuccess_prob\x18\x02 \x01(\x01\"\x80\x03\n\x03Hop\x12\x13\n\x07\x63han_id\x18\x01 \x01(\x04\x42\x02\x30\x01\x12\x19\n\rchan_capacity\x18\x02 \x01(\x03\x42\x02\x18\x01\x12\x1a\n\x0e\x61mt_to_forward\x18\x03 \x01(\x03\x42\x02\x18\x01\x12\x0f\n\x03\x66\x65\x65\x18\x04 \x01(\x03\x42\x02\x18\x01\x12\x0e\n\x06\x65xpiry\x18\x05 \x01(\r\x12\x1b\n\x13\x61mt_to_forward_msat\x18\x06 \x01(\x03\x12\x10\n\x08\x66\x65\x65_msat\x18\x07 \x01(\x03\x12\x0f\n\x07pub_key\x18\x08 \x01(\t\x12\x13\n\x0btlv_payload\x18\t \x01(\x08\x12$\n\nmpp_record\x18\n \x01(\x0b\x32\x10.lnrpc.MPPRecord\x12$\n\namp_record\x18\x0c \x01(\x0b\x32\x10.lnrpc.AMPRecord\x12\x35\n\x0e\x63ustom_records\x18\x0b \x03(\x0b\x32\x1d.lnrpc.Hop.CustomRecordsEntry\x1a\x34\n\x12\x43ustomRecordsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x04\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\"9\n\tMPPRecord\x12\x14\n\x0cpayment_addr\x18\x0b \x01(\x0c\x12\x16\n\x0etotal_amt_msat\x18\n \x01(\x03\"D\n\tAMPRecord\x12\x12\n\nroot_share\x18\x01 \x01(\x0c\x12\x0e\n\x06set_id\x18\x02 \x01(\x0c\x12\x13\n\x0b\x63hild_index\x18\x03 \x01(\r\"\x9a\x01\n\x05Route\x12\x17\n\x0ftotal_time_lock\x18\x01 \x01(\r\x12\x16\n\ntotal_fees\x18\x02 \x01(\x03\x42\x02\x18\x01\x12\x15\n\ttotal_amt\x18\x03 \x01(\x03\x42\x02\x18\x01\x12\x18\n\x04hops\x18\x04 \x03(\x0b\x32\n.lnrpc.Hop\x12\x17\n\x0ftotal_fees_msat\x18\x05 \x01(\x03\x12\x16\n\x0etotal_amt_msat\x18\x06 \x01(\x03\"<\n\x0fNodeInfoRequest\x12\x0f\n\x07pub_key\x18\x01 \x01(\t\x12\x18\n\x10include_channels\x18\x02 \x01(\x08\"\x82\x01\n\x08NodeInfo\x12\"\n\x04node\x18\x01 \x01(\x0b\x32\x14.lnrpc.LightningNode\x12\x14\n\x0cnum_channels\x18\x02 \x01(\r\x12\x16\n\x0etotal_capacity\x18\x03 \x01(\x03\x12$\n\x08\x63hannels\x18\x04 \x03(\x0b\x32\x12.lnrpc.ChannelEdge\"\xf1\x01\n\rLightningNode\x12\x13\n\x0blast_update\x18\x01 \x01(\r\x12\x0f\n\x07pub_key\x18\x02 \x01(\t\x12\r\n\x05\x61lias\x18\x03 \x01(\t\x12%\n\taddresses\x18\x04 \x03(\x0b\x32\x12.lnrpc.NodeAddress\x12\r\n\x05\x63olor\x18\x05 \x01(\t\x12\x34\n\x08\x66\x65\x61tures\x18\x06 \x03(\x0b\x32\".lnrpc.LightningNode.FeaturesEntry\x1a?\n\rFeaturesEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\x1d\n\x05value\x18\x02 \x01(\x0b\x32\x0e.lnrpc.Feature:\x02\x38\x01\",\n\x0bNodeAddress\x12\x0f\n\x07network\x18\x01 \x01(\t\x12\x0c\n\x04\x61\x64\x64r\x18\x02 \x01(\t\"\xac\x01\n\rRoutingPolicy\x12\x17\n\x0ftime_lock_delta\x18\x01 \x01(\r\x12\x10\n\x08min_htlc\x18\x02 \x01(\x03\x12\x15\n\rfee_base_msat\x18\x03 \x01(\x03\x12\x1b\n\x13\x66\x65\x65_rate_milli_msat\x18\x04 \x01(\x03\x12\x10\n\x08\x64isabled\x18\x05 \x01(\x08\x12\x15\n\rmax_htlc_msat\x18\x06 \x01(\x04\x12\x13\n\x0blast_update\x18\x07 \x01(\r\"\xe2\x01\n\x0b\x43hannelEdge\x12\x16\n\nchannel_id\x18\x01 \x01(\x04\x42\x02\x30\x01\x12\x12\n\nchan_point\x18\x02 \x01(\t\x12\x17\n\x0blast_update\x18\x03 \x01(\rB\x02\x18\x01\x12\x11\n\tnode1_pub\x18\x04 \x01(\t\x12\x11\n\tnode2_pub\x18\x05 \x01(\t\x12\x10\n\x08\x63\x61pacity\x18\x06 \x01(\x03\x12*\n\x0cnode1_policy\x18\x07 \x01(\x0b\x32\x14.lnrpc.RoutingPolicy\x12*\n\x0cnode2_policy\x18\x08 \x01(\x0b\x32\x14.lnrpc.RoutingPolicy\"2\n\x13\x43hannelGraphRequest\x12\x1b\n\x13include_unannounced\x18\x01 \x01(\x08\"V\n\x0c\x43hannelGraph\x12#\n\x05nodes\x18\x01 \x03(\x0b\x32\x14.lnrpc.LightningNode\x12!\n\x05\x65\x64ges\x18\x02 \x03(\x0b\x32\x12.lnrpc.ChannelEdge\":\n\x12NodeMetricsRequest\x12$\n\x05types\x18\x01 \x03(\x0e\x32\x15.lnrpc.NodeMetricType\"\xbe\x01\n\x13NodeMetricsResponse\x12U\n\x16\x62\x65tweenness_centrality\x18\x01 \x03(\x0b\x32\x35.lnrpc.NodeMetricsResponse.BetweennessCentralityEntry\x1aP\n\x1a\x42\x65tweennessCentralityEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12!\n\x05value\x18\x02 \x01(\x0b\x32\x12.lnrpc.FloatMetric:\x02\x38\x01\"6\n\x0b\x46loatMetric\x12\r\n\x05value\x18\x01 \x01(\x01\x12\x18\n\x10normalized_value\x18\x02 \x01(\x01\"&\n\x0f\x43hanInfoRequest\x12\x13\n\x07\x63han_id\x18\x01 \x01(\x04\x42\x02\x30\x01\"\x14\n\x12NetworkInfoRequest\"\xa7\x02\n\x0bNetworkInfo\x12\x16\n\x0egraph_diameter\x18\x01 \x01(\r\x12\x16\n\x0e\x61vg_out_degree\x18\x02 \x01(\x01\x12\x16\n\x0emax_out_degree\x18\x03 \x01(\r\x12\x11\n\tnum_nodes\x18\x04 \x01(\r\x12\x14\n\x0cnum_channels\x18\x05 \x01(\r\x12\x1e\n\x16total_network_capacity\x18\x06 \x01(\x03\x12\x18\n\x10\x61vg_channel_size\x18\x07 \x01(\x01\x12\x18\n\x10min_channel_size\x18\x08 \x01(\x03\x12\x18\n\x10max_channel_size\x18\t \x01(\x03\x12\x1f\n\x17median_channel_size_sat\x18\n \x01(\x03\x12\x18\n\x10num_zombie_chans\x18\x0b \x01(\x04\"\r\n\x0bStopRequest\"\x0e\n\x0cStopResponse\"\x1b\n\x19GraphTopologySubscription\"\xa3\x01\n\x13GraphTopologyUpdate\x12\'\n\x0cnode_updates\x18\x01 \x03(\x0b\x32\x11.lnrpc.NodeUpdate\x12\x31\n\x0f\x63hannel_updates\x18\x02 \x03(\x0b\x32\x18.lnrpc.ChannelEdgeUpdate\x12\x30\n\x0c\x63losed_chans\x18\x03 \x03(\x0b\x32\x1a.lnrpc.ClosedChannelUpdate\"\x94\x02\n\nNodeUpdate\x12\x15\n\taddresses\x18\x01 \x03(\tB\x02\x18\x01\x12\x14\n\x0cidentity_key\x18\x02 \x01(\t\x12\x1b\n\x0fglobal_features\x18\x03 \x01(\x0c\x42\x02\x18\x01\x12\r\n\x05\x61lias\x18\x04 \x01(\t\x12\r\n\x05\x63olor\x18\x05 \x01(\t\x12*\n\x0enode_addresses\x18\x07 \x03(\x0b\x32\x12.lnrpc.NodeAddress\x12\x31\n\x08\x66\x65\x61tures\x18\x06 \x03(\x0b\x32\x1f.lnrpc.NodeUpdate.FeaturesEntry\x1a?\n\rFeaturesEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\x1d\n\x05value\x18\x02 \x01(\x0b\x32\x0e.lnrpc.Feature:\x02\x38\x01\"\xc4\x01\n\x11\x43hannelEdgeUpdate\x12\x13\n\x07\x63han_id\x18\x01 \x01(\x04\x42\x02\x30\x01\x12\'\n\nchan_point\x18\x02 \x01(\x0b\x32\x13.lnrpc.ChannelPoint\x12\x10\n\x08\x63\x61pacity\x18\x03 \x01(\x03\x12,\n\x0erouting_policy\x18\x04 \x01(\x0b\x32\x14.lnrpc.RoutingPolicy\x12\x18\n\x10\x61\x64vertising_node\x18\x05 \x01(\t\x12\x17\n\x0f\x63onnecting_node\x18\x06 \x01(\t\"|\n\x13\x43losedChannelUpdate\x12\x13\n\x07\x63han_id\x18\x01 \x01(\x04\x42\x02\x30\x01\x12\x10\n\x08\x63\x61pacity\x18\x02 \x01(\x03\x12\x15\n\rclosed_height\x18\x03 \x01(\r\x12\'\n\nchan_point\x18\x04 \x01(\x0b\x32\x13.lnrpc.ChannelPoint\"\x86\x01\n\x07HopHint\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x13\n\x07\x63han_id\x18\x02 \x01(\x04\x42\x02\x30\x01\x12\x15\n\rfee_base_msat\x18\x03 \x01(\r\x12#\n\x1b\x66\x65\x65_proportional_millionths\x18\x04 \x01(\r\x12\x19\n\x11\x63ltv_expiry_delta\x18\x05 \x01(\r\".\n\tRouteHint\x12!\n\thop_hints\x18\x01 \x03(\x0b\x32\x0e.lnrpc.HopHint\"\xf5\x05\n\x07Invoice\x12\x0c\n\x04memo\x18\x01 \x01(\t\x12\x12\n\nr_preimage\x18\x03 \x01(\x0c\x12\x0e\n\x06r_hash\x18\x04 \x01(\x0c\x12\r\n\x05value\x18\x05 \x01(\x03\x12\x12\n\nvalue_msat\x18\x17 \x01(\x03\x12\x13\n\x07settled\x18\x06 \x01(\x08\x42\x02\x18\x01\x12\x15\n\rcreation_date\x18\x07 \x01(\x03\x12\x13\n\x0bsettle_date\x18\x08 \x01(\x03\x12\x17\n\x0fpayment_request\x18\t \x01(\t\x12\x18\n\x10\x64\x65scription_hash\x18\n \x01(\x0c\x12\x0e\n\x06\x65xpiry\x18\x0b \x01(\x03\x12\x15\n\rfallback_addr\x18\x0c \x01(\t\x12\x13\n\x0b\x63ltv_expiry\x18\r \x01(\x04\x12%\n\x0broute_hints\x18\x0e \x03(\x0b\x32\x10.lnrpc.RouteHint\x12\x0f\n\x07private\x18\x0f \x01(\x08\x12\x11\n\tadd_index\x18\x10 \x01(\x04\x12\x14\n\x0csettle_index\x18\x11 \x01(\x04\x12\x14\n\x08\x61mt_paid\x18\x12 \x01(\x03\x42\x02\x18\x01\x12\x14\n\x0c\x61mt_paid_sat\x18\x13 \x01(\x03\x12\x15\n\ramt_paid_msat\x18\x14 \x01(\x03\x12*\n\x05state\x18\x15 \x01(\x0e\x32\x1b.lnrpc.Invoice.InvoiceState\x12!\n\x05htlcs\x18\x16 \x03(\x0b\x32\x12.lnrpc.InvoiceHTLC\x12.\n\x08\x66\x65\x61tures\x18\x18 \x03(\x0b\x32\x1c.lnrpc.Invoice.FeaturesEntry\x12\x12\n\nis_keysend\x18\x19 \x01(\x08\x12\x14\n\x0cpayment_addr\x18\x1a \x01(\x0c\x12\x0e\n\x06is_amp\x18\x1b \x01(\x08\x1a?\n\rFeaturesEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\x1d\n\x05value\x18\x02 \x01(\x0b\x32\x0e.lnrpc.Feature:\x02\x38\x01\"A\n\x0cInvoiceState\x12\x08\n\x04OPEN\x10\x00\x12\x0b\n\x07SETTLED\x10\x01\x12\x0c\n\x08\x43\x41NCELED\x10\x02\x12\x0c\n\x08\x41\x43\x43\x45PTED\x10\x03J\x04\x08\x02\x10\x03\"\xf3\x02\n\x0bInvoiceHTLC\x12\x13\n\x07\x63han_id\x18\x01 \x01(\x04\x42\x02\x30\x01\x12\x12\n\nhtlc_index\x18\x02 \x01(\x04\x12\x10\n\x08\x61mt_msat\x18\x03 \x01(\x04\x12\x15\n\raccept_height\x18\x04 \x01(\x05\x12\x13\n\x0b\x61\x63\x63\x65pt_time\x18\x05 \x01(\x03\x12\x14\n\x0cresolve_time\x18\x06 \x01(\x03\x12\x15\n\rexpiry_height\x18\x07 \x01(\x05\x12&\n\x05state\x18\x08 \x01(\x0e\x32\x17.lnrpc.InvoiceHTLCState\x12=\n\x0e\x63ustom_records\x18\t \x03(\x0b\x32%.lnrpc.InvoiceHTLC.CustomRecordsEntry\x12\x1a\n\x12mpp_total_amt_msat\x18\n \x01(\x04\x12\x17\n\x03\x61mp\x18\x0b \x01(\x0b\x32\n.lnrpc.AMP\x1a\x34\n\x12\x43ustomRecordsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x04\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\"^\n\x03\x41MP\x12\x12\n\nroot_share\x18\x01 \x01(\x0c\x12\x0e\n\x06set_id\x18\x02 \x01(\x0c\x12\x13\n\x0b\x63hild_index\x18\x03 \x01(\r\x12\x0c\n\x04hash\x18\x04 \x01(\x0c\x12\x10\n\x08preimage\x18\x05 \x01(\x0c\"f\n\x12\x41\x64\x64InvoiceResponse\x12\x0e\n\x06r_hash\x18\x01 \x01(\x0c\x12\x17\n\x0fpayment_request\x18\x02 \x01(\t\x12\x11\n\tadd_index\x18\x10 \x01(\x04\x12\x14\n\x0cpayment_addr\x18\x11 \x01(\x0c\"5\n\x0bPaymentHash\x12\x16\n\nr_hash_str\x18\x01 \x01(\tB\x02\x18\x01\x12\x0e\n\x06r_hash\x18\x02 \x01(\x0c\"l\n\x12ListInvoiceRequest\x12\x14\n\x0cpending_only\x18\x01 \x01(\x08\x12\x14\n\x0cindex_offset\x18\x04 \x01(\x04\x12\x18\n\x10num_max_invoices\x18\x05 \x01(\x04\x12\x10\n\x08reversed\x18\x06 \x01(\x08\"n\n\x13ListInvoiceResponse\x12 \n\x08invoices\x18\x01 \x03(\x0b\x32\x0e.lnrpc.Invoice\x12\x19\n\x11last_index_offset\x18\x02 \x01(\x04\x12\x1a\n\x12\x66irst_index_offset\x18\x03 \x01(\x04\">\n\x13InvoiceSubscription\x12\x11\n\tadd_index\x18\x01 \x01(\x04\x12\x14\n\x0csettle_index\x18\x02 \x01(\x04\"\xe0\x03\n\x07Payment\x12\x14\n\x0cpayment_hash\x18\x01 \x01(\t\x12\x11\n\x05value\x18\x02 \x01(\x03\x42\x02\x18\x01\x12\x19\n\rcreation_date\x18\x03 \x01(\x03\x42\x02\x18\x01\x12\x0f\n\x03\x66\x65\x65\x18\x05 \x01(\x03\x42\x02\x18\x01\x12\x18\n\x10payment_preimage\x18\x06 \x01(\t\x12\x11\n\tvalue_sat\x18\x07 \x01(\x03\x12\x12\n\nvalue_msat\x18\x08 \x01(\x03\x12\x17\n\x0fpayment_request\x18\t \x01(\t\x12,\n\x06status\x18\n \x01(\x0e\x32\x1c.lnrpc.Payment.PaymentStatus\x12\x0f\n\x07\x66\x65\x65_sat\x18\x0b \x01(\x03\x12\x10\n\x08\x66\x65\x65_msat\x18\x0c \x01(\x03\x12\x18\n\x10\x63reation_time_ns\x18\r \x01(\x03\x12!\n\x05htlcs\x18\x0e \x03(\x0b\x32\x12.lnrpc.HTLCAttempt\x12\x15\n\rpayment_index\x18\x0f \x01(\x04\x12\x33\n\x0e\x66\x61ilure_reason\x18\x10 \x01(\x0e\x32\x1b.lnrpc.PaymentFailureReason\"F\n\rPaymentStatus\x12\x0b\n\x07UNKNOWN\x10\x00\x12\r\n\tIN_FLIGHT\x10\x01\x12\r\n\tSUCCEEDED\x10\x02\x12\n\n\x06\x46\x41ILED\x10\x03J\x04\x08\x04\x10\x05\"\x8a\x02\n\x0bHTLCAttempt\x12\x12\n\nattempt_id\x18\x07 \x01(\x04\x12-\n\x06status\x18\x01 \x01(\x0e\x32\x1d.lnrpc.HTLCAttempt.HTLCStatus\x12\x1b\n\x05route\x18\x02 \x01(\x0b\x32\x0c.lnrpc.Route\x12\x17\n\x0f\x61ttempt_time_ns\x18\x03 \x01(\x03\x12\x17\n\x0fresolve_time_ns\x18\x04 \x01(\x03\x12\x1f\n\x07\x66\x61ilure\x18\x05 \x01(\x0b\x32\x0e.lnrpc.Failure\x12\x10\n\x08preimage\x18\x06 \x01(\x0c\"6\n\nHTLCStatus\x12\r\n\tIN_FLIGHT\x10\x00\x12\r\n\tSUCCEEDED\x10\x01\x12\n\n\x06\x46\x41ILED\x10\x02\"o\n\x13ListPaymentsRequest\x12\x1a\n\x12include_incomplete\x18\x01 \x01(\x08\x12\x14\n\x0cindex_offset\x18\x02 \x01(\x04\x12\x14\n\x0cmax_payments\x18\x03 \x01(\x04\x12\x10\n\x08reversed\x18\x04 \x01(\x08\"o\n\x14ListPaymentsResponse\x12 \n\x08payments\x18\x01 \x03(\x0b\x32\x0e.lnrpc.Payment\x12\x1a\n\x12\x66irst_index_offset\x18\x02 \x01(\x04\x12\x19\n\x11last_index_offset\x18\x03 \x01(\x04\"G\n\x14\x44\x65letePaymentRequest\x12\x14\n\x0cpayment_hash\x18\x01 \x01(\x0c\x12\x19\n\x11\x66\x61iled_htlcs_only\x18\x02 \x01(\x08\"S\n\x18\x44\x65leteAllPaymentsRequest\x12\x1c\n\x14\x66\x61iled_payments_only\x18\x01 \x01(\x08\x12\x19\n\x11\x66\x61iled_htlcs_only\x18\x02 \x01(\x08\"\x17\n\x15\x44\x65letePaymentResponse\"\x1b\n\x19\x44\x65leteAllPaymentsResponse\"\x86\x01\n\x15\x41\x62\x61ndonChannelRequest\x12*\n\rchannel_point\x18\x01 \x01(\x0b\x32\x13.lnrpc.ChannelPoint\x12!\n\x19pending_funding_shim_only\x18\x02 \x01(\x08\x12\x1e\n\x16i_know_what_i_am_doing\x18\x03 \x01(\x08\"\x18\n\x16\x41\x62\x61ndonChannelResponse\"5\n\x11\x44\x65\x62ugLevelRequest\x12\x0c\n\x04show\x18\x01 \x01(\x08\x12\x12\n\nlevel_spec\x18\x02 \x01(\t\")\n\x12\x44\x65\x62ugLevelResponse\x12\x13\n\x0bsub_systems\x18\x01 \x01(\t\"\x1f\n\x0cPayReqString\x12\x0f\n\x07pay_req\x18\x01 \x01(\t\"\x86\x03\n\x06PayReq\x12\x13\n\x0b\x64\x65stination\x18\x01 \x01(\t\x12\x14\n\x0cpayment_hash\x18\x02 \x01(\t\x12\x14\n\x0cnum_satoshis\x18\x03 \x01(\x03\x12\x11\n\ttimestamp\x18\x04 \x01(\x03\x12\x0e\n\x06\x65xpiry\x18\x05 \x01(\x03\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\x18\n\x10\x64\x65scription_hash\x18\x07 \x01(\t\x12\x15\n\rfallback_addr\x18\x08 \x01(\t\x12\x13\n\x0b\x63ltv_expiry\x18\t \x01(\x03\x12%\n\x0broute_hints\x18\n \x03(\x0b\x32\x10.lnrpc.RouteHint\x12\x14\n\x0cpayment_addr\x18\x0b \x01(\x0c\x12\x10\n\x08num_msat\x18\x0c \x01(\x03\x12-\n\x08\x66\x65\x61tures\x18\r \x03(\x0b\x32\x1b.lnrpc.PayReq.FeaturesEntry\x1a?\n\rFeaturesEntry\x12\x0b\n\x03key\x18\x01 \x01(\r\x12\x1d\n\x05value\x18\x02 \x01(\x0b\x32\x0e.lnrpc.Feature:\x02\x38\x01\">\n\x07\x46\x65\x61ture\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bis_required\x18\x03 \x01(\x08\x12\x10\n\x08is_known\x18\x04 \x01(\x08\"\x12\n\x10\x46\x65\x65ReportRequest\"|\n\x10\x43hannelFeeReport\x12\x13\n\x07\x63han_id\x18\x05 \x01(\x04\x42\x02\x30\x01\x12\x15\n\rchannel_point\x18\x01 \x01(\t\x12\x15\n\rbase_fee_msat\x18\x02 \x01(\x03\x12\x13\n\x0b\x66\x65\x65_per_mil\x18\x03 \x01(\x03\x12\x10\n\x08\x66\x65\x65_rate\x18\x04 \x01(\x01\"\x84\x01\n\x11\x46\x65\x65ReportResponse\x12-\n\x0c\x63hannel_fees\x18\x01 \x03(\x0b\x32\x17.lnrpc.ChannelFeeReport\x12\x13\n\x0b\x64\x61y_fee_sum\x18\x02 \x01(\x04\x12\x14\n\x0cweek_fee_sum\x18\x03 \x01(\x04\x12\x15\n\rmonth_fee_sum\x18\x04 \x01(\x04\"\xec\x01\n\x13PolicyUpdateRequest\x12\x10\n\x06global\x18\x01 \x01(\x08H\x00\x12)\n\nchan_point\x18\x02 \x01(\x0b\x32\x13.lnrpc.ChannelPointH\x00\x12\x15\n\rbase_fee_msat\x18\x03 \x01(\x03\x12\x10\n\x08\x66\x65\x65_rate\x18\x04 \x01(\x01\x12\x17\n\x0ftime_lock_delta\x18\x05 \x01(\r\x12\x15\n\rmax_htlc_msat\x18\x06 \x01(\x04\x12\x15\n\rmin_htlc_msat\x18\x07 \x01(\x04\x12\x1f\n\x17min_htlc_msat_specified\x18\x08 \x01(\x08\x42\x07\n\x05scope\"m\n\x0c\x46\x61iledUpdate\x12!\n\x08outpoint\x18\x01 \x01(\x0b\x32\x0f.lnrpc.OutPoint\x12$\n\x06reason\x18\x02 \x01(\x0e\x32\x14.lnrpc.UpdateFailure\x12\x14\n\x0cupdate_error\x18\x03 \x01(\t\"C\n\x14PolicyUpdateResponse\x12+\n\x0e\x66\x61iled_updates\x18\x01 \x03(\x0b\x32\x13.lnrpc.FailedUpdate\"n\n\x18\x46orwardingHistoryRequest\x12\x12\n\nstart_time\x18\x01 \x01(\x04\x12\x10\n\x08\x65nd_time\x18\x02 \x01(\x04\x12\x14\n\x0cindex_offset\x18\x03 \x01(\r\x12\x16\n\x0enum_max_events\x18\x04 \x01(\r\"\xda\x01\n\x0f\x46orwardingEvent\x12\x15\n\ttimestamp\x18\x01 \x01(\x04\x42\x02\x18\x01\x12\x16\n\nchan_id_in\x18\x02 \x01(\x04\x42\x02\x30\x01\x12\x17\n\x0b\x63han_id_out\x18\x04 \x01(\x04\x42\x02\x30\x01\x12\x0e\n\x06\x61mt_in\x18\x05 \x01(\x04\x12\x0f\n\x07\x61mt_out\x18\x06 \x01(\x04\x12\x0b\n\x03\x66\x65\x65\x18\x07 \x01(\x04\x12\x10\n\x08\x66\x65\x65_msat\x18\x08 \x01(\x04\x12\x13\n\x0b\x61mt_in_msat\x18\t \x01(\x04\x12\x14\n\x0c\x61mt_out_msat\x18\n \x01(\x04\x12\x14\n\x0ctimestamp_ns\x18\x0b \x01(\x04\"i\n\x19\x46orwardingHistoryResponse\x12\x31\n\x11\x66orwarding_events\x18\x01 \x03(\x0b\x32\x16.lnrpc.ForwardingEvent\x12\x19\n\x11last_offset_index\x18\x02 \x01(\r\"E\n\x1a\x45xportChannelBackupRequest\x12\'\n\nchan_point\x18\x01 \x01(\x0b\x32\x13.lnrpc.ChannelPoint\"M\n\rChannelBackup\x12\'\n\nchan_point\x18\x01 \x01(\x0b\x32\x13.lnrpc.ChannelPoint\x12\x13\n\x0b\x63han_backup\x18\x02 \x01(\x0c\"V\n\x0fMultiChanBackup\x12(\n\x0b\x63han_points\x18\x01 \x03(\x0b\x32\x13.lnrpc.ChannelPoint\x12\x19\n\x11multi_chan_backup\x18\x02 \x01(\x0c\"\x19\n\x17\x43hanBackupExportRequest\"{\n\x12\x43hanBackupSnapshot\x12\x32\n\x13single_chan_backups\x18\x01 \x01(\x0b\x32\x15.lnrpc.ChannelBackups\x12\x31\n\x11multi_chan_backup\x18\x02 \x01(\x0b\x32\x16.lnrpc.MultiChanBackup\"<\n\x0e\x43hannelBackups\x12*\n\x0c\x63han_backups\x18\x01 \x03(\x0b\x32\x14.lnrpc.ChannelBackup\"p\n\x18RestoreChanBackupRequest\x12-\n\x0c\x63han_backups\x18\x01 \x01(\x0b\x32\x15.lnrpc.ChannelBackupsH\x00\x12\x1b\n\x11multi_chan_backup\x18\x02 \x01(\x0cH\x00\x42\x08\n\x06\x62\x61\x63kup\"\x17\n\x15RestoreBackupResponse\"\x1b\n\x19\x43hannelBackupSubscription\"\x1a\n\x18VerifyChanBackupResponse\"4\n\x12MacaroonPermission\x12\x0e\n\x06\x65ntity\x18\x01 \x01(\t\x12\x0e\n\x06\x61\x63tion\x18\x02 \x01(\t\"~\n\x13\x42\x61keMacaroonRequest\x12.\n\x0bpermissions\x18\x01 \x03(\x0b\x32\x19.lnrpc.MacaroonPermission\x12\x13\n\x0broot_key_id\x18\x02 \x01(\x04\x12\"\n\x1a\x61llow_external_permissions\x18\x03 \x01(\x08\"(\n\x14\x42\x61keMacaroonResponse\x12\x10\n\x08macaroon\x18\x01 \x01(\t\"\x18\n\x16ListMacaroonIDsRequest\"/\n\x17ListMacaroonIDsResponse\x12\x14\n\x0croot_key_ids\x18\x01 \x03(\x04\".\n\x17\x44\x65leteMacaroonIDRequest\x12\x13\n\x0broot_key_id\x18\x01 \x01(\x04\"+\n\x18\x44\x65leteMacaroonIDResponse\x12\x0f\n\x07\x64\x65leted\x18\x01 \x01(\x08\"H\n\x16MacaroonPermissionList\x12.\n\x0bpermissions\x18\x01 \x03(\x0b\x32\x19.lnrpc.MacaroonPermission\"\x18\n\x16ListPermissionsRequest\"\xc5\x01\n\x17ListPermissionsResponse\x12Q\n\x12method_permissions\x18\x01 \x03(\x0b\x32\x35.lnrpc.ListPermissionsResponse.MethodPermissionsEntry\x1aW\n\x16MethodPermissionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12,\n\x05value\x18\x02 \x01(\x0b\x32\x1d.lnrpc.MacaroonPermissionList:\x02\x38\x01\"\xd5\x07\n\x07\x46\x61ilure\x12(\n\x04\x63ode\x18\x01 \x01(\x0e\x32\x1a.lnrpc.Failure.FailureCode\x12,\n\x0e\x63hannel_update\x18\x03 \x01(\x0b\x32\x14.lnrpc.ChannelUpdate\x12\x11\n\thtlc_msat\x18\x04 \x01(\x04\x12\x15\n\ronion_sha_256\x18\x05 \x01(\x0c\x12\x13\n\x0b\x63ltv_expiry\x18\x06 \x01(\r\x12\r\n\x05\x66lags\x18\x07 \x01(\r\x12\x1c\n\x14\x66\x61ilure_source_index\x18\x08 \x01(\r\x12\x0e\n\x06height\x18\t \x01(\r\"\xef\x05\n\x0b\x46\x61ilureCode\x12\x0c\n\x08RESERVED\x10\x00\x12(\n$INCORRECT_OR_UNKNOWN_PAYMENT_DETAILS\x10\x01\x12\x1c\n\x18INCORRECT_PAYMENT_AMOUNT\x10\x02\x12\x1f\n\x1b\x46INAL_INCORRECT_CLTV_EXPIRY\x10\x03\x12\x1f\n\x1b\x46INAL_INCORRECT_HTLC_AMOUNT\x10\x04\x12\x19\n\x15\x46INAL_EXPIRY_TOO_SOON\x10\x05\x12\x11\n\rINVALID_REALM\x10\x06\x12\x13\n\x0f\x45XPIRY_TOO_SOON\x10\x07\x12\x19\n\x15INVALID_ONION_VERSION\x10\x08\x12\x16\n\x12INVALID_ONION_HMAC\x10\t\x12\x15\n\x11INVALID_ONION_KEY\x10\n\x12\x18\n\x14\x41MOUNT_BELOW_MINIMUM\x10\x0b\x12\x14\n\x10\x46\x45\x45_INSUFFICIENT\x10\x0c\x12\x19\n\x15INCORRECT_CLTV_EXPIRY\x10\r\x12\x14\n\x10\x43HANNEL_DISABLED\x10\x0e\x12\x1d\n\x19TEMPORARY_CHANNEL_FAILURE\x10\x0f\x12!\n\x1dREQUIRED_NODE_FEATURE_MISSING\x10\x10\x12$\n REQUIRED_CHANNEL_FEATURE_MISSING\x10\x11\x12\x15\n\x11UNKNOWN_NEXT_PEER\x10\x12\x12\x1a\n\x16TEMPORARY_NODE_FAILURE\x10\x13\x12\x1a\n\x16PERMANENT_NODE_FAILURE\x10\x14\x12\x1d\n\x19PERMANENT_CHANNEL_FAILURE\x10\x15\x12\x12\n\x0e\x45XPIRY_TOO_FAR\x10\x16\x12\x0f\n\x0bMPP_TIMEOUT\x10\x17\x12\x19\n\x15INVALID_ONION_PAYLOAD\x10\x18\x12\x15\n\x10INTERNAL_FAILURE\x10\xe5\x07\x12\x14\n\x0fUNKNOWN_FAILURE\x10\xe6\x07\x12\x17\n\x12UNREADABLE_FAILURE\x10\xe7\x07J\x04\x08\x02\x10\x03\"\x9a\x02\n\rChannelUpdate\x12\x11\n\tsignature\x18\x01 \x01(\x0c\x12\x12\n\nchain_hash\x18\x02 \x01(\x0c\x12\x13\n\x07\x63han_id\x18\x03 \x01(\x04\x42\x02\x30\x01\x12\x11\n\ttimestamp\x18\x04 \x01(\r\x12\x15\n\rmessage_flags\x18\n \x01(\r\x12\x15\n\rchannel_flags\x18\x05 \x01(\r\x12\x17\n\x0ftime_lock_delta\x18\x06 \x01(\r\x12\x19\n\x11htlc_minimum_msat\x18\x07 \x01(\x04\x12\x10\n\x08\x62\x61se_fee\x18\x08 \x01(\r\x12\x10\n\x08\x66\x65\x65_rate\x18\t \x01(\r\x12\x19\n\x11htlc_maximum_msat\x18\x0b \x01(\x04\x12\x19\n\x11\x65xtra_opaque_data\x18\x0c \x01(\x0c\"F\n\nMacaroonId\x12\r\n\x05nonce\x18\x01 \x01(\x0c\x12\x11\n\tstorageId\x18\x02 \x01(\x0c\x12\x16\n\x03ops\x18\x03 \x03(\x0b\x32\t.lnrpc.Op\"%\n\x02Op\x12\x0e\n\x06\x65ntity\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x63tions\x18\x02 \x03(\t\"k\n\x13\x43heckMacPermRequest\x12\x10\n\x08macaroon\x18\x01 \x01(\x0c\x12.\n\x0bpermissions\x18\x02 \x03(\x0b\x32\x19.lnrpc.MacaroonPermission\x12\x12\n\nfullMethod\x18\x03 \x01(\t\"%\n\x14\x43heckMacPermResponse\x12\r\n\x05valid\x18\x01 \x01(\x08\"\xea\x01\n\x14RPCMiddlewareRequest\x12\x12\n\nrequest_id\x18\x01 \x01(\x04\x12\x14\n\x0craw_macaroon\x18\x02 \x01(\x0c\x12\x1f\n\x17\x63ustom_caveat_condition\x18\x03 \x01(\t\x12(\n\x0bstream_auth\x18\x04 \x01(\x0b\x32\x11.lnrpc.StreamAuthH\x00\x12$\n\x07request\x18\x05 \x01(\x0b\x32\x11.lnrpc.RPCMessageH\x00\x12%\n\x08response\x18\x06 \x01(\x0b\x32\x11.lnrpc.RPCMessageH\x00\x42\x10\n\x0eintercept_type\"%\n\nStreamAuth\x12\x17\n\x0fmethod_full_uri\x18\x01 \x01(\t\"`\n\nRPCMessage\x12\x17\n\x0fmethod_full_uri\x18\x01 \x01(\t\x12\x12\n\nstream_rpc\x18\x02 \x01(\x08\x12\x11\n\ttype_name\x18\x03 \x01(\t\x12\x12\n\nserialized\x18\x04 \x01(\x0c\"\xa2\x01\n\x15RPCMiddlewareResponse\x12\x12\n\nrequest_id\x18\x01 \x01(\x04\x12\x31\n\x08register\x18\x02 \x01(\x0b\x32\x1d.lnrpc.MiddlewareRegistrationH\x00\x12,\n\x08\x66\x65\x65\x64\x62\x61\x63k\x18\x03 \x01(\x0b\x32\x18.lnrpc.InterceptFeedbackH\x00\x42\x14\n\x12middleware_message\"n\n\x16MiddlewareRegistration\x12\x17\n\x0fmiddleware_name\x18\x01 \x01(\t\x12#\n\x1b\x63ustom_macaroon_caveat_name\x18\x02 \x01(\t\x12\x16\n\x0eread_only_mode\x18\x03 \x01(\x08\"\\\n\x11InterceptFeedback\x12\r\n\x05\x65rror\x18\x01 \x01(\t\x12\x18\n\x10replace_response\x18\x02 \x01(\x08\x12\x1e\n\x16replacement_serialized\x18\x03 \x01(\x0c*}\n\x0b\x41\x64\x64ressType\x12\x17\n\x13WITNESS_PUBKEY_HASH\x10\x00\x12\x16\n\x12NESTED_PUBKEY_HASH\x10\x01\x12\x1e\n\x1aUNUSED_WITNESS_PUBKEY_HASH\x10\x02\x12\x1d\n\x19UNUSED_NESTED_PUBKEY_HASH\x10\x03*]\n\x0e\x43ommitmentType\x12\x1b\n\x17UNKNOWN_COMMITMENT_TYPE\x10\x00\x12\n\n\x06LEGACY\x10\x01\x12\x15\n\x11STATIC_REMOTE_KEY\x10\x02\x12\x0b\n\x07\x41NCHORS\x10\x03*a\n\tInitiator\x12\x15\n\x11INITIATOR_UNKNOWN\x10\x00\x12\x13\n\x0fINITIATOR_LOCAL\x10\x01\x12\x14\n\x10INITIATOR_REMOTE\x10\x02\x12\x12\n\x0eINITIATOR_BOTH\x10\x03*`\n\x0eResolutionType\x12\x10\n\x0cTYPE_UNKNOWN\x10\x00\x12\n\n\x06\x41NCHOR\x10\x01\x12\x11\n\rINCOMING_HTLC\x10\x02\x12\x11\n\rOUTGOING_HTLC\x10\x03\x12\n\n\x06\x43OMMIT\x10\x04*q\n\x11ResolutionOutcome\x12\x13\n\x0fOUTCOME_UNKNOWN\x10\x00\x12\x0b\n\x07\x43LAIMED\x10\x01\x12\r\n\tUNCLAIMED\x10\x02\x12\r\n\tABANDONED\x10\x03\x12\x0f\n\x0b\x46IRST_STAGE\x10\x04\x12\x0b\n\x07TIMEOUT\x10\x05*9\n\x0eNodeMetricType\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x1a\n\x16\x42\x45TWEENNESS_CENTRALITY\x10\x01*;\n\x10InvoiceHTLCState\x12\x0c\n\x08\x41\x43\x43\x45PTED\x10\x00\x12\x0b\n\x07SETTLED\x10\x01\x12\x0c\n\x08\x43\x41NCELED\x10\x02*\xd9\x01\n\x14PaymentFailureReason\x12\x17\n\x13\x46\x41ILURE_REASON_NONE\x10\x00\x12\x1a\n\x16\x46\x41ILURE_REASON_TIMEOUT\x10\x01\x12\x1b\n\x17\x46\x41ILURE_REASON_NO_ROUTE\x10\x02\x12\x18\n\x14\x46\x41ILURE_REASON_ERROR\x10\x03\x12,\n(FAILURE_REASON_INCORRECT_PAYMENT_DETAILS\x10\x04\x12\'\n#FAILURE_REASON_INSUFFICIENT_BALANCE\x10\x05*\xcf\x04\n\nFeatureBit\x12\x18\n\x14\x44\x41TALOSS_PROTECT_REQ\x10\x00\x12\x18\n\x14\x44\x41TALOSS_PROTECT_OPT\x10\x01\x12\x17\n\x13INITIAL_ROUING_SYNC\x10\x03\x12\x1f\n\x1bUPFRONT_SHUTDOWN_SCRIPT_REQ\x10\x04\x12\x1f\n\x1bUPFRONT_SHUTDOWN_SCRIPT_OPT\x10\x05\x12\x16\n\x12GOSSIP_QUERIES_REQ\x10\x06\x12\x16\n\x12GOSSIP_QUERIES_OPT\x10\x07\x12\x11\n\rTLV_ONION_REQ\x10\x08\x12\x11\n\rTLV_ONION_OPT\x10\t\x12\x1a\n\x16\x45XT_GOSSIP_QUERIES_REQ\x10\n\x12\x1a\n\x16\x45XT_GOSSIP_QUERIES_OPT\x10\x0b\x12\x19\n\x15STATIC_REMOTE_KEY_REQ\x10\x0c\x12\x19\n\x15STATIC_REMOTE_KEY_OPT\x10\r\x12\x14\n\x10PAYMENT_ADDR_REQ\x10\x0e\x12\x14\n\x10PAYMENT_ADDR_OPT\x10\x0f\x12\x0b\n\x07MPP_REQ\x10\x10\x12\x0b\n\x07MPP_OPT\x10\x11\x12\x16\n\x12WUMBO_CHANNELS_REQ\x10\x12\x12\x16\n\x12WUMBO_CHANNELS_OPT\x10\x13\x12\x0f\n\x0b\x41NCHORS_REQ\x10\x14\x12\x0f\n\x0b\x41NCHORS_OPT\x10\x15\x12\x1d\n\x19\x41NCHORS_ZERO_FEE_HTLC_REQ\x10\x16\x12\x1d\n\x19\x41NCHORS_ZERO_FEE_HTLC_OPT\x10\x17\x12\x0b\n\x07\x41MP_REQ\x10\x1e\x12\x0b\n\x07\x41MP_OPT\x10\x1f*\xac\x01\n\rUpdateFailure\x12\x1a\n\x16UPDATE_FAILURE_UNKNOWN\x10\x00\x12\x1a\n\x16UPDATE_FAILURE_PENDING\x10\x01\x12\x1c\n\x18UPDATE_FAILURE_NOT_FOUND\x10\x02\x12\x1f\n\x1bUPDATE_FAILURE_INTERNAL_ERR\x10\x03\x12$\n UPDATE_FAILURE_INVALID_PARAMETER\x10\x04\x32\x97$\n\tLightning\x12J\n\rWalletBalance\x12\x1b.lnrpc.WalletBalanceRequest\x1a\x1c.lnrpc.WalletBalanceResponse\x12M\n\x0e\x43hannelBalance\x12\x1c.lnrpc.ChannelBalanceRequest\x1a\x1d.lnrpc.ChannelBalanceResponse\x12K\n\x0fGetTransactions\x12\x1d.lnrpc.GetTransactionsRequest\x1a\x19.lnrpc.TransactionDetails\x12\x44\n\x0b\x45stimateFee\x12\x19.lnrpc.EstimateFeeRequest\x1a\x1a.lnrpc.EstimateFeeResponse\x12>\n\tSendCoins\x12\x17.lnrpc.SendCoinsRequest\x1a\x18.lnrpc.SendCoinsResponse\x12\x44\n\x0bListUnspent\x12\x19.lnrpc.ListUnspentRequest\x1a\x1a.lnrpc.ListUnspentResponse\x12L\n\x15SubscribeTransactions\x12\x1d.lnrpc.GetTransactionsRequest\x1a\x12.lnrpc.Transaction0\x01\x12;\n\x08SendMany\x12\x16.lnrpc.SendManyRequest\x1a\x17.lnrpc.SendManyResponse\x12\x41\n\nNewAddress\x12\x18.lnrpc.NewAddressRequest\x1a\x19.lnrpc.NewAddressResponse\x12\x44\n\x0bSignMessage\x12\x19.lnrpc.SignMessageRequest\x1a\x1a.lnrpc.SignMessageResponse\x12J\n\rVerifyMessage\x12\x1b.lnrpc.VerifyMessageRequest\x1a\x1c.lnrpc.VerifyMessageResponse\x12\x44\n\x0b\x43onnectPeer\x12\x19.lnrpc.ConnectPeerRequest\x1a\x1a.lnrpc.ConnectPeerResponse\x12M\n\x0e\x44isconnectPeer\x12\x1c.lnrpc.DisconnectPeerRequest\x1a\x1d.lnrpc.DisconnectPeerResponse\x12>\n\tListPeers\x12\x17.lnrpc.ListPeersRequest\x1a\x18.lnrpc.ListPeersResponse\x12G\n\x13SubscribePeerEvents\x12\x1c.lnrpc.PeerEventSubscription\x1a\x10.lnrpc.PeerEvent0\x01\x12\x38\n\x07GetInfo\x12\x15.lnrpc.GetInfoRequest\x1a\x16.lnrpc.GetInfoResponse\x12P\n\x0fGetRecoveryInfo\x12\x1d.lnrpc.GetRecoveryInfoRequest\x1a\x1e.lnrpc.GetRecoveryInfoResponse\x12P\n\x0fPendingChannels\x12\x1d.lnrpc.PendingChannelsRequest\x1a\x1e.lnrpc.PendingChannelsResponse\x12G\n\x0cListChannels\x12\x1a.lnrpc.ListChannelsRequest\x1a\x1b.lnrpc.ListChannelsResponse\x12V\n\x16SubscribeChannelEvents\x12\x1f.lnrpc.ChannelEventSubscription\x1a\x19.lnrpc.ChannelEventUpdate0\x01\x12M\n\x0e\x43losedChannels\x12\x1c.lnrpc.ClosedChannelsRequest\x1a\x1d.lnrpc.ClosedChannelsResponse\x12\x41\n\x0fOpenChannelSync\x12\x19.lnrpc.OpenChannelRequest\x1a\x13.lnrpc.ChannelPoint\x12\x43\n\x0bOpenChannel\x12\x19.lnrpc.OpenChannelRequest\x1a\x17.lnrpc.OpenStatusUpdate0\x01\x12S\n\x10\x42\x61tchOpenChannel\x12\x1e.lnrpc.BatchOpenChannelRequest\x1a\x1f.lnrpc.BatchOpenChannelResponse\x12L\n\x10\x46undingStateStep\x12\x1b.lnrpc.FundingTransitionMsg\x1a\x1b.lnrpc.FundingStateStepResp\x12P\n\x0f\x43hannelAcceptor\x12\x1c.lnrpc.ChannelAcceptResponse\x1a\x1b.lnrpc.ChannelAcceptRequest(\x01\x30\x01\x12\x46\n\x0c\x43loseChannel\x12\x1a.lnrpc.CloseChannelRequest\x1a\x18.lnrpc.CloseStatusUpdate0\x01\x12M\n\x0e\x41\x62\x61ndonChannel\x12\x1c.lnrpc.AbandonChannelRequest\x1a\x1d.lnrpc.AbandonChannelResponse\x12?\n\x0bSendPayment\x12\x12.lnrpc.SendRequest\x1a\x13.lnrpc.SendResponse\"\x03\x88\x02\x01(\x01\x30\x01\x12:\n\x0fSendPaymentSync\x12\x12.lnrpc.SendRequest\x1a\x13.lnrpc.SendResponse\x12\x46\n\x0bSendToRoute\x12\x19.lnrpc.SendToRouteRequest\x1a\x13.lnrpc.SendResponse\"\x03\x88\x02\x01(\x01\x30\x01\x12\x41\n\x0fSendToRouteSync\x12\x19.lnrpc.SendToRouteRequest\x1a\x13.lnrpc.SendResponse\x12\x37\n\nAddInvoice\x12\x0e.lnrpc.Invoice\x1a\x19.lnrpc.AddInvoiceResponse\x12\x45\n\x0cListInvoices\x12\x19.lnrpc.ListInvoiceRequest\x1a\x1a.lnrpc.ListInvoiceResponse\x12\x33\n\rLookupInvoice\x12\x12.lnrpc.PaymentHash\x1a\x0e.lnrpc.Invoice\x12\x41\n\x11SubscribeInvoices\x12\x1a.lnrpc.InvoiceSubscription\x1a\x0e.lnrpc.Invoice0\x01\x12\x32\n\x0c\x44\x65\x63odePayReq\x12\x13.lnrpc.PayReqString\x1a\r.lnrpc.PayReq\x12G\n\x0cListPayments\x12\x1a.lnrpc.ListPaymentsRequest\x1a\x1b.lnrpc.ListPaymentsResponse\x12J\n\rDeletePayment\x12\x1b.lnrpc.DeletePaymentRequest\x1a\x1c.lnrpc.DeletePaymentResponse\x12V\n\x11\x44\x65leteAllPayments\x12\x1f.lnrpc.DeleteAllPaymentsRequest\x1a .lnrpc.DeleteAllPaymentsResponse\x12@\n\rDescribeGraph\x12\x1a.lnrpc.ChannelGraphRequest\x1a\x13.lnrpc.ChannelGraph\x12G\n\x0eGetNodeMetrics\x12\x19.lnrpc.NodeMetricsRequest\x1a\x1a.lnrpc.NodeMetricsResponse\x12\x39\n\x0bGetChanInfo\x12\x16.lnrpc.ChanInfoRequest\x1a\x12.lnrpc.ChannelEdge\x12\x36\n\x0bGetNodeInfo\x12\x16.lnrpc.NodeInfoRequest\x1a\x0f.lnrpc.NodeInfo\x12\x44\n\x0bQueryRoutes\x12\x19.lnrpc.QueryRoutesRequest\x1a\x1a.lnrpc.QueryRoutesResponse\x12?\n\x0eGetNetworkInfo\x12\x19.lnrpc.NetworkInfoRequest\x1a\x12.lnrpc.NetworkInfo\x12\x35\n\nStopDaemon\x12\x12.lnrpc.StopRequest\x1a\x13.lnrpc.StopResponse\x12W\n\x15SubscribeChannelGraph\x12 .lnrpc.GraphTopologySubscription\x1a\x1a.lnrpc.GraphTopologyUpdate0\x01\x12\x41\n\nDebugLevel\x12\x18.lnrpc.DebugLevelRequest\x1a\x19.lnrpc.DebugLevelResponse\x12>\n\tFeeReport\x12\x17.lnrpc.FeeReportRequest\x1a\x18.lnrpc.FeeReportResponse\x12N\n\x13UpdateChannelPolicy\x12\x1a.lnrpc.PolicyUpdateRequest\x1a\x1b.lnrpc.PolicyUpdateResponse\x12V\n\x11\x46orwardingHistory\x12\x1f.lnrpc.ForwardingHistoryRequest\x1a .lnrpc.ForwardingHistoryResponse\x12N\n\x13\x45xportChannelBackup\x12!.lnrpc.ExportChannelBackupRequest\x1a\x14.lnrpc.ChannelBackup\x12T\n\x17\x45xportAllChannelBackups\x12\x1e.lnrpc.ChanBackupExportRequest\x1a\x19.lnrpc.ChanBackupSnapshot\x12N\n\x10VerifyChanBackup\x12\x19.lnrpc.ChanBackupSnapshot\x1a\x1f.lnrpc.VerifyChanBackupResponse\x12V\n\x15RestoreChannelBackups\x12\x1f.lnrpc.RestoreChanBackupRequest\x1a\x1c.lnrpc.RestoreBackupResponse\x12X\n\x17SubscribeChannelBackups\x12 .lnrpc.ChannelBackupSubscription\x1a\x19.lnrpc.ChanBackupSnapshot0\x01\x12G\n\x0c\x42\x61keMacaroon\x12\x1a.lnrpc.BakeMacaroonRequest\x1a\x1b.lnrpc.BakeMacaroonResponse\x12P\n\x0fListMacaroonIDs\x12\x1d.lnrpc.ListMacaroonIDsRequest\x1a\x1e.lnrpc.ListMacaroonIDsResponse\x12S\n\x10\x44\x65leteMacaroonID\x12\x1e.lnrpc.DeleteMacaroonIDRequest\x1a\x1f.lnrpc.DeleteMacaroonIDResponse\x12P\n\x0fListPermissions\x12\x1d.lnrpc.ListPermissionsRequest\x1a\x1e.lnrpc.ListPermissionsResponse\x12S\n\x18\x43heckMacaroonPermissions\x12\x1a.lnrpc.CheckMacPermRequest\x1a\x1b.lnrpc.CheckMacPermResponse\x12V\n\x15RegisterRPCMiddleware\x12\x1c.lnrpc.RPCMiddlewareResponse\x1a\x1b.lnrpc.RPCMiddlewareRequest(\x01\x30\x01\x42\'Z%github.com/lightningnetwork/lnd/lnrpcb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.lnd_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z%github.com/lightningnetwork/lnd/lnrpc'
+  _globals['_SENDREQUEST_DESTCUSTOMRECORDSENTRY']._loaded_options = None
+  _globals['_SENDREQUEST_DESTCUSTOMRECORDSENTRY']._serialized_options = b'8\001'
+  _globals['_SENDREQUEST'].fields_by_name['dest_string']._loaded_options = None
+  _globals['_SENDREQUEST'].fields_by_name['dest_string']._serialized_options = b'\030\001'
+  _globals['_SENDREQUEST'].fields_by_name['payment_hash_string']._loaded_options = None
+  _globals['_SENDREQUEST'].fields_by_name['payment_hash_string']._serialized_options = b'\030\001'
+  _globals['_SENDREQUEST'].fields_by_name['outgoing_chan_id']._loaded_options = None
+  _globals['_SENDREQUEST'].fields_by_name['outgoing_chan_id']._serialized_options = b'0\001'
+  _globals['_SENDTOROUTEREQUEST'].fields_by_name['payment_hash_string']._loaded_options = None
+  _globals['_SENDTOROUTEREQUEST'].fields_by_name['payment_hash_string']._serialized_options = b'\030\001'
+  _globals['_ESTIMATEFEEREQUEST_ADDRTOAMOUNTENTRY']._loaded_options = None
+  _globals['_ESTIMATEFEEREQUEST_ADDRTOAMOUNTENTRY']._serialized_options = b'8\001'
+  _globals['_ESTIMATEFEERESPONSE'].fields_by_name['feerate_sat_per_byte']._loaded_options = None
+  _globals['_ESTIMATEFEERESPONSE'].fields_by_name['feerate_sat_per_byte']._serialized_options = b'\030\001'
+  _globals['_SENDMANYREQUEST_ADDRTOAMOUNTENTRY']._loaded_options = None
+  _globals['_SENDMANYREQUEST_ADDRTOAMOUNTENTRY']._serialized_options = b'8\001'
+  _globals['_SENDMANYREQUEST'].fields_by_name['sat_per_byte']._loaded_options = None
+  _globals['_SENDMANYREQUEST'].fields_by_name['sat_per_byte']._serialized_options = b'\030\001'
+  _globals['_SENDCOINSREQUEST'].fields_by_name['sat_per_byte']._loaded_options = None
+  _globals['_SENDCOINSREQUEST'].fields_by_name['sat_per_byte']._serialized_options = b'\030\001'
+  _globals['_CHANNEL'].fields_by_name['chan_id']._loaded_options = None
+  _globals['_CHANNEL'].fields_by_name['chan_id']._serialized_options = b'0\001'
+  _globals['_CHANNEL'].fields_by_name['csv_delay']._loaded_options = None
+  _globals['_CHANNEL'].fields_by_name['csv_delay']._serialized_options = b'\030\001'
+  _globals['_CHANNEL'].fields_by_name['local_chan_reserve_sat']._loaded_options = None
+  _globals['_CHANNEL'].fields_by_name['local_chan_reserve_sat']._serialized_options = b'\030\001'
+  _globals['_CHANNEL'].fields_by_name['remote_chan_reserve_sat']._loaded_options = None
+  _globals['_CHANNEL'].fields_by_name['remote_chan_reserve_sat']._serialized_options = b'\030\001'
+  _globals['_CHANNEL'].fields_by_name['static_remote_key']._loaded_options = None
+  _globals['_CHANNEL'].fields_by_name['static_remote_key']._serialized_options = b'\030\001'
+  _globals['_CHANNELCLOSESUMMARY'].fields_by_name['chan_id']._loaded_options = None
+  _globals['_CHANNELCLOSESUMMARY'].fields_by_name['chan_id']._serialized_options = b'0\001'
+  _globals['_PEER_FEATURESENTRY']._loaded_options = None
+  _globals['_PEER_FEATURESENTRY']._serialized_options = b'8\001'
+  _globals['_GETINFORESPONSE_FEATURESENTRY']._loaded_options = None
+  _globals['_GETINFORESPONSE_FEATURESENTRY']._serialized_options = b'8\001'
+  _globals['_GETINFORESPONSE'].fields_by_name['testnet']._loaded_options = None
+  _globals['_GETINFORESPONSE'].fields_by_name['testnet']._serialized_options = b'\030\001'
+  _globals['_CLOSECHANNELREQUEST'].fields_by_name['sat_per_byte']._loaded_options = None
+  _globals['_CLOSECHANNELREQUEST'].fields_by_name['sat_per_byte']._serialized_options = b'\030\001'
+  _globals['_OPENCHANNELREQUEST'].fields_by_name['node_pubkey_string']._loaded_options = None
+  _globals['_OPENCHANNELREQUEST'].fields_by_name['node_pubkey_string']._serialized_options = b'\030\001'
+  _globals['_OPENCHANNELREQUEST'].fields_by_name['sat_per_byte']._loaded_options = None
+  _globals['_OPENCHANNELREQUEST'].fields_by_name['sat_per_byte']._serialized_options = b'\030\001'
+  _globals['_PENDINGCHANNELSRESPONSE'].fields_by_name['pending_closing_channels']._loaded_options = None
+  _globals['_PENDINGCHANNELSRESPONSE'].fields_by_name['pending_closing_channels']._serialized_options = b'\030\001'
+  _globals['_WALLETBALANCERESPONSE_ACCOUNTBALANCEENTRY']._loaded_options = None
+  _globals['_WALLETBALANCERESPONSE_ACCOUNTBALANCEENTRY']._serialized_options = b'8\001'
+  _globals['_CHANNELBALANCERESPONSE'].fields_by_name['balance']._loaded_options = None
+  _globals['_CHANNELBALANCERESPONSE'].fields_by_name['balance']._serialized_options = b'\030\001'
+  _globals['_CHANNELBALANCERESPONSE'].fields_by_name['pending_open_balance']._loaded_options = None
+  _globals['_CHANNELBALANCERESPONSE'].fields_by_name['pending_open_balance']._serialized_options = b'\030\001'
+  _globals['_QUERYROUTESREQUEST_DESTCUSTOMRECORDSENTRY']._loaded_options = None
+  _globals['_QUERYROUTESREQUEST_DESTCUSTOMRECORDSENTRY']._serialized_options = b'8\001'
+  _globals['_QUERYROUTESREQUEST'].fields_by_name['ignored_edges']._loaded_options = None
+  _globals['_QUERYROUTESREQUEST'].fields_by_name['ignored_edges']._serialized_options = b'\030\001'
+  _globals['_QUERYROUTESREQUEST'].fields_by_name['outgoing_chan_id']._loaded_options = None
+  _globals['_QUERYROUTESREQUEST'].fields_by_name['outgoing_chan_id']._serialized_options = b'0\001'
+  _globals['_EDGELOCATOR'].fields_by_name['channel_id']._loaded_options = None
+  _globals['_EDGELOCATOR'].fields_by_name['channel_id']._serialized_options = b'0\001'
+  _globals['_HOP_CUSTOMRECORDSENTRY']._loaded_options = None
+  _globals['_HOP_CUSTOMRECORDSENTRY']._serialized_options = b'8\001'
+  _globals['_HOP'].fields_by_name['chan_id']._loaded_options = None
+  _globals['_HOP'].fields_by_name['chan_id']._serialized_options = b'0\001'
+  _globals['_HOP'].fields_by_name['chan_capacity']._loaded_options = None
+  _globals['_HOP'].fields_by_name['chan_capacity']._serialized_options = b'\030\001'
+  _globals['_HOP'].fields_by_name['amt_to_forward']._loaded_options = None
+  _globals['_HOP'].fields_by_name['amt_to_forward']._serialized_options = b'\030\001'
+  _globals['_HOP'].fields_by_name['fee']._loaded_options = None
+  _globals['_HOP'].fields_by_name['fee']._serialized_options = b'\030\001'
+  _globals['_ROUTE'].fields_by_name['total_fees']._loaded_options = None
+  _globals['_ROUTE'].fields_by_name['total_fees']._serialized_options = b'\030\001'
+  _globals['_ROUTE'].fields_by_name['total_amt']._loaded_options = None
+  _globals['_ROUTE'].fields_by_name['total_amt']._serialized_options = b'\030\001'
+  _globals['_LIGHTNINGNODE_FEATURESENTRY']._loaded_options = None
+  _globals['_LIGHTNINGNODE_FEATURESENTRY']._serialized_options = b'8\001'
+  _globals['_CHANNELEDGE'].fields_by_name['channel_id']._loaded_options = None
+  _globals['_CHANNELEDGE'].fields_by_name['channel_id']._serialized_options = b'0\001'
+  _globals['_CHANNELEDGE'].fields_by_name['last_update']._loaded_options = None
+  _globals['_CHANNELEDGE'].fields_by_name['last_update']._serialized_options = b'\030\001'
+  _globals['_NODEMETRICSRESPONSE_BETWEENNESSCENTRALITYENTRY']._loaded_options = None
+  _globals['_NODEMETRICSRESPONSE_BETWEENNESSCENTRALITYENTRY']._serialized_options = b'8\001'
+  _globals['_CHANINFOREQUEST'].fields_by_name['chan_id']._loaded_options = None
+  _globals['_CHANINFOREQUEST'].fields_by_name['chan_id']._serialized_options = b'0\001'
+  _globals['_NODEUPDATE_FEATURESENTRY']._loaded_options = None
+  _globals['_NODEUPDATE_FEATURESENTRY']._serialized_options = b'8\001'
+  _globals['_NODEUPDATE'].fields_by_name['addresses']._loaded_options = None
+  _globals['_NODEUPDATE'].fields_by_name['addresses']._serialized_options = b'\030\001'
+  _globals['_NODEUPDATE'].fields_by_name['global_features']._loaded_options = None
+  _globals['_NODEUPDATE'].fields_by_name['global_features']._serialized_options = b'\030\001'
+  _globals['_CHANNELEDGEUPDATE'].fields_by_name['chan_id']._loaded_options = None
+  _globals['_CHANNELEDGEUPDATE'].fields_by_name['chan_id']._serialized_options = b'0\001'
+  _globals['_CLOSEDCHANNELUPDATE'].fields_by_name['chan_id']._loaded_options = None
+  _globals['_CLOSEDCHANNELUPDATE'].fields_by_name['chan_id']._serialized_options = b'0\001'
+  _globals['_HOPHINT'].fields_by_name['chan_id']._loaded_options = None
+  _globals['_HOPHINT'].fields_by_name['chan_id']._serialized_options = b'0\001'
+  _globals['_INVOICE_FEATURESENTRY']._loaded_options = None
+  _globals['_INVOICE_FEATURESENTRY']._serialized_options = b'8\001'
+  _globals['_INVOICE'].fields_by_name['settled']._loaded_options = None
+  _globals['_INVOICE'].fields_by_name['settled']._serialized_options = b'\030\001'
+  _globals['_INVOICE'].fields_by_name['amt_paid']._loaded_options = None
+  _globals['_INVOICE'].fields_by_name['amt_paid']._serialized_options = b'\030\001'
+  _globals['_INVOICEHTLC_CUSTOMRECORDSENTRY']._loaded_options = None
+  _globals['_INVOICEHTLC_CUSTOMRECORDSENTRY']._serialized_options = b'8\001'
+  _globals['_INVOICEHTLC'].fields_by_name['chan_id']._loaded_options = None
+  _globals['_INVOICEHTLC'].fields_by_name['chan_id']._serialized_options = b'0\001'
+  _globals['_PAYMENTHASH'].fields_by_name['r_hash_str']._loaded_options = None
+  _globals['_PAYMENTHASH'].fields_by_name['r_hash_str']._serialized_options = b'\030\001'
+  _globals['_PAYMENT'].fields_by_name['value']._loaded_options = None
+  _globals['_PAYMENT'].fields_by_name['value']._serialized_options = b'\030\001'
+  _globals['_PAYMENT'].fields_by_name['creation_date']._loaded_options = None
+  _globals['_PAYMENT'].fields_by_name['creation_date']._serialized_options = b'\030\001'
+  _globals['_PAYMENT'].fields_by_name['fee']._loaded_options = None
+  _globals['_PAYMENT'].fields_by_name['fee']._serialized_options = b'\030\001'
+  _globals['_PAYREQ_FEATURESENTRY']._loaded_options = None
+  _globals['_PAYREQ_FEATURESENTRY']._serialized_options = b'8\001'
+  _globals['_CHANNELFEEREPORT'].fields_by_name['chan_id']._loaded_options = None
+  _globals['_CHANNELFEEREPORT'].fields_by_name['chan_id']._serialized_options = b'0\001'
+  _globals['_FORWARDINGEVENT'].fields_by_name['timestamp']._loaded_options = None
+  _globals['_FORWARDINGEVENT'].fields_by_name['timestamp']._serialized_options = b'\030\001'
+  _globals['_FORWARDINGEVENT'].fields_by_name['chan_id_in']._loaded_options = None
+  _globals['_FORWARDINGEVENT'].fields_by_name['chan_id_in']._serialized_options = b'0\001'
+  _globals['_FORWARDINGEVENT'].fields_by_name['chan_id_out']._loaded_options = None
+  _globals['_FORWARDINGEVENT'].fields_by_name['chan_id_out']._serialized_options = b'0\001'
+  _globals['_LISTPERMISSIONSRESPONSE_METHODPERMISSIONSENTRY']._loaded_options = None
+  _globals['_LISTPERMISSIONSRESPONSE_METHODPERMISSIONSENTRY']._serialized_options = b'8\001'
+  _globals['_CHANNELUPDATE'].fields_by_name['chan_id']._loaded_options = None
+  _globals['_CHANNELUPDATE'].fields_by_name['chan_id']._serialized_options = b'0\001'
+  _globals['_LIGHTNING'].methods_by_name['SendPayment']._loaded_options = None
+  _globals['_LIGHTNING'].methods_by_name['SendPayment']._serialized_options = b'\210\002\001'
+  _globals['_LIGHTNING'].methods_by_name['SendToRoute']._loaded_options = None
+  _globals['_LIGHTNING'].methods_by_name['SendToRoute']._serialized_options = b'\210\002\001'
+  _globals['_ADDRESSTYPE']._serialized_start=26105
+  _globals['_ADDRESSTYPE']._serialized_end=26230
+  _globals['_COMMITMENTTYPE']._serialized_start=26232
+  _globals['_COMMITMENTTYPE']._serialized_end=26325
+  _globals['_INITIATOR']._serialized_start=26327
+  _globals['_INITIATOR']._serialized_end=26424
+  _globals['_RESOLUTIONTYPE']._serialized_start=26426
+  _globals['_RESOLUTIONTYPE']._serialized_end=26522
+  _globals['_RESOLUTIONOUTCOME']._serialized_start=26524
+  _globals['_RESOLUTIONOUTCOME']._serialized_end=26637
+  _globals['_NODEMETRICTYPE']._serialized_start=26639
+  _globals['_NODEMETRICTYPE']._serialized_end=26696
+  _globals['_INVOICEHTLCSTATE']._serialized_start=26698
+  _globals['_INVOICEHTLCSTATE']._serialized_end=26757
+  _globals['_PAYMENTFAILUREREASON']._serialized_start=26760
+  _globals['_PAYMENTFAILUREREASON']._serialized_end=26977
+  _globals['_FEATUREBIT']._serialized_start=26980
+  _globals['_FEATUREBIT']._serialized_end=27571
+  _globals['_UPDATEFAILURE']._serialized_start=27574
+  _globals['_UPDATEFAILURE']._serialized_end=27746
+  _globals['_UTXO']._serialized_start=27
+  _globals['_UTXO']._serialized_end=189
+  _globals['_TRANSACTION']._serialized_start=192
+  _globals['_TRANSACTION']._serialized_end=406
+  _globals['_GETTRANSACTIONSREQUEST']._serialized_start=408
+  _globals['_GETTRANSACTIONSREQUEST']._serialized_end=491
+  _globals['_TRANSACTIONDETAILS']._serialized_start=493
+  _globals['_TRANSACTIONDETAILS']._serialized_end=555
+  _globals['_FEELIMIT']._serialized_start=557
+  _globals['_FEELIMIT']._serialized_end=634
+  _globals['_SENDREQUEST']._serialized_start=637
+  _globals['_SENDREQUEST']._serialized_end=1159
+  _globals['_SENDREQUEST_DESTCUSTOMRECORDSENTRY']._serialized_start=1103
+  _globals['_SENDREQUEST_DESTCUSTOMRECORDSENTRY']._serialized_end=1159
+  _globals['_SENDRESPONSE']._serialized_start=1161
+  _globals['_SENDRESPONSE']._serialized_end=1283
+  _globals['_SENDTOROUTEREQUEST']._serialized_start=1285
+  _globals['_SENDTOROUTEREQUEST']._serialized_end=1395
+  _globals['_CHANNELACCEPTREQUEST']._serialized_start=1398
+  _globals['_CHANNELACCEPTREQUEST']._serialized_end=1707
+  _globals['_CHANNELACCEPTRESPONSE']._serialized_start=1710
+  _globals['_CHANNELACCEPTRESPONSE']._serialized_end=1954
+  _globals['_CHANNELPOINT']._serialized_start=1956
+  _globals['_CHANNELPOINT']._serialized_end=2066
+  _globals['_OUTPOINT']._serialized_start=2068
+  _globals['_OUTPOINT']._serialized_end=2138
+  _globals['_LIGHTNINGADDRESS']._serialized_start=2140
+  _globals['_LIGHTNINGADDRESS']._serialized_end=2188
+  _globals['_ESTIMATEFEEREQUEST']._serialized_start=2191
+  _globals['_ESTIMATEFEEREQUEST']._serialized_end=2398
+  _globals['_ESTIMATEFEEREQUEST_ADDRTOAMOUNTENTRY']._serialized_start=2347
+  _globals['_ESTIMATEFEEREQUEST_ADDRTOAMOUNTENTRY']._serialized_end=2398
+  _globals['_ESTIMATEFEERESPONSE']._serialized_start=2400
+  _globals['_ESTIMATEFEERESPONSE']._serialized_end=2495
+  _globals['_SENDMANYREQUEST']._serialized_start=2498
+  _globals['_SENDMANYREQUEST']._serialized_end=2763
+  _globals['_SENDMANYREQUEST_ADDRTOAMOUNTENTRY']._serialized_start=2347
+  _globals['_SENDMANYREQUEST_ADDRTOAMOUNTENTRY']._serialized_end=2398
+  _globals['_SENDMANYRESPONSE']._serialized_start=2765
+  _globals['_SENDMANYRESPONSE']._serialized_end=2797
+  _globals['_SENDCOINSREQUEST']._serialized_start=2800
+  _globals['_SENDCOINSREQUEST']._serialized_end=2997
+  _globals['_SENDCOINSRESPONSE']._serialized_start=2999
+  _globals['_SENDCOINSRESPONSE']._serialized_end=3032
+  _globals['_LISTUNSPENTREQUEST']._serialized_start=3034
+  _globals['_LISTUNSPENTREQUEST']._serialized_end=3109
+  _globals['_LISTUNSPENTRESPONSE']._serialized_start=3111
+  _globals['_LISTUNSPENTRESPONSE']._serialized_end=3160
+  _globals['_NEWADDRESSREQUEST']._serialized_start=3162
+  _globals['_NEWADDRESSREQUEST']._serialized_end=3232
+  _globals['_NEWADDRESSRESPONSE']._serialized_start=3234
+  _globals['_NEWADDRESSRESPONSE']._serialized_end=3271
+  _globals['_SIGNMESSAGEREQUEST']._serialized_start=3273
+  _globals['_SIGNMESSAGEREQUEST']._serialized_end=3327
+  _globals['_SIGNMESSAGERESPONSE']._serialized_start=3329
+  _globals['_SIGNMESSAGERESPONSE']._serialized_end=3369
+  _globals['_VERIFYMESSAGEREQUEST']._serialized_start=3371
+  _globals['_VERIFYMESSAGEREQUEST']._serialized_end=3425
+  _globals['_VERIFYMESSAGERESPONSE']._serialized_start=3427
+  _globals['_VERIFYMESSAGERESPONSE']._serialized_end=3481
+  _globals['_CONNECTPEERREQUEST']._serialized_start=3483
+  _globals['_CONNECTPEERREQUEST']._serialized_end=3573
+  _globals['_CONNECTPEERRESPONSE']._serialized_start=3575
+  _globals['_CONNECTPEERRESPONSE']._serialized_end=3596
+  _globals['_DISCONNECTPEERREQUEST']._serialized_start=3598
+  _globals['_DISCONNECTPEERREQUEST']._serialized_end=3638
+  _globals['_DISCONNECTPEERRESPONSE']._serialized_start=3640
+  _globals['_DISCONNECTPEERRESPONSE']._serialized_end=3664
+  _globals['_HTLC']._serialized_start=3667
+  _globals['_HTLC']._serialized_end=3832
+  _globals['_CHANNELCONSTRAINTS']._serialized_start=3835
+  _globals['_CHANNELCONSTRAINTS']._serialized_end=4005
+  _globals['_CHANNEL']._serialized_start=4008
+  _globals['_CHANNEL']._serialized_end=4824
+  _globals['_LISTCHANNELSREQUEST']._serialized_start=4826
+  _globals['_LISTCHANNELSREQUEST']._serialized_end=4948
+  _globals['_LISTCHANNELSRESPONSE']._serialized_start=4950
+  _globals['_LISTCHANNELSRESPONSE']._serialized_end=5006
+  _globals['_CHANNELCLOSESUMMARY']._serialized_start=5009
+  _globals['_CHANNELCLOSESUMMARY']._serialized_end=5562
+  _globals['_CHANNELCLOSESUMMARY_CLOSURETYPE']._serialized_start=5424
+  _globals['_CHANNELCLOSESUMMARY_CLOSURETYPE']._serialized_end=5562
+  _globals['_RESOLUTION']._serialized_start=5565
+  _globals['_RESOLUTION']._serialized_end=5743
+  _globals['_CLOSEDCHANNELSREQUEST']._serialized_start=5746
+  _globals['_CLOSEDCHANNELSREQUEST']._serialized_end=5894
+  _globals['_CLOSEDCHANNELSRESPONSE']._serialized_start=5896
+  _globals['_CLOSEDCHANNELSRESPONSE']._serialized_end=5966
+  _globals['_PEER']._serialized_start=5969
+  _globals['_PEER']._serialized_end=6464
+  _globals['_PEER_FEATURESENTRY']._serialized_start=6319
+  _globals['_PEER_FEATURESENTRY']._serialized_end=6382
+  _globals['_PEER_SYNCTYPE']._serialized_start=6384
+  _globals['_PEER_SYNCTYPE']._serialized_end=6464
+  _globals['_TIMESTAMPEDERROR']._serialized_start=6466
+  _globals['_TIMESTAMPEDERROR']._serialized_end=6518
+  _globals['_LISTPEERSREQUEST']._serialized_start=6520
+  _globals['_LISTPEERSREQUEST']._serialized_end=6560
+  _globals['_LISTPEERSRESPONSE']._serialized_start=6562
+  _globals['_LISTPEERSRESPONSE']._serialized_end=6609
+  _globals['_PEEREVENTSUBSCRIPTION']._serialized_start=6611
+  _globals['_PEEREVENTSUBSCRIPTION']._serialized_end=6634
+  _globals['_PEEREVENT']._serialized_start=6636
+  _globals['_PEEREVENT']._serialized_end=6754
+  _globals['_PEEREVENT_EVENTTYPE']._serialized_start=6708
+  _globals['_PEEREVENT_EVENTTYPE']._serialized_end=6754
+  _globals['_GETINFOREQUEST']._serialized_start=6756
+  _globals['_GETINFOREQUEST']._serialized_end=6772
+  _globals['_GETINFORESPONSE']._serialized_start=6775
+  _globals['_GETINFORESPONSE']._serialized_end=7309
+  _globals['_GETINFORESPONSE_FEATURESENTRY']._serialized_start=6319
+  _globals['_GETINFORESPONSE_FEATURESENTRY']._serialized_end=6382
+  _globals['_GETRECOVERYINFOREQUEST']._serialized_start=7311
+  _globals['_GETRECOVERYINFOREQUEST']._serialized_end=7335
+  _globals['_GETRECOVERYINFORESPONSE']._serialized_start=7337
+  _globals['_GETRECOVERYINFORESPONSE']._serialized_end=7430
+  _globals['_CHAIN']._serialized_start=7432
+  _globals['_CHAIN']._serialized_end=7471
+  _globals['_CONFIRMATIONUPDATE']._serialized_start=7473
+  _globals['_CONFIRMATIONUPDATE']._serialized_end=7558
+  _globals['_CHANNELOPENUPDATE']._serialized_start=7560
+  _globals['_CHANNELOPENUPDATE']._serialized_end=7623
+  _globals['_CHANNELCLOSEUPDATE']._serialized_start=7625
+  _globals['_CHANNELCLOSEUPDATE']._serialized_end=7684
+  _globals['_CLOSECHANNELREQUEST']._serialized_start=7687
+  _globals['_CLOSECHANNELREQUEST']._serialized_end=7863
+  _globals['_CLOSESTATUSUPDATE']._serialized_start=7865
+  _globals['_CLOSESTATUSUPDATE']._serialized_end=7990
+  _globals['_PENDINGUPDATE']._serialized_start=7992
+  _globals['_PENDINGUPDATE']._serialized_end=8043
+  _globals['_READYFORPSBTFUNDING']._serialized_start=8045
+  _globals['_READYFORPSBTFUNDING']._serialized_end=8129
+  _globals['_BATCHOPENCHANNELREQUEST']._serialized_start=8132
+  _globals['_BATCHOPENCHANNELREQUEST']._serialized_end=8305
+  _globals['_BATCHOPENCHANNEL']._serialized_start=8308
+  _globals['_BATCHOPENCHANNEL']._serialized_end=8557
+  _globals['_BATCHOPENCHANNELRESPONSE']._serialized_start=8559
+  _globals['_BATCHOPENCHANNELRESPONSE']._serialized_end=8633
+  _globals['_OPENCHANNELREQUEST']._serialized_start=8636
+  _globals['_OPENCHANNELREQUEST']._serialized_end=9142
+  _globals['_OPENSTATUSUPDATE']._serialized_start=9145
+  _globals['_OPENSTATUSUPDATE']._serialized_end=9340
+  _globals['_KEYLOCATOR']._serialized_start=9342
+  _globals['_KEYLOCATOR']._serialized_end=9393
+  _globals['_KEYDESCRIPTOR']._serialized_start=9395
+  _globals['_KEYDESCRIPTOR']._serialized_end=9469
+  _globals['_CHANPOINTSHIM']._serialized_start=9472
+  _globals['_CHANPOINTSHIM']._serialized_end=9648
+  _globals['_PSBTSHIM']._serialized_start=9650
+  _globals['_PSBTSHIM']._serialized_end=9724
+  _globals['_FUNDINGSHIM']._serialized_start=9726
+  _globals['_FUNDINGSHIM']._serialized_end=9834
+  _globals['_FUNDINGSHIMCANCEL']._serialized_start=9836
+  _globals['_FUNDINGSHIMCANCEL']._serialized_end=9880
+  _globals['_FUNDINGPSBTVERIFY']._serialized_start=9882
+  _globals['_FUNDINGPSBTVERIFY']._serialized_end=9970
+  _globals['_FUNDINGPSBTFINALIZE']._serialized_start=9972
+  _globals['_FUNDINGPSBTFINALIZE']._serialized_end=10061
+  _globals['_FUNDINGTRANSITIONMSG']._serialized_start=10064
+  _globals['_FUNDINGTRANSITIONMSG']._serialized_end=10293
+  _globals['_FUNDINGSTATESTEPRESP']._serialized_start=10295
+  _globals['_FUNDINGSTATESTEPRESP']._serialized_end=10317
+  _globals['_PENDINGHTLC']._serialized_start=10320
+  _globals['_PENDINGHTLC']._serialized_end=10454
+  _globals['_PENDINGCHANNELSREQUEST']._serialized_start=10456
+  _globals['_PENDINGCHANNELSREQUEST']._serialized_end=10480
+  _globals['_PENDINGCHANNELSRESPONSE']._serialized_start=10483
+  _globals['_PENDINGCHANNELSRESPONSE']._serialized_end=12223
+  _globals['_PENDINGCHANNELSRESPONSE_PENDINGCHANNEL']._serialized_start=10881
+  _globals['_PENDINGCHANNELSRESPONSE_PENDINGCHANNEL']._serialized_end=11193
+  _globals['_PENDINGCHANNELSRESPONSE_PENDINGOPENCHANNEL']._serialized_start=11196
+  _globals['_PENDINGCHANNELSRESPONSE_PENDINGOPENCHANNEL']._serialized_end=11372
+  _globals['_PENDINGCHANNELSRESPONSE_WAITINGCLOSECHANNEL']._serialized_start=11375
+  _globals['_PENDINGCHANNELSRESPONSE_WAITINGCLOSECHANNEL']._serialized_end=11548
+  _globals['_PENDINGCHANNELSRESPONSE_COMMITMENTS']._serialized_start=11551
+  _globals['_PENDINGCHANNELSRESPONSE_COMMITMENTS']._serialized_end=11734
+  _globals['_PENDINGCHANNELSRESPONSE_CLOSEDCHANNEL']._serialized_start=11736
+  _globals['_PENDINGCHANNELSRESPONSE_CLOSEDCHANNEL']._serialized_end=11837
+  _globals['_PENDINGCHANNELSRESPONSE_FORCECLOSEDCHANNEL']._serialized_start=11840
+  _globals['_PENDINGCHANNELSRESPONSE_FORCECLOSEDCHANNEL']._serialized_end=12223
+  _globals['_PENDINGCHANNELSRESPONSE_FORCECLOSEDCHANNEL_ANCHORSTATE']._serialized_start=12174
+  _globals['_PENDINGCHANNELSRESPONSE_FORCECLOSEDCHANNEL_ANCHORSTATE']._serialized_end=12223
+  _globals['_CHANNELEVENTSUBSCRIPTION']._serialized_start=12225
+  _globals['_CHANNELEVENTSUBSCRIPTION']._serialized_end=12251
+  _globals['_CHANNELEVENTUPDATE']._serialized_start=12254
+  _globals['_CHANNELEVENTUPDATE']._serialized_end=12785
+  _globals['_CHANNELEVENTUPDATE_UPDATETYPE']._serialized_start=12628
+  _globals['_CHANNELEVENTUPDATE_UPDATETYPE']._serialized_end=12774
+  _globals['_WALLETACCOUNTBALANCE']._serialized_start=12787
+  _globals['_WALLETACCOUNTBALANCE']._serialized_end=12865
+  _globals['_WALLETBALANCEREQUEST']._serialized_start=12867
+  _globals['_WALLETBALANCEREQUEST']._serialized_end=12889
+  _globals['_WALLETBALANCERESPONSE']._serialized_start=12892
+  _globals['_WALLETBALANCERESPONSE']._serialized_end=13153
+  _globals['_WALLETBALANCERESPONSE_ACCOUNTBALANCEENTRY']._serialized_start=13071
+  _globals['_WALLETBALANCERESPONSE_ACCOUNTBALANCEENTRY']._serialized_end=13153
+  _globals['_AMOUNT']._serialized_start=13155
+  _globals['_AMOUNT']._serialized_end=13190
+  _globals['_CHANNELBALANCEREQUEST']._serialized_start=13192
+  _globals['_CHANNELBALANCEREQUEST']._serialized_end=13215
+  _globals['_CHANNELBALANCERESPONSE']._serialized_start=13218
+  _globals['_CHANNELBALANCERESPONSE']._serialized_end=13574
+  _globals['_QUERYROUTESREQUEST']._serialized_start=13577
+  _globals['_QUERYROUTESREQUEST']._serialized_end=14169
+  _globals['_QUERYROUTESREQUEST_DESTCUSTOMRECORDSENTRY']._serialized_start=1103
+  _globals['_QUERYROUTESREQUEST_DESTCUSTOMRECORDSENTRY']._serialized_end=1159
+  _globals['_NODEPAIR']._serialized_start=14171
+  _globals['_NODEPAIR']._serialized_end=14207
+  _globals['_EDGELOCATOR']._serialized_start=14209
+  _globals['_EDGELOCATOR']._serialized_end=14273
+  _globals['_QUERYROUTESRESPONSE']._serialized_start=14275
+  _globals['_QUERYROUTESRESPONSE']._serialized_end=14348
+  _globals['_HOP']._serialized_start=14351
+  _globals['_HOP']._serialized_end=14735
+  _globals['_HOP_CUSTOMRECORDSENTRY']._serialized_start=14683
+  _globals['_HOP_CUSTOMRECORDSENTRY']._serialized_end=14735
+  _globals['_MPPRECORD']._serialized_start=14737
+  _globals['_MPPRECORD']._serialized_end=14794
+  _globals['_AMPRECORD']._serialized_start=14796
+  _globals['_AMPRECORD']._serialized_end=14864
+  _globals['_ROUTE']._serialized_start=14867
+  _globals['_ROUTE']._serialized_end=15021
+  _globals['_NODEINFOREQUEST']._serialized_start=15023
+  _globals['_NODEINFOREQUEST']._serialized_end=15083
+  _globals['_NODEINFO']._serialized_start=15086
+  _globals['_NODEINFO']._serialized_end=15216
+  _globals['_LIGHTNINGNODE']._serialized_start=15219
+  _globals['_LIGHTNINGNODE']._serialized_end=15460
+  _globals['_LIGHTNINGNODE_FEATURESENTRY']._serialized_start=6319
+  _globals['_LIGHTNINGNODE_FEATURESENTRY']._serialized_end=6382
+  _globals['_NODEADDRESS']._serialized_start=15462
+  _globals['_NODEADDRESS']._serialized_end=15506
+  _globals['_ROUTINGPOLICY']._serialized_start=15509
+  _globals['_ROUTINGPOLICY']._serialized_end=15681
+  _globals['_CHANNELEDGE']._serialized_start=15684
+  _globals['_CHANNELEDGE']._serialized_end=15910
+  _globals['_CHANNELGRAPHREQUEST']._serialized_start=15912
+  _globals['_CHANNELGRAPHREQUEST']._serialized_end=15962
+  _globals['_CHANNELGRAPH']._serialized_start=15964
+  _globals['_CHANNELGRAPH']._serialized_end=16050
+  _globals['_NODEMETRICSREQUEST']._serialized_start=16052
+  _globals['_NODEMETRICSREQUEST']._serialized_end=16110
+  _globals['_NODEMETRICSRESPONSE']._serialized_start=16113
+  _globals['_NODEMETRICSRESPONSE']._serialized_end=16303
+  _globals['_NODEMETRICSRESPONSE_BETWEENNESSCENTRALITYENTRY']._serialized_start=16223
+  _globals['_NODEMETRICSRESPONSE_BETWEENNESSCENTRALITYENTRY']._serialized_end=16303
+  _globals['_FLOATMETRIC']._serialized_start=16305
+  _globals['_FLOATMETRIC']._serialized_end=16359
+  _globals['_CHANINFOREQUEST']._serialized_start=16361
+  _globals['_CHANINFOREQUEST']._serialized_end=16399
+  _globals['_NETWORKINFOREQUEST']._serialized_start=16401
+  _globals['_NETWORKINFOREQUEST']._serialized_end=16421
+  _globals['_NETWORKINFO']._serialized_start=16424
+  _globals['_NETWORKINFO']._serialized_end=16719
+  _globals['_STOPREQUEST']._serialized_start=16721
+  _globals['_STOPREQUEST']._serialized_end=16734
+  _globals['_STOPRESPONSE']._serialized_start=16736
+  _globals['_STOPRESPONSE']._serialized_end=16750
+  _globals['_GRAPHTOPOLOGYSUBSCRIPTION']._serialized_start=16752
+  _globals['_GRAPHTOPOLOGYSUBSCRIPTION']._serialized_end=16779
+  _globals['_GRAPHTOPOLOGYUPDATE']._serialized_start=16782
+  _globals['_GRAPHTOPOLOGYUPDATE']._serialized_end=16945
+  _globals['_NODEUPDATE']._serialized_start=16948
+  _globals['_NODEUPDATE']._serialized_end=17224
+  _globals['_NODEUPDATE_FEATURESENTRY']._serialized_start=6319
+  _globals['_NODEUPDATE_FEATURESENTRY']._serialized_end=6382
+  _globals['_CHANNELEDGEUPDATE']._serialized_start=17227
+  _globals['_CHANNELEDGEUPDATE']._serialized_end=17423
+  _globals['_CLOSEDCHANNELUPDATE']._serialized_start=17425
+  _globals['_CLOSEDCHANNELUPDATE']._serialized_end=17549
+  _globals['_HOPHINT']._serialized_start=17552
+  _globals['_HOPHINT']._serialized_end=17686
+  _globals['_ROUTEHINT']._serialized_start=17688
+  _globals['_ROUTEHINT']._serialized_end=17734
+  _globals['_INVOICE']._serialized_start=17737
+  _globals['_INVOICE']._serialized_end=18494
+  _globals['_INVOICE_FEATURESENTRY']._serialized_start=6319
+  _globals['_INVOICE_FEATURESENTRY']._serialized_end=6382
+  _globals['_INVOICE_INVOICESTATE']._serialized_start=18423
+  _globals['_INVOICE_INVOICESTATE']._serialized_end=18488
+  _globals['_INVOICEHTLC']._serialized_start=18497
+  _globals['_INVOICEHTLC']._serialized_end=18868
+  _globals['_INVOICEHTLC_CUSTOMRECORDSENTRY']._serialized_start=14683
+  _globals['_INVOICEHTLC_CUSTOMRECORDSENTRY']._serialized_end=14735
+  _globals['_AMP']._serialized_start=18870
+  _globals['_AMP']._serialized_end=18964
+  _globals['_ADDINVOICERESPONSE']._serialized_start=18966
+  _globals['_ADDINVOICERESPONSE']._serialized_end=19068
+  _globals['_PAYMENTHASH']._serialized_start=19070
+  _globals['_PAYMENTHASH']._serialized_end=19123
+  _globals['_LISTINVOICEREQUEST']._serialized_start=19125
+  _globals['_LISTINVOICEREQUEST']._serialized_end=19233
+  _globals['_LISTINVOICERESPONSE']._serialized_start=19235
+  _globals['_LISTINVOICERESPONSE']._serialized_end=19345
+  _globals['_INVOICESUBSCRIPTION']._serialized_start=19347
+  _globals['_INVOICESUBSCRIPTION']._serialized_end=19409
+  _globals['_PAYMENT']._serialized_start=19412
+  _globals['_PAYMENT']._serialized_end=19892
+  _globals['_PAYMENT_PAYMENTSTATUS']._serialized_start=19816
+  _globals['_PAYMENT_PAYMENTSTATUS']._serialized_end=19886
+  _globals['_HTLCATTEMPT']._serialized_start=19895
+  _globals['_HTLCATTEMPT']._serialized_end=20161
+  _globals['_HTLCATTEMPT_HTLCSTATUS']._serialized_start=20107
+  _globals['_HTLCATTEMPT_HTLCSTATUS']._serialized_end=20161
+  _globals['_LISTPAYMENTSREQUEST']._serialized_start=20163
+  _globals['_LISTPAYMENTSREQUEST']._serialized_end=20274
+  _globals['_LISTPAYMENTSRESPONSE']._serialized_start=20276
+  _globals['_LISTPAYMENTSRESPONSE']._serialized_end=20387
+  _globals['_DELETEPAYMENTREQUEST']._serialized_start=20389
+  _globals['_DELETEPAYMENTREQUEST']._serialized_end=20460
+  _globals['_DELETEALLPAYMENTSREQUEST']._serialized_start=20462
+  _globals['_DELETEALLPAYMENTSREQUEST']._serialized_end=20545
+  _globals['_DELETEPAYMENTRESPONSE']._serialized_start=20547
+  _globals['_DELETEPAYMENTRESPONSE']._serialized_end=20570
+  _globals['_DELETEALLPAYMENTSRESPONSE']._serialized_start=20572
+  _globals['_DELETEALLPAYMENTSRESPONSE']._serialized_end=20599
+  _globals['_ABANDONCHANNELREQUEST']._serialized_start=20602
+  _globals['_ABANDONCHANNELREQUEST']._serialized_end=20736
+  _globals['_ABANDONCHANNELRESPONSE']._serialized_start=20738
+  _globals['_ABANDONCHANNELRESPONSE']._serialized_end=20762
+  _globals['_DEBUGLEVELREQUEST']._serialized_start=20764
+  _globals['_DEBUGLEVELREQUEST']._serialized_end=20817
+  _globals['_DEBUGLEVELRESPONSE']._serialized_start=20819
+  _globals['_DEBUGLEVELRESPONSE']._serialized_end=20860
+  _globals['_PAYREQSTRING']._serialized_start=20862
+  _globals['_PAYREQSTRING']._serialized_end=20893
+  _globals['_PAYREQ']._serialized_start=20896
+  _globals['_PAYREQ']._serialized_end=21286
+  _globals['_PAYREQ_FEATURESENTRY']._serialized_start=6319
+  _globals['_PAYREQ_FEATURESENTRY']._serialized_end=6382
+  _globals['_FEATURE']._serialized_start=21288
+  _globals['_FEATURE']._serialized_end=21350
+  _globals['_FEEREPORTREQUEST']._serialized_start=21352
+  _globals['_FEEREPORTREQUEST']._serialized_end=21370
+  _globals['_CHANNELFEEREPORT']._serialized_start=21372
+  _globals['_CHANNELFEEREPORT']._serialized_end=21496
+  _globals['_FEEREPORTRESPONSE']._serialized_start=21499
+  _globals['_FEEREPORTRESPONSE']._serialized_end=21631
+  _globals['_POLICYUPDATEREQUEST']._serialized_start=21634
+  _globals['_POLICYUPDATEREQUEST']._serialized_end=21870
+  _globals['_FAILEDUPDATE']._serialized_start=21872
+  _globals['_FAILEDUPDATE']._serialized_end=21981
+  _globals['_POLICYUPDATERESPONSE']._serialized_start=21983
+  _globals['_POLICYUPDATERESPONSE']._serialized_end=22050
+  _globals['_FORWARDINGHISTORYREQUEST']._serialized_start=22052
+  _globals['_FORWARDINGHISTORYREQUEST']._serialized_end=22162
+  _globals['_FORWARDINGEVENT']._serialized_start=22165
+  _globals['_FORWARDINGEVENT']._serialized_end=22383
+  _globals['_FORWARDINGHISTORYRESPONSE']._serialized_start=22385
+  _globals['_FORWARDINGHISTORYRESPONSE']._serialized_end=22490
+  _globals['_EXPORTCHANNELBACKUPREQUEST']._serialized_start=22492
+  _globals['_EXPORTCHANNELBACKUPREQUEST']._serialized_end=22561
+  _globals['_CHANNELBACKUP']._serialized_start=22563
+  _globals['_CHANNELBACKUP']._serialized_end=22640
+  _globals['_MULTICHANBACKUP']._serialized_start=22642
+  _globals['_MULTICHANBACKUP']._serialized_end=22728
+  _globals['_CHANBACKUPEXPORTREQUEST']._serialized_start=22730
+  _globals['_CHANBACKUPEXPORTREQUEST']._serialized_end=22755
+  _globals['_CHANBACKUPSNAPSHOT']._serialized_start=22757
+  _globals['_CHANBACKUPSNAPSHOT']._serialized_end=22880
+  _globals['_CHANNELBACKUPS']._serialized_start=22882
+  _globals['_CHANNELBACKUPS']._serialized_end=22942
+  _globals['_RESTORECHANBACKUPREQUEST']._serialized_start=22944
+  _globals['_RESTORECHANBACKUPREQUEST']._serialized_end=23056
+  _globals['_RESTOREBACKUPRESPONSE']._serialized_start=23058
+  _globals['_RESTOREBACKUPRESPONSE']._serialized_end=23081
+  _globals['_CHANNELBACKUPSUBSCRIPTION']._serialized_start=23083
+  _globals['_CHANNELBACKUPSUBSCRIPTION']._serialized_end=23110
+  _globals['_VERIFYCHANBACKUPRESPONSE']._serialized_start=23112
+  _globals['_VERIFYCHANBACKUPRESPONSE']._serialized_end=23138
+  _globals['_MACAROONPERMISSION']._serialized_start=23140
+  _globals['_MACAROONPERMISSION']._serialized_end=23192
+  _globals['_BAKEMACAROONREQUEST']._serialized_start=23194
+  _globals['_BAKEMACAROONREQUEST']._serialized_end=23320
+  _globals['_BAKEMACAROONRESPONSE']._serialized_start=23322
+  _globals['_BAKEMACAROONRESPONSE']._serialized_end=23362
+  _globals['_LISTMACAROONIDSREQUEST']._serialized_start=23364
+  _globals['_LISTMACAROONIDSREQUEST']._serialized_end=23388
+  _globals['_LISTMACAROONIDSRESPONSE']._serialized_start=23390
+  _globals['_LISTMACAROONIDSRESPONSE']._serialized_end=23437
+  _globals['_DELETEMACAROONIDREQUEST']._serialized_start=23439
+  _globals['_DELETEMACAROONIDREQUEST']._serialized_end=23485
+  _globals['_DELETEMACAROONIDRESPONSE']._serialized_start=23487
+  _globals['_DELETEMACAROONIDRESPONSE']._serialized_end=23530
+  _globals['_MACAROONPERMISSIONLIST']._serialized_start=23532
+  _globals['_MACAROONPERMISSIONLIST']._serialized_end=23604
+  _globals['_LISTPERMISSIONSREQUEST']._serialized_start=23606
+  _globals['_LISTPERMISSIONSREQUEST']._serialized_end=23630
+  _globals['_LISTPERMISSIONSRESPONSE']._serialized_start=23633
+  _globals['_LISTPERMISSIONSRESPONSE']._serialized_end=23830
+  _globals['_LISTPERMISSIONSRESPONSE_METHODPERMISSIONSENTRY']._serialized_start=23743
+  _globals['_LISTPERMISSIONSRESPONSE_METHODPERMISSIONSENTRY']._serialized_end=23830
+  _globals['_FAILURE']._serialized_start=23833
+  _globals['_FAILURE']._serialized_end=24814
+  _globals['_FAILURE_FAILURECODE']._serialized_start=24057
+  _globals['_FAILURE_FAILURECODE']._serialized_end=24808
+  _globals['_CHANNELUPDATE']._serialized_start=24817
+  _globals['_CHANNELUPDATE']._serialized_end=25099
+  _globals['_MACAROONID']._serialized_start=25101
+  _globals['_MACAROONID']._serialized_end=25171
+  _globals['_OP']._serialized_start=25173
+  _globals['_OP']._serialized_end=25210
+  _globals['_CHECKMACPERMREQUEST']._serialized_start=25212
+  _globals['_CHECKMACPERMREQUEST']._serialized_end=25319
+  _globals['_CHECKMACPERMRESPONSE']._serialized_start=25321
+  _globals['_CHECKMACPERMRESPONSE']._serialized_end=25358
+  _globals['_RPCMIDDLEWAREREQUEST']._serialized_start=25361
+  _globals['_RPCMIDDLEWAREREQUEST']._serialized_end=25595
+  _globals['_STREAMAUTH']._serialized_start=25597
+  _globals['_STREAMAUTH']._serialized_end=25634
+  _globals['_RPCMESSAGE']._serialized_start=25636
+  _globals['_RPCMESSAGE']._serialized_end=25732
+  _globals['_RPCMIDDLEWARERESPONSE']._serialized_start=25735
+  _globals['_RPCMIDDLEWARERESPONSE']._serialized_end=25897
+  _globals['_MIDDLEWAREREGISTRATION']._serialized_start=25899
+  _globals['_MIDDLEWAREREGISTRATION']._serialized_end=26009
+  _globals['_INTERCEPTFEEDBACK']._serialized_start=26011
+  _globals['_INTERCEPTFEEDBACK']._serialized_end=26103
+  _globals['_LIGHTNING']._serialized_start=27749
+  _globals['_LIGHTNING']._serialized_end=32380
+# @@protoc_insertion_point(module_scope)
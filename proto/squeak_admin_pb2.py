@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: proto/squeak_admin.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'proto/squeak_admin.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from proto import lnd_pb2 as proto_dot_lnd__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18proto/squeak_admin.proto\x12\nsqueaknode\x1a\x0fproto/lnd.proto\"3\n\x1b\x43reateSigningProfileRequest\x12\x14\n\x0cprofile_name\x18\x01 \x01(\t\"/\n\x19\x43reateSigningProfileReply\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\"H\n\x1bImportSigningProfileRequest\x12\x14\n\x0cprofile_name\x18\x01 \x01(\t\x12\x13\n\x0bprivate_key\x18\x02 \x01(\t\"/\n\x19ImportSigningProfileReply\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\"C\n\x1b\x43reateContactProfileRequest\x12\x14\n\x0cprofile_name\x18\x01 \x01(\t\x12\x0e\n\x06pubkey\x18\x02 \x01(\t\"/\n\x19\x43reateContactProfileReply\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\"\x14\n\x12GetProfilesRequest\"F\n\x10GetProfilesReply\x12\x32\n\x0fsqueak_profiles\x18\x01 \x03(\x0b\x32\x19.squeaknode.SqueakProfile\"\x1b\n\x19GetSigningProfilesRequest\"M\n\x17GetSigningProfilesReply\x12\x32\n\x0fsqueak_profiles\x18\x01 \x03(\x0b\x32\x19.squeaknode.SqueakProfile\"\x1b\n\x19GetContactProfilesRequest\"M\n\x17GetContactProfilesReply\x12\x32\n\x0fsqueak_profiles\x18\x01 \x03(\x0b\x32\x19.squeaknode.SqueakProfile\"-\n\x17GetSqueakProfileRequest\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\"J\n\x15GetSqueakProfileReply\x12\x31\n\x0esqueak_profile\x18\x01 \x01(\x0b\x32\x19.squeaknode.SqueakProfile\"1\n\x1fGetSqueakProfileByPubKeyRequest\x12\x0e\n\x06pubkey\x18\x01 \x01(\t\"R\n\x1dGetSqueakProfileByPubKeyReply\x12\x31\n\x0esqueak_profile\x18\x01 \x01(\x0b\x32\x19.squeaknode.SqueakProfile\"-\n\x1dGetSqueakProfileByNameRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"P\n\x1bGetSqueakProfileByNameReply\x12\x31\n\x0esqueak_profile\x18\x01 \x01(\x0b\x32\x19.squeaknode.SqueakProfile\"I\n SetSqueakProfileFollowingRequest\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\x12\x11\n\tfollowing\x18\x02 \x01(\x08\" \n\x1eSetSqueakProfileFollowingReply\"F\n\x1aRenameSqueakProfileRequest\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\x12\x14\n\x0cprofile_name\x18\x02 \x01(\t\"\x1a\n\x18RenameSqueakProfileReply\"7\n!GetSqueakProfilePrivateKeyRequest\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\"6\n\x1fGetSqueakProfilePrivateKeyReply\x12\x13\n\x0bprivate_key\x18\x01 \x01(\t\"0\n\x1a\x44\x65leteSqueakProfileRequest\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\"\x1a\n\x18\x44\x65leteSqueakProfileReply\"I\n\x1cSetSqueakProfileImageRequest\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\x12\x15\n\rprofile_image\x18\x02 \x01(\t\"\x1c\n\x1aSetSqueakProfileImageReply\"4\n\x1e\x43learSqueakProfileImageRequest\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\"\x1e\n\x1c\x43learSqueakProfileImageReply\"4\n\x17GetProfileImagesRequest\x12\x19\n\x11profile_image_ids\x18\x01 \x03(\t\"I\n\x15GetProfileImagesReply\x12\x30\n\x0eprofile_images\x18\x01 \x03(\x0b\x32\x18.squeaknode.ProfileImage\"?\n\x0cProfileImage\x12\x18\n\x10profile_image_id\x18\x01 \x01(\t\x12\x15\n\rprofile_image\x18\x02 \x01(\t\"\xc8\x01\n\rSqueakProfile\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\x12\x14\n\x0cprofile_name\x18\x02 \x01(\t\x12\x17\n\x0fhas_private_key\x18\x03 \x01(\x08\x12\x0e\n\x06pubkey\x18\x04 \x01(\t\x12\x11\n\tfollowing\x18\x05 \x01(\x08\x12\x15\n\rprofile_image\x18\x06 \x01(\t\x12 \n\x18has_custom_profile_image\x18\x07 \x01(\x08\x12\x18\n\x10profile_image_id\x18\x08 \x01(\t\"~\n\x11MakeSqueakRequest\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x0f\n\x07replyto\x18\x03 \x01(\t\x12\x15\n\rhas_recipient\x18\x04 \x01(\x08\x12\x1c\n\x14recipient_profile_id\x18\x05 \x01(\x05\"&\n\x0fMakeSqueakReply\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"S\n\x13MakeResqueakRequest\x12\x12\n\nprofile_id\x18\x01 \x01(\x05\x12\x17\n\x0fresqueaked_hash\x18\x02 \x01(\t\x12\x0f\n\x07replyto\x18\x03 \x01(\t\"(\n\x11MakeResqueakReply\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"S\n\x17GetSqueakDisplayRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\x12#\n\x1bprofile_images_by_reference\x18\x02 \x01(\x08\"U\n\x15GetSqueakDisplayReply\x12<\n\x14squeak_display_entry\x18\x01 \x01(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\"\x80\x05\n\x12SqueakDisplayEntry\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\x12\x13\n\x0bis_unlocked\x18\x02 \x01(\x08\x12\x13\n\x0b\x63ontent_str\x18\x03 \x01(\t\x12\x10\n\x08is_reply\x18\x04 \x01(\x08\x12\x10\n\x08reply_to\x18\x05 \x01(\t\x12\x14\n\x0c\x62lock_height\x18\x06 \x01(\x05\x12\x12\n\nblock_hash\x18\x07 \x01(\t\x12\x12\n\nblock_time\x18\x08 \x01(\x03\x12\x13\n\x0bsqueak_time\x18\t \x01(\x03\x12\x15\n\rauthor_pubkey\x18\n \x01(\t\x12\x17\n\x0fis_author_known\x18\x0b \x01(\x08\x12)\n\x06\x61uthor\x18\x0c \x01(\x0b\x32\x19.squeaknode.SqueakProfile\x12\x15\n\rliked_time_ms\x18\r \x01(\x03\x12\x1d\n\x15serialized_squeak_hex\x18\x0e \x01(\t\x12\x16\n\x0esecret_key_hex\x18\x0f \x01(\t\x12\x12\n\nis_private\x18\x10 \x01(\x08\x12\x18\n\x10recipient_pubkey\x18\x11 \x01(\t\x12\x1a\n\x12is_recipient_known\x18\x12 \x01(\x08\x12,\n\trecipient\x18\x13 \x01(\x0b\x32\x19.squeaknode.SqueakProfile\x12\x13\n\x0bnum_replies\x18\x14 \x01(\x05\x12\x13\n\x0bis_resqueak\x18\x15 \x01(\x08\x12\x17\n\x0fresqueaked_hash\x18\x16 \x01(\t\x12\x39\n\x11resqueaked_squeak\x18\x17 \x01(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\x12\x15\n\rnum_resqueaks\x18\x18 \x01(\x05\"\x8a\x01\n GetTimelineSqueakDisplaysRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x32\n\nlast_entry\x18\x02 \x01(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\x12#\n\x1bprofile_images_by_reference\x18\x03 \x01(\x08\"`\n\x1eGetTimelineSqueakDisplaysReply\x12>\n\x16squeak_display_entries\x18\x01 \x03(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\"\x98\x01\n\x1eGetPubKeySqueakDisplaysRequest\x12\x0e\n\x06pubkey\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x32\n\nlast_entry\x18\x03 \x01(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\x12#\n\x1bprofile_images_by_reference\x18\x04 \x01(\x08\"^\n\x1cGetPubKeySqueakDisplaysReply\x12>\n\x16squeak_display_entries\x18\x01 \x03(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\"\x9d\x01\n\x1eGetSearchSqueakDisplaysRequest\x12\x13\n\x0bsearch_text\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x32\n\nlast_entry\x18\x03 \x01(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\x12#\n\x1bprofile_images_by_reference\x18\x04 \x01(\x08\"^\n\x1cGetSearchSqueakDisplaysReply\x12>\n\x16squeak_display_entries\x18\x01 \x03(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\"\\\n GetAncestorSqueakDisplaysRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\x12#\n\x1bprofile_images_by_reference\x18\x02 \x01(\x08\"`\n\x1eGetAncestorSqueakDisplaysReply\x12>\n\x16squeak_display_entries\x18\x01 \x03(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\"\x9c\x01\n\x1dGetReplySqueakDisplaysRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x32\n\nlast_entry\x18\x03 \x01(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\x12#\n\x1bprofile_images_by_reference\x18\x04 \x01(\x08\"]\n\x1bGetReplySqueakDisplaysReply\x12>\n\x16squeak_display_entries\x18\x01 \x03(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\"*\n\x13\x44\x65leteSqueakRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"\x13\n\x11\x44\x65leteSqueakReply\"U\n\x11\x43reatePeerRequest\x12\x11\n\tpeer_name\x18\x01 \x01(\t\x12-\n\x0cpeer_address\x18\x02 \x01(\x0b\x32\x17.squeaknode.PeerAddress\"\"\n\x0f\x43reatePeerReply\x12\x0f\n\x07peer_id\x18\x01 \x01(\x05\"!\n\x0eGetPeerRequest\x12\x0f\n\x07peer_id\x18\x01 \x01(\x05\";\n\x0cGetPeerReply\x12+\n\x0bsqueak_peer\x18\x01 \x01(\x0b\x32\x16.squeaknode.SqueakPeer\"H\n\x17GetPeerByAddressRequest\x12-\n\x0cpeer_address\x18\x01 \x01(\x0b\x32\x17.squeaknode.PeerAddress\"D\n\x15GetPeerByAddressReply\x12+\n\x0bsqueak_peer\x18\x01 \x01(\x0b\x32\x16.squeaknode.SqueakPeer\"\x11\n\x0fGetPeersRequest\"=\n\rGetPeersReply\x12,\n\x0csqueak_peers\x18\x01 \x03(\x0b\x32\x16.squeaknode.SqueakPeer\"\x8c\x01\n\nSqueakPeer\x12\x0f\n\x07peer_id\x18\x01 \x01(\x05\x12\x11\n\tpeer_name\x18\x02 \x01(\t\x12-\n\x0cpeer_address\x18\x03 \x01(\x0b\x32\x17.squeaknode.PeerAddress\x12\x13\n\x0b\x61utoconnect\x18\x04 \x01(\x08\x12\x16\n\x0eshare_for_free\x18\x05 \x01(\x08\"A\n\x19SetPeerAutoconnectRequest\x12\x0f\n\x07peer_id\x18\x01 \x01(\x05\x12\x13\n\x0b\x61utoconnect\x18\x02 \x01(\x08\"\x19\n\x17SetPeerAutoconnectReply\"E\n\x1aSetPeerShareForFreeRequest\x12\x0f\n\x07peer_id\x18\x01 \x01(\x05\x12\x16\n\x0eshare_for_free\x18\x02 \x01(\x08\"\x1a\n\x18SetPeerShareForFreeReply\"7\n\x11RenamePeerRequest\x12\x0f\n\x07peer_id\x18\x01 \x01(\x05\x12\x11\n\tpeer_name\x18\x02 \x01(\t\"\x11\n\x0fRenamePeerReply\"$\n\x11\x44\x65letePeerRequest\x12\x0f\n\x07peer_id\x18\x01 \x01(\x05\"\x11\n\x0f\x44\x65letePeerReply\"+\n\x14LoadBuyOffersRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"\x14\n\x12LoadBuyOffersReply\"*\n\x13GetBuyOffersRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"B\n\x11GetBuyOffersReply\x12-\n\x06offers\x18\x01 \x03(\x0b\x32\x1d.squeaknode.OfferDisplayEntry\"&\n\x12GetBuyOfferRequest\x12\x10\n\x08offer_id\x18\x01 \x01(\x05\"@\n\x10GetBuyOfferReply\x12,\n\x05offer\x18\x01 \x01(\x0b\x32\x1d.squeaknode.OfferDisplayEntry\"\xeb\x01\n\x11OfferDisplayEntry\x12\x10\n\x08offer_id\x18\x01 \x01(\x05\x12\x13\n\x0bsqueak_hash\x18\x02 \x01(\t\x12\x12\n\nprice_msat\x18\x03 \x01(\x03\x12\x13\n\x0bnode_pubkey\x18\x04 \x01(\t\x12\x11\n\tnode_host\x18\x05 \x01(\t\x12\x11\n\tnode_port\x18\x06 \x01(\x05\x12\x19\n\x11invoice_timestamp\x18\x07 \x01(\x05\x12\x16\n\x0einvoice_expiry\x18\x08 \x01(\x05\x12-\n\x0cpeer_address\x18\t \x01(\x0b\x32\x17.squeaknode.PeerAddress\"z\n\x16\x44ownloadSqueaksRequest\x12\x0f\n\x07pubkeys\x18\x01 \x03(\t\x12\x18\n\x10min_block_height\x18\x02 \x01(\x05\x12\x18\n\x10max_block_height\x18\x03 \x01(\x05\x12\x1b\n\x13replyto_squeak_hash\x18\x04 \x01(\t\"t\n\x0e\x44ownloadResult\x12\x19\n\x11number_downloaded\x18\x01 \x01(\x05\x12\x18\n\x10number_requested\x18\x02 \x01(\x05\x12\x14\n\x0cnumber_peers\x18\x03 \x01(\x05\x12\x17\n\x0f\x65lapsed_time_ms\x18\x04 \x01(\x05\"K\n\x14\x44ownloadSqueaksReply\x12\x33\n\x0f\x64ownload_result\x18\x01 \x01(\x0b\x32\x1a.squeaknode.DownloadResult\"#\n\x0fPayOfferRequest\x12\x10\n\x08offer_id\x18\x01 \x01(\x05\"(\n\rPayOfferReply\x12\x17\n\x0fsent_payment_id\x18\x01 \x01(\x05\"\x8f\x01\n\x14\x44\x65\x63ryptSqueakRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\x12\x15\n\rhas_recipient\x18\x02 \x01(\x08\x12\x1c\n\x14recipient_profile_id\x18\x03 \x01(\x05\x12\x12\n\nhas_author\x18\x04 \x01(\x08\x12\x19\n\x11\x61uthor_profile_id\x18\x05 \x01(\x05\"\x14\n\x12\x44\x65\x63ryptSqueakReply\"[\n\x16GetSentPaymentsRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x32\n\x11last_sent_payment\x18\x02 \x01(\x0b\x32\x17.squeaknode.SentPayment\"F\n\x14GetSentPaymentsReply\x12.\n\rsent_payments\x18\x01 \x03(\x0b\x32\x17.squeaknode.SentPayment\"y\n\x1fGetSentPaymentsForSqueakRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x32\n\x11last_sent_payment\x18\x03 \x01(\x0b\x32\x17.squeaknode.SentPayment\"O\n\x1dGetSentPaymentsForSqueakReply\x12.\n\rsent_payments\x18\x01 \x03(\x0b\x32\x17.squeaknode.SentPayment\"t\n\x1fGetSentPaymentsForPubkeyRequest\x12\x0e\n\x06pubkey\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x32\n\x11last_sent_payment\x18\x03 \x01(\x0b\x32\x17.squeaknode.SentPayment\"O\n\x1dGetSentPaymentsForPubkeyReply\x12.\n\rsent_payments\x18\x01 \x03(\x0b\x32\x17.squeaknode.SentPayment\"\x91\x01\n\x1dGetSentPaymentsForPeerRequest\x12-\n\x0cpeer_address\x18\x01 \x01(\x0b\x32\x17.squeaknode.PeerAddress\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x32\n\x11last_sent_payment\x18\x03 \x01(\x0b\x32\x17.squeaknode.SentPayment\"M\n\x1bGetSentPaymentsForPeerReply\x12.\n\rsent_payments\x18\x01 \x03(\x0b\x32\x17.squeaknode.SentPayment\"0\n\x15GetSentPaymentRequest\x12\x17\n\x0fsent_payment_id\x18\x01 \x01(\x05\"D\n\x13GetSentPaymentReply\x12-\n\x0csent_payment\x18\x01 \x01(\x0b\x32\x17.squeaknode.SentPayment\"\xc9\x01\n\x0bSentPayment\x12\x17\n\x0fsent_payment_id\x18\x01 \x01(\x05\x12\x13\n\x0bsqueak_hash\x18\x02 \x01(\t\x12\x14\n\x0cpayment_hash\x18\x03 \x01(\t\x12\x12\n\nprice_msat\x18\x04 \x01(\x03\x12\x13\n\x0bnode_pubkey\x18\x05 \x01(\t\x12\r\n\x05valid\x18\x06 \x01(\x08\x12\x0f\n\x07time_ms\x18\x07 \x01(\x03\x12-\n\x0cpeer_address\x18\x08 \x01(\x0b\x32\x17.squeaknode.PeerAddress\",\n\x15\x44ownloadSqueakRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"J\n\x13\x44ownloadSqueakReply\x12\x33\n\x0f\x64ownload_result\x18\x01 \x01(\x0b\x32\x1a.squeaknode.DownloadResult\"5\n\x1e\x44ownloadSqueakSecretKeyRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"S\n\x1c\x44ownloadSqueakSecretKeyReply\x12\x33\n\x0f\x64ownload_result\x18\x01 \x01(\x0b\x32\x1a.squeaknode.DownloadResult\",\n\x15\x44ownloadOffersRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"J\n\x13\x44ownloadOffersReply\x12\x33\n\x0f\x64ownload_result\x18\x01 \x01(\x0b\x32\x1a.squeaknode.DownloadResult\"-\n\x16\x44ownloadRepliesRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"K\n\x14\x44ownloadRepliesReply\x12\x33\n\x0f\x64ownload_result\x18\x01 \x01(\x0b\x32\x1a.squeaknode.DownloadResult\".\n\x1c\x44ownloadPubKeySqueaksRequest\x12\x0e\n\x06pubkey\x18\x01 \x01(\t\"Q\n\x1a\x44ownloadPubKeySqueaksReply\x12\x33\n\x0f\x64ownload_result\x18\x01 \x01(\x0b\x32\x1a.squeaknode.DownloadResult\"\x16\n\x14GetSentOffersRequest\"@\n\x12GetSentOffersReply\x12*\n\x0bsent_offers\x18\x01 \x03(\x0b\x32\x15.squeaknode.SentOffer\"a\n\tSentOffer\x12\x15\n\rsent_offer_id\x18\x01 \x01(\x05\x12\x13\n\x0bsqueak_hash\x18\x02 \x01(\t\x12\x14\n\x0cpayment_hash\x18\x03 \x01(\t\x12\x12\n\nprice_msat\x18\x04 \x01(\x03\"g\n\x1aGetReceivedPaymentsRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12:\n\x15last_received_payment\x18\x02 \x01(\x0b\x32\x1b.squeaknode.ReceivedPayment\"R\n\x18GetReceivedPaymentsReply\x12\x36\n\x11received_payments\x18\x01 \x03(\x0b\x32\x1b.squeaknode.ReceivedPayment\"\x85\x01\n#GetReceivedPaymentsForSqueakRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12:\n\x15last_received_payment\x18\x03 \x01(\x0b\x32\x1b.squeaknode.ReceivedPayment\"[\n!GetReceivedPaymentsForSqueakReply\x12\x36\n\x11received_payments\x18\x01 \x03(\x0b\x32\x1b.squeaknode.ReceivedPayment\"\x80\x01\n#GetReceivedPaymentsForPubkeyRequest\x12\x0e\n\x06pubkey\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12:\n\x15last_received_payment\x18\x03 \x01(\x0b\x32\x1b.squeaknode.ReceivedPayment\"[\n!GetReceivedPaymentsForPubkeyReply\x12\x36\n\x11received_payments\x18\x01 \x03(\x0b\x32\x1b.squeaknode.ReceivedPayment\"\x9d\x01\n!GetReceivedPaymentsForPeerRequest\x12-\n\x0cpeer_address\x18\x01 \x01(\x0b\x32\x17.squeaknode.PeerAddress\x12\r\n\x05limit\x18\x02 \x01(\x05\x12:\n\x15last_received_payment\x18\x03 \x01(\x0b\x32\x1b.squeaknode.ReceivedPayment\"Y\n\x1fGetReceivedPaymentsForPeerReply\x12\x36\n\x11received_payments\x18\x01 \x03(\x0b\x32\x1b.squeaknode.ReceivedPayment\"\xad\x01\n\x0fReceivedPayment\x12\x1b\n\x13received_payment_id\x18\x01 \x01(\x05\x12\x13\n\x0bsqueak_hash\x18\x02 \x01(\t\x12\x14\n\x0cpayment_hash\x18\x03 \x01(\t\x12\x12\n\nprice_msat\x18\x04 \x01(\x03\x12\x0f\n\x07time_ms\x18\x05 \x01(\x03\x12-\n\x0cpeer_address\x18\x06 \x01(\x0b\x32\x17.squeaknode.PeerAddress\"9\n SubscribeReceivedPaymentsRequest\x12\x15\n\rpayment_index\x18\x01 \x01(\x03\"\x13\n\x11GetNetworkRequest\"\"\n\x0fGetNetworkReply\x12\x0f\n\x07network\x18\x01 \x01(\t\"\x1a\n\x18GetPaymentSummaryRequest\"M\n\x16GetPaymentSummaryReply\x12\x33\n\x0fpayment_summary\x18\x01 \x01(\x0b\x32\x1a.squeaknode.PaymentSummary\"8\n!GetPaymentSummaryForSqueakRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"V\n\x1fGetPaymentSummaryForSqueakReply\x12\x33\n\x0fpayment_summary\x18\x01 \x01(\x0b\x32\x1a.squeaknode.PaymentSummary\"3\n!GetPaymentSummaryForPubkeyRequest\x12\x0e\n\x06pubkey\x18\x01 \x01(\t\"V\n\x1fGetPaymentSummaryForPubkeyReply\x12\x33\n\x0fpayment_summary\x18\x01 \x01(\x0b\x32\x1a.squeaknode.PaymentSummary\"P\n\x1fGetPaymentSummaryForPeerRequest\x12-\n\x0cpeer_address\x18\x01 \x01(\x0b\x32\x17.squeaknode.PeerAddress\"T\n\x1dGetPaymentSummaryForPeerReply\x12\x33\n\x0fpayment_summary\x18\x01 \x01(\x0b\x32\x1a.squeaknode.PaymentSummary\"\x81\x01\n\x0ePaymentSummary\x12\x1d\n\x15num_received_payments\x18\x01 \x01(\x05\x12\x19\n\x11num_sent_payments\x18\x02 \x01(\x05\x12\x1a\n\x12\x61mount_earned_msat\x18\x03 \x01(\x03\x12\x19\n\x11\x61mount_spent_msat\x18\x04 \x01(\x03\"\"\n ReprocessReceivedPaymentsRequest\" \n\x1eReprocessReceivedPaymentsReply\"(\n\x11LikeSqueakRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"\x11\n\x0fLikeSqueakReply\"*\n\x13UnlikeSqueakRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"\x13\n\x11UnlikeSqueakReply\"\x87\x01\n\x1dGetLikedSqueakDisplaysRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x32\n\nlast_entry\x18\x02 \x01(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\x12#\n\x1bprofile_images_by_reference\x18\x03 \x01(\x08\"]\n\x1bGetLikedSqueakDisplaysReply\x12>\n\x16squeak_display_entries\x18\x01 \x03(\x0b\x32\x1e.squeaknode.SqueakDisplayEntry\"C\n\x12\x43onnectPeerRequest\x12-\n\x0cpeer_address\x18\x01 \x01(\x0b\x32\x17.squeaknode.PeerAddress\"\x12\n\x10\x43onnectPeerReply\"\xb9\x02\n\rConnectedPeer\x12-\n\x0cpeer_address\x18\x01 \x01(\x0b\x32\x17.squeaknode.PeerAddress\x12\x16\n\x0e\x63onnect_time_s\x18\x02 \x01(\x03\x12$\n\x1clast_message_received_time_s\x18\x03 \x01(\x03\x12 \n\x18number_messages_received\x18\x04 \x01(\x03\x12\x1d\n\x15number_bytes_received\x18\x05 \x01(\x03\x12\x1c\n\x14number_messages_sent\x18\x06 \x01(\x03\x12\x19\n\x11number_bytes_sent\x18\x07 \x01(\x03\x12\x15\n\ris_peer_saved\x18\x08 \x01(\x08\x12*\n\nsaved_peer\x18\t \x01(\x0b\x32\x16.squeaknode.SqueakPeer\"\x1a\n\x18GetConnectedPeersRequest\"L\n\x16GetConnectedPeersReply\x12\x32\n\x0f\x63onnected_peers\x18\x01 \x03(\x0b\x32\x19.squeaknode.ConnectedPeer\"H\n\x17GetConnectedPeerRequest\x12-\n\x0cpeer_address\x18\x01 \x01(\x0b\x32\x17.squeaknode.PeerAddress\"J\n\x15GetConnectedPeerReply\x12\x31\n\x0e\x63onnected_peer\x18\x01 \x01(\x0b\x32\x19.squeaknode.ConnectedPeer\"F\n\x15\x44isconnectPeerRequest\x12-\n\x0cpeer_address\x18\x01 \x01(\x0b\x32\x17.squeaknode.PeerAddress\"\x15\n\x13\x44isconnectPeerReply\" \n\x1eSubscribeConnectedPeersRequest\"N\n\x1dSubscribeConnectedPeerRequest\x12-\n\x0cpeer_address\x18\x01 \x01(\x0b\x32\x17.squeaknode.PeerAddress\":\n\x0bPeerAddress\x12\x0f\n\x07network\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\x05\"0\n\x19SubscribeBuyOffersRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\"Y\n\x1dSubscribeSqueakDisplayRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\x12#\n\x1bprofile_images_by_reference\x18\x02 \x01(\x08\"_\n#SubscribeReplySqueakDisplaysRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\x12#\n\x1bprofile_images_by_reference\x18\x02 \x01(\x08\"[\n$SubscribePubKeySqueakDisplaysRequest\x12\x0e\n\x06pubkey\x18\x01 \x01(\t\x12#\n\x1bprofile_images_by_reference\x18\x02 \x01(\x08\"b\n&SubscribeAncestorSqueakDisplaysRequest\x12\x13\n\x0bsqueak_hash\x18\x01 \x01(\t\x12#\n\x1bprofile_images_by_reference\x18\x02 \x01(\x08\"E\n\x1eSubscribeSqueakDisplaysRequest\x12#\n\x1bprofile_images_by_reference\x18\x01 \x01(\x08\"M\n&SubscribeTimelineSqueakDisplaysRequest\x12#\n\x1bprofile_images_by_reference\x18\x01 \x01(\x08\"\x1b\n\x19GetExternalAddressRequest\"H\n\x17GetExternalAddressReply\x12-\n\x0cpeer_address\x18\x01 \x01(\x0b\x32\x17.squeaknode.PeerAddress\"\x1b\n\x19GetDefaultPeerPortRequest\"\'\n\x17GetDefaultPeerPortReply\x12\x0c\n\x04port\x18\x01 \x01(\x05\")\n\x13SetSellPriceRequest\x12\x12\n\nprice_msat\x18\x01 \x01(\x03\"\x13\n\x11SetSellPriceReply\"\x17\n\x15\x43learSellPriceRequest\"\x15\n\x13\x43learSellPriceReply\"\x15\n\x13GetSellPriceRequest\"\'\n\x11GetSellPriceReply\x12\x12\n\nprice_msat\x18\x01 \x01(\x03\"\xad\x01\n\x0eTwitterAccount\x12\x1a\n\x12twitter_account_id\x18\x01 \x01(\x05\x12\x0e\n\x06handle\x18\x02 \x01(\t\x12\x12\n\nprofile_id\x18\x03 \x01(\x05\x12\x18\n\x10is_profile_known\x18\x04 \x01(\x08\x12*\n\x07profile\x18\x05 \x01(\x0b\x32\x19.squeaknode.SqueakProfile\x12\x15\n\ris_forwarding\x18\x06 \x01(\x08\"T\n\x18\x41\x64\x64TwitterAccountRequest\x12\x0e\n\x06handle\x18\x01 \x01(\t\x12\x12\n\nprofile_id\x18\x02 \x01(\x05\x12\x14\n\x0c\x62\x65\x61rer_token\x18\x03 \x01(\t\"4\n\x16\x41\x64\x64TwitterAccountReply\x12\x1a\n\x12twitter_account_id\x18\x01 \x01(\x05\"\x1b\n\x19GetTwitterAccountsRequest\"O\n\x17GetTwitterAccountsReply\x12\x34\n\x10twitter_accounts\x18\x01 \x03(\x0b\x32\x1a.squeaknode.TwitterAccount\"9\n\x1b\x44\x65leteTwitterAccountRequest\x12\x1a\n\x12twitter_account_id\x18\x01 \x01(\x05\"\x1b\n\x19\x44\x65leteTwitterAccountReply\"\x8b\x01\n\x0c\x44\x62QueryStats\x12\x13\n\x0bmethod_name\x18\x01 \x01(\t\x12\x11\n\tnum_calls\x18\x02 \x01(\x03\x12\x10\n\x08num_rows\x18\x03 \x01(\x03\x12\x15\n\rtotal_time_ms\x18\x04 \x01(\x01\x12\x13\n\x0bmax_time_ms\x18\x05 \x01(\x01\x12\x15\n\rbucket_counts\x18\x06 \x03(\x03\"\x18\n\x16GetDbQueryStatsRequest\"_\n\x14GetDbQueryStatsReply\x12-\n\x0bquery_stats\x18\x01 \x03(\x0b\x32\x18.squeaknode.DbQueryStats\x12\x18\n\x10\x62ucket_bounds_ms\x18\x02 \x03(\x01\"\xb2\x01\n\nCacheStats\x12\x12\n\ncache_name\x18\x01 \x01(\t\x12\x10\n\x08num_hits\x18\x02 \x01(\x03\x12\x12\n\nnum_misses\x18\x03 \x01(\x03\x12\x10\n\x08hit_rate\x18\x04 \x01(\x01\x12\x15\n\rnum_evictions\x18\x05 \x01(\x03\x12\x19\n\x11num_invalidations\x18\x06 \x01(\x03\x12\x13\n\x0bnum_entries\x18\x07 \x01(\x03\x12\x11\n\tnum_bytes\x18\x08 \x01(\x03\"\x16\n\x14GetCacheStatsRequest\"A\n\x12GetCacheStatsReply\x12+\n\x0b\x63\x61\x63he_stats\x18\x01 \x03(\x0b\x32\x16.squeaknode.CacheStats\"\xa7\x01\n\x13PeerConnectionStats\x12-\n\x0cpeer_address\x18\x01 \x01(\x0b\x32\x17.squeaknode.PeerAddress\x12\x14\n\x0cnum_requests\x18\x02 \x01(\x03\x12\x17\n\x0fnum_connections\x18\x03 \x01(\x03\x12\x1e\n\x16num_reused_connections\x18\x04 \x01(\x03\x12\x12\n\nreuse_rate\x18\x05 \x01(\x01\"\x1f\n\x1dGetPeerConnectionStatsRequest\"]\n\x1bGetPeerConnectionStatsReply\x12>\n\x15peer_connection_stats\x18\x01 \x03(\x0b\x32\x1f.squeaknode.PeerConnectionStats\"\x86\x01\n\x13SqueakDeletionStats\x12\x10\n\x08num_runs\x18\x01 \x01(\x03\x12\x13\n\x0bnum_deleted\x18\x02 \x01(\x03\x12\x13\n\x0bnum_batches\x18\x03 \x01(\x03\x12\x15\n\rtotal_time_ms\x18\x04 \x01(\x01\x12\x1c\n\x14num_budget_exhausted\x18\x05 \x01(\x03\"\x1f\n\x1dGetSqueakDeletionStatsRequest\"]\n\x1bGetSqueakDeletionStatsReply\x12>\n\x15squeak_deletion_stats\x18\x01 \x01(\x0b\x32\x1f.squeaknode.SqueakDeletionStats2\x8fM\n\x0bSqueakAdmin\x12=\n\nLndGetInfo\x12\x15.lnrpc.GetInfoRequest\x1a\x16.lnrpc.GetInfoResponse\"\x00\x12O\n\x10LndWalletBalance\x12\x1b.lnrpc.WalletBalanceRequest\x1a\x1c.lnrpc.WalletBalanceResponse\"\x00\x12\x46\n\rLndNewAddress\x12\x18.lnrpc.NewAddressRequest\x1a\x19.lnrpc.NewAddressResponse\"\x00\x12L\n\x0fLndListChannels\x12\x1a.lnrpc.ListChannelsRequest\x1a\x1b.lnrpc.ListChannelsResponse\"\x00\x12U\n\x12LndPendingChannels\x12\x1d.lnrpc.PendingChannelsRequest\x1a\x1e.lnrpc.PendingChannelsResponse\"\x00\x12P\n\x12LndGetTransactions\x12\x1d.lnrpc.GetTransactionsRequest\x1a\x19.lnrpc.TransactionDetails\"\x00\x12\x43\n\x0cLndListPeers\x12\x17.lnrpc.ListPeersRequest\x1a\x18.lnrpc.ListPeersResponse\"\x00\x12I\n\x0eLndConnectPeer\x12\x19.lnrpc.ConnectPeerRequest\x1a\x1a.lnrpc.ConnectPeerResponse\"\x00\x12R\n\x11LndDisconnectPeer\x12\x1c.lnrpc.DisconnectPeerRequest\x1a\x1d.lnrpc.DisconnectPeerResponse\"\x00\x12\x46\n\x12LndOpenChannelSync\x12\x19.lnrpc.OpenChannelRequest\x1a\x13.lnrpc.ChannelPoint\"\x00\x12K\n\x0fLndCloseChannel\x12\x1a.lnrpc.CloseChannelRequest\x1a\x18.lnrpc.CloseStatusUpdate\"\x00\x30\x01\x12[\n\x19LndSubscribeChannelEvents\x12\x1f.lnrpc.ChannelEventSubscription\x1a\x19.lnrpc.ChannelEventUpdate\"\x00\x30\x01\x12\x43\n\x0cLndSendCoins\x12\x17.lnrpc.SendCoinsRequest\x1a\x18.lnrpc.SendCoinsResponse\"\x00\x12h\n\x14\x43reateSigningProfile\x12\'.squeaknode.CreateSigningProfileRequest\x1a%.squeaknode.CreateSigningProfileReply\"\x00\x12h\n\x14\x43reateContactProfile\x12\'.squeaknode.CreateContactProfileRequest\x1a%.squeaknode.CreateContactProfileReply\"\x00\x12h\n\x14ImportSigningProfile\x12\'.squeaknode.ImportSigningProfileRequest\x1a%.squeaknode.ImportSigningProfileReply\"\x00\x12M\n\x0bGetProfiles\x12\x1e.squeaknode.GetProfilesRequest\x1a\x1c.squeaknode.GetProfilesReply\"\x00\x12\x62\n\x12GetSigningProfiles\x12%.squeaknode.GetSigningProfilesRequest\x1a#.squeaknode.GetSigningProfilesReply\"\x00\x12\x62\n\x12GetContactProfiles\x12%.squeaknode.GetContactProfilesRequest\x1a#.squeaknode.GetContactProfilesReply\"\x00\x12\\\n\x10GetSqueakProfile\x12#.squeaknode.GetSqueakProfileRequest\x1a!.squeaknode.GetSqueakProfileReply\"\x00\x12t\n\x18GetSqueakProfileByPubKey\x12+.squeaknode.GetSqueakProfileByPubKeyRequest\x1a).squeaknode.GetSqueakProfileByPubKeyReply\"\x00\x12n\n\x16GetSqueakProfileByName\x12).squeaknode.GetSqueakProfileByNameRequest\x1a\'.squeaknode.GetSqueakProfileByNameReply\"\x00\x12w\n\x19SetSqueakProfileFollowing\x12,.squeaknode.SetSqueakProfileFollowingRequest\x1a*.squeaknode.SetSqueakProfileFollowingReply\"\x00\x12\x65\n\x13RenameSqueakProfile\x12&.squeaknode.RenameSqueakProfileRequest\x1a$.squeaknode.RenameSqueakProfileReply\"\x00\x12z\n\x1aGetSqueakProfilePrivateKey\x12-.squeaknode.GetSqueakProfilePrivateKeyRequest\x1a+.squeaknode.GetSqueakProfilePrivateKeyReply\"\x00\x12\x65\n\x13\x44\x65leteSqueakProfile\x12&.squeaknode.DeleteSqueakProfileRequest\x1a$.squeaknode.DeleteSqueakProfileReply\"\x00\x12k\n\x15SetSqueakProfileImage\x12(.squeaknode.SetSqueakProfileImageRequest\x1a&.squeaknode.SetSqueakProfileImageReply\"\x00\x12q\n\x17\x43learSqueakProfileImage\x12*.squeaknode.ClearSqueakProfileImageRequest\x1a(.squeaknode.ClearSqueakProfileImageReply\"\x00\x12\\\n\x10GetProfileImages\x12#.squeaknode.GetProfileImagesRequest\x1a!.squeaknode.GetProfileImagesReply\"\x00\x12J\n\nMakeSqueak\x12\x1d.squeaknode.MakeSqueakRequest\x1a\x1b.squeaknode.MakeSqueakReply\"\x00\x12P\n\x0cMakeResqueak\x12\x1f.squeaknode.MakeResqueakRequest\x1a\x1d.squeaknode.MakeResqueakReply\"\x00\x12\\\n\x10GetSqueakDisplay\x12#.squeaknode.GetSqueakDisplayRequest\x1a!.squeaknode.GetSqueakDisplayReply\"\x00\x12w\n\x19GetTimelineSqueakDisplays\x12,.squeaknode.GetTimelineSqueakDisplaysRequest\x1a*.squeaknode.GetTimelineSqueakDisplaysReply\"\x00\x12q\n\x17GetPubKeySqueakDisplays\x12*.squeaknode.GetPubKeySqueakDisplaysRequest\x1a(.squeaknode.GetPubKeySqueakDisplaysReply\"\x00\x12q\n\x17GetSearchSqueakDisplays\x12*.squeaknode.GetSearchSqueakDisplaysRequest\x1a(.squeaknode.GetSearchSqueakDisplaysReply\"\x00\x12w\n\x19GetAncestorSqueakDisplays\x12,.squeaknode.GetAncestorSqueakDisplaysRequest\x1a*.squeaknode.GetAncestorSqueakDisplaysReply\"\x00\x12n\n\x16GetReplySqueakDisplays\x12).squeaknode.GetReplySqueakDisplaysRequest\x1a\'.squeaknode.GetReplySqueakDisplaysReply\"\x00\x12P\n\x0c\x44\x65leteSqueak\x12\x1f.squeaknode.DeleteSqueakRequest\x1a\x1d.squeaknode.DeleteSqueakReply\"\x00\x12J\n\nCreatePeer\x12\x1d.squeaknode.CreatePeerRequest\x1a\x1b.squeaknode.CreatePeerReply\"\x00\x12\x41\n\x07GetPeer\x12\x1a.squeaknode.GetPeerRequest\x1a\x18.squeaknode.GetPeerReply\"\x00\x12\\\n\x10GetPeerByAddress\x12#.squeaknode.GetPeerByAddressRequest\x1a!.squeaknode.GetPeerByAddressReply\"\x00\x12\x44\n\x08GetPeers\x12\x1b.squeaknode.GetPeersRequest\x1a\x19.squeaknode.GetPeersReply\"\x00\x12\x62\n\x12SetPeerAutoconnect\x12%.squeaknode.SetPeerAutoconnectRequest\x1a#.squeaknode.SetPeerAutoconnectReply\"\x00\x12\x65\n\x13SetPeerShareForFree\x12&.squeaknode.SetPeerShareForFreeRequest\x1a$.squeaknode.SetPeerShareForFreeReply\"\x00\x12J\n\nRenamePeer\x12\x1d.squeaknode.RenamePeerRequest\x1a\x1b.squeaknode.RenamePeerReply\"\x00\x12J\n\nDeletePeer\x12\x1d.squeaknode.DeletePeerRequest\x1a\x1b.squeaknode.DeletePeerReply\"\x00\x12P\n\x0cGetBuyOffers\x12\x1f.squeaknode.GetBuyOffersRequest\x1a\x1d.squeaknode.GetBuyOffersReply\"\x00\x12M\n\x0bGetBuyOffer\x12\x1e.squeaknode.GetBuyOfferRequest\x1a\x1c.squeaknode.GetBuyOfferReply\"\x00\x12Y\n\x0f\x44ownloadSqueaks\x12\".squeaknode.DownloadSqueaksRequest\x1a .squeaknode.DownloadSqueaksReply\"\x00\x12V\n\x0e\x44ownloadSqueak\x12!.squeaknode.DownloadSqueakRequest\x1a\x1f.squeaknode.DownloadSqueakReply\"\x00\x12q\n\x17\x44ownloadSqueakSecretKey\x12*.squeaknode.DownloadSqueakSecretKeyRequest\x1a(.squeaknode.DownloadSqueakSecretKeyReply\"\x00\x12V\n\x0e\x44ownloadOffers\x12!.squeaknode.DownloadOffersRequest\x1a\x1f.squeaknode.DownloadOffersReply\"\x00\x12Y\n\x0f\x44ownloadReplies\x12\".squeaknode.DownloadRepliesRequest\x1a .squeaknode.DownloadRepliesReply\"\x00\x12k\n\x15\x44ownloadPubKeySqueaks\x12(.squeaknode.DownloadPubKeySqueaksRequest\x1a&.squeaknode.DownloadPubKeySqueaksReply\"\x00\x12\x44\n\x08PayOffer\x12\x1b.squeaknode.PayOfferRequest\x1a\x19.squeaknode.PayOfferReply\"\x00\x12S\n\rDecryptSqueak\x12 .squeaknode.DecryptSqueakRequest\x1a\x1e.squeaknode.DecryptSqueakReply\"\x00\x12Y\n\x0fGetSentPayments\x12\".squeaknode.GetSentPaymentsRequest\x1a .squeaknode.GetSentPaymentsReply\"\x00\x12t\n\x18GetSentPaymentsForSqueak\x12+.squeaknode.GetSentPaymentsForSqueakRequest\x1a).squeaknode.GetSentPaymentsForSqueakReply\"\x00\x12t\n\x18GetSentPaymentsForPubkey\x12+.squeaknode.GetSentPaymentsForPubkeyRequest\x1a).squeaknode.GetSentPaymentsForPubkeyReply\"\x00\x12n\n\x16GetSentPaymentsForPeer\x12).squeaknode.GetSentPaymentsForPeerRequest\x1a\'.squeaknode.GetSentPaymentsForPeerReply\"\x00\x12V\n\x0eGetSentPayment\x12!.squeaknode.GetSentPaymentRequest\x1a\x1f.squeaknode.GetSentPaymentReply\"\x00\x12S\n\rGetSentOffers\x12 .squeaknode.GetSentOffersRequest\x1a\x1e.squeaknode.GetSentOffersReply\"\x00\x12\x65\n\x13GetReceivedPayments\x12&.squeaknode.GetReceivedPaymentsRequest\x1a$.squeaknode.GetReceivedPaymentsReply\"\x00\x12\x80\x01\n\x1cGetReceivedPaymentsForSqueak\x12/.squeaknode.GetReceivedPaymentsForSqueakRequest\x1a-.squeaknode.GetReceivedPaymentsForSqueakReply\"\x00\x12\x80\x01\n\x1cGetReceivedPaymentsForPubkey\x12/.squeaknode.GetReceivedPaymentsForPubkeyRequest\x1a-.squeaknode.GetReceivedPaymentsForPubkeyReply\"\x00\x12z\n\x1aGetReceivedPaymentsForPeer\x12-.squeaknode.GetReceivedPaymentsForPeerRequest\x1a+.squeaknode.GetReceivedPaymentsForPeerReply\"\x00\x12j\n\x19SubscribeReceivedPayments\x12,.squeaknode.SubscribeReceivedPaymentsRequest\x1a\x1b.squeaknode.ReceivedPayment\"\x00\x30\x01\x12J\n\nGetNetwork\x12\x1d.squeaknode.GetNetworkRequest\x1a\x1b.squeaknode.GetNetworkReply\"\x00\x12_\n\x11GetPaymentSummary\x12$.squeaknode.GetPaymentSummaryRequest\x1a\".squeaknode.GetPaymentSummaryReply\"\x00\x12z\n\x1aGetPaymentSummaryForSqueak\x12-.squeaknode.GetPaymentSummaryForSqueakRequest\x1a+.squeaknode.GetPaymentSummaryForSqueakReply\"\x00\x12z\n\x1aGetPaymentSummaryForPubkey\x12-.squeaknode.GetPaymentSummaryForPubkeyRequest\x1a+.squeaknode.GetPaymentSummaryForPubkeyReply\"\x00\x12t\n\x18GetPaymentSummaryForPeer\x12+.squeaknode.GetPaymentSummaryForPeerRequest\x1a).squeaknode.GetPaymentSummaryForPeerReply\"\x00\x12w\n\x19ReprocessReceivedPayments\x12,.squeaknode.ReprocessReceivedPaymentsRequest\x1a*.squeaknode.ReprocessReceivedPaymentsReply\"\x00\x12J\n\nLikeSqueak\x12\x1d.squeaknode.LikeSqueakRequest\x1a\x1b.squeaknode.LikeSqueakReply\"\x00\x12P\n\x0cUnlikeSqueak\x12\x1f.squeaknode.UnlikeSqueakRequest\x1a\x1d.squeaknode.UnlikeSqueakReply\"\x00\x12n\n\x16GetLikedSqueakDisplays\x12).squeaknode.GetLikedSqueakDisplaysRequest\x1a\'.squeaknode.GetLikedSqueakDisplaysReply\"\x00\x12M\n\x0b\x43onnectPeer\x12\x1e.squeaknode.ConnectPeerRequest\x1a\x1c.squeaknode.ConnectPeerReply\"\x00\x12_\n\x11GetConnectedPeers\x12$.squeaknode.GetConnectedPeersRequest\x1a\".squeaknode.GetConnectedPeersReply\"\x00\x12\\\n\x10GetConnectedPeer\x12#.squeaknode.GetConnectedPeerRequest\x1a!.squeaknode.GetConnectedPeerReply\"\x00\x12V\n\x0e\x44isconnectPeer\x12!.squeaknode.DisconnectPeerRequest\x1a\x1f.squeaknode.DisconnectPeerReply\"\x00\x12m\n\x17SubscribeConnectedPeers\x12*.squeaknode.SubscribeConnectedPeersRequest\x1a\".squeaknode.GetConnectedPeersReply\"\x00\x30\x01\x12j\n\x16SubscribeConnectedPeer\x12).squeaknode.SubscribeConnectedPeerRequest\x1a!.squeaknode.GetConnectedPeerReply\"\x00\x30\x01\x12]\n\x12SubscribeBuyOffers\x12%.squeaknode.SubscribeBuyOffersRequest\x1a\x1c.squeaknode.GetBuyOfferReply\"\x00\x30\x01\x12j\n\x16SubscribeSqueakDisplay\x12).squeaknode.SubscribeSqueakDisplayRequest\x1a!.squeaknode.GetSqueakDisplayReply\"\x00\x30\x01\x12v\n\x1cSubscribeReplySqueakDisplays\x12/.squeaknode.SubscribeReplySqueakDisplaysRequest\x1a!.squeaknode.GetSqueakDisplayReply\"\x00\x30\x01\x12x\n\x1dSubscribePubKeySqueakDisplays\x12\x30.squeaknode.SubscribePubKeySqueakDisplaysRequest\x1a!.squeaknode.GetSqueakDisplayReply\"\x00\x30\x01\x12\x85\x01\n\x1fSubscribeAncestorSqueakDisplays\x12\x32.squeaknode.SubscribeAncestorSqueakDisplaysRequest\x1a*.squeaknode.GetAncestorSqueakDisplaysReply\"\x00\x30\x01\x12l\n\x17SubscribeSqueakDisplays\x12*.squeaknode.SubscribeSqueakDisplaysRequest\x1a!.squeaknode.GetSqueakDisplayReply\"\x00\x30\x01\x12|\n\x1fSubscribeTimelineSqueakDisplays\x12\x32.squeaknode.SubscribeTimelineSqueakDisplaysRequest\x1a!.squeaknode.GetSqueakDisplayReply\"\x00\x30\x01\x12\x62\n\x12GetExternalAddress\x12%.squeaknode.GetExternalAddressRequest\x1a#.squeaknode.GetExternalAddressReply\"\x00\x12\x62\n\x12GetDefaultPeerPort\x12%.squeaknode.GetDefaultPeerPortRequest\x1a#.squeaknode.GetDefaultPeerPortReply\"\x00\x12P\n\x0cSetSellPrice\x12\x1f.squeaknode.SetSellPriceRequest\x1a\x1d.squeaknode.SetSellPriceReply\"\x00\x12V\n\x0e\x43learSellPrice\x12!.squeaknode.ClearSellPriceRequest\x1a\x1f.squeaknode.ClearSellPriceReply\"\x00\x12P\n\x0cGetSellPrice\x12\x1f.squeaknode.GetSellPriceRequest\x1a\x1d.squeaknode.GetSellPriceReply\"\x00\x12_\n\x11\x41\x64\x64TwitterAccount\x12$.squeaknode.AddTwitterAccountRequest\x1a\".squeaknode.AddTwitterAccountReply\"\x00\x12\x62\n\x12GetTwitterAccounts\x12%.squeaknode.GetTwitterAccountsRequest\x1a#.squeaknode.GetTwitterAccountsReply\"\x00\x12h\n\x14\x44\x65leteTwitterAccount\x12\'.squeaknode.DeleteTwitterAccountRequest\x1a%.squeaknode.DeleteTwitterAccountReply\"\x00\x12Y\n\x0fGetDbQueryStats\x12\".squeaknode.GetDbQueryStatsRequest\x1a .squeaknode.GetDbQueryStatsReply\"\x00\x12S\n\rGetCacheStats\x12 .squeaknode.GetCacheStatsRequest\x1a\x1e.squeaknode.GetCacheStatsReply\"\x00\x12n\n\x16GetPeerConnectionStats\x12).squeaknode.GetPeerConnectionStatsRequest\x1a\'.squeaknode.GetPeerConnectionStatsReply\"\x00\x12n\n\x16GetSqueakDeletionStats\x12).squeaknode.GetSqueakDeletionStatsRequest\x1a\'.squeaknode.GetSqueakDeletionStatsReply\"\x00\x42\x38\n\x1cio.github.yzernik.squeaknodeB\x10SqueakAdminProtoP\x01\xa2\x02\x03SQKb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.squeak_admin_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\034io.github.yzernik.squeaknodeB\020SqueakAdminProtoP\001\242\002\003SQK'
+  _globals['_CREATESIGNINGPROFILEREQUEST']._serialized_start=57
+  _globals['_CREATESIGNINGPROFILEREQUEST']._serialized_end=108
+  _globals['_CREATESIGNINGPROFILEREPLY']._serialized_start=110
+  _globals['_CREATESIGNINGPROFILEREPLY']._serialized_end=157
+  _globals['_IMPORTSIGNINGPROFILEREQUEST']._serialized_start=159
+  _globals['_IMPORTSIGNINGPROFILEREQUEST']._serialized_end=231
+  _globals['_IMPORTSIGNINGPROFILEREPLY']._serialized_start=233
+  _globals['_IMPORTSIGNINGPROFILEREPLY']._serialized_end=280
+  _globals['_CREATECONTACTPROFILEREQUEST']._serialized_start=282
+  _globals['_CREATECONTACTPROFILEREQUEST']._serialized_end=349
+  _globals['_CREATECONTACTPROFILEREPLY']._serialized_start=351
+  _globals['_CREATECONTACTPROFILEREPLY']._serialized_end=398
+  _globals['_GETPROFILESREQUEST']._serialized_start=400
+  _globals['_GETPROFILESREQUEST']._serialized_end=420
+  _globals['_GETPROFILESREPLY']._serialized_start=422
+  _globals['_GETPROFILESREPLY']._serialized_end=492
+  _globals['_GETSIGNINGPROFILESREQUEST']._serialized_start=494
+  _globals['_GETSIGNINGPROFILESREQUEST']._serialized_end=521
+  _globals['_GETSIGNINGPROFILESREPLY']._serialized_start=523
+  _globals['_GETSIGNINGPROFILESREPLY']._serialized_end=600
+  _globals['_GETCONTACTPROFILESREQUEST']._serialized_start=602
+  _globals['_GETCONTACTPROFILESREQUEST']._serialized_end=629
+  _globals['_GETCONTACTPROFILESREPLY']._serialized_start=631
+  _globals['_GETCONTACTPROFILESREPLY']._serialized_end=708
+  _globals['_GETSQUEAKPROFILEREQUEST']._serialized_start=710
+  _globals['_GETSQUEAKPROFILEREQUEST']._serialized_end=755
+  _globals['_GETSQUEAKPROFILEREPLY']._serialized_start=757
+  _globals['_GETSQUEAKPROFILEREPLY']._serialized_end=831
+  _globals['_GETSQUEAKPROFILEBYPUBKEYREQUEST']._serialized_start=833
+  _globals['_GETSQUEAKPROFILEBYPUBKEYREQUEST']._serialized_end=882
+  _globals['_GETSQUEAKPROFILEBYPUBKEYREPLY']._serialized_start=884
+  _globals['_GETSQUEAKPROFILEBYPUBKEYREPLY']._serialized_end=966
+  _globals['_GETSQUEAKPROFILEBYNAMEREQUEST']._serialized_start=968
+  _globals['_GETSQUEAKPROFILEBYNAMEREQUEST']._serialized_end=1013
+  _globals['_GETSQUEAKPROFILEBYNAMEREPLY']._serialized_start=1015
+  _globals['_GETSQUEAKPROFILEBYNAMEREPLY']._serialized_end=1095
+  _globals['_SETSQUEAKPROFILEFOLLOWINGREQUEST']._serialized_start=1097
+  _globals['_SETSQUEAKPROFILEFOLLOWINGREQUEST']._serialized_end=1170
+  _globals['_SETSQUEAKPROFILEFOLLOWINGREPLY']._serialized_start=1172
+  _globals['_SETSQUEAKPROFILEFOLLOWINGREPLY']._serialized_end=1204
+  _globals['_RENAMESQUEAKPROFILEREQUEST']._serialized_start=1206
+  _globals['_RENAMESQUEAKPROFILEREQUEST']._serialized_end=1276
+  _globals['_RENAMESQUEAKPROFILEREPLY']._serialized_start=1278
+  _globals['_RENAMESQUEAKPROFILEREPLY']._serialized_end=1304
+  _globals['_GETSQUEAKPROFILEPRIVATEKEYREQUEST']._serialized_start=1306
+  _globals['_GETSQUEAKPROFILEPRIVATEKEYREQUEST']._serialized_end=1361
+  _globals['_GETSQUEAKPROFILEPRIVATEKEYREPLY']._serialized_start=1363
+  _globals['_GETSQUEAKPROFILEPRIVATEKEYREPLY']._serialized_end=1417
+  _globals['_DELETESQUEAKPROFILEREQUEST']._serialized_start=1419
+  _globals['_DELETESQUEAKPROFILEREQUEST']._serialized_end=1467
+  _globals['_DELETESQUEAKPROFILEREPLY']._serialized_start=1469
+  _globals['_DELETESQUEAKPROFILEREPLY']._serialized_end=1495
+  _globals['_SETSQUEAKPROFILEIMAGEREQUEST']._serialized_start=1497
+  _globals['_SETSQUEAKPROFILEIMAGEREQUEST']._serialized_end=1570
+  _globals['_SETSQUEAKPROFILEIMAGEREPLY']._serialized_start=1572
+  _globals['_SETSQUEAKPROFILEIMAGEREPLY']._serialized_end=1600
+  _globals['_CLEARSQUEAKPROFILEIMAGEREQUEST']._serialized_start=1602
+  _globals['_CLEARSQUEAKPROFILEIMAGEREQUEST']._serialized_end=1654
+  _globals['_CLEARSQUEAKPROFILEIMAGEREPLY']._serialized_start=1656
+  _globals['_CLEARSQUEAKPROFILEIMAGEREPLY']._serialized_end=1686
+  _globals['_GETPROFILEIMAGESREQUEST']._serialized_start=1688
+  _globals['_GETPROFILEIMAGESREQUEST']._serialized_end=1740
+  _globals['_GETPROFILEIMAGESREPLY']._serialized_start=1742
+  _globals['_GETPROFILEIMAGESREPLY']._serialized_end=1815
+  _globals['_PROFILEIMAGE']._serialized_start=1817
+  _globals['_PROFILEIMAGE']._serialized_end=1880
+  _globals['_SQUEAKPROFILE']._serialized_start=1883
+  _globals['_SQUEAKPROFILE']._serialized_end=2083
+  _globals['_MAKESQUEAKREQUEST']._serialized_start=2085
+  _globals['_MAKESQUEAKREQUEST']._serialized_end=2211
+  _globals['_MAKESQUEAKREPLY']._serialized_start=2213
+  _globals['_MAKESQUEAKREPLY']._serialized_end=2251
+  _globals['_MAKERESQUEAKREQUEST']._serialized_start=2253
+  _globals['_MAKERESQUEAKREQUEST']._serialized_end=2336
+  _globals['_MAKERESQUEAKREPLY']._serialized_start=2338
+  _globals['_MAKERESQUEAKREPLY']._serialized_end=2378
+  _globals['_GETSQUEAKDISPLAYREQUEST']._serialized_start=2380
+  _globals['_GETSQUEAKDISPLAYREQUEST']._serialized_end=2463
+  _globals['_GETSQUEAKDISPLAYREPLY']._serialized_start=2465
+  _globals['_GETSQUEAKDISPLAYREPLY']._serialized_end=2550
+  _globals['_SQUEAKDISPLAYENTRY']._serialized_start=2553
+  _globals['_SQUEAKDISPLAYENTRY']._serialized_end=3193
+  _globals['_GETTIMELINESQUEAKDISPLAYSREQUEST']._serialized_start=3196
+  _globals['_GETTIMELINESQUEAKDISPLAYSREQUEST']._serialized_end=3334
+  _globals['_GETTIMELINESQUEAKDISPLAYSREPLY']._serialized_start=3336
+  _globals['_GETTIMELINESQUEAKDISPLAYSREPLY']._serialized_end=3432
+  _globals['_GETPUBKEYSQUEAKDISPLAYSREQUEST']._serialized_start=3435
+  _globals['_GETPUBKEYSQUEAKDISPLAYSREQUEST']._serialized_end=3587
+  _globals['_GETPUBKEYSQUEAKDISPLAYSREPLY']._serialized_start=3589
+  _globals['_GETPUBKEYSQUEAKDISPLAYSREPLY']._serialized_end=3683
+  _globals['_GETSEARCHSQUEAKDISPLAYSREQUEST']._serialized_start=3686
+  _globals['_GETSEARCHSQUEAKDISPLAYSREQUEST']._serialized_end=3843
+  _globals['_GETSEARCHSQUEAKDISPLAYSREPLY']._serialized_start=3845
+  _globals['_GETSEARCHSQUEAKDISPLAYSREPLY']._serialized_end=3939
+  _globals['_GETANCESTORSQUEAKDISPLAYSREQUEST']._serialized_start=3941
+  _globals['_GETANCESTORSQUEAKDISPLAYSREQUEST']._serialized_end=4033
+  _globals['_GETANCESTORSQUEAKDISPLAYSREPLY']._serialized_start=4035
+  _globals['_GETANCESTORSQUEAKDISPLAYSREPLY']._serialized_end=4131
+  _globals['_GETREPLYSQUEAKDISPLAYSREQUEST']._serialized_start=4134
+  _globals['_GETREPLYSQUEAKDISPLAYSREQUEST']._serialized_end=4290
+  _globals['_GETREPLYSQUEAKDISPLAYSREPLY']._serialized_start=4292
+  _globals['_GETREPLYSQUEAKDISPLAYSREPLY']._serialized_end=4385
+  _globals['_DELETESQUEAKREQUEST']._serialized_start=4387
+  _globals['_DELETESQUEAKREQUEST']._serialized_end=4429
+  _globals['_DELETESQUEAKREPLY']._serialized_start=4431
+  _globals['_DELETESQUEAKREPLY']._serialized_end=4450
+  _globals['_CREATEPEERREQUEST']._serialized_start=4452
+  _globals['_CREATEPEERREQUEST']._serialized_end=4537
+  _globals['_CREATEPEERREPLY']._serialized_start=4539
+  _globals['_CREATEPEERREPLY']._serialized_end=4573
+  _globals['_GETPEERREQUEST']._serialized_start=4575
+  _globals['_GETPEERREQUEST']._serialized_end=4608
+  _globals['_GETPEERREPLY']._serialized_start=4610
+  _globals['_GETPEERREPLY']._serialized_end=4669
+  _globals['_GETPEERBYADDRESSREQUEST']._serialized_start=4671
+  _globals['_GETPEERBYADDRESSREQUEST']._serialized_end=4743
+  _globals['_GETPEERBYADDRESSREPLY']._serialized_start=4745
+  _globals['_GETPEERBYADDRESSREPLY']._serialized_end=4813
+  _globals['_GETPEERSREQUEST']._serialized_start=4815
+  _globals['_GETPEERSREQUEST']._serialized_end=4832
+  _globals['_GETPEERSREPLY']._serialized_start=4834
+  _globals['_GETPEERSREPLY']._serialized_end=4895
+  _globals['_SQUEAKPEER']._serialized_start=4898
+  _globals['_SQUEAKPEER']._serialized_end=5038
+  _globals['_SETPEERAUTOCONNECTREQUEST']._serialized_start=5040
+  _globals['_SETPEERAUTOCONNECTREQUEST']._serialized_end=5105
+  _globals['_SETPEERAUTOCONNECTREPLY']._serialized_start=5107
+  _globals['_SETPEERAUTOCONNECTREPLY']._serialized_end=5132
+  _globals['_SETPEERSHAREFORFREEREQUEST']._serialized_start=5134
+  _globals['_SETPEERSHAREFORFREEREQUEST']._serialized_end=5203
+  _globals['_SETPEERSHAREFORFREEREPLY']._serialized_start=5205
+  _globals['_SETPEERSHAREFORFREEREPLY']._serialized_end=5231
+  _globals['_RENAMEPEERREQUEST']._serialized_start=5233
+  _globals['_RENAMEPEERREQUEST']._serialized_end=5288
+  _globals['_RENAMEPEERREPLY']._serialized_start=5290
+  _globals['_RENAMEPEERREPLY']._serialized_end=5307
+  _globals['_DELETEPEERREQUEST']._serialized_start=5309
+  _globals['_DELETEPEERREQUEST']._serialized_end=5345
+  _globals['_DELETEPEERREPLY']._serialized_start=5347
+  _globals['_DELETEPEERREPLY']._serialized_end=5364
+  _globals['_LOADBUYOFFERSREQUEST']._serialized_start=5366
+  _globals['_LOADBUYOFFERSREQUEST']._serialized_end=5409
+  _globals['_LOADBUYOFFERSREPLY']._serialized_start=5411
+  _globals['_LOADBUYOFFERSREPLY']._serialized_end=5431
+  _globals['_GETBUYOFFERSREQUEST']._serialized_start=5433
+  _globals['_GETBUYOFFERSREQUEST']._serialized_end=5475
+  _globals['_GETBUYOFFERSREPLY']._serialized_start=5477
+  _globals['_GETBUYOFFERSREPLY']._serialized_end=5543
+  _globals['_GETBUYOFFERREQUEST']._serialized_start=5545
+  _globals['_GETBUYOFFERREQUEST']._serialized_end=5583
+  _globals['_GETBUYOFFERREPLY']._serialized_start=5585
+  _globals['_GETBUYOFFERREPLY']._serialized_end=5649
+  _globals['_OFFERDISPLAYENTRY']._serialized_start=5652
+  _globals['_OFFERDISPLAYENTRY']._serialized_end=5887
+  _globals['_DOWNLOADSQUEAKSREQUEST']._serialized_start=5889
+  _globals['_DOWNLOADSQUEAKSREQUEST']._serialized_end=6011
+  _globals['_DOWNLOADRESULT']._serialized_start=6013
+  _globals['_DOWNLOADRESULT']._serialized_end=6129
+  _globals['_DOWNLOADSQUEAKSREPLY']._serialized_start=6131
+  _globals['_DOWNLOADSQUEAKSREPLY']._serialized_end=6206
+  _globals['_PAYOFFERREQUEST']._serialized_start=6208
+  _globals['_PAYOFFERREQUEST']._serialized_end=6243
+  _globals['_PAYOFFERREPLY']._serialized_start=6245
+  _globals['_PAYOFFERREPLY']._serialized_end=6285
+  _globals['_DECRYPTSQUEAKREQUEST']._serialized_start=6288
+  _globals['_DECRYPTSQUEAKREQUEST']._serialized_end=6431
+  _globals['_DECRYPTSQUEAKREPLY']._serialized_start=6433
+  _globals['_DECRYPTSQUEAKREPLY']._serialized_end=6453
+  _globals['_GETSENTPAYMENTSREQUEST']._serialized_start=6455
+  _globals['_GETSENTPAYMENTSREQUEST']._serialized_end=6546
+  _globals['_GETSENTPAYMENTSREPLY']._serialized_start=6548
+  _globals['_GETSENTPAYMENTSREPLY']._serialized_end=6618
+  _globals['_GETSENTPAYMENTSFORSQUEAKREQUEST']._serialized_start=6620
+  _globals['_GETSENTPAYMENTSFORSQUEAKREQUEST']._serialized_end=6741
+  _globals['_GETSENTPAYMENTSFORSQUEAKREPLY']._serialized_start=6743
+  _globals['_GETSENTPAYMENTSFORSQUEAKREPLY']._serialized_end=6822
+  _globals['_GETSENTPAYMENTSFORPUBKEYREQUEST']._serialized_start=6824
+  _globals['_GETSENTPAYMENTSFORPUBKEYREQUEST']._serialized_end=6940
+  _globals['_GETSENTPAYMENTSFORPUBKEYREPLY']._serialized_start=6942
+  _globals['_GETSENTPAYMENTSFORPUBKEYREPLY']._serialized_end=7021
+  _globals['_GETSENTPAYMENTSFORPEERREQUEST']._serialized_start=7024
+  _globals['_GETSENTPAYMENTSFORPEERREQUEST']._serialized_end=7169
+  _globals['_GETSENTPAYMENTSFORPEERREPLY']._serialized_start=7171
+  _globals['_GETSENTPAYMENTSFORPEERREPLY']._serialized_end=7248
+  _globals['_GETSENTPAYMENTREQUEST']._serialized_start=7250
+  _globals['_GETSENTPAYMENTREQUEST']._serialized_end=7298
+  _globals['_GETSENTPAYMENTREPLY']._serialized_start=7300
+  _globals['_GETSENTPAYMENTREPLY']._serialized_end=7368
+  _globals['_SENTPAYMENT']._serialized_start=7371
+  _globals['_SENTPAYMENT']._serialized_end=7572
+  _globals['_DOWNLOADSQUEAKREQUEST']._serialized_start=7574
+  _globals['_DOWNLOADSQUEAKREQUEST']._serialized_end=7618
+  _globals['_DOWNLOADSQUEAKREPLY']._serialized_start=7620
+  _globals['_DOWNLOADSQUEAKREPLY']._serialized_end=7694
+  _globals['_DOWNLOADSQUEAKSECRETKEYREQUEST']._serialized_start=7696
+  _globals['_DOWNLOADSQUEAKSECRETKEYREQUEST']._serialized_end=7749
+  _globals['_DOWNLOADSQUEAKSECRETKEYREPLY']._serialized_start=7751
+  _globals['_DOWNLOADSQUEAKSECRETKEYREPLY']._serialized_end=7834
+  _globals['_DOWNLOADOFFERSREQUEST']._serialized_start=7836
+  _globals['_DOWNLOADOFFERSREQUEST']._serialized_end=7880
+  _globals['_DOWNLOADOFFERSREPLY']._serialized_start=7882
+  _globals['_DOWNLOADOFFERSREPLY']._serialized_end=7956
+  _globals['_DOWNLOADREPLIESREQUEST']._serialized_start=7958
+  _globals['_DOWNLOADREPLIESREQUEST']._serialized_end=8003
+  _globals['_DOWNLOADREPLIESREPLY']._serialized_start=8005
+  _globals['_DOWNLOADREPLIESREPLY']._serialized_end=8080
+  _globals['_DOWNLOADPUBKEYSQUEAKSREQUEST']._serialized_start=8082
+  _globals['_DOWNLOADPUBKEYSQUEAKSREQUEST']._serialized_end=8128
+  _globals['_DOWNLOADPUBKEYSQUEAKSREPLY']._serialized_start=8130
+  _globals['_DOWNLOADPUBKEYSQUEAKSREPLY']._serialized_end=8211
+  _globals['_GETSENTOFFERSREQUEST']._serialized_start=8213
+  _globals['_GETSENTOFFERSREQUEST']._serialized_end=8235
+  _globals['_GETSENTOFFERSREPLY']._serialized_start=8237
+  _globals['_GETSENTOFFERSREPLY']._serialized_end=8301
+  _globals['_SENTOFFER']._serialized_start=8303
+  _globals['_SENTOFFER']._serialized_end=8400
+  _globals['_GETRECEIVEDPAYMENTSREQUEST']._serialized_start=8402
+  _globals['_GETRECEIVEDPAYMENTSREQUEST']._serialized_end=8505
+  _globals['_GETRECEIVEDPAYMENTSREPLY']._serialized_start=8507
+  _globals['_GETRECEIVEDPAYMENTSREPLY']._serialized_end=8589
+  _globals['_GETRECEIVEDPAYMENTSFORSQUEAKREQUEST']._serialized_start=8592
+  _globals['_GETRECEIVEDPAYMENTSFORSQUEAKREQUEST']._serialized_end=8725
+  _globals['_GETRECEIVEDPAYMENTSFORSQUEAKREPLY']._serialized_start=8727
+  _globals['_GETRECEIVEDPAYMENTSFORSQUEAKREPLY']._serialized_end=8818
+  _globals['_GETRECEIVEDPAYMENTSFORPUBKEYREQUEST']._serialized_start=8821
+  _globals['_GETRECEIVEDPAYMENTSFORPUBKEYREQUEST']._serialized_end=8949
+  _globals['_GETRECEIVEDPAYMENTSFORPUBKEYREPLY']._serialized_start=8951
+  _globals['_GETRECEIVEDPAYMENTSFORPUBKEYREPLY']._serialized_end=9042
+  _globals['_GETRECEIVEDPAYMENTSFORPEERREQUEST']._serialized_start=9045
+  _globals['_GETRECEIVEDPAYMENTSFORPEERREQUEST']._serialized_end=9202
+  _globals['_GETRECEIVEDPAYMENTSFORPEERREPLY']._serialized_start=9204
+  _globals['_GETRECEIVEDPAYMENTSFORPEERREPLY']._serialized_end=9293
+  _globals['_RECEIVEDPAYMENT']._serialized_start=9296
+  _globals['_RECEIVEDPAYMENT']._serialized_end=9469
+  _globals['_SUBSCRIBERECEIVEDPAYMENTSREQUEST']._serialized_start=9471
+  _globals['_SUBSCRIBERECEIVEDPAYMENTSREQUEST']._serialized_end=9528
+  _globals['_GETNETWORKREQUEST']._serialized_start=9530
+  _globals['_GETNETWORKREQUEST']._serialized_end=9549
+  _globals['_GETNETWORKREPLY']._serialized_start=9551
+  _globals['_GETNETWORKREPLY']._serialized_end=9585
+  _globals['_GETPAYMENTSUMMARYREQUEST']._serialized_start=9587
+  _globals['_GETPAYMENTSUMMARYREQUEST']._serialized_end=9613
+  _globals['_GETPAYMENTSUMMARYREPLY']._serialized_start=9615
+  _globals['_GETPAYMENTSUMMARYREPLY']._serialized_end=9692
+  _globals['_GETPAYMENTSUMMARYFORSQUEAKREQUEST']._serialized_start=9694
+  _globals['_GETPAYMENTSUMMARYFORSQUEAKREQUEST']._serialized_end=9750
+  _globals['_GETPAYMENTSUMMARYFORSQUEAKREPLY']._serialized_start=9752
+  _globals['_GETPAYMENTSUMMARYFORSQUEAKREPLY']._serialized_end=9838
+  _globals['_GETPAYMENTSUMMARYFORPUBKEYREQUEST']._serialized_start=9840
+  _globals['_GETPAYMENTSUMMARYFORPUBKEYREQUEST']._serialized_end=9891
+  _globals['_GETPAYMENTSUMMARYFORPUBKEYREPLY']._serialized_start=9893
+  _globals['_GETPAYMENTSUMMARYFORPUBKEYREPLY']._serialized_end=9979
+  _globals['_GETPAYMENTSUMMARYFORPEERREQUEST']._serialized_start=9981
+  _globals['_GETPAYMENTSUMMARYFORPEERREQUEST']._serialized_end=10061
+  _globals['_GETPAYMENTSUMMARYFORPEERREPLY']._serialized_start=10063
+  _globals['_GETPAYMENTSUMMARYFORPEERREPLY']._serialized_end=10147
+  _globals['_PAYMENTSUMMARY']._serialized_start=10150
+  _globals['_PAYMENTSUMMARY']._serialized_end=10279
+  _globals['_REPROCESSRECEIVEDPAYMENTSREQUEST']._serialized_start=10281
+  _globals['_REPROCESSRECEIVEDPAYMENTSREQUEST']._serialized_end=10315
+  _globals['_REPROCESSRECEIVEDPAYMENTSREPLY']._serialized_start=10317
+  _globals['_REPROCESSRECEIVEDPAYMENTSREPLY']._serialized_end=10349
+  _globals['_LIKESQUEAKREQUEST']._serialized_start=10351
+  _globals['_LIKESQUEAKREQUEST']._serialized_end=10391
+  _globals['_LIKESQUEAKREPLY']._serialized_start=10393
+  _globals['_LIKESQUEAKREPLY']._serialized_end=10410
+  _globals['_UNLIKESQUEAKREQUEST']._serialized_start=10412
+  _globals['_UNLIKESQUEAKREQUEST']._serialized_end=10454
+  _globals['_UNLIKESQUEAKREPLY']._serialized_start=10456
+  _globals['_UNLIKESQUEAKREPLY']._serialized_end=10475
+  _globals['_GETLIKEDSQUEAKDISPLAYSREQUEST']._serialized_start=10478
+  _globals['_GETLIKEDSQUEAKDISPLAYSREQUEST']._serialized_end=10613
+  _globals['_GETLIKEDSQUEAKDISPLAYSREPLY']._serialized_start=10615
+  _globals['_GETLIKEDSQUEAKDISPLAYSREPLY']._serialized_end=10708
+  _globals['_CONNECTPEERREQUEST']._serialized_start=10710
+  _globals['_CONNECTPEERREQUEST']._serialized_end=10777
+  _globals['_CONNECTPEERREPLY']._serialized_start=10779
+  _globals['_CONNECTPEERREPLY']._serialized_end=10797
+  _globals['_CONNECTEDPEER']._serialized_start=10800
+  _globals['_CONNECTEDPEER']._serialized_end=11113
+  _globals['_GETCONNECTEDPEERSREQUEST']._serialized_start=11115
+  _globals['_GETCONNECTEDPEERSREQUEST']._serialized_end=11141
+  _globals['_GETCONNECTEDPEERSREPLY']._serialized_start=11143
+  _globals['_GETCONNECTEDPEERSREPLY']._serialized_end=11219
+  _globals['_GETCONNECTEDPEERREQUEST']._serialized_start=11221
+  _globals['_GETCONNECTEDPEERREQUEST']._serialized_end=11293
+  _globals['_GETCONNECTEDPEERREPLY']._serialized_start=11295
+  _globals['_GETCONNECTEDPEERREPLY']._serialized_end=11369
+  _globals['_DISCONNECTPEERREQUEST']._serialized_start=11371
+  _globals['_DISCONNECTPEERREQUEST']._serialized_end=11441
+  _globals['_DISCONNECTPEERREPLY']._serialized_start=11443
+  _globals['_DISCONNECTPEERREPLY']._serialized_end=11464
+  _globals['_SUBSCRIBECONNECTEDPEERSREQUEST']._serialized_start=11466
+  _globals['_SUBSCRIBECONNECTEDPEERSREQUEST']._serialized_end=11498
+  _globals['_SUBSCRIBECONNECTEDPEERREQUEST']._serialized_start=11500
+  _globals['_SUBSCRIBECONNECTEDPEERREQUEST']._serialized_end=11578
+  _globals['_PEERADDRESS']._serialized_start=11580
+  _globals['_PEERADDRESS']._serialized_end=11638
+  _globals['_SUBSCRIBEBUYOFFERSREQUEST']._serialized_start=11640
+  _globals['_SUBSCRIBEBUYOFFERSREQUEST']._serialized_end=11688
+  _globals['_SUBSCRIBESQUEAKDISPLAYREQUEST']._serialized_start=11690
+  _globals['_SUBSCRIBESQUEAKDISPLAYREQUEST']._serialized_end=11779
+  _globals['_SUBSCRIBEREPLYSQUEAKDISPLAYSREQUEST']._serialized_start=11781
+  _globals['_SUBSCRIBEREPLYSQUEAKDISPLAYSREQUEST']._serialized_end=11876
+  _globals['_SUBSCRIBEPUBKEYSQUEAKDISPLAYSREQUEST']._serialized_start=11878
+  _globals['_SUBSCRIBEPUBKEYSQUEAKDISPLAYSREQUEST']._serialized_end=11969
+  _globals['_SUBSCRIBEANCESTORSQUEAKDISPLAYSREQUEST']._serialized_start=11971
+  _globals['_SUBSCRIBEANCESTORSQUEAKDISPLAYSREQUEST']._serialized_end=12069
+  _globals['_SUBSCRIBESQUEAKDISPLAYSREQUEST']._serialized_start=12071
+  _globals['_SUBSCRIBESQUEAKDISPLAYSREQUEST']._serialized_end=12140
+  _globals['_SUBSCRIBETIMELINESQUEAKDISPLAYSREQUEST']._serialized_start=12142
+  _globals['_SUBSCRIBETIMELINESQUEAKDISPLAYSREQUEST']._serialized_end=12219
+  _globals['_GETEXTERNALADDRESSREQUEST']._serialized_start=12221
+  _globals['_GETEXTERNALADDRESSREQUEST']._serialized_end=12248
+  _globals['_GETEXTERNALADDRESSREPLY']._serialized_start=12250
+  _globals['_GETEXTERNALADDRESSREPLY']._serialized_end=12322
+  _globals['_GETDEFAULTPEERPORTREQUEST']._serialized_start=12324
+  _globals['_GETDEFAULTPEERPORTREQUEST']._serialized_end=12351
+  _globals['_GETDEFAULTPEERPORTREPLY']._serialized_start=12353
+  _globals['_GETDEFAULTPEERPORTREPLY']._serialized_end=12392
+  _globals['_SETSELLPRICEREQUEST']._serialized_start=12394
+  _globals['_SETSELLPRICEREQUEST']._serialized_end=12435
+  _globals['_SETSELLPRICEREPLY']._serialized_start=12437
+  _globals['_SETSELLPRICEREPLY']._serialized_end=12456
+  _globals['_CLEARSELLPRICEREQUEST']._serialized_start=12458
+  _globals['_CLEARSELLPRICEREQUEST']._serialized_end=12481
+  _globals['_CLEARSELLPRICEREPLY']._serialized_start=12483
+  _globals['_CLEARSELLPRICEREPLY']._serialized_end=12504
+  _globals['_GETSELLPRICEREQUEST']._serialized_start=12506
+  _globals['_GETSELLPRICEREQUEST']._serialized_end=12527
+  _globals['_GETSELLPRICEREPLY']._serialized_start=12529
+  _globals['_GETSELLPRICEREPLY']._serialized_end=12568
+  _globals['_TWITTERACCOUNT']._serialized_start=12571
+  _globals['_TWITTERACCOUNT']._serialized_end=12744
+  _globals['_ADDTWITTERACCOUNTREQUEST']._serialized_start=12746
+  _globals['_ADDTWITTERACCOUNTREQUEST']._serialized_end=12830
+  _globals['_ADDTWITTERACCOUNTREPLY']._serialized_start=12832
+  _globals['_ADDTWITTERACCOUNTREPLY']._serialized_end=12884
+  _globals['_GETTWITTERACCOUNTSREQUEST']._serialized_start=12886
+  _globals['_GETTWITTERACCOUNTSREQUEST']._serialized_end=12913
+  _globals['_GETTWITTERACCOUNTSREPLY']._serialized_start=12915
+  _globals['_GETTWITTERACCOUNTSREPLY']._serialized_end=12994
+  _globals['_DELETETWITTERACCOUNTREQUEST']._serialized_start=12996
+  _globals['_DELETETWITTERACCOUNTREQUEST']._serialized_end=13053
+  _globals['_DELETETWITTERACCOUNTREPLY']._serialized_start=13055
+  _globals['_DELETETWITTERACCOUNTREPLY']._serialized_end=13082
+  _globals['_DBQUERYSTATS']._serialized_start=13085
+  _globals['_DBQUERYSTATS']._serialized_end=13224
+  _globals['_GETDBQUERYSTATSREQUEST']._serialized_start=13226
+  _globals['_GETDBQUERYSTATSREQUEST']._serialized_end=13250
+  _globals['_GETDBQUERYSTATSREPLY']._serialized_start=13252
+  _globals['_GETDBQUERYSTATSREPLY']._serialized_end=13347
+  _globals['_CACHESTATS']._serialized_start=13350
+  _globals['_CACHESTATS']._serialized_end=13528
+  _globals['_GETCACHESTATSREQUEST']._serialized_start=13530
+  _globals['_GETCACHESTATSREQUEST']._serialized_end=13552
+  _globals['_GETCACHESTATSREPLY']._serialized_start=13554
+  _globals['_GETCACHESTATSREPLY']._serialized_end=13619
+  _globals['_PEERCONNECTIONSTATS']._serialized_start=13622
+  _globals['_PEERCONNECTIONSTATS']._serialized_end=13789
+  _globals['_GETPEERCONNECTIONSTATSREQUEST']._serialized_start=13791
+  _globals['_GETPEERCONNECTIONSTATSREQUEST']._serialized_end=13822
+  _globals['_GETPEERCONNECTIONSTATSREPLY']._serialized_start=13824
+  _globals['_GETPEERCONNECTIONSTATSREPLY']._serialized_end=13917
+  _globals['_SQUEAKDELETIONSTATS']._serialized_start=13920
+  _globals['_SQUEAKDELETIONSTATS']._serialized_end=14054
+  _globals['_GETSQUEAKDELETIONSTATSREQUEST']._serialized_start=14056
+  _globals['_GETSQUEAKDELETIONSTATSREQUEST']._serialized_end=14087
+  _globals['_GETSQUEAKDELETIONSTATSREPLY']._serialized_start=14089
+  _globals['_GETSQUEAKDELETIONSTATSREPLY']._serialized_end=14182
+  _globals['_SQUEAKADMIN']._serialized_start=14185
+  _globals['_SQUEAKADMIN']._serialized_end=24056
+# @@protoc_insertion_point(module_scope)
@@ -107,6 +107,7 @@ setup(
     extras_require={
         "test": ["pytest", "coverage"],
         "postgres": ["psycopg2"],
+        "async": ["aiohttp", "aiohttp-socks"],
     },
     entry_points={
         'console_scripts': [
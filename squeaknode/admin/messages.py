@@ -27,14 +27,19 @@ from squeak.core.keys import SqueakPublicKey
 from proto import squeak_admin_pb2
 from squeaknode.admin.profile_image_util import bytes_to_base64_string
 from squeaknode.admin.profile_image_util import load_default_profile_image
+from squeaknode.core.cache_stats import CacheStats
 from squeaknode.core.download_result import DownloadResult
 from squeaknode.core.payment_summary import PaymentSummary
 from squeaknode.core.peer_address import Network
 from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.peer_connection_stats import PeerConnectionStats
+from squeaknode.core.profiles import get_profile_image_hash
+from squeaknode.core.query_method_stats import QueryMethodStats
 from squeaknode.core.received_offer import ReceivedOffer
 from squeaknode.core.received_payment import ReceivedPayment
 from squeaknode.core.sent_offer import SentOffer
 from squeaknode.core.sent_payment import SentPayment
+from squeaknode.core.squeak_deletion_stats import SqueakDeletionStats
 from squeaknode.core.squeak_entry import SqueakEntry
 from squeaknode.core.squeak_peer import SqueakPeer
 from squeaknode.core.squeak_profile import SqueakProfile
@@ -44,9 +49,13 @@ logger = logging.getLogger(__name__)
 
 
 DEFAULT_PROFILE_IMAGE = load_default_profile_image()
+DEFAULT_PROFILE_IMAGE_ID = get_profile_image_hash(DEFAULT_PROFILE_IMAGE).hex()
 
 
-def squeak_entry_to_message(squeak_entry: SqueakEntry) -> squeak_admin_pb2.SqueakDisplayEntry:
+def squeak_entry_to_message(
+        squeak_entry: SqueakEntry,
+        profile_images_by_reference: bool = False,
+) -> squeak_admin_pb2.SqueakDisplayEntry:
     return squeak_admin_pb2.SqueakDisplayEntry(
         squeak_hash=squeak_entry.squeak_hash.hex(),
         serialized_squeak_hex=squeak_entry.serialized_squeak.hex(),
@@ -63,7 +72,7 @@ def squeak_entry_to_message(squeak_entry: SqueakEntry) -> squeak_admin_pb2.Squea
                   if squeak_entry.reply_to else None),  # type: ignore
         author_pubkey=squeak_entry.public_key.to_bytes().hex(),
         is_author_known=(squeak_entry.squeak_profile is not None),
-        author=(squeak_profile_to_message(squeak_entry.squeak_profile)
+        author=(squeak_profile_to_message(squeak_entry.squeak_profile, profile_images_by_reference)
                 if squeak_entry.squeak_profile else None),
         liked_time_ms=squeak_entry.liked_time_ms,  # type: ignore
         num_replies=squeak_entry.num_replies,
@@ -72,27 +81,47 @@ def squeak_entry_to_message(squeak_entry: SqueakEntry) -> squeak_admin_pb2.Squea
         recipient_pubkey=(squeak_entry.recipient_public_key.to_bytes(
         ).hex() if squeak_entry.recipient_public_key else None),
         is_recipient_known=(squeak_entry.recipient_squeak_profile is not None),
-        recipient=(squeak_profile_to_message(squeak_entry.recipient_squeak_profile)
+        recipient=(squeak_profile_to_message(squeak_entry.recipient_squeak_profile, profile_images_by_reference)
                    if squeak_entry.recipient_squeak_profile else None),
         is_resqueak=(squeak_entry.resqueaked_hash is not None),
         resqueaked_hash=(squeak_entry.resqueaked_hash.hex()
                          if squeak_entry.resqueaked_hash else None),  # type: ignore
-        resqueaked_squeak=(squeak_entry_to_message(squeak_entry.resqueaked_squeak)
+        resqueaked_squeak=(squeak_entry_to_message(squeak_entry.resqueaked_squeak, profile_images_by_reference)
                            if squeak_entry.resqueaked_squeak else None),  # type: ignore
     )
 
 
-def squeak_profile_to_message(squeak_profile: SqueakProfile) -> squeak_admin_pb2.SqueakProfile:
-    profile_image = squeak_profile.profile_image or DEFAULT_PROFILE_IMAGE
-    image_base64_str = bytes_to_base64_string(profile_image)
+def squeak_profile_to_message(
+        squeak_profile: SqueakProfile,
+        profile_image_by_reference: bool = False,
+) -> squeak_admin_pb2.SqueakProfile:
+    profile_image_hash = squeak_profile.profile_image_hash
+    if profile_image_hash is None and squeak_profile.profile_image is not None:
+        profile_image_hash = get_profile_image_hash(
+            squeak_profile.profile_image)
+    profile_image_id = (profile_image_hash.hex()
+                        if profile_image_hash else DEFAULT_PROFILE_IMAGE_ID)
+    if profile_image_by_reference:
+        image_base64_str = None
+    else:
+        profile_image = squeak_profile.profile_image or DEFAULT_PROFILE_IMAGE
+        image_base64_str = bytes_to_base64_string(profile_image)
     return squeak_admin_pb2.SqueakProfile(
         profile_id=squeak_profile.profile_id or 0,
         profile_name=squeak_profile.profile_name,
         has_private_key=(squeak_profile.private_key is not None),
         pubkey=squeak_profile.public_key.to_bytes().hex(),
         following=squeak_profile.following,
-        profile_image=image_base64_str,
-        has_custom_profile_image=(squeak_profile.profile_image is not None),
+        profile_image=image_base64_str,  # type: ignore
+        has_custom_profile_image=(profile_image_hash is not None),
+        profile_image_id=profile_image_id,
+    )
+
+
+def profile_image_to_message(profile_image_id: str, profile_image: bytes) -> squeak_admin_pb2.ProfileImage:
+    return squeak_admin_pb2.ProfileImage(
+        profile_image_id=profile_image_id,
+        profile_image=bytes_to_base64_string(profile_image),
     )
 
 
@@ -164,6 +193,53 @@ def payment_summary_to_message(
     )
 
 
+def query_method_stats_to_message(
+        query_method_stats: QueryMethodStats,
+) -> squeak_admin_pb2.DbQueryStats:
+    return squeak_admin_pb2.DbQueryStats(
+        method_name=query_method_stats.method_name,
+        num_calls=query_method_stats.num_calls,
+        num_rows=query_method_stats.num_rows,
+        total_time_ms=query_method_stats.total_time_ms,
+        max_time_ms=query_method_stats.max_time_ms,
+        bucket_counts=query_method_stats.bucket_counts,
+    )
+
+
+def cache_stats_to_message(cache_stats: CacheStats) -> squeak_admin_pb2.CacheStats:
+    return squeak_admin_pb2.CacheStats(
+        cache_name=cache_stats.cache_name,
+        num_hits=cache_stats.num_hits,
+        num_misses=cache_stats.num_misses,
+        hit_rate=cache_stats.hit_rate,
+        num_evictions=cache_stats.num_evictions,
+        num_invalidations=cache_stats.num_invalidations,
+        num_entries=cache_stats.num_entries,
+        num_bytes=cache_stats.num_bytes,
+    )
+
+
+def peer_connection_stats_to_message(peer_connection_stats: PeerConnectionStats) -> squeak_admin_pb2.PeerConnectionStats:
+    return squeak_admin_pb2.PeerConnectionStats(
+        peer_address=peer_address_to_message(
+            peer_connection_stats.peer_address),
+        num_requests=peer_connection_stats.num_requests,
+        num_connections=peer_connection_stats.num_connections,
+        num_reused_connections=peer_connection_stats.num_reused_connections,
+        reuse_rate=peer_connection_stats.reuse_rate,
+    )
+
+
+def squeak_deletion_stats_to_message(squeak_deletion_stats: SqueakDeletionStats) -> squeak_admin_pb2.SqueakDeletionStats:
+    return squeak_admin_pb2.SqueakDeletionStats(
+        num_runs=squeak_deletion_stats.num_runs,
+        num_deleted=squeak_deletion_stats.num_deleted,
+        num_batches=squeak_deletion_stats.num_batches,
+        total_time_ms=squeak_deletion_stats.total_time_ms,
+        num_budget_exhausted=squeak_deletion_stats.num_budget_exhausted,
+    )
+
+
 def peer_address_to_message(peer_address: PeerAddress) -> squeak_admin_pb2.PeerAddress:
     return squeak_admin_pb2.PeerAddress(
         network=peer_address.network.name,
@@ -267,10 +343,13 @@ def optional_squeak_hash_to_hex(squeak_hash: Optional[bytes]) -> Optional[str]:
     return squeak_hash.hex()
 
 
-def optional_squeak_entry_to_message(squeak_entry: Optional[SqueakEntry]) -> Optional[squeak_admin_pb2.SqueakDisplayEntry]:
+def optional_squeak_entry_to_message(
+        squeak_entry: Optional[SqueakEntry],
+        profile_images_by_reference: bool = False,
+) -> Optional[squeak_admin_pb2.SqueakDisplayEntry]:
     if squeak_entry is None:
         return None
-    return squeak_entry_to_message(squeak_entry)
+    return squeak_entry_to_message(squeak_entry, profile_images_by_reference)
 
 
 def optional_squeak_peer_to_message(squeak_peer: Optional[SqueakPeer]) -> Optional[squeak_admin_pb2.SqueakPeer]:
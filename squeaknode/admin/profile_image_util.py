@@ -24,6 +24,13 @@ import base64
 from pkg_resources import resource_stream
 
 IMAGE_PATH = "icon.png"
+DEFAULT_IMAGE_MIMETYPE = "image/jpeg"
+IMAGE_MIMETYPE_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+]
 
 
 def load_default_profile_image():
@@ -38,3 +45,12 @@ def bytes_to_base64_string(data: bytes) -> str:
 def base64_string_to_bytes(data: str) -> bytes:
     base64_bytes = data.encode('utf-8')
     return base64.decodebytes(base64_bytes)
+
+
+def get_image_mimetype(data: bytes) -> str:
+    for signature, mimetype in IMAGE_MIMETYPE_SIGNATURES:
+        if data.startswith(signature):
+            return mimetype
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return DEFAULT_IMAGE_MIMETYPE
@@ -20,11 +20,15 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
+from typing import Optional
 
 from squeak.core.keys import SqueakPrivateKey
 from squeak.core.keys import SqueakPublicKey
 
 from proto import squeak_admin_pb2
+from squeaknode.admin.messages import cache_stats_to_message
+from squeaknode.admin.messages import DEFAULT_PROFILE_IMAGE
+from squeaknode.admin.messages import DEFAULT_PROFILE_IMAGE_ID
 from squeaknode.admin.messages import download_result_to_message
 from squeaknode.admin.messages import message_to_peer_address
 from squeaknode.admin.messages import message_to_received_payment
@@ -38,15 +42,20 @@ from squeaknode.admin.messages import optional_squeak_peer_to_message
 from squeaknode.admin.messages import optional_squeak_profile_to_message
 from squeaknode.admin.messages import payment_summary_to_message
 from squeaknode.admin.messages import peer_address_to_message
+from squeaknode.admin.messages import peer_connection_stats_to_message
+from squeaknode.admin.messages import profile_image_to_message
+from squeaknode.admin.messages import query_method_stats_to_message
 from squeaknode.admin.messages import received_offer_to_message
 from squeaknode.admin.messages import received_payment_to_message
 from squeaknode.admin.messages import sent_offer_to_message
 from squeaknode.admin.messages import sent_payment_to_message
+from squeaknode.admin.messages import squeak_deletion_stats_to_message
 from squeaknode.admin.messages import squeak_entry_to_message
 from squeaknode.admin.messages import squeak_peer_to_message
 from squeaknode.admin.messages import squeak_profile_to_message
 from squeaknode.admin.messages import twitter_account_to_message
 from squeaknode.admin.profile_image_util import base64_string_to_bytes
+from squeaknode.db.query_stats import QUERY_LATENCY_BUCKETS_MS
 from squeaknode.lightning.lnd_lightning_client import LNDLightningClient
 from squeaknode.node.squeak_controller import SqueakController
 
@@ -273,6 +282,35 @@ class SqueakAdminServerHandler(object):
         )
         return squeak_admin_pb2.ClearSqueakProfileImageReply()
 
+    def handle_get_profile_image(self, image_hash_str: str) -> Optional[bytes]:
+        logger.debug(
+            "Handle get profile image with hash: {}".format(image_hash_str))
+        if image_hash_str == DEFAULT_PROFILE_IMAGE_ID:
+            return DEFAULT_PROFILE_IMAGE
+        try:
+            image_hash = bytes.fromhex(image_hash_str)
+        except ValueError:
+            return None
+        return self.squeak_controller.get_profile_image(image_hash)
+
+    def handle_get_profile_images(self, request):
+        profile_image_ids = request.profile_image_ids
+        logger.info(
+            "Handle get profile images for number of ids: {}".format(
+                len(profile_image_ids),
+            )
+        )
+        profile_image_msgs = []
+        for profile_image_id in set(profile_image_ids):
+            profile_image = self.handle_get_profile_image(profile_image_id)
+            if profile_image is not None:
+                profile_image_msgs.append(
+                    profile_image_to_message(profile_image_id, profile_image)
+                )
+        return squeak_admin_pb2.GetProfileImagesReply(
+            profile_images=profile_image_msgs,
+        )
+
     def handle_get_squeak_profile_private_key(self, request):
         profile_id = request.profile_id
         logger.info(
@@ -344,7 +382,9 @@ class SqueakAdminServerHandler(object):
             )
         )
         display_message = optional_squeak_entry_to_message(
-            squeak_entry)
+            squeak_entry,
+            request.profile_images_by_reference,
+        )
         return squeak_admin_pb2.GetSqueakDisplayReply(
             squeak_display_entry=display_message
         )
@@ -372,7 +412,10 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(
+                entry,
+                request.profile_images_by_reference,
+            ) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetTimelineSqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -405,7 +448,10 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(
+                entry,
+                request.profile_images_by_reference,
+            ) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetPubKeySqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -437,7 +483,10 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(
+                entry,
+                request.profile_images_by_reference,
+            ) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetSearchSqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -462,7 +511,10 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(
+                entry,
+                request.profile_images_by_reference,
+            ) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetAncestorSqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -495,7 +547,10 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(
+                entry,
+                request.profile_images_by_reference,
+            ) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetReplySqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -1143,7 +1198,10 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(
+                entry,
+                request.profile_images_by_reference,
+            ) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetLikedSqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -1176,7 +1234,9 @@ class SqueakAdminServerHandler(object):
         )
         for squeak_display in squeak_display_stream:
             display_message = optional_squeak_entry_to_message(
-                squeak_display)
+                squeak_display,
+                request.profile_images_by_reference,
+            )
             yield squeak_admin_pb2.GetSqueakDisplayReply(
                 squeak_display_entry=display_message
             )
@@ -1192,7 +1252,9 @@ class SqueakAdminServerHandler(object):
         )
         for squeak_display in squeak_display_stream:
             display_message = optional_squeak_entry_to_message(
-                squeak_display)
+                squeak_display,
+                request.profile_images_by_reference,
+            )
             yield squeak_admin_pb2.GetSqueakDisplayReply(
                 squeak_display_entry=display_message
             )
@@ -1208,7 +1270,9 @@ class SqueakAdminServerHandler(object):
         )
         for squeak_display in squeak_display_stream:
             display_message = optional_squeak_entry_to_message(
-                squeak_display)
+                squeak_display,
+                request.profile_images_by_reference,
+            )
             yield squeak_admin_pb2.GetSqueakDisplayReply(
                 squeak_display_entry=display_message
             )
@@ -1229,7 +1293,10 @@ class SqueakAdminServerHandler(object):
                 )
             )
             squeak_display_msgs = [
-                squeak_entry_to_message(entry) for entry in squeak_entries
+                squeak_entry_to_message(
+                    entry,
+                    request.profile_images_by_reference,
+                ) for entry in squeak_entries
             ]
             yield squeak_admin_pb2.GetAncestorSqueakDisplaysReply(
                 squeak_display_entries=squeak_display_msgs
@@ -1242,7 +1309,9 @@ class SqueakAdminServerHandler(object):
         )
         for squeak_display in squeak_display_stream:
             display_message = optional_squeak_entry_to_message(
-                squeak_display)
+                squeak_display,
+                request.profile_images_by_reference,
+            )
             yield squeak_admin_pb2.GetSqueakDisplayReply(
                 squeak_display_entry=display_message
             )
@@ -1254,7 +1323,9 @@ class SqueakAdminServerHandler(object):
         )
         for squeak_display in squeak_display_stream:
             display_message = optional_squeak_entry_to_message(
-                squeak_display)
+                squeak_display,
+                request.profile_images_by_reference,
+            )
             yield squeak_admin_pb2.GetSqueakDisplayReply(
                 squeak_display_entry=display_message
             )
@@ -1335,3 +1406,45 @@ class SqueakAdminServerHandler(object):
             twitter_account_id,
         )
         return squeak_admin_pb2.DeleteTwitterAccountReply()
+
+    def handle_get_db_query_stats(self, request):
+        logger.info("Handle get db query stats")
+        query_stats = self.squeak_controller.get_db_query_stats()
+        query_stats_msgs = [
+            query_method_stats_to_message(stats)
+            for stats in query_stats
+        ]
+        return squeak_admin_pb2.GetDbQueryStatsReply(
+            query_stats=query_stats_msgs,
+            bucket_bounds_ms=QUERY_LATENCY_BUCKETS_MS,
+        )
+
+    def handle_get_cache_stats(self, request):
+        logger.info("Handle get cache stats")
+        cache_stats = self.squeak_controller.get_cache_stats()
+        cache_stats_msgs = [
+            cache_stats_to_message(stats)
+            for stats in cache_stats
+        ]
+        return squeak_admin_pb2.GetCacheStatsReply(
+            cache_stats=cache_stats_msgs,
+        )
+
+    def handle_get_peer_connection_stats(self, request):
+        logger.info("Handle get peer connection stats")
+        peer_connection_stats = self.squeak_controller.get_peer_connection_stats()
+        peer_connection_stats_msgs = [
+            peer_connection_stats_to_message(stats)
+            for stats in peer_connection_stats
+        ]
+        return squeak_admin_pb2.GetPeerConnectionStatsReply(
+            peer_connection_stats=peer_connection_stats_msgs,
+        )
+
+    def handle_get_squeak_deletion_stats(self, request):
+        logger.info("Handle get squeak deletion stats")
+        squeak_deletion_stats = self.squeak_controller.get_squeak_deletion_stats()
+        return squeak_admin_pb2.GetSqueakDeletionStatsReply(
+            squeak_deletion_stats=squeak_deletion_stats_to_message(
+                squeak_deletion_stats),
+        )
@@ -134,6 +134,9 @@ class SqueakAdminServerServicer(squeak_admin_pb2_grpc.SqueakAdminServicer):
     def ClearSqueakProfileImage(self, request, context):
         return self.handler.handle_clear_squeak_profile_image(request)
 
+    def GetProfileImages(self, request, context):
+        return self.handler.handle_get_profile_images(request)
+
     def GetSqueakProfilePrivateKey(self, request, context):
         return self.handler.handle_get_squeak_profile_private_key(request)
 
@@ -394,3 +397,15 @@ class SqueakAdminServerServicer(squeak_admin_pb2_grpc.SqueakAdminServicer):
 
     def DeleteTwitterAccount(self, request, context):
         return self.handler.handle_delete_twitter_account(request)
+
+    def GetDbQueryStats(self, request, context):
+        return self.handler.handle_get_db_query_stats(request)
+
+    def GetCacheStats(self, request, context):
+        return self.handler.handle_get_cache_stats(request)
+
+    def GetPeerConnectionStats(self, request, context):
+        return self.handler.handle_get_peer_connection_stats(request)
+
+    def GetSqueakDeletionStats(self, request, context):
+        return self.handler.handle_get_squeak_deletion_stats(request)
@@ -26,6 +26,7 @@ from functools import wraps
 
 from flask import flash
 from flask import Flask
+from flask import make_response
 from flask import redirect
 from flask import render_template
 from flask import request
@@ -40,12 +41,18 @@ from werkzeug.serving import make_server
 
 from proto import lnd_pb2
 from proto import squeak_admin_pb2
+from squeaknode.admin.profile_image_util import get_image_mimetype
 from squeaknode.admin.webapp.forms import LoginForm
 from squeaknode.admin.webapp.user import User
 
 logger = logging.getLogger(__name__)
 
 
+# Profile images are addressed by the hash of their content, so the
+# browser can cache them forever.
+PROFILE_IMAGE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
 def create_app(handler, username, password):
     # create and configure the app
     logger.debug("Starting flask app from directory: {}".format(os.getcwd()))
@@ -229,6 +236,27 @@ def create_app(handler, username, password):
     def clearsqueakprofileimage(msg):
         return handler.handle_clear_squeak_profile_image(msg)
 
+    @app.route("/getprofileimages", methods=["POST"])
+    @login_required
+    @protobuf_serialized(squeak_admin_pb2.GetProfileImagesRequest())
+    def getprofileimages(msg):
+        return handler.handle_get_profile_images(msg)
+
+    @app.route("/profileimage/<image_hash>")
+    @login_required
+    def profileimage(image_hash):
+        if image_hash in request.if_none_match:
+            response = make_response("", 304)
+        else:
+            profile_image = handler.handle_get_profile_image(image_hash)
+            if profile_image is None:
+                return "Profile image not found.", 404
+            response = make_response(profile_image)
+            response.mimetype = get_image_mimetype(profile_image)
+        response.set_etag(image_hash)
+        response.headers["Cache-Control"] = PROFILE_IMAGE_CACHE_CONTROL
+        return response
+
     @app.route("/getpeers", methods=["POST"])
     @login_required
     @protobuf_serialized(squeak_admin_pb2.GetPeersRequest())
@@ -589,6 +617,30 @@ def create_app(handler, username, password):
     def deletetwitteraccount(msg):
         return handler.handle_delete_twitter_account(msg)
 
+    @app.route("/getdbquerystats", methods=["POST"])
+    @login_required
+    @protobuf_serialized(squeak_admin_pb2.GetDbQueryStatsRequest())
+    def getdbquerystats(msg):
+        return handler.handle_get_db_query_stats(msg)
+
+    @app.route("/getcachestats", methods=["POST"])
+    @login_required
+    @protobuf_serialized(squeak_admin_pb2.GetCacheStatsRequest())
+    def getcachestats(msg):
+        return handler.handle_get_cache_stats(msg)
+
+    @app.route("/getpeerconnectionstats", methods=["POST"])
+    @login_required
+    @protobuf_serialized(squeak_admin_pb2.GetPeerConnectionStatsRequest())
+    def getpeerconnectionstats(msg):
+        return handler.handle_get_peer_connection_stats(msg)
+
+    @app.route("/getsqueakdeletionstats", methods=["POST"])
+    @login_required
+    @protobuf_serialized(squeak_admin_pb2.GetSqueakDeletionStatsRequest())
+    def getsqueakdeletionstats(msg):
+        return handler.handle_get_squeak_deletion_stats(msg)
+
     return app
 
 
@@ -20,8 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
+import time
 from abc import ABC
 from abc import abstractmethod
+from typing import List
 
 from squeaknode.bitcoin.block_info import BlockInfo
 
@@ -54,3 +56,37 @@ class BitcoinClient(ABC):
         Raises:
             BitcoinRequestError: If the request fails.
         """
+
+    def get_block_infos_by_heights(self, block_heights: List[int]) -> List[BlockInfo]:
+        """Get block info for the Bitcoin blocks at the given heights.
+
+        Clients that can fetch many blocks in one request should override
+        this. Heights that are above the best block may be skipped.
+
+        Args:
+            block_heights: The heights of the blocks.
+
+        Returns:
+            List[BlockInfo]: the block infos, in the order of the heights.
+
+        Raises:
+            BitcoinRequestError: If the request fails.
+        """
+        return [
+            self.get_block_info_by_height(block_height)
+            for block_height in block_heights
+        ]
+
+    def wait_for_new_block(self, timeout_s: int) -> None:
+        """Wait until a new block arrives or the timeout passes.
+
+        Clients that can long-poll for new blocks should override this.
+        The default implementation only waits for the timeout.
+
+        Args:
+            timeout_s: The maximum time to wait in seconds.
+
+        Raises:
+            BitcoinRequestError: If the request fails.
+        """
+        time.sleep(timeout_s)
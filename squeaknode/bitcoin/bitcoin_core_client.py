@@ -22,6 +22,10 @@
 import json
 import logging
 import os
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Union
 
 import requests
 from bitcoin.core import CBlockHeader
@@ -33,6 +37,10 @@ from squeaknode.bitcoin.exception import BitcoinRequestError
 logger = logging.getLogger(__name__)
 
 
+RPC_BATCH_SIZE = 500
+WAIT_FOR_NEW_BLOCK_TIMEOUT_MARGIN_S = 10
+
+
 class BitcoinCoreClient(BitcoinClient):
     """Access a bitcoin daemon using RPC."""
 
@@ -48,11 +56,12 @@ class BitcoinCoreClient(BitcoinClient):
         protocol = "https" if use_ssl else "http"
         self.url = f"{protocol}://{rpc_user}:{rpc_password}@{host}:{port}"
         self.headers = {"content-type": "application/json"}
-        s = requests.Session()
+        # Reuse the connections to bitcoind across requests.
+        self.session = requests.Session()
         if ssl_cert:
             os.environ["SSL_CERT_FILE"] = ssl_cert
             os.environ["REQUESTS_CA_BUNDLE"] = ssl_cert
-            s.cert = ssl_cert
+            self.session.verify = ssl_cert
 
     def get_best_block_info(self) -> BlockInfo:
         block_height = self.get_block_count()
@@ -64,6 +73,40 @@ class BitcoinCoreClient(BitcoinClient):
         block_header = self.get_block_header(block_hash)
         return BlockInfo(block_height, block_hash, block_header)
 
+    def get_block_infos_by_heights(self, block_heights: List[int]) -> List[BlockInfo]:
+        """Get the block infos for many heights with one batch request for
+        the hashes and one for the headers (per `RPC_BATCH_SIZE` heights).
+
+        Heights that are above the best block are skipped.
+        """
+        block_infos = []
+        for i in range(0, len(block_heights), RPC_BATCH_SIZE):
+            batch_heights = block_heights[i:i + RPC_BATCH_SIZE]
+            block_hashes = self.get_block_hashes(batch_heights)
+            found = [
+                (block_height, block_hash)
+                for block_height, block_hash in zip(batch_heights, block_hashes)
+                if block_hash is not None
+            ]
+            block_headers = self.get_block_headers(
+                [block_hash for _, block_hash in found])
+            for (block_height, block_hash), block_header in zip(found, block_headers):
+                block_infos.append(
+                    BlockInfo(block_height, block_hash, block_header))
+        return block_infos
+
+    def wait_for_new_block(self, timeout_s: int) -> None:
+        payload = {
+            "method": "waitfornewblock",
+            "params": [timeout_s * 1000],
+            "jsonrpc": "2.0",
+            "id": 0,
+        }
+        self.make_request(
+            payload,
+            timeout=timeout_s + WAIT_FOR_NEW_BLOCK_TIMEOUT_MARGIN_S,
+        )
+
     def get_block_count(self) -> int:
         payload = {
             "method": "getblockcount",
@@ -98,12 +141,71 @@ class BitcoinCoreClient(BitcoinClient):
         header_bytes = bytes.fromhex(result)
         return CBlockHeader.deserialize(header_bytes)
 
-    def make_request(self, payload: dict) -> dict:
+    def get_block_hashes(self, block_heights: List[int]) -> List[Optional[bytes]]:
+        """Get the block hashes for many heights in a batch request.
+
+        The hash is None for heights that are above the best block.
+        """
+        payloads = [
+            {
+                "method": "getblockhash",
+                "params": [block_height],
+                "jsonrpc": "2.0",
+                "id": i,
+            }
+            for i, block_height in enumerate(block_heights)
+        ]
+        return [
+            bytes.fromhex(json_response["result"])
+            if json_response.get("result") else None
+            for json_response in self.make_batch_request(payloads)
+        ]
+
+    def get_block_headers(self, block_hashes: List[bytes]) -> List[CBlockHeader]:
+        """Get the block headers for many block hashes in a batch request."""
+        payloads = [
+            {
+                "method": "getblockheader",
+                "params": [block_hash.hex(), False],
+                "jsonrpc": "2.0",
+                "id": i,
+            }
+            for i, block_hash in enumerate(block_hashes)
+        ]
+        block_headers = []
+        for json_response in self.make_batch_request(payloads):
+            if json_response.get("error"):
+                raise BitcoinRequestError(json_response["error"])
+            header_bytes = bytes.fromhex(json_response["result"])
+            block_headers.append(CBlockHeader.deserialize(header_bytes))
+        return block_headers
+
+    def make_batch_request(self, payloads: List[dict]) -> List[dict]:
+        """Send a JSON-RPC batch request and return the responses in the
+        same order as the payloads.
+        """
+        if not payloads:
+            return []
+        json_responses = self.make_request(payloads)
+        if not isinstance(json_responses, list):
+            raise BitcoinRequestError(json_responses.get("error"))
+        responses_by_id = {
+            json_response["id"]: json_response
+            for json_response in json_responses
+        }
+        return [responses_by_id[payload["id"]] for payload in payloads]
+
+    def make_request(
+            self,
+            payload: Union[dict, List[dict]],
+            timeout: Optional[float] = None,
+    ) -> Any:
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.url,
                 data=json.dumps(payload),
                 headers=self.headers,
+                timeout=timeout,
             )
             response.raise_for_status()
         except requests.exceptions.HTTPError as errh:
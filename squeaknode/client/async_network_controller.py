@@ -0,0 +1,244 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import aiohttp
+from aiohttp_socks import ProxyConnector
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.client.async_peer_client import AsyncPeerClient
+from squeaknode.client.async_peer_downloader import AsyncPeerDownloader
+from squeaknode.client.network_controller import BaseNetworkController
+from squeaknode.core.peer_address import Network
+from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.squeak_peer import SqueakPeer
+from squeaknode.node.squeak_store import SqueakStore
+
+logger = logging.getLogger(__name__)
+
+
+STORE_EXECUTOR_WORKERS = 4
+
+
+class AsyncNetworkController(BaseNetworkController):
+    """Network controller that syncs with the peers on an asyncio event
+    loop instead of a thread per peer.
+
+    The event loop runs in a single background thread. The number of
+    concurrent requests is limited globally and for each peer, and the
+    blocking calls to the squeak store run in a small thread pool.
+    """
+
+    def __init__(
+            self,
+            squeak_store: SqueakStore,
+            proxy_host: Optional[str],
+            proxy_port: Optional[int],
+            verified_squeak_cache_size: int,
+            rejected_squeak_cache_size: int,
+            rejected_squeak_cache_ttl_s: int,
+            max_concurrent_requests: int,
+            max_requests_per_peer: int,
+    ):
+        super().__init__(
+            squeak_store,
+            proxy_host,
+            proxy_port,
+            verified_squeak_cache_size,
+            rejected_squeak_cache_size,
+            rejected_squeak_cache_ttl_s,
+        )
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_requests_per_peer = max_requests_per_peer
+        self.store_executor = ThreadPoolExecutor(STORE_EXECUTOR_WORKERS)
+        # The sessions and the semaphores are created lazily on the event
+        # loop, because they must be bound to it.
+        self.clearnet_session: Optional[aiohttp.ClientSession] = None
+        self.tor_session: Optional[aiohttp.ClientSession] = None
+        self.global_semaphore: Optional[asyncio.Semaphore] = None
+        self.peer_semaphores: Dict[PeerAddress, asyncio.Semaphore] = {}
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(
+            target=self.loop.run_forever,
+            daemon=True,
+        )
+        self.loop_thread.start()
+
+    def run(self, coro):
+        """Run the coroutine on the event loop and wait for the result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def close(self) -> None:
+        super().close()
+        if self.loop.is_running():
+            self.run(self.close_sessions())
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop_thread.join()
+        self.store_executor.shutdown(wait=False)
+
+    async def close_sessions(self) -> None:
+        for session in [self.clearnet_session, self.tor_session]:
+            if session is not None:
+                await session.close()
+        self.clearnet_session = None
+        self.tor_session = None
+
+    def get_session(self, peer: SqueakPeer) -> aiohttp.ClientSession:
+        # The concurrency is limited by the semaphores, not the connectors.
+        if peer.address.network == Network.TORV3 and \
+           self.proxy_host is not None and \
+           self.proxy_port is not None:
+            if self.tor_session is None:
+                proxy_connector = ProxyConnector.from_url(
+                    f"socks5://{self.proxy_host}:{self.proxy_port}",
+                    rdns=True,
+                    limit=0,
+                )
+                self.tor_session = aiohttp.ClientSession(
+                    connector=proxy_connector)
+            return self.tor_session
+        if self.clearnet_session is None:
+            connector = aiohttp.TCPConnector(limit=0)
+            self.clearnet_session = aiohttp.ClientSession(connector=connector)
+        return self.clearnet_session
+
+    def get_async_downloader(self, peer: SqueakPeer) -> AsyncPeerDownloader:
+        if self.global_semaphore is None:
+            self.global_semaphore = asyncio.Semaphore(
+                self.max_concurrent_requests)
+        peer_semaphore = self.peer_semaphores.get(peer.address)
+        if peer_semaphore is None:
+            peer_semaphore = asyncio.Semaphore(self.max_requests_per_peer)
+            self.peer_semaphores[peer.address] = peer_semaphore
+        client = AsyncPeerClient(
+            peer,
+            self.get_session(peer),
+            self.global_semaphore,
+            peer_semaphore,
+        )
+        return AsyncPeerDownloader(
+            peer,
+            self.squeak_store,
+            self.verified_squeak_hashes,
+            self.rejected_squeak_hashes,
+            client,
+            self.store_executor,
+        )
+
+    def download_timeline(
+            self,
+            interest_block_interval: int,
+    ) -> None:
+        max_block = self.squeak_store.get_latest_block()
+        min_block = max(0, max_block - interest_block_interval)
+        followed_public_keys = self.squeak_store.get_followed_public_keys()
+        peers = self.squeak_store.get_autoconnect_peers()
+        self.run(self.download_timeline_async(
+            min_block,
+            max_block,
+            followed_public_keys,
+            peers,
+        ))
+
+    def download_single_squeak(self, squeak_hash: bytes) -> None:
+        peers = self.squeak_store.get_autoconnect_peers()
+        self.run(self.download_single_squeak_async(squeak_hash, peers))
+
+    def download_single_squeak_secret_key(self, squeak_hash: bytes) -> None:
+        peers = self.squeak_store.get_autoconnect_peers()
+        self.run(self.download_single_squeak_secret_key_async(
+            squeak_hash,
+            peers,
+        ))
+
+    async def download_timeline_async(
+            self,
+            min_block: int,
+            max_block: int,
+            followed_public_keys: List[SqueakPublicKey],
+            peers: List[SqueakPeer],
+    ) -> None:
+        downloaders = [
+            self.get_async_downloader(peer)
+            for peer in peers
+        ]
+        await asyncio.gather(
+            *[
+                downloader.download_interest_range(
+                    min_block,
+                    max_block,
+                    followed_public_keys,
+                )
+                for downloader in downloaders
+            ],
+            return_exceptions=True,
+        )
+
+    async def download_single_squeak_async(
+            self,
+            squeak_hash: bytes,
+            peers: List[SqueakPeer],
+    ) -> None:
+        downloaders = [
+            self.get_async_downloader(peer)
+            for peer in peers
+        ]
+        tasks = [
+            asyncio.ensure_future(
+                downloader.download_single_squeak(squeak_hash),
+            )
+            for downloader in downloaders
+        ]
+        try:
+            # Stop at the first peer that has the squeak.
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    await next_done
+                except Exception:
+                    continue
+                break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def download_single_squeak_secret_key_async(
+            self,
+            squeak_hash: bytes,
+            peers: List[SqueakPeer],
+    ) -> None:
+        downloaders = [
+            self.get_async_downloader(peer)
+            for peer in peers
+        ]
+        await asyncio.gather(
+            *[
+                downloader.download_single_squeak_secret_key(squeak_hash)
+                for downloader in downloaders
+            ],
+            return_exceptions=True,
+        )
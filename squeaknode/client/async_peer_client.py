@@ -0,0 +1,175 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import logging
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import aiohttp
+from squeak.core import CBaseSqueak
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.core.batch_stream import decode_items
+from squeaknode.core.batch_stream import encode_hashes
+from squeaknode.core.batch_stream import MAX_BATCH_SIZE_HEADER
+from squeaknode.core.offer import Offer
+from squeaknode.core.squeak_peer import SqueakPeer
+from squeaknode.core.squeaks import deserialize_squeak
+
+logger = logging.getLogger(__name__)
+
+
+REQUEST_TIMEOUT_S = 10
+
+
+class AsyncPeerClient:
+    """Peer client that makes its requests with an aiohttp session.
+
+    Every request first acquires the global semaphore, shared by all
+    peers, and then the semaphore of this peer.
+    """
+
+    def __init__(
+            self,
+            peer: SqueakPeer,
+            session: aiohttp.ClientSession,
+            global_semaphore: asyncio.Semaphore,
+            peer_semaphore: asyncio.Semaphore,
+    ):
+        self.peer = peer
+        self.session = session
+        self.global_semaphore = global_semaphore
+        self.peer_semaphore = peer_semaphore
+        self.base_url = f"http://{peer.address.host}:{peer.address.port}"
+        self.timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_S)
+        # Updated from the response headers. Zero if the peer does not
+        # support the batch requests.
+        self.max_batch_size = 0
+
+    async def lookup(
+            self,
+            min_block: int,
+            max_block: int,
+            pubkeys: List[SqueakPublicKey],
+    ) -> List[bytes]:
+        params = [
+            ('minblock', str(min_block)),
+            ('maxblock', str(max_block)),
+        ] + [
+            ('pubkeys', pubkey.to_bytes().hex())
+            for pubkey in pubkeys
+        ]
+        url = f"{self.base_url}/lookup"
+        async with self.global_semaphore, self.peer_semaphore:
+            async with self.session.get(
+                    url,
+                    params=params,
+                    timeout=self.timeout,
+            ) as r:
+                self.update_max_batch_size(r)
+                squeak_hashes_str = await r.json()
+        return [
+            bytes.fromhex(squeak_hash_str)
+            for squeak_hash_str in squeak_hashes_str
+        ]
+
+    async def get_squeak(self, squeak_hash: bytes) -> Optional[CBaseSqueak]:
+        squeak_hash_str = squeak_hash.hex()
+        squeak_bytes = await self.get_bytes(f"squeak/{squeak_hash_str}")
+        if squeak_bytes is None:
+            return None
+        try:
+            return deserialize_squeak(squeak_bytes)
+        except Exception:
+            return None
+
+    async def get_secret_key(self, squeak_hash: bytes) -> Optional[bytes]:
+        squeak_hash_str = squeak_hash.hex()
+        return await self.get_bytes(f"secretkey/{squeak_hash_str}")
+
+    async def get_offer(self, squeak_hash: bytes) -> Optional[Offer]:
+        squeak_hash_str = squeak_hash.hex()
+        url = f"{self.base_url}/offer/{squeak_hash_str}"
+        async with self.global_semaphore, self.peer_semaphore:
+            async with self.session.get(url, timeout=self.timeout) as r:
+                if r.status != 200:
+                    return None
+                offer_json = await r.json()
+        return Offer(
+            squeak_hash=bytes.fromhex(offer_json['squeak_hash']),
+            nonce=bytes.fromhex(offer_json['nonce']),
+            payment_request=offer_json['payment_request'],
+            host=offer_json['host'],
+            port=int(offer_json['port']),
+        )
+
+    async def get_squeaks(self, squeak_hashes: List[bytes]) -> Dict[bytes, CBaseSqueak]:
+        squeaks_bytes = await self.post_batch_request("squeaks", squeak_hashes)
+        squeaks = {}
+        for squeak_hash, squeak_bytes in squeaks_bytes.items():
+            try:
+                squeaks[squeak_hash] = deserialize_squeak(squeak_bytes)
+            except Exception:
+                logger.debug(
+                    "Failed to deserialize squeak: {}".format(squeak_hash.hex()))
+        return squeaks
+
+    async def get_secret_keys(self, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        return await self.post_batch_request("secretkeys", squeak_hashes)
+
+    async def get_bytes(self, path: str) -> Optional[bytes]:
+        url = f"{self.base_url}/{path}"
+        async with self.global_semaphore, self.peer_semaphore:
+            async with self.session.get(url, timeout=self.timeout) as r:
+                if r.status != 200:
+                    return None
+                return await r.read()
+
+    async def post_batch_request(self, path: str, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        url = f"{self.base_url}/{path}"
+        async with self.global_semaphore, self.peer_semaphore:
+            async with self.session.post(
+                    url,
+                    data=encode_hashes(squeak_hashes),
+                    headers={"Content-Type": "application/octet-stream"},
+                    timeout=self.timeout,
+            ) as r:
+                if r.status != 200:
+                    return {}
+                content = await r.read()
+        try:
+            return decode_items(content)
+        except ValueError:
+            logger.debug("Invalid batch response from peer: {}".format(
+                self.peer,
+            ))
+            return {}
+
+    def update_max_batch_size(self, response: aiohttp.ClientResponse) -> None:
+        try:
+            self.max_batch_size = max(
+                int(response.headers.get(MAX_BATCH_SIZE_HEADER, 0)),
+                0,
+            )
+        except ValueError:
+            self.max_batch_size = 0
@@ -0,0 +1,282 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import logging
+from concurrent.futures import Executor
+from typing import List
+from typing import Optional
+
+from squeak.core import CBaseSqueak
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.client.async_peer_client import AsyncPeerClient
+from squeaknode.client.peer_downloader import BasePeerDownloader
+from squeaknode.client.peer_downloader import SAVE_SQUEAKS_BATCH_SIZE
+from squeaknode.client.squeak_hash_cache import SqueakHashCache
+from squeaknode.core.squeak_peer import SqueakPeer
+from squeaknode.core.squeaks import get_hash
+from squeaknode.node.squeak_store import SqueakStore
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPeerDownloader(BasePeerDownloader):
+    """Peer downloader for the asyncio sync engine.
+
+    The requests to the peer are made concurrently on the event loop, and
+    the blocking calls to the squeak store are run in the given executor.
+    """
+
+    def __init__(
+            self,
+            peer: SqueakPeer,
+            squeak_store: SqueakStore,
+            verified_squeak_hashes: SqueakHashCache,
+            rejected_squeak_hashes: SqueakHashCache,
+            client: AsyncPeerClient,
+            store_executor: Executor,
+    ):
+        super().__init__(
+            peer,
+            squeak_store,
+            verified_squeak_hashes,
+            rejected_squeak_hashes,
+        )
+        self.client = client
+        self.store_executor = store_executor
+
+    async def run_blocking(self, fn, *args):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.store_executor, fn, *args)
+
+    async def download_interest_range(
+            self,
+            min_block: int,
+            max_block: int,
+            pubkeys: List[SqueakPublicKey],
+    ) -> None:
+        squeak_hashes = await self.client.lookup(
+            min_block,
+            max_block,
+            pubkeys,
+        )
+        if self.client.max_batch_size > 0:
+            await self.download_squeaks_batched(
+                squeak_hashes,
+                min_block,
+                max_block,
+                pubkeys,
+            )
+            return
+        results = await asyncio.gather(
+            *[
+                self.fetch_squeak(
+                    squeak_hash,
+                    min_block,
+                    max_block,
+                    pubkeys,
+                )
+                for squeak_hash in squeak_hashes
+            ],
+            return_exceptions=True,
+        )
+        squeaks = [
+            result for result in results
+            if isinstance(result, CBaseSqueak)
+        ]
+        for i in range(0, len(squeaks), SAVE_SQUEAKS_BATCH_SIZE):
+            await self.run_blocking(
+                self.save_squeaks,
+                squeaks[i:i + SAVE_SQUEAKS_BATCH_SIZE],
+            )
+        await asyncio.gather(
+            *[
+                self.download_secret_key(squeak_hash)
+                for squeak_hash in squeak_hashes
+                if not self.rejected_squeak_hashes.contains(squeak_hash)
+            ],
+            return_exceptions=True,
+        )
+
+    async def download_squeaks_batched(
+            self,
+            squeak_hashes: List[bytes],
+            min_block: int,
+            max_block: int,
+            pubkeys: List[SqueakPublicKey],
+    ) -> None:
+        batch_size = self.client.max_batch_size
+        for i in range(0, len(squeak_hashes), batch_size):
+            batch_hashes = squeak_hashes[i:i + batch_size]
+            try:
+                squeaks = await self.fetch_squeaks(
+                    batch_hashes,
+                    min_block,
+                    max_block,
+                    pubkeys,
+                )
+            except Exception:
+                logger.exception("Failed to fetch batch of squeaks.")
+                continue
+            if squeaks:
+                await self.run_blocking(self.save_squeaks, squeaks)
+        for i in range(0, len(squeak_hashes), batch_size):
+            batch_hashes = squeak_hashes[i:i + batch_size]
+            try:
+                await self.download_secret_keys(batch_hashes)
+            except Exception:
+                logger.exception("Failed to fetch batch of secret keys.")
+
+    async def download_single_squeak(
+            self,
+            squeak_hash: bytes,
+    ) -> None:
+        self.invalidate_cached_squeak(squeak_hash)
+        squeak = await self.fetch_squeak(squeak_hash)
+        await self.run_blocking(self.squeak_store.save_squeak, squeak)
+
+    async def download_single_squeak_secret_key(
+            self,
+            squeak_hash: bytes,
+    ) -> None:
+        await self.download_secret_key(squeak_hash)
+
+    async def fetch_squeak(
+            self,
+            squeak_hash: bytes,
+            min_block: Optional[int] = None,
+            max_block: Optional[int] = None,
+            pubkeys: Optional[List[SqueakPublicKey]] = None,
+    ) -> CBaseSqueak:
+        await self.run_blocking(self.check_should_fetch, squeak_hash)
+
+        squeak = await self.client.get_squeak(squeak_hash)
+
+        if not squeak:
+            raise Exception('Squeak not found.')
+        self.check_fetched_squeak(
+            squeak_hash,
+            squeak,
+            min_block,
+            max_block,
+            pubkeys,
+        )
+        return squeak
+
+    async def fetch_squeaks(
+            self,
+            squeak_hashes: List[bytes],
+            min_block: Optional[int] = None,
+            max_block: Optional[int] = None,
+            pubkeys: Optional[List[SqueakPublicKey]] = None,
+    ) -> List[CBaseSqueak]:
+        hashes_to_fetch = await self.run_blocking(
+            self.get_hashes_to_fetch,
+            squeak_hashes,
+        )
+        if not hashes_to_fetch:
+            return []
+
+        fetched_squeaks = await self.client.get_squeaks(hashes_to_fetch)
+
+        squeaks = []
+        for squeak_hash in hashes_to_fetch:
+            squeak = fetched_squeaks.get(squeak_hash)
+            if not squeak:
+                continue
+            try:
+                self.check_fetched_squeak(
+                    squeak_hash,
+                    squeak,
+                    min_block,
+                    max_block,
+                    pubkeys,
+                )
+            except Exception:
+                logger.debug("Skipping invalid squeak from peer: {}".format(
+                    squeak_hash.hex(),
+                ))
+                continue
+            squeaks.append(squeak)
+        return squeaks
+
+    async def download_secret_key(self, squeak_hash: bytes) -> None:
+        squeak = await self.run_blocking(
+            self.get_squeak_without_secret_key,
+            squeak_hash,
+        )
+
+        secret_key = await self.client.get_secret_key(squeak_hash)
+        if secret_key:
+            await self.run_blocking(
+                self.squeak_store.save_secret_key,
+                squeak_hash,
+                secret_key,
+            )
+            return
+
+        await self.download_offer(squeak)
+
+    async def download_secret_keys(self, squeak_hashes: List[bytes]) -> None:
+        squeaks = await self.run_blocking(
+            self.get_squeaks_without_secret_key,
+            squeak_hashes,
+        )
+        if not squeaks:
+            return
+
+        secret_keys = await self.client.get_secret_keys([
+            get_hash(squeak) for squeak in squeaks
+        ])
+
+        async def save_secret_key_or_download_offer(squeak):
+            squeak_hash = get_hash(squeak)
+            secret_key = secret_keys.get(squeak_hash)
+            if secret_key:
+                await self.run_blocking(
+                    self.squeak_store.save_secret_key,
+                    squeak_hash,
+                    secret_key,
+                )
+            else:
+                await self.download_offer(squeak)
+
+        await asyncio.gather(
+            *[
+                save_secret_key_or_download_offer(squeak)
+                for squeak in squeaks
+            ],
+            return_exceptions=True,
+        )
+
+    async def download_offer(self, squeak: CBaseSqueak) -> None:
+        squeak_hash = get_hash(squeak)
+        await self.run_blocking(self.check_no_received_offer, squeak_hash)
+
+        offer = await self.client.get_offer(squeak_hash)
+        if offer:
+            await self.run_blocking(
+                self.squeak_store.handle_offer,
+                squeak,
+                offer,
+                self.peer.address,
+            )
@@ -20,13 +20,24 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
+from abc import ABC
+from abc import abstractmethod
 from concurrent.futures import as_completed
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import wait
+from typing import List
 from typing import Optional
 
+from squeak.core import CBaseSqueak
+
 from squeaknode.client.peer_downloader import PeerDownloader
+from squeaknode.client.peer_session_pool import PeerSessionPool
+from squeaknode.client.squeak_hash_cache import SqueakHashCache
+from squeaknode.core.cache_stats import CacheStats
+from squeaknode.core.peer_connection_stats import PeerConnectionStats
+from squeaknode.core.rejected_squeak import RejectedSqueak
 from squeaknode.core.squeak_peer import SqueakPeer
+from squeaknode.core.squeaks import get_hash
 from squeaknode.node.squeak_store import SqueakStore
 
 logger = logging.getLogger(__name__)
@@ -35,17 +46,121 @@ logger = logging.getLogger(__name__)
 DOWNLOAD_TIMEOUT_S = 10
 
 
-class NetworkController:
+class BaseNetworkController(ABC):
+    """Caches and listeners shared by the network controllers,
+    independent of how the requests to the peers are made.
+    """
 
     def __init__(
             self,
             squeak_store: SqueakStore,
             proxy_host: Optional[str],
             proxy_port: Optional[int],
+            verified_squeak_cache_size: int,
+            rejected_squeak_cache_size: int,
+            rejected_squeak_cache_ttl_s: int,
     ):
         self.squeak_store = squeak_store
         self.proxy_host = proxy_host
         self.proxy_port = proxy_port
+        # Hashes of squeaks that are already saved, and of squeaks that
+        # failed to save, so that downloads can skip them without any
+        # network request.
+        self.verified_squeak_hashes = SqueakHashCache(
+            "verified_squeak_hashes",
+            verified_squeak_cache_size,
+        )
+        self.rejected_squeak_hashes = SqueakHashCache(
+            "rejected_squeak_hashes",
+            rejected_squeak_cache_size,
+            rejected_squeak_cache_ttl_s,
+        )
+        self.squeak_store.new_squeak_listener.add_callback(
+            "network_controller_new_squeak",
+            self.handle_new_squeak,
+        )
+        self.squeak_store.rejected_squeak_listener.add_callback(
+            "network_controller_rejected_squeak",
+            self.handle_rejected_squeak,
+        )
+
+    def handle_new_squeak(self, base_squeak: CBaseSqueak) -> None:
+        squeak_hash = get_hash(base_squeak)
+        self.rejected_squeak_hashes.invalidate(squeak_hash)
+        self.verified_squeak_hashes.add(squeak_hash)
+
+    def handle_rejected_squeak(self, rejected_squeak: RejectedSqueak) -> None:
+        self.rejected_squeak_hashes.add(
+            rejected_squeak.squeak_hash,
+            rejected_squeak.reason,
+        )
+
+    def get_cache_stats(self) -> List[CacheStats]:
+        return [
+            self.verified_squeak_hashes.get_stats(),
+            self.rejected_squeak_hashes.get_stats(),
+        ]
+
+    def get_peer_connection_stats(self) -> List[PeerConnectionStats]:
+        return []
+
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def download_timeline(
+            self,
+            interest_block_interval: int,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def download_single_squeak(self, squeak_hash: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def download_single_squeak_secret_key(self, squeak_hash: bytes) -> None:
+        pass
+
+
+class NetworkController(BaseNetworkController):
+
+    def __init__(
+            self,
+            squeak_store: SqueakStore,
+            proxy_host: Optional[str],
+            proxy_port: Optional[int],
+            verified_squeak_cache_size: int,
+            rejected_squeak_cache_size: int,
+            rejected_squeak_cache_ttl_s: int,
+            peer_session_pool_size: int,
+            peer_max_connections: int,
+            peer_keep_alive_s: int,
+            peer_max_retries: int,
+            peer_retry_backoff_s: float,
+    ):
+        super().__init__(
+            squeak_store,
+            proxy_host,
+            proxy_port,
+            verified_squeak_cache_size,
+            rejected_squeak_cache_size,
+            rejected_squeak_cache_ttl_s,
+        )
+        # Long-lived HTTP sessions, reused across sync cycles.
+        self.peer_session_pool = PeerSessionPool(
+            peer_session_pool_size,
+            peer_max_connections,
+            peer_keep_alive_s,
+            peer_max_retries,
+            peer_retry_backoff_s,
+        )
+
+    def get_peer_connection_stats(self) -> List[PeerConnectionStats]:
+        return self.peer_session_pool.get_stats()
+
+    def close(self) -> None:
+        self.peer_session_pool.close()
 
     def get_downloader(self, peer: SqueakPeer):
         return PeerDownloader(
@@ -53,6 +168,9 @@ class NetworkController:
             self.squeak_store,
             self.proxy_host,
             self.proxy_port,
+            self.verified_squeak_hashes,
+            self.rejected_squeak_hashes,
+            self.peer_session_pool.get_session(peer.address),
         )
 
     def download_timeline(
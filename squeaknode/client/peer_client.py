@@ -20,18 +20,21 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
+from typing import Dict
 from typing import List
 from typing import Optional
 
 import requests
 from squeak.core import CBaseSqueak
-from squeak.core import CResqueak
-from squeak.core import CSqueak
 from squeak.core.keys import SqueakPublicKey
 
+from squeaknode.core.batch_stream import decode_items
+from squeaknode.core.batch_stream import encode_hashes
+from squeaknode.core.batch_stream import MAX_BATCH_SIZE_HEADER
 from squeaknode.core.offer import Offer
 from squeaknode.core.peer_address import Network
 from squeaknode.core.squeak_peer import SqueakPeer
+from squeaknode.core.squeaks import deserialize_squeak
 
 logger = logging.getLogger(__name__)
 
@@ -46,12 +49,17 @@ class PeerClient:
             peer: SqueakPeer,
             proxy_host: Optional[str],
             proxy_port: Optional[int],
+            session: requests.Session,
     ):
         self.peer = peer
+        self.session = session
         self.proxy_host = proxy_host
         self.proxy_port = proxy_port
         self.base_url = f"http://{peer.address.host}:{peer.address.port}"
         self.proxies = {}
+        # Updated from the response headers. Zero if the peer does not
+        # support the batch requests.
+        self.max_batch_size = 0
         if peer.address.network == Network.TORV3 and \
            proxy_host is not None and \
            proxy_port is not None:
@@ -77,12 +85,13 @@ class PeerClient:
             'pubkeys': pubkeys_str,
         }
         url = f"{self.base_url}/lookup"
-        r = requests.get(  # type: ignore
+        r = self.session.get(  # type: ignore
             url,
             params=payload,  # type: ignore
             proxies=self.proxies,
             timeout=REQUEST_TIMEOUT_S,
         )
+        self.update_max_batch_size(r)
         squeak_hashes_str = r.json()
         return [
             bytes.fromhex(squeak_hash_str)
@@ -92,7 +101,7 @@ class PeerClient:
     def get_squeak(self, squeak_hash: bytes) -> Optional[CBaseSqueak]:
         squeak_hash_str = squeak_hash.hex()
         url = f"{self.base_url}/squeak/{squeak_hash_str}"
-        r = requests.get(
+        r = self.session.get(
             url,
             proxies=self.proxies,
             timeout=REQUEST_TIMEOUT_S,
@@ -101,19 +110,14 @@ class PeerClient:
             return None
         squeak_bytes = r.content
         try:
-            return CSqueak.deserialize(squeak_bytes)
+            return deserialize_squeak(squeak_bytes)
         except Exception:
-            pass
-        try:
-            return CResqueak.deserialize(squeak_bytes)
-        except Exception:
-            pass
-        return None
+            return None
 
     def get_secret_key(self, squeak_hash: bytes) -> Optional[bytes]:
         squeak_hash_str = squeak_hash.hex()
         url = f"{self.base_url}/secretkey/{squeak_hash_str}"
-        r = requests.get(
+        r = self.session.get(
             url,
             proxies=self.proxies,
             timeout=REQUEST_TIMEOUT_S,
@@ -123,10 +127,60 @@ class PeerClient:
         secret_key = r.content
         return secret_key
 
+    def get_squeaks(self, squeak_hashes: List[bytes]) -> Dict[bytes, CBaseSqueak]:
+        """Get the squeaks with the given hashes in a single request.
+
+        Squeaks that the peer does not have, or that fail to deserialize,
+        are left out of the result.
+        """
+        squeaks_bytes = self.post_batch_request("squeaks", squeak_hashes)
+        squeaks = {}
+        for squeak_hash, squeak_bytes in squeaks_bytes.items():
+            try:
+                squeaks[squeak_hash] = deserialize_squeak(squeak_bytes)
+            except Exception:
+                logger.debug(
+                    "Failed to deserialize squeak: {}".format(squeak_hash.hex()))
+        return squeaks
+
+    def get_secret_keys(self, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        """Get the secret keys of the squeaks with the given hashes in a
+        single request.
+        """
+        return self.post_batch_request("secretkeys", squeak_hashes)
+
+    def post_batch_request(self, path: str, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        url = f"{self.base_url}/{path}"
+        r = self.session.post(
+            url,
+            data=encode_hashes(squeak_hashes),
+            headers={"Content-Type": "application/octet-stream"},
+            proxies=self.proxies,
+            timeout=REQUEST_TIMEOUT_S,
+        )
+        if r.status_code != requests.codes.ok:
+            return {}
+        try:
+            return decode_items(r.content)
+        except ValueError:
+            logger.debug("Invalid batch response from peer: {}".format(
+                self.peer,
+            ))
+            return {}
+
+    def update_max_batch_size(self, response: requests.Response) -> None:
+        try:
+            self.max_batch_size = max(
+                int(response.headers.get(MAX_BATCH_SIZE_HEADER, 0)),
+                0,
+            )
+        except ValueError:
+            self.max_batch_size = 0
+
     def get_offer(self, squeak_hash: bytes) -> Optional[Offer]:
         squeak_hash_str = squeak_hash.hex()
         url = f"{self.base_url}/offer/{squeak_hash_str}"
-        r = requests.get(
+        r = self.session.get(
             url,
             proxies=self.proxies,
             timeout=REQUEST_TIMEOUT_S,
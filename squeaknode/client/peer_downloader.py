@@ -24,9 +24,12 @@ from abc import ABC
 from typing import List
 from typing import Optional
 
+import requests
+from squeak.core import CBaseSqueak
 from squeak.core.keys import SqueakPublicKey
 
 from squeaknode.client.peer_client import PeerClient
+from squeaknode.client.squeak_hash_cache import SqueakHashCache
 from squeaknode.core.squeak_peer import SqueakPeer
 from squeaknode.core.squeaks import get_hash
 from squeaknode.node.squeak_store import SqueakStore
@@ -35,9 +38,110 @@ logger = logging.getLogger(__name__)
 
 
 DOWNLOAD_TIMEOUT_S = 10
+SAVE_SQUEAKS_BATCH_SIZE = 100
 
 
-class PeerDownloader(ABC):
+class BasePeerDownloader(ABC):
+    """Checks and storage shared by the peer downloaders, independent of
+    how the requests to the peer are made.
+    """
+
+    def __init__(
+            self,
+            peer: SqueakPeer,
+            squeak_store: SqueakStore,
+            verified_squeak_hashes: SqueakHashCache,
+            rejected_squeak_hashes: SqueakHashCache,
+    ):
+        self.peer = peer
+        self.squeak_store = squeak_store
+        self.verified_squeak_hashes = verified_squeak_hashes
+        self.rejected_squeak_hashes = rejected_squeak_hashes
+
+    def save_squeaks(self, squeaks: List[CBaseSqueak]) -> None:
+        try:
+            self.squeak_store.save_squeaks(squeaks)
+        except Exception:
+            logger.exception("Failed to save downloaded squeaks.")
+
+    def invalidate_cached_squeak(self, squeak_hash: bytes) -> None:
+        # Check the database and the peer again when a single squeak is
+        # requested explicitly.
+        self.verified_squeak_hashes.invalidate(squeak_hash)
+        self.rejected_squeak_hashes.invalidate(squeak_hash)
+
+    def check_should_fetch(self, squeak_hash: bytes) -> None:
+        # Skip the squeak if it is already saved or was rejected.
+        if self.verified_squeak_hashes.contains(squeak_hash):
+            raise Exception('Squeak already saved.')
+        rejected_reason = self.rejected_squeak_hashes.get(squeak_hash)
+        if rejected_reason is not None:
+            raise Exception('Squeak was rejected: {}.'.format(
+                rejected_reason))
+
+        # Download the squeak if not already owned.
+        if self.squeak_store.get_squeak(squeak_hash):
+            self.verified_squeak_hashes.add(squeak_hash)
+            raise Exception('Squeak already saved.')
+
+    def get_hashes_to_fetch(self, squeak_hashes: List[bytes]) -> List[bytes]:
+        hashes_to_fetch = []
+        for squeak_hash in squeak_hashes:
+            try:
+                self.check_should_fetch(squeak_hash)
+            except Exception:
+                continue
+            hashes_to_fetch.append(squeak_hash)
+        return hashes_to_fetch
+
+    def check_fetched_squeak(
+            self,
+            squeak_hash: bytes,
+            squeak: CBaseSqueak,
+            min_block: Optional[int] = None,
+            max_block: Optional[int] = None,
+            pubkeys: Optional[List[SqueakPublicKey]] = None,
+    ) -> None:
+        if get_hash(squeak) != squeak_hash:
+            raise Exception('Squeak has wrong hash.')
+        if min_block and squeak.nBlockHeight < min_block:
+            raise Exception('Squeak has block height below minimum.')
+        if max_block and squeak.nBlockHeight > max_block:
+            raise Exception('Squeak has block height above minimum.')
+        if pubkeys and squeak.GetPubKey() not in pubkeys:
+            raise Exception('Squeak has wronge pubkey.')
+
+    def get_squeak_without_secret_key(self, squeak_hash: bytes) -> CBaseSqueak:
+        squeak = self.squeak_store.get_squeak(squeak_hash)
+
+        # Check if squeak is already owned.
+        if not squeak:
+            raise Exception('Squeak is not already saved.')
+
+        if self.squeak_store.get_squeak_secret_key(squeak_hash):
+            raise Exception('Squeak secret key is already saved.')
+
+        return squeak
+
+    def get_squeaks_without_secret_key(self, squeak_hashes: List[bytes]) -> List[CBaseSqueak]:
+        squeaks = []
+        for squeak_hash in squeak_hashes:
+            if self.rejected_squeak_hashes.contains(squeak_hash):
+                continue
+            try:
+                squeak = self.get_squeak_without_secret_key(squeak_hash)
+            except Exception:
+                continue
+            squeaks.append(squeak)
+        return squeaks
+
+    def check_no_received_offer(self, squeak_hash: bytes) -> None:
+        for received_offer in self.squeak_store.get_received_offers(squeak_hash):
+            if received_offer.peer_address == self.peer.address:
+                raise Exception('Received offer from this peer already saved.')
+
+
+class PeerDownloader(BasePeerDownloader):
 
     def __init__(
             self,
@@ -45,12 +149,19 @@ class PeerDownloader(ABC):
             squeak_store: SqueakStore,
             proxy_host: Optional[str],
             proxy_port: Optional[int],
+            verified_squeak_hashes: SqueakHashCache,
+            rejected_squeak_hashes: SqueakHashCache,
+            session: requests.Session,
     ):
-        self.peer = peer
+        super().__init__(
+            peer,
+            squeak_store,
+            verified_squeak_hashes,
+            rejected_squeak_hashes,
+        )
         self.proxy_host = proxy_host
         self.proxy_port = proxy_port
-        self.client = PeerClient(peer, proxy_host, proxy_port)
-        self.squeak_store = squeak_store
+        self.client = PeerClient(peer, proxy_host, proxy_port, session)
 
     def download_interest_range(
             self,
@@ -63,26 +174,73 @@ class PeerDownloader(ABC):
             max_block,
             pubkeys,
         )
+        if self.client.max_batch_size > 0:
+            self.download_squeaks_batched(
+                squeak_hashes,
+                min_block,
+                max_block,
+                pubkeys,
+            )
+            return
+        squeaks = []
         for squeak_hash in squeak_hashes:
             try:
-                self.download_squeak(
+                squeak = self.fetch_squeak(
                     squeak_hash,
                     min_block,
                     max_block,
                     pubkeys,
                 )
             except Exception:
-                pass
+                continue
+            squeaks.append(squeak)
+            if len(squeaks) >= SAVE_SQUEAKS_BATCH_SIZE:
+                self.save_squeaks(squeaks)
+                squeaks = []
+        if squeaks:
+            self.save_squeaks(squeaks)
         for squeak_hash in squeak_hashes:
+            if self.rejected_squeak_hashes.contains(squeak_hash):
+                continue
             try:
                 self.download_secret_key(squeak_hash)
             except Exception:
                 pass
 
+    def download_squeaks_batched(
+            self,
+            squeak_hashes: List[bytes],
+            min_block: int,
+            max_block: int,
+            pubkeys: List[SqueakPublicKey],
+    ) -> None:
+        batch_size = self.client.max_batch_size
+        for i in range(0, len(squeak_hashes), batch_size):
+            batch_hashes = squeak_hashes[i:i + batch_size]
+            try:
+                squeaks = self.fetch_squeaks(
+                    batch_hashes,
+                    min_block,
+                    max_block,
+                    pubkeys,
+                )
+            except Exception:
+                logger.exception("Failed to fetch batch of squeaks.")
+                continue
+            if squeaks:
+                self.save_squeaks(squeaks)
+        for i in range(0, len(squeak_hashes), batch_size):
+            batch_hashes = squeak_hashes[i:i + batch_size]
+            try:
+                self.download_secret_keys(batch_hashes)
+            except Exception:
+                logger.exception("Failed to fetch batch of secret keys.")
+
     def download_single_squeak(
             self,
             squeak_hash: bytes,
     ) -> None:
+        self.invalidate_cached_squeak(squeak_hash)
         self.download_squeak(squeak_hash)
 
     def download_single_squeak_secret_key(
@@ -98,9 +256,24 @@ class PeerDownloader(ABC):
             max_block: Optional[int] = None,
             pubkeys: Optional[List[SqueakPublicKey]] = None,
     ) -> None:
-        # Download the squeak if not already owned.
-        if self.squeak_store.get_squeak(squeak_hash):
-            raise Exception('Squeak already saved.')
+        squeak = self.fetch_squeak(
+            squeak_hash,
+            min_block,
+            max_block,
+            pubkeys,
+        )
+
+        # Save the squeak.
+        self.squeak_store.save_squeak(squeak)
+
+    def fetch_squeak(
+            self,
+            squeak_hash: bytes,
+            min_block: Optional[int] = None,
+            max_block: Optional[int] = None,
+            pubkeys: Optional[List[SqueakPublicKey]] = None,
+    ) -> CBaseSqueak:
+        self.check_should_fetch(squeak_hash)
 
         # Download the squeak if not already owned.
         squeak = self.client.get_squeak(squeak_hash)
@@ -108,27 +281,54 @@ class PeerDownloader(ABC):
         # Check if the squeak is valid.
         if not squeak:
             raise Exception('Squeak not found.')
-        if get_hash(squeak) != squeak_hash:
-            raise Exception('Squeak has wrong hash.')
-        if min_block and squeak.nBlockHeight < min_block:
-            raise Exception('Squeak has block height below minimum.')
-        if max_block and squeak.nBlockHeight > max_block:
-            raise Exception('Squeak has block height above minimum.')
-        if pubkeys and squeak.GetPubKey() not in pubkeys:
-            raise Exception('Squeak has wronge pubkey.')
+        self.check_fetched_squeak(
+            squeak_hash,
+            squeak,
+            min_block,
+            max_block,
+            pubkeys,
+        )
+        return squeak
 
-        # Save the squeak.
-        self.squeak_store.save_squeak(squeak)
+    def fetch_squeaks(
+            self,
+            squeak_hashes: List[bytes],
+            min_block: Optional[int] = None,
+            max_block: Optional[int] = None,
+            pubkeys: Optional[List[SqueakPublicKey]] = None,
+    ) -> List[CBaseSqueak]:
+        """Fetch the given squeaks from the peer in a single request,
+        skipping the ones that should not be downloaded.
+        """
+        hashes_to_fetch = self.get_hashes_to_fetch(squeak_hashes)
+        if not hashes_to_fetch:
+            return []
 
-    def download_secret_key(self, squeak_hash: bytes) -> None:
-        squeak = self.squeak_store.get_squeak(squeak_hash)
+        fetched_squeaks = self.client.get_squeaks(hashes_to_fetch)
 
-        # Check if squeak is already owned.
-        if not squeak:
-            raise Exception('Squeak is not already saved.')
+        squeaks = []
+        for squeak_hash in hashes_to_fetch:
+            squeak = fetched_squeaks.get(squeak_hash)
+            if not squeak:
+                continue
+            try:
+                self.check_fetched_squeak(
+                    squeak_hash,
+                    squeak,
+                    min_block,
+                    max_block,
+                    pubkeys,
+                )
+            except Exception:
+                logger.debug("Skipping invalid squeak from peer: {}".format(
+                    squeak_hash.hex(),
+                ))
+                continue
+            squeaks.append(squeak)
+        return squeaks
 
-        if self.squeak_store.get_squeak_secret_key(squeak_hash):
-            raise Exception('Squeak secret key is already saved.')
+    def download_secret_key(self, squeak_hash: bytes) -> None:
+        squeak = self.get_squeak_without_secret_key(squeak_hash)
 
         # Download the secret key if not already owned.
         secret_key = self.client.get_secret_key(squeak_hash)
@@ -136,9 +336,35 @@ class PeerDownloader(ABC):
             self.squeak_store.save_secret_key(squeak_hash, secret_key)
             return
 
-        for received_offer in self.squeak_store.get_received_offers(squeak_hash):
-            if received_offer.peer_address == self.peer.address:
-                raise Exception('Received offer from this peer already saved.')
+        self.download_offer(squeak)
+
+    def download_secret_keys(self, squeak_hashes: List[bytes]) -> None:
+        """Download the secret keys of the given squeaks in a single
+        request, and fall back to downloading offers for the squeaks that
+        the peer did not return a secret key for.
+        """
+        squeaks = self.get_squeaks_without_secret_key(squeak_hashes)
+        if not squeaks:
+            return
+
+        secret_keys = self.client.get_secret_keys([
+            get_hash(squeak) for squeak in squeaks
+        ])
+
+        for squeak in squeaks:
+            squeak_hash = get_hash(squeak)
+            try:
+                secret_key = secret_keys.get(squeak_hash)
+                if secret_key:
+                    self.squeak_store.save_secret_key(squeak_hash, secret_key)
+                else:
+                    self.download_offer(squeak)
+            except Exception:
+                pass
+
+    def download_offer(self, squeak: CBaseSqueak) -> None:
+        squeak_hash = get_hash(squeak)
+        self.check_no_received_offer(squeak_hash)
 
         # Download the offer if secret key not already owned.
         offer = self.client.get_offer(squeak_hash)
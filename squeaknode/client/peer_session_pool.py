@@ -0,0 +1,192 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict
+from typing import List
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.peer_connection_stats import PeerConnectionStats
+
+logger = logging.getLogger(__name__)
+
+
+RETRY_STATUS_CODES = [502, 503, 504]
+
+
+class PeerHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that can count the connections opened by its pools."""
+
+    def get_num_connections(self) -> int:
+        pool_managers = [self.poolmanager] + list(self.proxy_manager.values())
+        num_connections = 0
+        for pool_manager in pool_managers:
+            for pool_key in pool_manager.pools.keys():
+                pool = pool_manager.pools.get(pool_key)
+                if pool is not None:
+                    num_connections += pool.num_connections
+        return num_connections
+
+
+class PeerSession:
+    """A long-lived HTTP session used for all requests to a single peer."""
+
+    def __init__(
+            self,
+            peer_address: PeerAddress,
+            max_connections: int,
+            max_retries: int,
+            retry_backoff_s: float,
+    ):
+        self.peer_address = peer_address
+        self.session = requests.Session()
+        self.adapter = PeerHTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_connections,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=retry_backoff_s,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset(["GET", "POST"]),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        self.session.hooks["response"].append(self.handle_response)
+        self.lock = threading.Lock()
+        self.num_requests = 0
+        self.last_used_time = time.time()
+
+    def handle_response(self, response, *args, **kwargs):
+        with self.lock:
+            self.num_requests += 1
+            self.last_used_time = time.time()
+
+    def get_num_connections(self) -> int:
+        return self.adapter.get_num_connections()
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class PeerSessionPool:
+    """Bounded pool of HTTP sessions keyed by peer address.
+
+    Sessions are reused across sync cycles so that requests to the same
+    peer can reuse open connections, instead of opening a new connection
+    (or a new SOCKS5 handshake through the Tor proxy) for each request.
+    The least recently used session is closed when the pool is full, and
+    sessions that are idle for longer than `keep_alive_s` are closed the
+    next time the pool is used.
+    """
+
+    def __init__(
+            self,
+            max_sessions: int,
+            max_connections_per_peer: int,
+            keep_alive_s: int,
+            max_retries: int,
+            retry_backoff_s: float,
+    ):
+        self.max_sessions = max_sessions
+        self.max_connections_per_peer = max_connections_per_peer
+        self.keep_alive_s = keep_alive_s
+        self.max_retries = max_retries
+        self.retry_backoff_s = retry_backoff_s
+        self.lock = threading.Lock()
+        self.sessions: OrderedDict = OrderedDict()
+        # Counters of the sessions that were already closed, so that the
+        # stats of a peer survive its session being recreated.
+        self.closed_num_requests: Dict[PeerAddress, int] = {}
+        self.closed_num_connections: Dict[PeerAddress, int] = {}
+
+    def get_session(self, peer_address: PeerAddress) -> requests.Session:
+        with self.lock:
+            self._close_idle_sessions()
+            peer_session = self.sessions.get(peer_address)
+            if peer_session is None:
+                peer_session = PeerSession(
+                    peer_address,
+                    self.max_connections_per_peer,
+                    self.max_retries,
+                    self.retry_backoff_s,
+                )
+                self.sessions[peer_address] = peer_session
+            self.sessions.move_to_end(peer_address)
+            while len(self.sessions) > max(self.max_sessions, 1):
+                _, evicted_session = self.sessions.popitem(last=False)
+                self._close_session(evicted_session)
+            return peer_session.session
+
+    def get_stats(self) -> List[PeerConnectionStats]:
+        with self.lock:
+            peer_addresses = set(self.sessions.keys()) | \
+                set(self.closed_num_requests.keys())
+            stats = []
+            for peer_address in peer_addresses:
+                num_requests = self.closed_num_requests.get(peer_address, 0)
+                num_connections = self.closed_num_connections.get(
+                    peer_address, 0)
+                peer_session = self.sessions.get(peer_address)
+                if peer_session is not None:
+                    num_requests += peer_session.num_requests
+                    num_connections += peer_session.get_num_connections()
+                stats.append(PeerConnectionStats(
+                    peer_address=peer_address,
+                    num_requests=num_requests,
+                    num_connections=num_connections,
+                ))
+            return sorted(stats, key=lambda s: (s.peer_address.host, s.peer_address.port))
+
+    def close(self) -> None:
+        with self.lock:
+            while self.sessions:
+                _, peer_session = self.sessions.popitem(last=False)
+                self._close_session(peer_session)
+
+    def _close_idle_sessions(self) -> None:
+        min_last_used_time = time.time() - self.keep_alive_s
+        idle_peer_addresses = [
+            peer_address
+            for peer_address, peer_session in self.sessions.items()
+            if peer_session.last_used_time < min_last_used_time
+        ]
+        for peer_address in idle_peer_addresses:
+            self._close_session(self.sessions.pop(peer_address))
+
+    def _close_session(self, peer_session: PeerSession) -> None:
+        peer_address = peer_session.peer_address
+        logger.debug("Closing session for peer: {}".format(peer_address))
+        self.closed_num_requests[peer_address] = \
+            self.closed_num_requests.get(peer_address, 0) + \
+            peer_session.num_requests
+        self.closed_num_connections[peer_address] = \
+            self.closed_num_connections.get(peer_address, 0) + \
+            peer_session.get_num_connections()
+        peer_session.close()
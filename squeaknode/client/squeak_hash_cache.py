@@ -0,0 +1,99 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from squeaknode.core.cache_stats import CacheStats
+
+
+class SqueakHashCache:
+    """Bounded LRU set of squeak hashes, each with an optional reason.
+
+    Entries expire `ttl_s` seconds after they are added, or never if
+    `ttl_s` is None. The least recently used entries are evicted when
+    the cache is full.
+    """
+
+    def __init__(self, cache_name: str, max_entries: int, ttl_s: Optional[int] = None):
+        self.cache_name = cache_name
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.lock = threading.Lock()
+        # Map from squeak hash to (reason, expiry time).
+        self.entries: OrderedDict = OrderedDict()
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+        self.num_invalidations = 0
+
+    def get(self, squeak_hash: bytes) -> Optional[str]:
+        """ Get the reason of the cached hash, or None if the hash is not
+        cached.
+        """
+        with self.lock:
+            entry = self.entries.get(squeak_hash)
+            if entry is not None:
+                reason, expiry_time = entry
+                if expiry_time is None or expiry_time > time.time():
+                    self.entries.move_to_end(squeak_hash)
+                    self.num_hits += 1
+                    return reason
+                del self.entries[squeak_hash]
+                self.num_evictions += 1
+            self.num_misses += 1
+            return None
+
+    def contains(self, squeak_hash: bytes) -> bool:
+        return self.get(squeak_hash) is not None
+
+    def add(self, squeak_hash: bytes, reason: str = "") -> None:
+        if self.max_entries <= 0:
+            return
+        expiry_time = time.time() + self.ttl_s if self.ttl_s is not None else None
+        with self.lock:
+            self.entries[squeak_hash] = (reason, expiry_time)
+            self.entries.move_to_end(squeak_hash)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.num_evictions += 1
+
+    def invalidate(self, squeak_hash: bytes) -> None:
+        with self.lock:
+            if self.entries.pop(squeak_hash, None) is not None:
+                self.num_invalidations += 1
+
+    def get_stats(self) -> CacheStats:
+        with self.lock:
+            return CacheStats(
+                cache_name=self.cache_name,
+                num_hits=self.num_hits,
+                num_misses=self.num_misses,
+                num_evictions=self.num_evictions,
+                num_invalidations=self.num_invalidations,
+                num_entries=len(self.entries),
+                num_bytes=sum(
+                    len(squeak_hash) + len(reason)
+                    for squeak_hash, (reason, _) in self.entries.items()
+                ),
+            )
@@ -42,12 +42,14 @@ DEFAULT_MAX_SQUEAKS_PER_PUBLIC_KEY_PER_BLOCK = 100
 DEFAULT_SERVER_RPC_HOST = "0.0.0.0"
 DEFAULT_SERVER_RPC_PORT = 8555
 DEFAULT_EXTERNAL_PORT = 8555
+DEFAULT_SERVER_MAX_BATCH_SIZE = 100
 DEFAULT_ADMIN_RPC_HOST = "0.0.0.0"
 DEFAULT_ADMIN_RPC_PORT = 8994
 DEFAULT_WEBADMIN_HOST = "0.0.0.0"
 DEFAULT_WEBADMIN_PORT = 12994
 DEFAULT_BITCOIN_RPC_HOST = "localhost"
 DEFAULT_BITCOIN_RPC_PORT = 18334
+DEFAULT_CHAIN_TIP_POLL_INTERVAL_S = 10
 BITCOIN_RPC_PORT = {
     "mainnet": 8332,
     "testnet": 18332,
@@ -70,7 +72,38 @@ DEFAULT_PEER_DOWNLOAD_INTERVAL_S = 30
 DEFAULT_SUBSCRIBE_INVOICES_RETRY_S = 10
 DEFAULT_SQUEAK_RETENTION_S = 604800
 DEFAULT_SQUEAK_DELETION_INTERVAL_S = 10
+DEFAULT_SQUEAK_DELETION_BATCH_SIZE = 500
+DEFAULT_SQUEAK_DELETION_MAX_ROWS = 10000
+DEFAULT_SQUEAK_DELETION_MAX_TIME_MS = 1000
+DEFAULT_SQUEAK_COUNTER_BLOCK_WINDOW = 2016
+DEFAULT_SQUEAK_COUNTER_RECONCILE_INTERVAL_S = 3600
+DEFAULT_SQUEAK_ENTRY_CACHE_SIZE = 10000
+DEFAULT_SQUEAK_ENTRY_CACHE_MAX_BYTES = 33554432
+DEFAULT_SQUEAK_VERIFIER_WORKERS = 0
+DEFAULT_VERIFIED_SQUEAK_CACHE_SIZE = 100000
+DEFAULT_REJECTED_SQUEAK_CACHE_SIZE = 10000
+DEFAULT_REJECTED_SQUEAK_CACHE_TTL_S = 3600
+DEFAULT_PEER_SESSION_POOL_SIZE = 100
+DEFAULT_PEER_MAX_CONNECTIONS = 10
+DEFAULT_PEER_KEEP_ALIVE_S = 300
+DEFAULT_PEER_MAX_RETRIES = 2
+DEFAULT_PEER_RETRY_BACKOFF_S = 0.5
+DEFAULT_SYNC_ENGINE = "threads"
+DEFAULT_SYNC_MAX_CONCURRENT_REQUESTS = 100
+DEFAULT_SYNC_MAX_REQUESTS_PER_PEER = 4
+DEFAULT_BLOCK_HEADER_SYNC_INTERVAL_S = 60
+DEFAULT_BLOCK_HEADER_SYNC_BATCH_SIZE = 500
 DEFAULT_FORWARD_TWEETS_RETRY_S = 10
+DEFAULT_SQLITE_JOURNAL_MODE = "wal"
+DEFAULT_SQLITE_SYNCHRONOUS = "normal"
+DEFAULT_SQLITE_MMAP_SIZE = 268435456
+DEFAULT_SQLITE_CACHE_SIZE = -65536
+DEFAULT_SQLITE_BUSY_TIMEOUT_MS = 5000
+DEFAULT_SQLITE_TEMP_STORE = "memory"
+DEFAULT_DB_POOL_SIZE = 5
+DEFAULT_DB_MAX_OVERFLOW = 10
+DEFAULT_DB_POOL_RECYCLE_S = 3600
+DEFAULT_DB_SLOW_QUERY_THRESHOLD_MS = 500
 
 
 @section('bitcoin')
@@ -81,6 +114,10 @@ class BitcoinConfig(Config):
     rpc_pass = key(cast=str, required=False, default="")
     rpc_use_ssl = key(cast=bool, required=False, default=False)
     rpc_ssl_cert = key(cast=str, required=False, default="")
+    chain_tip_poll_interval_s = key(
+        cast=int, required=False, default=DEFAULT_CHAIN_TIP_POLL_INTERVAL_S)
+    chain_tip_use_waitfornewblock = key(
+        cast=bool, required=False, default=False)
 
 
 @section('lightning')
@@ -110,6 +147,8 @@ class ServerConfig(Config):
     external_address = key(cast=str, required=False, default="")
     external_port = key(cast=int, required=False,
                         default=DEFAULT_EXTERNAL_PORT)
+    max_batch_size = key(
+        cast=int, required=False, default=DEFAULT_SERVER_MAX_BATCH_SIZE)
 
 
 @section('rpc')
@@ -155,17 +194,80 @@ class NodeConfig(Config):
         cast=int, required=False, default=DEFAULT_SQUEAK_RETENTION_S)
     squeak_deletion_interval_s = key(
         cast=int, required=False, default=DEFAULT_SQUEAK_DELETION_INTERVAL_S)
+    squeak_deletion_batch_size = key(
+        cast=int, required=False, default=DEFAULT_SQUEAK_DELETION_BATCH_SIZE)
+    squeak_deletion_max_rows = key(
+        cast=int, required=False, default=DEFAULT_SQUEAK_DELETION_MAX_ROWS)
+    squeak_deletion_max_time_ms = key(
+        cast=int, required=False, default=DEFAULT_SQUEAK_DELETION_MAX_TIME_MS)
     offer_deletion_interval_s = key(
         cast=int, required=False, default=DEFAULT_OFFER_DELETION_INTERVAL_S)
     interest_block_interval = key(
         cast=int, required=False, default=DEFAULT_INTEREST_BLOCK_INTERVAL)
     peer_download_interval_s = key(
         cast=int, required=False, default=DEFAULT_PEER_DOWNLOAD_INTERVAL_S)
+    squeak_counter_block_window = key(
+        cast=int, required=False, default=DEFAULT_SQUEAK_COUNTER_BLOCK_WINDOW)
+    squeak_counter_reconcile_interval_s = key(
+        cast=int, required=False, default=DEFAULT_SQUEAK_COUNTER_RECONCILE_INTERVAL_S)
+    squeak_entry_cache_size = key(
+        cast=int, required=False, default=DEFAULT_SQUEAK_ENTRY_CACHE_SIZE)
+    squeak_entry_cache_max_bytes = key(
+        cast=int, required=False, default=DEFAULT_SQUEAK_ENTRY_CACHE_MAX_BYTES)
+    squeak_verifier_workers = key(
+        cast=int, required=False, default=DEFAULT_SQUEAK_VERIFIER_WORKERS)
+    verified_squeak_cache_size = key(
+        cast=int, required=False, default=DEFAULT_VERIFIED_SQUEAK_CACHE_SIZE)
+    rejected_squeak_cache_size = key(
+        cast=int, required=False, default=DEFAULT_REJECTED_SQUEAK_CACHE_SIZE)
+    rejected_squeak_cache_ttl_s = key(
+        cast=int, required=False, default=DEFAULT_REJECTED_SQUEAK_CACHE_TTL_S)
+    peer_session_pool_size = key(
+        cast=int, required=False, default=DEFAULT_PEER_SESSION_POOL_SIZE)
+    peer_max_connections = key(
+        cast=int, required=False, default=DEFAULT_PEER_MAX_CONNECTIONS)
+    peer_keep_alive_s = key(
+        cast=int, required=False, default=DEFAULT_PEER_KEEP_ALIVE_S)
+    peer_max_retries = key(
+        cast=int, required=False, default=DEFAULT_PEER_MAX_RETRIES)
+    peer_retry_backoff_s = key(
+        cast=float, required=False, default=DEFAULT_PEER_RETRY_BACKOFF_S)
+    sync_engine = key(cast=str, required=False, default=DEFAULT_SYNC_ENGINE)
+    sync_max_concurrent_requests = key(
+        cast=int, required=False, default=DEFAULT_SYNC_MAX_CONCURRENT_REQUESTS)
+    sync_max_requests_per_peer = key(
+        cast=int, required=False, default=DEFAULT_SYNC_MAX_REQUESTS_PER_PEER)
+    block_header_sync_interval_s = key(
+        cast=int, required=False, default=DEFAULT_BLOCK_HEADER_SYNC_INTERVAL_S)
+    block_header_sync_batch_size = key(
+        cast=int, required=False, default=DEFAULT_BLOCK_HEADER_SYNC_BATCH_SIZE)
 
 
 @section('db')
 class DbConfig(Config):
     connection_string = key(cast=str, required=False, default="")
+    sqlite_journal_mode = key(
+        cast=str, required=False, default=DEFAULT_SQLITE_JOURNAL_MODE)
+    sqlite_synchronous = key(
+        cast=str, required=False, default=DEFAULT_SQLITE_SYNCHRONOUS)
+    sqlite_mmap_size = key(
+        cast=int, required=False, default=DEFAULT_SQLITE_MMAP_SIZE)
+    sqlite_cache_size = key(
+        cast=int, required=False, default=DEFAULT_SQLITE_CACHE_SIZE)
+    sqlite_busy_timeout_ms = key(
+        cast=int, required=False, default=DEFAULT_SQLITE_BUSY_TIMEOUT_MS)
+    sqlite_temp_store = key(
+        cast=str, required=False, default=DEFAULT_SQLITE_TEMP_STORE)
+    pool_size = key(
+        cast=int, required=False, default=DEFAULT_DB_POOL_SIZE)
+    max_overflow = key(
+        cast=int, required=False, default=DEFAULT_DB_MAX_OVERFLOW)
+    pool_recycle_s = key(
+        cast=int, required=False, default=DEFAULT_DB_POOL_RECYCLE_S)
+    pool_pre_ping = key(cast=bool, required=False, default=True)
+    slow_query_threshold_ms = key(
+        cast=int, required=False, default=DEFAULT_DB_SLOW_QUERY_THRESHOLD_MS)
+    slow_query_explain = key(cast=bool, required=False, default=False)
 
 
 @section('twitter')
@@ -0,0 +1,82 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Binary encoding of the batch squeak and secret key requests between peers.
+
+The request body is the concatenated 32 byte squeak hashes. The
+response body is a sequence of records, each a 32 byte squeak hash, a
+4 byte big-endian length and that many bytes of payload. Hashes that the
+peer does not have are left out of the response.
+"""
+import struct
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+HASH_LENGTH = 32
+LENGTH_PREFIX = struct.Struct(">I")
+MAX_BATCH_SIZE_HEADER = "X-Squeak-Max-Batch-Size"
+
+
+def encode_hashes(squeak_hashes: List[bytes]) -> bytes:
+    for squeak_hash in squeak_hashes:
+        if len(squeak_hash) != HASH_LENGTH:
+            raise ValueError("Invalid squeak hash length.")
+    return b"".join(squeak_hashes)
+
+
+def decode_hashes(data: bytes) -> List[bytes]:
+    if len(data) % HASH_LENGTH != 0:
+        raise ValueError("Invalid squeak hashes length.")
+    return [
+        data[i:i + HASH_LENGTH]
+        for i in range(0, len(data), HASH_LENGTH)
+    ]
+
+
+def encode_items(items: List[Tuple[bytes, bytes]]) -> bytes:
+    """ Encode a list of (squeak hash, payload) pairs. """
+    encoded_items = []
+    for squeak_hash, payload in items:
+        if len(squeak_hash) != HASH_LENGTH:
+            raise ValueError("Invalid squeak hash length.")
+        encoded_items.append(
+            squeak_hash + LENGTH_PREFIX.pack(len(payload)) + payload)
+    return b"".join(encoded_items)
+
+
+def decode_items(data: bytes) -> Dict[bytes, bytes]:
+    """ Decode the payloads of a response, keyed by squeak hash. """
+    items = {}
+    offset = 0
+    header_length = HASH_LENGTH + LENGTH_PREFIX.size
+    while offset < len(data):
+        if offset + header_length > len(data):
+            raise ValueError("Truncated batch item header.")
+        squeak_hash = data[offset:offset + HASH_LENGTH]
+        (payload_length,) = LENGTH_PREFIX.unpack_from(
+            data, offset + HASH_LENGTH)
+        offset += header_length
+        if offset + payload_length > len(data):
+            raise ValueError("Truncated batch item payload.")
+        items[squeak_hash] = data[offset:offset + payload_length]
+        offset += payload_length
+    return items
@@ -19,6 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import hashlib
 from typing import Optional
 
 from squeak.core.keys import SqueakPrivateKey
@@ -61,3 +62,7 @@ def get_profile_private_key(profile: SqueakProfile) -> SqueakPrivateKey:
             profile,
         ))
     return profile.private_key
+
+
+def get_profile_image_hash(profile_image: bytes) -> bytes:
+    return hashlib.sha256(profile_image).digest()
@@ -21,6 +21,8 @@
 # SOFTWARE.
 import logging
 from typing import Callable
+from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Tuple
 
@@ -29,6 +31,7 @@ from squeak.core import CBaseSqueak
 from squeak.core import CSqueak
 
 from squeaknode.bitcoin.bitcoin_client import BitcoinClient
+from squeaknode.bitcoin.block_info import BlockInfo
 from squeaknode.core.lightning_address import LightningAddressHostPort
 from squeaknode.core.offer import Offer
 from squeaknode.core.peer_address import PeerAddress
@@ -164,6 +167,31 @@ class SqueakCore:
             raise Exception("Block hash incorrect.")
         return block_info.block_header
 
+    def get_block_infos(
+            self,
+            base_squeaks: List[CBaseSqueak],
+    ) -> Dict[int, BlockInfo]:
+        """Get the block infos for a batch of squeaks with a single
+        lookup of all of their block heights.
+
+        Args:
+            base_squeaks: The squeaks to be validated.
+
+        Returns:
+            Dict[int, BlockInfo]: the block infos of the blocks in the best
+        chain, keyed by block height. Heights that are above the best
+        block have no entry.
+        """
+        block_heights = sorted({
+            base_squeak.nBlockHeight for base_squeak in base_squeaks
+        })
+        block_infos = self.bitcoin_client.get_block_infos_by_heights(
+            block_heights)
+        return {
+            block_info.block_height: block_info
+            for block_info in block_infos
+        }
+
     def get_decrypted_content(
             self,
             squeak: CSqueak,
@@ -34,3 +34,4 @@ class SqueakProfile(NamedTuple):
     private_key: Optional[SqueakPrivateKey] = None
     following: bool = True
     profile_image: Optional[bytes] = None
+    profile_image_hash: Optional[bytes] = None
@@ -23,6 +23,7 @@ import time
 from typing import Optional
 from typing import Tuple
 
+from squeak.core import CBaseSqueak
 from squeak.core import CheckSqueak
 from squeak.core import CResqueak
 from squeak.core import CSqueak
@@ -55,6 +56,25 @@ def get_hash(squeak: CSqueak):
     return squeak.GetHash()[::-1]
 
 
+def deserialize_squeak(squeak_bytes: bytes) -> CBaseSqueak:
+    """Deserialize a squeak or a resqueak.
+
+    Args:
+        squeak_bytes: The serialized squeak or resqueak.
+
+    Returns:
+        CBaseSqueak: the deserialized squeak or resqueak.
+
+    Raises:
+        Exception: If the bytes are not a valid squeak or resqueak.
+    """
+    try:
+        return CSqueak.deserialize(squeak_bytes)
+    except Exception:
+        pass
+    return CResqueak.deserialize(squeak_bytes)
+
+
 def make_squeak_with_block(
         private_key: SqueakPrivateKey,
         content_str: str,
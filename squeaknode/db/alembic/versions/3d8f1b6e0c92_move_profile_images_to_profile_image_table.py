@@ -0,0 +1,114 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Move profile images to profile image table
+
+Revision ID: 3d8f1b6e0c92
+Revises: e2b6f4c81a57
+Create Date: 2026-10-18 19:21:47.630918
+
+"""
+import hashlib
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3d8f1b6e0c92'
+down_revision = 'e2b6f4c81a57'
+branch_labels = None
+depends_on = None
+
+
+profile_table = sa.table(
+    'profile',
+    sa.column('profile_id', sa.Integer),
+    sa.column('profile_image', sa.LargeBinary),
+    sa.column('profile_image_hash', sa.LargeBinary),
+)
+
+profile_image_table = sa.table(
+    'profile_image',
+    sa.column('image_hash', sa.LargeBinary),
+    sa.column('image', sa.LargeBinary),
+)
+
+
+def upgrade():
+    op.create_table('profile_image',
+                    sa.Column('image_hash', sa.LargeBinary(
+                        length=32), nullable=False),
+                    sa.Column('image', sa.LargeBinary(), nullable=False),
+                    sa.PrimaryKeyConstraint(
+                        'image_hash', name=op.f('pk_profile_image'))
+                    )
+    with op.batch_alter_table('profile', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('profile_image_hash', sa.LargeBinary(length=32), nullable=True))
+
+    # Copy the existing images to the new table.
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select([
+            profile_table.c.profile_id,
+            profile_table.c.profile_image,
+        ]).where(profile_table.c.profile_image != None)  # noqa: E711
+    ).fetchall()
+    images_by_hash = {}
+    for profile_id, profile_image in rows:
+        image_hash = hashlib.sha256(profile_image).digest()
+        images_by_hash[image_hash] = profile_image
+        connection.execute(
+            profile_table.update()
+            .where(profile_table.c.profile_id == profile_id)
+            .values(profile_image_hash=image_hash)
+        )
+    if images_by_hash:
+        op.bulk_insert(profile_image_table, [
+            {'image_hash': image_hash, 'image': image}
+            for image_hash, image in images_by_hash.items()
+        ])
+
+    with op.batch_alter_table('profile', schema=None) as batch_op:
+        batch_op.drop_column('profile_image')
+
+
+def downgrade():
+    with op.batch_alter_table('profile', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('profile_image', sa.LargeBinary(), nullable=True))
+
+    # Copy the images back to the profile table.
+    op.execute(
+        profile_table.update().values(
+            profile_image=(
+                sa.select([profile_image_table.c.image])
+                .where(profile_image_table.c.image_hash == profile_table.c.profile_image_hash)
+                .scalar_subquery()
+            )
+        )
+    )
+
+    with op.batch_alter_table('profile', schema=None) as batch_op:
+        batch_op.drop_column('profile_image_hash')
+
+    op.drop_table('profile_image')
@@ -0,0 +1,66 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Add reply and resqueak count columns in squeak table
+
+Revision ID: 5f2c8e4a1d7b
+Revises: b3d0395263c4
+Create Date: 2026-10-18 10:12:43.518204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5f2c8e4a1d7b'
+down_revision = 'b3d0395263c4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('squeak', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('num_replies', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(
+            sa.Column('num_resqueaks', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill the counts for existing squeaks.
+    op.execute(
+        """
+        UPDATE squeak SET
+            num_replies = (
+                SELECT count(*) FROM squeak AS reply_squeak
+                WHERE reply_squeak.reply_hash = squeak.hash
+            ),
+            num_resqueaks = (
+                SELECT count(*) FROM squeak AS resqueak
+                WHERE resqueak.resqueak_hash = squeak.hash
+            )
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('squeak', schema=None) as batch_op:
+        batch_op.drop_column('num_resqueaks')
+        batch_op.drop_column('num_replies')
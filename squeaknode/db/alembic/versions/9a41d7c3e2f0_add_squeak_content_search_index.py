@@ -0,0 +1,72 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Add squeak content search index
+
+Revision ID: 9a41d7c3e2f0
+Revises: 5f2c8e4a1d7b
+Create Date: 2026-10-18 13:47:05.201833
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9a41d7c3e2f0'
+down_revision = '5f2c8e4a1d7b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        has_fts5 = bind.exec_driver_sql(
+            "SELECT sqlite_compileoption_used('ENABLE_FTS5')"
+        ).scalar()
+        if not has_fts5:
+            return
+        op.execute(
+            "CREATE VIRTUAL TABLE squeak_search "
+            "USING fts5(hash UNINDEXED, content)"
+        )
+        op.execute(
+            "INSERT INTO squeak_search (hash, content) "
+            "SELECT hash, content FROM squeak WHERE content IS NOT NULL"
+        )
+    elif bind.dialect.name == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            'ix_squeak_content_trgm',
+            'squeak',
+            ['content'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'content': 'gin_trgm_ops'},
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS squeak_search")
+    elif bind.dialect.name == 'postgresql':
+        op.drop_index('ix_squeak_content_trgm', table_name='squeak')
@@ -0,0 +1,54 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Add block header table
+
+Revision ID: a6d3e9f1c2b8
+Revises: f4a9d2c7b315
+Create Date: 2026-10-18 23:12:05.381904
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6d3e9f1c2b8'
+down_revision = 'f4a9d2c7b315'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('block_header',
+                    sa.Column('block_height', sa.Integer(),
+                              autoincrement=False, nullable=False),
+                    sa.Column('block_hash', sa.LargeBinary(
+                        length=32), nullable=False),
+                    sa.Column('block_header', sa.LargeBinary(),
+                              nullable=False),
+                    sa.PrimaryKeyConstraint(
+                        'block_height', name=op.f('pk_block_header'))
+                    )
+
+
+def downgrade():
+    op.drop_table('block_header')
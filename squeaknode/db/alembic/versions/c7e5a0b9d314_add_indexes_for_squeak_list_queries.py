@@ -0,0 +1,75 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Add indexes for squeak list queries
+
+Revision ID: c7e5a0b9d314
+Revises: 9a41d7c3e2f0
+Create Date: 2026-10-18 16:02:31.774915
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e5a0b9d314'
+down_revision = '9a41d7c3e2f0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('squeak', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_squeak_block_height_time_s_hash',
+            ['block_height', 'time_s', 'hash'],
+            unique=False,
+        )
+        batch_op.create_index(
+            'ix_squeak_author_public_key_block_height_time_s_hash',
+            ['author_public_key', 'block_height', 'time_s', 'hash'],
+            unique=False,
+        )
+        batch_op.create_index(
+            'ix_squeak_reply_hash_block_height_time_s_hash',
+            ['reply_hash', 'block_height', 'time_s', 'hash'],
+            unique=False,
+        )
+        batch_op.create_index(
+            'ix_squeak_liked_time_ms_hash',
+            ['liked_time_ms', 'hash'],
+            unique=False,
+        )
+        batch_op.create_index(
+            'ix_squeak_resqueak_hash',
+            ['resqueak_hash'],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('squeak', schema=None) as batch_op:
+        batch_op.drop_index('ix_squeak_resqueak_hash')
+        batch_op.drop_index('ix_squeak_liked_time_ms_hash')
+        batch_op.drop_index('ix_squeak_reply_hash_block_height_time_s_hash')
+        batch_op.drop_index(
+            'ix_squeak_author_public_key_block_height_time_s_hash')
+        batch_op.drop_index('ix_squeak_block_height_time_s_hash')
@@ -0,0 +1,87 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Add squeak thread closure table
+
+Revision ID: e2b6f4c81a57
+Revises: c7e5a0b9d314
+Create Date: 2026-10-18 18:05:12.204377
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b6f4c81a57'
+down_revision = 'c7e5a0b9d314'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('squeak_thread_closure',
+                    sa.Column('ancestor_hash', sa.LargeBinary(
+                        length=32), nullable=False),
+                    sa.Column('descendant_hash', sa.LargeBinary(
+                        length=32), nullable=False),
+                    sa.Column('depth', sa.Integer(), nullable=False),
+                    sa.PrimaryKeyConstraint('ancestor_hash', 'descendant_hash', name=op.f(
+                        'pk_squeak_thread_closure'))
+                    )
+    with op.batch_alter_table('squeak_thread_closure', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_squeak_thread_closure_descendant_hash_depth',
+            ['descendant_hash', 'depth'],
+            unique=False,
+        )
+
+    # Backfill the closure rows for existing squeaks.
+    op.execute(
+        """
+        INSERT INTO squeak_thread_closure (ancestor_hash, descendant_hash, depth)
+        WITH RECURSIVE thread_closure(ancestor_hash, descendant_hash, depth) AS (
+            SELECT hash, hash, 0 FROM squeak
+          UNION ALL
+            SELECT squeak.reply_hash, thread_closure.descendant_hash, thread_closure.depth + 1
+            FROM squeak
+            JOIN thread_closure ON squeak.hash = thread_closure.ancestor_hash
+            WHERE squeak.reply_hash IS NOT NULL
+        )
+        SELECT ancestor_hash, descendant_hash, depth FROM thread_closure
+        """
+    )
+    # Reply parents that are not saved get a row for themselves.
+    op.execute(
+        """
+        INSERT INTO squeak_thread_closure (ancestor_hash, descendant_hash, depth)
+        SELECT DISTINCT reply_hash, reply_hash, 0 FROM squeak
+        WHERE reply_hash IS NOT NULL
+        AND reply_hash NOT IN (SELECT hash FROM squeak)
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('squeak_thread_closure', schema=None) as batch_op:
+        batch_op.drop_index('ix_squeak_thread_closure_descendant_hash_depth')
+
+    op.drop_table('squeak_thread_closure')
@@ -0,0 +1,146 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Add payment summary tables
+
+Revision ID: f4a9d2c7b315
+Revises: 8b1c6f2d4e70
+Create Date: 2026-10-18 21:03:44.512870
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4a9d2c7b315'
+down_revision = '8b1c6f2d4e70'
+branch_labels = None
+depends_on = None
+
+
+PAYMENTS = """
+    SELECT squeak_hash, peer_network, peer_host, peer_port,
+        1 AS num_received_payments, price_msat AS total_amount_received_msat,
+        0 AS num_sent_payments, 0 AS total_amount_sent_msat
+    FROM received_payment
+  UNION ALL
+    SELECT squeak_hash, peer_network, peer_host, peer_port,
+        0, 0, 1, price_msat
+    FROM sent_payment
+"""
+
+AMOUNTS = """
+    SUM(num_received_payments), SUM(total_amount_received_msat),
+    SUM(num_sent_payments), SUM(total_amount_sent_msat)
+"""
+
+
+def amount_columns():
+    return [
+        sa.Column('num_received_payments', sa.BigInteger(),
+                  server_default='0', nullable=False),
+        sa.Column('total_amount_received_msat', sa.BigInteger(),
+                  server_default='0', nullable=False),
+        sa.Column('num_sent_payments', sa.BigInteger(),
+                  server_default='0', nullable=False),
+        sa.Column('total_amount_sent_msat', sa.BigInteger(),
+                  server_default='0', nullable=False),
+    ]
+
+
+def upgrade():
+    op.create_table('payment_summary',
+                    sa.Column('summary_id', sa.Integer(),
+                              autoincrement=False, nullable=False),
+                    *amount_columns(),
+                    sa.PrimaryKeyConstraint(
+                        'summary_id', name=op.f('pk_payment_summary'))
+                    )
+    op.create_table('squeak_payment_summary',
+                    sa.Column('squeak_hash', sa.LargeBinary(
+                        length=32), nullable=False),
+                    *amount_columns(),
+                    sa.PrimaryKeyConstraint(
+                        'squeak_hash', name=op.f('pk_squeak_payment_summary'))
+                    )
+    op.create_table('pubkey_payment_summary',
+                    sa.Column('public_key', sa.LargeBinary(
+                        length=32), nullable=False),
+                    *amount_columns(),
+                    sa.PrimaryKeyConstraint(
+                        'public_key', name=op.f('pk_pubkey_payment_summary'))
+                    )
+    op.create_table('peer_payment_summary',
+                    sa.Column('peer_network', sa.String(
+                        length=10), nullable=False),
+                    sa.Column('peer_host', sa.String(), nullable=False),
+                    sa.Column('peer_port', sa.Integer(),
+                              autoincrement=False, nullable=False),
+                    *amount_columns(),
+                    sa.PrimaryKeyConstraint(
+                        'peer_network', 'peer_host', 'peer_port',
+                        name=op.f('pk_peer_payment_summary'))
+                    )
+
+    # Backfill the summaries from the existing payments.
+    op.execute(
+        f"""
+        INSERT INTO payment_summary (summary_id, num_received_payments,
+            total_amount_received_msat, num_sent_payments, total_amount_sent_msat)
+        SELECT 1, {AMOUNTS} FROM ({PAYMENTS}) AS payments
+        HAVING COUNT(*) > 0
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO squeak_payment_summary (squeak_hash, num_received_payments,
+            total_amount_received_msat, num_sent_payments, total_amount_sent_msat)
+        SELECT squeak_hash, {AMOUNTS} FROM ({PAYMENTS}) AS payments
+        GROUP BY squeak_hash
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO pubkey_payment_summary (public_key, num_received_payments,
+            total_amount_received_msat, num_sent_payments, total_amount_sent_msat)
+        SELECT squeak.author_public_key, {AMOUNTS} FROM ({PAYMENTS}) AS payments
+        JOIN squeak ON squeak.hash = payments.squeak_hash
+        GROUP BY squeak.author_public_key
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO peer_payment_summary (peer_network, peer_host, peer_port,
+            num_received_payments, total_amount_received_msat,
+            num_sent_payments, total_amount_sent_msat)
+        SELECT peer_network, peer_host, peer_port, {AMOUNTS}
+        FROM ({PAYMENTS}) AS payments
+        GROUP BY peer_network, peer_host, peer_port
+        """
+    )
+
+
+def downgrade():
+    op.drop_table('peer_payment_summary')
+    op.drop_table('pubkey_payment_summary')
+    op.drop_table('squeak_payment_summary')
+    op.drop_table('payment_summary')
@@ -19,16 +19,142 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import logging
+import time
 from pathlib import Path
 
 from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+
+
+logger = logging.getLogger(__name__)
 
 
 DB_FILE = "data-v4.db"
 
 
-def get_engine(connection_string):
-    return create_engine(connection_string)
+def get_engine(connection_string, db_config=None):
+    """ Create the engine for the database.
+
+    If `db_config` is given, the sqlite pragmas or the connection
+    pool options in the config are used.
+    """
+    if db_config is None:
+        return create_engine(connection_string)
+    url = make_url(connection_string)
+    if url.get_backend_name() == "sqlite":
+        engine = get_sqlite_engine(url, db_config)
+    else:
+        engine = create_engine(
+            url,
+            pool_size=db_config.pool_size,
+            max_overflow=db_config.max_overflow,
+            pool_recycle=db_config.pool_recycle_s,
+            pool_pre_ping=db_config.pool_pre_ping,
+        )
+    if db_config.slow_query_threshold_ms > 0:
+        add_slow_query_log(
+            engine,
+            db_config.slow_query_threshold_ms,
+            db_config.slow_query_explain,
+        )
+    return engine
+
+
+def get_sqlite_pragmas(db_config):
+    pragmas = {
+        "journal_mode": db_config.sqlite_journal_mode,
+        "synchronous": db_config.sqlite_synchronous,
+        "mmap_size": db_config.sqlite_mmap_size,
+        "cache_size": db_config.sqlite_cache_size,
+        "busy_timeout": db_config.sqlite_busy_timeout_ms,
+        "temp_store": db_config.sqlite_temp_store,
+    }
+    return {
+        name: value
+        for name, value in pragmas.items()
+        if value != ""
+    }
+
+
+def get_sqlite_engine(url, db_config):
+    if url.database and url.database != ":memory:":
+        # Keep file connections open in a pool, so that each connection
+        # keeps its page cache and memory map between uses. The overflow
+        # is not limited, because the sync workers use many threads at
+        # once, and the busy timeout already limits the waiting for the
+        # database lock.
+        engine = create_engine(
+            url,
+            poolclass=QueuePool,
+            pool_size=db_config.pool_size,
+            max_overflow=-1,
+            connect_args={"check_same_thread": False},
+        )
+    else:
+        engine = create_engine(url)
+    pragmas = get_sqlite_pragmas(db_config)
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute("PRAGMA {}={}".format(name, value))
+        cursor.close()
+
+    return engine
+
+
+def add_slow_query_log(engine, threshold_ms, explain=False):
+    """ Log the SQL of each statement that takes longer than
+    `threshold_ms` to execute, and its query plan if `explain` is set.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        context.query_start_time = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - context.query_start_time) * 1000
+        if elapsed_ms < threshold_ms:
+            return
+        if explain and not executemany and is_select(statement):
+            query_plan = get_query_plan(conn, statement, parameters)
+            logger.warning("Slow query ({:.1f} ms): {}\nQuery plan:\n{}".format(
+                elapsed_ms,
+                statement,
+                query_plan,
+            ))
+        else:
+            logger.warning("Slow query ({:.1f} ms): {}".format(
+                elapsed_ms,
+                statement,
+            ))
+
+
+def is_select(statement):
+    return statement.lstrip().upper().startswith(("SELECT", "WITH"))
+
+
+def get_query_plan(conn, statement, parameters):
+    """ Get the query plan of a statement, using the same DBAPI
+    connection so that the explain does not fire the engine events.
+    """
+    if conn.dialect.name == "sqlite":
+        explain_prefix = "EXPLAIN QUERY PLAN "
+    else:
+        explain_prefix = "EXPLAIN "
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(explain_prefix + statement, parameters)
+        return "\n".join(str(row[-1]) for row in cursor.fetchall())
+    except Exception as e:
+        return "Failed to get query plan: {}".format(e)
+    finally:
+        cursor.close()
 
 
 def get_sqlite_connection_string(sqk_dir, network):
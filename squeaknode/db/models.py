@@ -24,6 +24,7 @@ import logging
 from sqlalchemy import BigInteger
 from sqlalchemy import Boolean
 from sqlalchemy import Column
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import LargeBinary
 from sqlalchemy import MetaData
@@ -31,6 +32,8 @@ from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import UniqueConstraint
 from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import column
+from sqlalchemy.sql import table
 
 
 logger = logging.getLogger(__name__)
@@ -83,6 +86,57 @@ class Models:
             Column("liked_time_ms", SLBigInteger, default=None, nullable=True),
             Column("content", String(280), nullable=True),
             Column("resqueak_hash", LargeBinary(32), nullable=True),
+            Column("num_replies", Integer, nullable=False,
+                   default=0, server_default="0"),
+            Column("num_resqueaks", Integer, nullable=False,
+                   default=0, server_default="0"),
+            Index(
+                "ix_squeak_block_height_time_s_hash",
+                "block_height", "time_s", "hash",
+            ),
+            Index(
+                "ix_squeak_author_public_key_block_height_time_s_hash",
+                "author_public_key", "block_height", "time_s", "hash",
+            ),
+            Index(
+                "ix_squeak_reply_hash_block_height_time_s_hash",
+                "reply_hash", "block_height", "time_s", "hash",
+            ),
+            Index(
+                "ix_squeak_liked_time_ms_hash",
+                "liked_time_ms", "hash",
+            ),
+            Index("ix_squeak_resqueak_hash", "resqueak_hash"),
+            Index(
+                "ix_squeak_liked_time_ms_created_time_ms",
+                "liked_time_ms", "created_time_ms",
+            ),
+        )
+
+        # Closure table of reply threads. There is a row for every pair
+        # of a squeak and one of its reply ancestors (including itself
+        # at depth 0). Reply parents that have not been saved yet also
+        # get rows, so threads are linked when the parent arrives later.
+        self.squeak_thread_closure = Table(
+            "squeak_thread_closure",
+            self.metadata,
+            Column("ancestor_hash", LargeBinary(32), primary_key=True),
+            Column("descendant_hash", LargeBinary(32), primary_key=True),
+            Column("depth", Integer, nullable=False),
+            Index(
+                "ix_squeak_thread_closure_descendant_hash_depth",
+                "descendant_hash", "depth",
+            ),
+        )
+
+        # Full-text search index of squeak content. This is an FTS5
+        # virtual table on sqlite, so it is created by the migration
+        # instead of being part of the metadata.
+        self.squeak_search = table(
+            "squeak_search",
+            column("hash", LargeBinary),
+            column("content", String),
+            schema=schema,
         )
 
         self.profiles = Table(
@@ -94,10 +148,19 @@ class Models:
             Column("private_key", LargeBinary, nullable=True),
             Column("public_key", LargeBinary(32), unique=True, nullable=False),
             Column("following", Boolean, nullable=False),
-            Column("profile_image", LargeBinary, nullable=True),
+            Column("profile_image_hash", LargeBinary(32), nullable=True),
             sqlite_autoincrement=True,
         )
 
+        # Profile images are stored once for each distinct image, keyed
+        # by the sha256 hash of the image data.
+        self.profile_images = Table(
+            "profile_image",
+            self.metadata,
+            Column("image_hash", LargeBinary(32), primary_key=True),
+            Column("image", LargeBinary, nullable=False),
+        )
+
         self.peers = Table(
             "peer",
             self.metadata,
@@ -192,6 +255,80 @@ class Models:
             sqlite_autoincrement=True,
         )
 
+        # Rollups of the sent and received payment tables, updated in the
+        # same transaction as each inserted payment. The global summary
+        # has a single row.
+        self.payment_summaries = Table(
+            "payment_summary",
+            self.metadata,
+            Column("summary_id", Integer, primary_key=True,
+                   autoincrement=False),
+            Column("num_received_payments", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("total_amount_received_msat", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("num_sent_payments", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("total_amount_sent_msat", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+        )
+
+        self.squeak_payment_summaries = Table(
+            "squeak_payment_summary",
+            self.metadata,
+            Column("squeak_hash", LargeBinary(32), primary_key=True),
+            Column("num_received_payments", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("total_amount_received_msat", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("num_sent_payments", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("total_amount_sent_msat", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+        )
+
+        self.pubkey_payment_summaries = Table(
+            "pubkey_payment_summary",
+            self.metadata,
+            Column("public_key", LargeBinary(32), primary_key=True),
+            Column("num_received_payments", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("total_amount_received_msat", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("num_sent_payments", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("total_amount_sent_msat", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+        )
+
+        self.peer_payment_summaries = Table(
+            "peer_payment_summary",
+            self.metadata,
+            Column("peer_network", String(10), primary_key=True),
+            Column("peer_host", String, primary_key=True),
+            Column("peer_port", Integer, primary_key=True,
+                   autoincrement=False),
+            Column("num_received_payments", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("total_amount_received_msat", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("num_sent_payments", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+            Column("total_amount_sent_msat", SLBigInteger, nullable=False,
+                   default=0, server_default="0"),
+        )
+
+        # Headers of the bitcoin blocks in the interest range, keyed by
+        # height. Rows above a reorg are deleted and synced again.
+        self.block_headers = Table(
+            "block_header",
+            self.metadata,
+            Column("block_height", Integer, primary_key=True,
+                   autoincrement=False),
+            Column("block_hash", LargeBinary(32), nullable=False),
+            Column("block_header", LargeBinary, nullable=False),
+        )
+
         self.configs = Table(
             "config",
             self.metadata,
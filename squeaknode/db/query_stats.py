@@ -0,0 +1,143 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import functools
+import inspect
+import threading
+import time
+from typing import Dict
+from typing import List
+
+from squeaknode.core.query_method_stats import QueryMethodStats
+
+
+# Upper bounds of the latency histogram buckets. The last bucket counts
+# the calls that are slower than the last bound.
+QUERY_LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class QueryStats:
+    """ Keeps the call counts, row counts and latency histogram of
+    each timed db method.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.method_stats: Dict[str, QueryMethodStats] = {}
+
+    def record(self, method_name: str, elapsed_ms: float, num_rows: int) -> None:
+        with self.lock:
+            stats = self.method_stats.get(method_name)
+            if stats is None:
+                stats = QueryMethodStats(
+                    method_name=method_name,
+                    num_calls=0,
+                    num_rows=0,
+                    total_time_ms=0.0,
+                    max_time_ms=0.0,
+                    bucket_counts=[0] * (len(QUERY_LATENCY_BUCKETS_MS) + 1),
+                )
+            stats.bucket_counts[get_bucket_index(elapsed_ms)] += 1
+            self.method_stats[method_name] = stats._replace(
+                num_calls=stats.num_calls + 1,
+                num_rows=stats.num_rows + num_rows,
+                total_time_ms=stats.total_time_ms + elapsed_ms,
+                max_time_ms=max(stats.max_time_ms, elapsed_ms),
+            )
+
+    def get_method_stats(self) -> List[QueryMethodStats]:
+        with self.lock:
+            return [
+                stats._replace(bucket_counts=list(stats.bucket_counts))
+                for _, stats in sorted(self.method_stats.items())
+            ]
+
+    def reset(self) -> None:
+        with self.lock:
+            self.method_stats = {}
+
+
+def get_bucket_index(elapsed_ms: float) -> int:
+    for i, bound in enumerate(QUERY_LATENCY_BUCKETS_MS):
+        if elapsed_ms <= bound:
+            return i
+    return len(QUERY_LATENCY_BUCKETS_MS)
+
+
+def count_rows(result) -> int:
+    if result is None:
+        return 0
+    if isinstance(result, (list, tuple, set, dict)):
+        return len(result)
+    return 1
+
+
+def timed_method(method_name, fn):
+    if inspect.isgeneratorfunction(fn):
+        @functools.wraps(fn)
+        def timed_generator(self, *args, **kwargs):
+            elapsed_s = 0.0
+            num_rows = 0
+            start_time = time.perf_counter()
+            try:
+                for item in fn(self, *args, **kwargs):
+                    elapsed_s += time.perf_counter() - start_time
+                    num_rows += 1
+                    yield item
+                    start_time = time.perf_counter()
+                elapsed_s += time.perf_counter() - start_time
+            finally:
+                self.query_stats.record(
+                    method_name, elapsed_s * 1000, num_rows)
+        return timed_generator
+
+    @functools.wraps(fn)
+    def timed(self, *args, **kwargs):
+        start_time = time.perf_counter()
+        result = fn(self, *args, **kwargs)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.query_stats.record(method_name, elapsed_ms, count_rows(result))
+        return result
+    return timed
+
+
+def untimed(fn):
+    """ Mark a public method that does not run a query, so that it is
+    not timed by `timed_queries`.
+    """
+    fn.untimed = True
+    return fn
+
+
+def timed_queries(cls):
+    """ Class decorator that records the timing and row count of each
+    call to a public method in the `query_stats` of the instance.
+
+    Only the time spent inside the method is counted for generators,
+    not the time spent by the caller between items.
+    """
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(value):
+            continue
+        if getattr(value, "untimed", False):
+            continue
+        setattr(cls, name, timed_method(name, value))
+    return cls
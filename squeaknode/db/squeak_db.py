@@ -22,17 +22,29 @@
 import logging
 import time
 from contextlib import contextmanager
+from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import sqlalchemy
 from bitcoin.core import CBlockHeader
-from sqlalchemy import distinct
+from sqlalchemy import and_
+from sqlalchemy import bindparam
+from sqlalchemy import exists
 from sqlalchemy import func
+from sqlalchemy import Integer
 from sqlalchemy import literal
 from sqlalchemy import not_
 from sqlalchemy import or_
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import union_all
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.sql import select
 from sqlalchemy.sql import tuple_
 from squeak.core import CBaseSqueak
@@ -41,9 +53,11 @@ from squeak.core import CSqueak
 from squeak.core.keys import SqueakPrivateKey
 from squeak.core.keys import SqueakPublicKey
 
+from squeaknode.bitcoin.block_info import BlockInfo
 from squeaknode.core.lightning_address import LightningAddressHostPort
 from squeaknode.core.peer_address import Network
 from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.profiles import get_profile_image_hash
 from squeaknode.core.received_offer import ReceivedOffer
 from squeaknode.core.received_payment import ReceivedPayment
 from squeaknode.core.received_payment_summary import ReceivedPaymentSummary
@@ -60,33 +74,73 @@ from squeaknode.core.user_config import UserConfig
 from squeaknode.db.exception import SqueakDatabaseError
 from squeaknode.db.migrations import run_migrations
 from squeaknode.db.models import Models
+from squeaknode.db.query_stats import QueryStats
+from squeaknode.db.query_stats import timed_queries
+from squeaknode.db.query_stats import untimed
 
 
 MAX_INT = 999999999999
 MAX_HASH = b'\xff' * 32
 INIT_NUM_RETRIES = 10
 INIT_RETRY_INTERVAL_S = 1
+RECEIVED_PAYMENTS_BATCH_SIZE = 100
+PAYMENT_SUMMARY_ID = 1
+PAYMENT_SUMMARY_AMOUNT_COLUMN_NAMES = [
+    "num_received_payments",
+    "total_amount_received_msat",
+    "num_sent_payments",
+    "total_amount_sent_msat",
+]
 
 
 logger = logging.getLogger(__name__)
 
 
+def get_search_match_query(search_text: str) -> str:
+    """ Get the full-text search query that matches squeaks with words
+    starting with each of the words in the search text.
+    """
+    return " ".join(
+        '"{}"*'.format(term.replace('"', '""'))
+        for term in search_text.split()
+    )
+
+
+@timed_queries
 class SqueakDb:
     def __init__(self, engine, schema=None):
         self.engine = engine
         self.schema = schema
         self.models = Models(schema=schema)
+        self._statements: Dict[str, Any] = {}
+        self.query_stats = QueryStats()
 
+    @untimed
     @contextmanager
     def get_connection(self):
         with self.engine.connect() as connection:
             yield connection
 
+    @untimed
+    @contextmanager
+    def get_transaction(self):
+        with self.engine.begin() as connection:
+            yield connection
+
     def init(self):
         """ Create the tables and indices in the database. """
         logger.debug("SqlAlchemy version: {}".format(sqlalchemy.__version__))
         run_migrations(self.engine)
 
+        # The search index table only exists on sqlite.
+        self.has_search_index = (
+            self.engine.dialect.name == "sqlite"
+            and sqlalchemy.inspect(self.engine).has_table(
+                "squeak_search",
+                schema=self.schema,
+            )
+        )
+
         # Create aliases for profiles
         self.author_profiles = self.profiles.alias()
         self.resqueaked_author_profiles = self.profiles.alias()
@@ -94,12 +148,15 @@ class SqueakDb:
 
         # Create aliases for squeaks
         self.display_squeaks = self.squeaks.alias()
-        self.reply_squeaks = self.squeaks.alias()
         self.resqueaked_squeaks = self.squeaks.alias()
-        self.resqueaked_reply_squeaks = self.squeaks.alias()
+        self.reply_squeaks = self.squeaks.alias()
         self.resqueaks = self.squeaks.alias()
-        self.resqueaked_resqueaks = self.squeaks.alias()
 
+        # Create aliases for the thread closure
+        self.thread_ancestors = self.squeak_thread_closure.alias()
+        self.thread_descendants = self.squeak_thread_closure.alias()
+
+    @untimed
     def init_with_retries(
             self,
             num_retries=INIT_NUM_RETRIES,
@@ -125,10 +182,38 @@ class SqueakDb:
     def squeaks(self):
         return self.models.squeaks
 
+    @property
+    def squeak_search(self):
+        return self.models.squeak_search
+
+    @property
+    def squeak_thread_closure(self):
+        return self.models.squeak_thread_closure
+
     @property
     def profiles(self):
         return self.models.profiles
 
+    @property
+    def profile_images(self):
+        return self.models.profile_images
+
+    @property
+    def payment_summaries(self):
+        return self.models.payment_summaries
+
+    @property
+    def squeak_payment_summaries(self):
+        return self.models.squeak_payment_summaries
+
+    @property
+    def pubkey_payment_summaries(self):
+        return self.models.pubkey_payment_summaries
+
+    @property
+    def peer_payment_summaries(self):
+        return self.models.peer_payment_summaries
+
     @property
     def peers(self):
         return self.models.peers
@@ -149,6 +234,10 @@ class SqueakDb:
     def sent_offers(self):
         return self.models.sent_offers
 
+    @property
+    def block_headers(self):
+        return self.models.block_headers
+
     @property
     def configs(self):
         return self.models.configs
@@ -165,13 +254,16 @@ class SqueakDb:
     def squeak_is_liked(self):
         return self.squeaks.c.liked_time_ms != None  # noqa: E711
 
+    @untimed
     def squeak_is_older_than_retention(self, interval_s):
-        return self.timestamp_now_ms > \
-            self.squeaks.c.created_time_ms + interval_s * 1000
+        return self.squeaks.c.created_time_ms < \
+            self.timestamp_now_ms - interval_s * 1000
 
+    @untimed
     def profile_has_private_key(self, profiles_table):
         return profiles_table.c.private_key != None  # noqa: E711
 
+    @untimed
     def profile_is_following(self, profiles_table):
         return profiles_table.c.following == True  # noqa: E711
 
@@ -187,6 +279,7 @@ class SqueakDb:
         )
         return self.timestamp_now_ms / 1000 >= expire_time
 
+    @untimed
     def received_offer_is_out_of_retention(self, interval_s):
         expire_time_s = (
             self.received_offers.c.created_time_ms / 1000
@@ -198,6 +291,7 @@ class SqueakDb:
     def received_offer_is_paid(self):
         return self.received_offers.c.paid == True  # noqa: E711
 
+    @untimed
     def sent_offer_out_of_retention(self, interval_s):
         expire_time = (
             self.sent_offers.c.invoice_timestamp
@@ -218,37 +312,191 @@ class SqueakDb:
         )
         return self.timestamp_now_ms / 1000 >= expire_time
 
-    def insert_squeak(self, squeak: CSqueak, block_header: CBlockHeader) -> Optional[bytes]:
-        """ Insert a new squeak.
+    def _select_squeak_entries(self, squeaks_from_clause=None):
+        """ Select squeaks with the columns needed to build squeak entries.
 
-        Return the hash (bytes) of the inserted squeak.
-        Return None if squeak already exists.
+        The reply and resqueak counts are read from the counter columns
+        of the squeak table, so no aggregation is needed.
+        """
+        if squeaks_from_clause is None:
+            squeaks_from_clause = self.squeaks
+        return (
+            select([
+                self.squeaks,
+                self.author_profiles,
+                self.resqueaked_author_profiles,
+                self.recipient_profiles,
+                self.resqueaked_squeaks,
+            ])
+            .select_from(
+                squeaks_from_clause
+                .outerjoin(
+                    self.author_profiles,
+                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
+                )
+                .outerjoin(
+                    self.recipient_profiles,
+                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
+                )
+                .outerjoin(
+                    self.resqueaked_squeaks,
+                    self.resqueaked_squeaks.c.hash == self.squeaks.c.resqueak_hash,
+                )
+                .outerjoin(
+                    self.resqueaked_author_profiles,
+                    self.resqueaked_author_profiles.c.public_key == self.resqueaked_squeaks.c.author_public_key,
+                )
+            )
+        )
+
+    def _get_statement(self, name: str, build_statement: Callable[[], Any]):
+        """ Get a prebuilt statement, building it on first use.
+
+        Prebuilt statements take their values as bind parameters, so the
+        statement and its cache key are only built once.
+        """
+        statement = self._statements.get(name)
+        if statement is None:
+            statement = build_statement()
+            self._statements[name] = statement
+        return statement
+
+    def _paginate_squeak_entries(self, s):
+        """ Order squeak entries by block height and time, starting after
+        the cursor given by the bind parameters of `_get_page_params`.
+        """
+        return (
+            s.where(
+                tuple_(
+                    self.squeaks.c.block_height,
+                    self.squeaks.c.time_s,
+                    self.squeaks.c.hash,
+                ) < tuple_(
+                    bindparam(
+                        "last_block_height",
+                        type_=self.squeaks.c.block_height.type,
+                    ),
+                    bindparam(
+                        "last_squeak_time",
+                        type_=self.squeaks.c.time_s.type,
+                    ),
+                    bindparam(
+                        "last_squeak_hash",
+                        type_=self.squeaks.c.hash.type,
+                    ),
+                )
+            )
+            .order_by(
+                self.squeaks.c.block_height.desc(),
+                self.squeaks.c.time_s.desc(),
+                self.squeaks.c.hash.desc(),
+            )
+            .limit(bindparam("limit", type_=Integer))
+        )
+
+    def _get_page_params(
+            self,
+            limit: int,
+            last_entry: Optional[SqueakEntry],
+            **params,
+    ) -> dict:
+        return dict(
+            limit=limit,
+            last_block_height=last_entry.block_height if last_entry else MAX_INT,
+            last_squeak_time=last_entry.squeak_time if last_entry else MAX_INT,
+            last_squeak_hash=last_entry.squeak_hash if last_entry else MAX_HASH,
+            **params,
+        )
+
+    def _update_squeak_counts(self, connection, squeak_hashes=None) -> None:
+        """ Recompute the reply and resqueak counts of the given squeaks.
+
+        Recompute the counts of all squeaks if `squeak_hashes` is None.
         """
-        ins = self.squeaks.insert().values(
+        num_replies = (
+            select([func.count()])
+            .select_from(self.reply_squeaks)
+            .where(self.reply_squeaks.c.reply_hash == self.squeaks.c.hash)
+            .scalar_subquery()
+        )
+        num_resqueaks = (
+            select([func.count()])
+            .select_from(self.resqueaks)
+            .where(self.resqueaks.c.resqueak_hash == self.squeaks.c.hash)
+            .scalar_subquery()
+        )
+        stmt = self.squeaks.update().values(
+            num_replies=num_replies,
+            num_resqueaks=num_resqueaks,
+        )
+        if squeak_hashes is not None:
+            squeak_hashes = [
+                squeak_hash for squeak_hash in squeak_hashes
+                if squeak_hash is not None
+            ]
+            if not squeak_hashes:
+                return
+            stmt = stmt.where(self.squeaks.c.hash.in_(squeak_hashes))
+        connection.execute(stmt)
+
+    def _get_squeak_values(self, base_squeak: CBaseSqueak, block_header: CBlockHeader) -> dict:
+        values = dict(
             created_time_ms=self.timestamp_now_ms,
-            hash=get_hash(squeak),
-            squeak=squeak.serialize(),
-            reply_hash=(squeak.hashReplySqk
-                        if squeak.is_reply
+            hash=get_hash(base_squeak),
+            squeak=base_squeak.serialize(),
+            reply_hash=(base_squeak.hashReplySqk
+                        if base_squeak.is_reply
                         else None),
-            block_hash=squeak.hashBlock,
-            block_height=squeak.nBlockHeight,
-            time_s=squeak.nTime,
-            author_public_key=squeak.GetPubKey().to_bytes(),
-            recipient_public_key=(squeak.GetRecipientPubKey().to_bytes()
-                                  if squeak.is_private_message
-                                  else None),
+            block_hash=base_squeak.hashBlock,
+            block_height=base_squeak.nBlockHeight,
+            time_s=base_squeak.nTime,
+            author_public_key=base_squeak.GetPubKey().to_bytes(),
+            recipient_public_key=None,
             secret_key=None,
+            resqueak_hash=None,
             block_time_s=block_header.nTime,
         )
-        with self.get_connection() as connection:
-            try:
+        if isinstance(base_squeak, CResqueak):
+            values.update(
+                resqueak_hash=base_squeak.hashResqueakSqk,
+            )
+        elif base_squeak.is_private_message:
+            values.update(
+                recipient_public_key=base_squeak.GetRecipientPubKey().to_bytes(),
+            )
+        return values
+
+    def _insert_squeak_values(self, values: dict) -> Optional[bytes]:
+        ins = self.squeaks.insert().values(**values)
+        try:
+            with self.get_transaction() as connection:
                 res = connection.execute(ins)
                 squeak_hash = res.inserted_primary_key[0]
+                self._insert_into_thread_closure(
+                    connection,
+                    squeak_hash,
+                    values["reply_hash"],
+                )
+                # Counts of the new squeak include any replies or
+                # resqueaks that were saved before it.
+                self._update_squeak_counts(
+                    connection,
+                    [squeak_hash, values["reply_hash"], values["resqueak_hash"]],
+                )
                 return squeak_hash
-            except sqlalchemy.exc.IntegrityError:
-                logger.debug("Failed to insert squeak.", exc_info=True)
-                return None
+        except sqlalchemy.exc.IntegrityError:
+            logger.debug("Failed to insert squeak.", exc_info=True)
+            return None
+
+    def insert_squeak(self, squeak: CSqueak, block_header: CBlockHeader) -> Optional[bytes]:
+        """ Insert a new squeak.
+
+        Return the hash (bytes) of the inserted squeak.
+        Return None if squeak already exists.
+        """
+        return self._insert_squeak_values(
+            self._get_squeak_values(squeak, block_header),
+        )
 
     def insert_resqueak(self, resqueak: CResqueak, block_header: CBlockHeader) -> Optional[bytes]:
         """ Insert a new resqueak.
@@ -256,28 +504,174 @@ class SqueakDb:
         Return the hash (bytes) of the inserted resqueak.
         Return None if resqueak already exists.
         """
-        ins = self.squeaks.insert().values(
-            created_time_ms=self.timestamp_now_ms,
-            hash=get_hash(resqueak),
-            squeak=resqueak.serialize(),
-            reply_hash=(resqueak.hashReplySqk
-                        if resqueak.is_reply
-                        else None),
-            block_hash=resqueak.hashBlock,
-            block_height=resqueak.nBlockHeight,
-            time_s=resqueak.nTime,
-            author_public_key=resqueak.GetPubKey().to_bytes(),
-            resqueak_hash=resqueak.hashResqueakSqk,
-            block_time_s=block_header.nTime,
+        return self._insert_squeak_values(
+            self._get_squeak_values(resqueak, block_header),
         )
-        with self.get_connection() as connection:
-            try:
-                res = connection.execute(ins)
-                squeak_hash = res.inserted_primary_key[0]
-                return squeak_hash
-            except sqlalchemy.exc.IntegrityError:
-                logger.debug("Failed to insert squeak.", exc_info=True)
-                return None
+
+    def insert_squeaks(
+            self,
+            squeaks_with_block_headers: List[Tuple[CBaseSqueak, CBlockHeader]],
+    ) -> List[bytes]:
+        """ Insert a batch of squeaks and resqueaks in a single transaction.
+
+        Return the hashes (bytes) of the inserted squeaks. Squeaks that
+        already exist are skipped.
+        """
+        values_by_hash: Dict[bytes, dict] = {}
+        for base_squeak, block_header in squeaks_with_block_headers:
+            values = self._get_squeak_values(base_squeak, block_header)
+            values_by_hash.setdefault(values["hash"], values)
+        if not values_by_hash:
+            return []
+        s = select([self.squeaks.c.hash]).where(
+            self.squeaks.c.hash.in_(list(values_by_hash.keys()))
+        )
+        with self.get_transaction() as connection:
+            existing_hashes = set(
+                row["hash"] for row in connection.execute(s)
+            )
+            new_values = [
+                values for squeak_hash, values in values_by_hash.items()
+                if squeak_hash not in existing_hashes
+            ]
+            if not new_values:
+                return []
+            connection.execute(
+                self._insert_ignore_duplicates(self.squeaks),
+                new_values,
+            )
+            updated_hashes = set()
+            for values in new_values:
+                self._insert_into_thread_closure(
+                    connection,
+                    values["hash"],
+                    values["reply_hash"],
+                )
+                updated_hashes.update([
+                    values["hash"],
+                    values["reply_hash"],
+                    values["resqueak_hash"],
+                ])
+            self._update_squeak_counts(connection, updated_hashes)
+            return [values["hash"] for values in new_values]
+
+    def _insert_into_thread_closure(
+            self,
+            connection,
+            squeak_hash: bytes,
+            reply_hash: Optional[bytes],
+    ) -> None:
+        """ Add a squeak to the thread closure table.
+
+        The squeak may already have rows as the unsaved parent of
+        earlier replies, so those replies are linked to its ancestors
+        as well.
+        """
+        self_rows = [
+            dict(ancestor_hash=squeak_hash, descendant_hash=squeak_hash, depth=0),
+        ]
+        if reply_hash is not None:
+            self_rows.append(
+                dict(ancestor_hash=reply_hash, descendant_hash=reply_hash, depth=0),
+            )
+        connection.execute(
+            self._insert_ignore_duplicates(self.squeak_thread_closure),
+            self_rows,
+        )
+        if reply_hash is None:
+            return
+        # Link every ancestor of the parent to every descendant of the
+        # squeak, including the two of them.
+        links = select([
+            self.thread_ancestors.c.ancestor_hash,
+            self.thread_descendants.c.descendant_hash,
+            (
+                self.thread_ancestors.c.depth
+                + self.thread_descendants.c.depth + 1
+            ).label("depth"),
+        ]).select_from(
+            self.thread_ancestors.join(
+                self.thread_descendants,
+                self.thread_descendants.c.ancestor_hash == squeak_hash,
+            )
+        ).where(
+            self.thread_ancestors.c.descendant_hash == reply_hash
+        )
+        connection.execute(
+            self._insert_ignore_duplicates(self.squeak_thread_closure).from_select(
+                ["ancestor_hash", "descendant_hash", "depth"],
+                links,
+            )
+        )
+
+    def _delete_from_thread_closure(
+            self,
+            connection,
+            squeak_hashes: List[bytes],
+            reply_hashes: List[Optional[bytes]],
+    ) -> None:
+        """ Remove deleted squeaks from the thread closure table.
+
+        The ancestors of each squeak are unlinked from its replies, so
+        the squeak stays in the table only as the unsaved root of its
+        replies.
+        """
+        for squeak_hash in squeak_hashes:
+            ancestor_hashes = select([
+                self.thread_ancestors.c.ancestor_hash,
+            ]).where(
+                self.thread_ancestors.c.descendant_hash == squeak_hash
+            ).where(
+                self.thread_ancestors.c.depth > 0
+            )
+            descendant_hashes = select([
+                self.thread_descendants.c.descendant_hash,
+            ]).where(
+                self.thread_descendants.c.ancestor_hash == squeak_hash
+            )
+            connection.execute(
+                self.squeak_thread_closure.delete().where(
+                    self.squeak_thread_closure.c.ancestor_hash.in_(
+                        ancestor_hashes)
+                ).where(
+                    self.squeak_thread_closure.c.descendant_hash.in_(
+                        descendant_hashes)
+                )
+            )
+        # Remove the rows of the squeaks and their parents if they are
+        # unsaved and have no replies left.
+        has_saved_squeak = exists().where(
+            self.squeaks.c.hash == self.squeak_thread_closure.c.ancestor_hash
+        )
+        has_descendants = exists().where(
+            self.thread_descendants.c.ancestor_hash == self.squeak_thread_closure.c.ancestor_hash
+        ).where(
+            self.thread_descendants.c.depth > 0
+        )
+        connection.execute(
+            self.squeak_thread_closure.delete().where(
+                self.squeak_thread_closure.c.ancestor_hash.in_(
+                    [h for h in squeak_hashes + reply_hashes if h is not None]
+                )
+            ).where(
+                self.squeak_thread_closure.c.depth == 0
+            ).where(
+                not_(has_saved_squeak)
+            ).where(
+                not_(has_descendants)
+            )
+        )
+
+    def _insert_ignore_duplicates(self, table):
+        """ Get an insert statement for the table that skips rows that
+        conflict with existing rows.
+        """
+        dialect_name = self.engine.dialect.name
+        if dialect_name == "sqlite":
+            return sqlite_insert(table).on_conflict_do_nothing()
+        if dialect_name == "postgresql":
+            return postgresql_insert(table).on_conflict_do_nothing()
+        return table.insert()
 
     def get_squeak(self, squeak_hash: bytes) -> Optional[CBaseSqueak]:
         """ Get a squeak. """
@@ -306,68 +700,15 @@ class SqueakDb:
         # author_profiles = self.profiles.alias()
         # recipient_profiles = self.profiles.alias()
 
-        s = (
-            select([
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-                func.count(distinct(self.reply_squeaks.c.hash)
-                           ).label("num_replies"),
-                func.count(distinct(self.resqueaked_reply_squeaks.c.hash)).label(
-                    "num_resqueak_replies"),
-                func.count(distinct(self.resqueaks.c.hash)
-                           ).label("num_resqueaks"),
-                func.count(distinct(self.resqueaked_resqueaks.c.hash)).label(
-                    "num_resqueak_resqueaks"),
-            ])
-            .select_from(
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-                .outerjoin(
-                    self.reply_squeaks,
-                    self.reply_squeaks.c.reply_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaks,
-                    self.resqueaks.c.resqueak_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_squeaks,
-                    self.resqueaked_squeaks.c.hash == self.squeaks.c.resqueak_hash,
-                )
-                .outerjoin(
-                    self.resqueaked_author_profiles,
-                    self.resqueaked_author_profiles.c.public_key == self.resqueaked_squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.resqueaked_reply_squeaks,
-                    self.resqueaked_reply_squeaks.c.reply_hash == self.resqueaked_squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_resqueaks,
-                    self.resqueaked_resqueaks.c.resqueak_hash == self.resqueaked_squeaks.c.hash,
-                )
-            )
-            .group_by(
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-            )
-            .where(self.squeaks.c.hash == squeak_hash)
+        s = self._get_statement(
+            "squeak_entry",
+            lambda: (
+                self._select_squeak_entries()
+                .where(self.squeaks.c.hash == bindparam("squeak_hash"))
+            ),
         )
         with self.get_connection() as connection:
-            result = connection.execute(s)
+            result = connection.execute(s, dict(squeak_hash=squeak_hash))
             row = result.fetchone()
             if row is None:
                 return None
@@ -383,104 +724,27 @@ class SqueakDb:
             last_entry: Optional[SqueakEntry],
     ) -> List[SqueakEntry]:
         """ Get all followed squeaks. """
-        last_block_height = last_entry.block_height if last_entry else MAX_INT
-        last_squeak_time = last_entry.squeak_time if last_entry else MAX_INT
-        last_squeak_hash = last_entry.squeak_hash if last_entry else MAX_HASH
-        logger.info("""Timeline db query with
+        params = self._get_page_params(limit, last_entry)
+        logger.debug("""Timeline db query with
         limit: {}
         block_height: {}
         squeak_time: {}
         squeak_hash: {}
         """.format(
             limit,
-            last_block_height,
-            last_squeak_time,
-            last_squeak_hash.hex(),
+            params["last_block_height"],
+            params["last_squeak_time"],
+            params["last_squeak_hash"].hex(),
         ))
-        s = (
-            # select([self.squeaks, self.profiles])
-            select([
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-                func.count(distinct(self.reply_squeaks.c.hash)
-                           ).label("num_replies"),
-                func.count(distinct(self.resqueaked_reply_squeaks.c.hash)).label(
-                    "num_resqueak_replies"),
-                func.count(distinct(self.resqueaks.c.hash)
-                           ).label("num_resqueaks"),
-                func.count(distinct(self.resqueaked_resqueaks.c.hash)).label(
-                    "num_resqueak_resqueaks"),
-            ])
-            .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-                .outerjoin(
-                    self.reply_squeaks,
-                    self.reply_squeaks.c.reply_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaks,
-                    self.resqueaks.c.resqueak_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_squeaks,
-                    self.resqueaked_squeaks.c.hash == self.squeaks.c.resqueak_hash,
-                )
-                .outerjoin(
-                    self.resqueaked_author_profiles,
-                    self.resqueaked_author_profiles.c.public_key == self.resqueaked_squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.resqueaked_reply_squeaks,
-                    self.resqueaked_reply_squeaks.c.reply_hash == self.resqueaked_squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_resqueaks,
-                    self.resqueaked_resqueaks.c.resqueak_hash == self.resqueaked_squeaks.c.hash,
-                )
-            )
-            .group_by(
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-            )
-            .where(self.profile_is_following(self.author_profiles))
-            .where(
-                tuple_(
-                    self.squeaks.c.block_height,
-                    self.squeaks.c.time_s,
-                    self.squeaks.c.hash,
-                ) < tuple_(
-                    last_block_height,
-                    last_squeak_time,
-                    last_squeak_hash,
-                )
-            )
-            .order_by(
-                self.squeaks.c.block_height.desc(),
-                self.squeaks.c.time_s.desc(),
-                self.squeaks.c.hash.desc(),
-            )
-            .limit(limit)
+        s = self._get_statement(
+            "timeline_squeak_entries",
+            lambda: self._paginate_squeak_entries(
+                self._select_squeak_entries()
+                .where(self.profile_is_following(self.author_profiles))
+            ),
         )
         with self.get_connection() as connection:
-            result = connection.execute(s)
+            result = connection.execute(s, params)
             rows = result.fetchall()
             return [self._parse_squeak_entry(row) for row in rows]
 
@@ -492,7 +756,7 @@ class SqueakDb:
         """ Get liked squeaks. """
         last_liked_time_ms = last_entry.liked_time_ms if last_entry else self.timestamp_now_ms
         last_squeak_hash = last_entry.squeak_hash if last_entry else MAX_HASH
-        logger.info("""Liked squeaks db query with
+        logger.debug("""Liked squeaks db query with
         limit: {}
         last_liked_time_ms: {}
         last_squeak_hash: {}
@@ -501,89 +765,41 @@ class SqueakDb:
             last_liked_time_ms,
             last_squeak_hash.hex(),
         ))
-        s = (
-            # select([self.squeaks, self.profiles])
-            select([
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-                func.count(distinct(self.reply_squeaks.c.hash)
-                           ).label("num_replies"),
-                func.count(distinct(self.resqueaked_reply_squeaks.c.hash)).label(
-                    "num_resqueak_replies"),
-                func.count(distinct(self.resqueaks.c.hash)
-                           ).label("num_resqueaks"),
-                func.count(distinct(self.resqueaked_resqueaks.c.hash)).label(
-                    "num_resqueak_resqueaks"),
-            ])
-            .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-                .outerjoin(
-                    self.reply_squeaks,
-                    self.reply_squeaks.c.reply_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaks,
-                    self.resqueaks.c.resqueak_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_squeaks,
-                    self.resqueaked_squeaks.c.hash == self.squeaks.c.resqueak_hash,
-                )
-                .outerjoin(
-                    self.resqueaked_author_profiles,
-                    self.resqueaked_author_profiles.c.public_key == self.resqueaked_squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.resqueaked_reply_squeaks,
-                    self.resqueaked_reply_squeaks.c.reply_hash == self.resqueaked_squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_resqueaks,
-                    self.resqueaked_resqueaks.c.resqueak_hash == self.resqueaked_squeaks.c.hash,
-                )
-            )
-            .group_by(
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-            )
-            .where(
-                self.squeak_is_liked,
-            )
-            .where(
-                tuple_(
-                    self.squeaks.c.liked_time_ms,
-                    self.squeaks.c.hash,
-                ) < tuple_(
-                    last_liked_time_ms,
-                    last_squeak_hash,
-                )
-            )
-            .order_by(
-                self.squeaks.c.liked_time_ms.desc(),
-                self.squeaks.c.hash.desc(),
-            )
-            .limit(limit)
+        s = self._get_statement(
+            "liked_squeak_entries",
+            lambda: (
+                self._select_squeak_entries()
+                .where(
+                    self.squeak_is_liked,
+                )
+                .where(
+                    tuple_(
+                        self.squeaks.c.liked_time_ms,
+                        self.squeaks.c.hash,
+                    ) < tuple_(
+                        bindparam(
+                            "last_liked_time_ms",
+                            type_=self.squeaks.c.liked_time_ms.type,
+                        ),
+                        bindparam(
+                            "last_squeak_hash",
+                            type_=self.squeaks.c.hash.type,
+                        ),
+                    )
+                )
+                .order_by(
+                    self.squeaks.c.liked_time_ms.desc(),
+                    self.squeaks.c.hash.desc(),
+                )
+                .limit(bindparam("limit", type_=Integer))
+            ),
         )
         with self.get_connection() as connection:
-            result = connection.execute(s)
+            result = connection.execute(s, dict(
+                limit=limit,
+                last_liked_time_ms=last_liked_time_ms,
+                last_squeak_hash=last_squeak_hash,
+            ))
             rows = result.fetchall()
             return [self._parse_squeak_entry(row) for row in rows]
 
@@ -594,10 +810,12 @@ class SqueakDb:
             last_entry: Optional[SqueakEntry],
     ) -> List[SqueakEntry]:
         """ Get a squeak. """
-        last_block_height = last_entry.block_height if last_entry else MAX_INT
-        last_squeak_time = last_entry.squeak_time if last_entry else MAX_INT
-        last_squeak_hash = last_entry.squeak_hash if last_entry else MAX_HASH
-        logger.info("""Address db query with
+        params = self._get_page_params(
+            limit,
+            last_entry,
+            public_key=public_key.to_bytes(),
+        )
+        logger.debug("""Address db query with
         public key: {}
         limit: {}
         block_height: {}
@@ -606,94 +824,19 @@ class SqueakDb:
         """.format(
             public_key,
             limit,
-            last_block_height,
-            last_squeak_time,
-            last_squeak_hash.hex(),
+            params["last_block_height"],
+            params["last_squeak_time"],
+            params["last_squeak_hash"].hex(),
         ))
-        s = (
-            # select([self.squeaks, self.profiles])
-            select([
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-                func.count(distinct(self.reply_squeaks.c.hash)
-                           ).label("num_replies"),
-                func.count(distinct(self.resqueaked_reply_squeaks.c.hash)).label(
-                    "num_resqueak_replies"),
-                func.count(distinct(self.resqueaks.c.hash)
-                           ).label("num_resqueaks"),
-                func.count(distinct(self.resqueaked_resqueaks.c.hash)).label(
-                    "num_resqueak_resqueaks"),
-            ])
-            .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-                .outerjoin(
-                    self.reply_squeaks,
-                    self.reply_squeaks.c.reply_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaks,
-                    self.resqueaks.c.resqueak_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_squeaks,
-                    self.resqueaked_squeaks.c.hash == self.squeaks.c.resqueak_hash,
-                )
-                .outerjoin(
-                    self.resqueaked_author_profiles,
-                    self.resqueaked_author_profiles.c.public_key == self.resqueaked_squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.resqueaked_reply_squeaks,
-                    self.resqueaked_reply_squeaks.c.reply_hash == self.resqueaked_squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_resqueaks,
-                    self.resqueaked_resqueaks.c.resqueak_hash == self.resqueaked_squeaks.c.hash,
-                )
-            )
-            .group_by(
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-            )
-            .where(self.squeaks.c.author_public_key == public_key.to_bytes())
-            .where(
-                tuple_(
-                    self.squeaks.c.block_height,
-                    self.squeaks.c.time_s,
-                    self.squeaks.c.hash,
-                ) < tuple_(
-                    last_block_height,
-                    last_squeak_time,
-                    last_squeak_hash,
-                )
-            )
-            .order_by(
-                self.squeaks.c.block_height.desc(),
-                self.squeaks.c.time_s.desc(),
-                self.squeaks.c.hash.desc(),
-            )
-            .limit(limit)
+        s = self._get_statement(
+            "public_key_squeak_entries",
+            lambda: self._paginate_squeak_entries(
+                self._select_squeak_entries()
+                .where(self.squeaks.c.author_public_key == bindparam("public_key"))
+            ),
         )
         with self.get_connection() as connection:
-            result = connection.execute(s)
+            result = connection.execute(s, params)
             rows = result.fetchall()
             return [self._parse_squeak_entry(row) for row in rows]
 
@@ -704,10 +847,8 @@ class SqueakDb:
             last_entry: Optional[SqueakEntry],
     ) -> List[SqueakEntry]:
         """ Get a squeak. """
-        last_block_height = last_entry.block_height if last_entry else MAX_INT
-        last_squeak_time = last_entry.squeak_time if last_entry else MAX_INT
-        last_squeak_hash = last_entry.squeak_hash if last_entry else MAX_HASH
-        logger.info("""Search db query with
+        params = self._get_page_params(limit, last_entry)
+        logger.debug("""Search db query with
         search_text: {}
         limit: {}
         block_height: {}
@@ -716,217 +857,135 @@ class SqueakDb:
         """.format(
             search_text,
             limit,
-            last_block_height,
-            last_squeak_time,
-            last_squeak_hash.hex(),
+            params["last_block_height"],
+            params["last_squeak_time"],
+            params["last_squeak_hash"].hex(),
         ))
-        s = (
-            # select([self.squeaks, self.profiles])
-            select([
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-                func.count(distinct(self.reply_squeaks.c.hash)
-                           ).label("num_replies"),
-                func.count(distinct(self.resqueaked_reply_squeaks.c.hash)).label(
-                    "num_resqueak_replies"),
-                func.count(distinct(self.resqueaks.c.hash)
-                           ).label("num_resqueaks"),
-                func.count(distinct(self.resqueaked_resqueaks.c.hash)).label(
-                    "num_resqueak_resqueaks"),
-            ])
-            .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-                .outerjoin(
-                    self.reply_squeaks,
-                    self.reply_squeaks.c.reply_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaks,
-                    self.resqueaks.c.resqueak_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_squeaks,
-                    self.resqueaked_squeaks.c.hash == self.squeaks.c.resqueak_hash,
-                )
-                .outerjoin(
-                    self.resqueaked_author_profiles,
-                    self.resqueaked_author_profiles.c.public_key == self.resqueaked_squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.resqueaked_reply_squeaks,
-                    self.resqueaked_reply_squeaks.c.reply_hash == self.resqueaked_squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_resqueaks,
-                    self.resqueaked_resqueaks.c.resqueak_hash == self.resqueaked_squeaks.c.hash,
-                )
-            )
-            .group_by(
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
+        match_query = get_search_match_query(search_text)
+        if self.has_search_index and match_query:
+            s = self._get_statement(
+                "text_search_squeak_entries",
+                lambda: self._paginate_squeak_entries(
+                    self._select_squeak_entries()
+                    .where(self.squeaks.c.hash.in_(
+                        select([self.squeak_search.c.hash])
+                        .where(self.squeak_search.c.content.op("MATCH")(
+                            bindparam("match_query", type_=String)))
+                    ))
+                ),
             )
-            .where(self.squeaks.c.content.ilike(f'%{search_text}%'))
-            .where(
-                tuple_(
-                    self.squeaks.c.block_height,
-                    self.squeaks.c.time_s,
-                    self.squeaks.c.hash,
-                ) < tuple_(
-                    last_block_height,
-                    last_squeak_time,
-                    last_squeak_hash,
-                )
-            )
-            .order_by(
-                self.squeaks.c.block_height.desc(),
-                self.squeaks.c.time_s.desc(),
-                self.squeaks.c.hash.desc(),
+            params.update(match_query=match_query)
+        else:
+            s = self._get_statement(
+                "text_like_squeak_entries",
+                lambda: self._paginate_squeak_entries(
+                    self._select_squeak_entries()
+                    .where(self.squeaks.c.content.ilike(
+                        bindparam("search_pattern", type_=String)))
+                ),
             )
-            .limit(limit)
-        )
+            params.update(search_pattern=f'%{search_text}%')
         with self.get_connection() as connection:
-            result = connection.execute(s)
+            result = connection.execute(s, params)
             rows = result.fetchall()
             return [self._parse_squeak_entry(row) for row in rows]
 
     def get_thread_ancestor_squeak_entries(self, squeak_hash: bytes) -> List[SqueakEntry]:
         """ Get all reply ancestors of squeak hash. """
-        ancestors = (
-            select(
-                [
-                    self.squeaks.c.hash.label("hash"),
-                    literal(0).label("depth"),
-                ]
-            )
-            .where(self.squeaks.c.hash == squeak_hash)
-            .cte(recursive=True)
+        s = self._get_statement(
+            "thread_ancestor_squeak_entries",
+            lambda: (
+                self._select_squeak_entries(
+                    self.squeaks.join(
+                        self.thread_ancestors,
+                        self.thread_ancestors.c.ancestor_hash == self.squeaks.c.hash,
+                    )
+                )
+                .where(self.thread_ancestors.c.descendant_hash == bindparam("squeak_hash"))
+                .order_by(
+                    self.thread_ancestors.c.depth.desc(),
+                )
+            ),
         )
+        with self.get_connection() as connection:
+            result = connection.execute(s, dict(squeak_hash=squeak_hash))
+            rows = result.fetchall()
+            return [self._parse_squeak_entry(row) for row in rows]
 
-        ancestors_alias = ancestors.alias()
-        squeaks_alias = self.squeaks.alias()
-
-        ancestors = ancestors.union_all(
-            select(
-                [
-                    squeaks_alias.c.reply_hash.label("hash"),
-                    (ancestors_alias.c.depth + 1).label("depth"),
-                ]
-            ).where(squeaks_alias.c.hash == ancestors_alias.c.hash)
+    def get_thread_descendant_squeak_entries(
+            self,
+            squeak_hash: bytes,
+            limit: int,
+            last_entry: Optional[SqueakEntry],
+    ) -> List[SqueakEntry]:
+        """ Get all replies and nested replies for a squeak hash. """
+        s = self._get_statement(
+            "thread_descendant_squeak_entries",
+            lambda: self._paginate_squeak_entries(
+                self._select_squeak_entries(
+                    self.squeaks.join(
+                        self.thread_descendants,
+                        self.thread_descendants.c.descendant_hash == self.squeaks.c.hash,
+                    )
+                )
+                .where(self.thread_descendants.c.ancestor_hash == bindparam("squeak_hash"))
+                .where(self.thread_descendants.c.depth > 0)
+            ),
         )
-
-        s = (
-            # select([self.squeaks, self.profiles])
-            select([
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-                func.count(distinct(self.reply_squeaks.c.hash)
-                           ).label("num_replies"),
-                func.count(distinct(self.resqueaked_reply_squeaks.c.hash)).label(
-                    "num_resqueak_replies"),
-                func.count(distinct(self.resqueaks.c.hash)
-                           ).label("num_resqueaks"),
-                func.count(distinct(self.resqueaked_resqueaks.c.hash)).label(
-                    "num_resqueak_resqueaks"),
-            ])
-            .select_from(
-                self.squeaks.join(
-                    ancestors,
-                    ancestors.c.hash == self.squeaks.c.hash,
-                    # ).outerjoin(
-                    #     self.profiles,
-                    #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-                .outerjoin(
-                    self.reply_squeaks,
-                    self.reply_squeaks.c.reply_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaks,
-                    self.resqueaks.c.resqueak_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_squeaks,
-                    self.resqueaked_squeaks.c.hash == self.squeaks.c.resqueak_hash,
-                )
-                .outerjoin(
-                    self.resqueaked_author_profiles,
-                    self.resqueaked_author_profiles.c.public_key == self.resqueaked_squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.resqueaked_reply_squeaks,
-                    self.resqueaked_reply_squeaks.c.reply_hash == self.resqueaked_squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_resqueaks,
-                    self.resqueaked_resqueaks.c.resqueak_hash == self.resqueaked_squeaks.c.hash,
-                )
-            )
-            .group_by(
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-                ancestors.c.depth,
-            )
-            .order_by(
-                ancestors.c.depth.desc(),
+        with self.get_connection() as connection:
+            result = connection.execute(
+                s,
+                self._get_page_params(
+                    limit,
+                    last_entry,
+                    squeak_hash=squeak_hash,
+                ),
             )
-        )
+            rows = result.fetchall()
+            return [self._parse_squeak_entry(row) for row in rows]
 
-        with self.get_connection() as connection:
-            result = connection.execute(s)
+    def get_thread_conversation_squeak_entries(
+            self,
+            squeak_hash: bytes,
+            limit: int,
+            last_entry: Optional[SqueakEntry],
+    ) -> List[SqueakEntry]:
+        """ Get all squeaks in the same reply thread as a squeak hash,
+        starting from the root of the thread.
+        """
+        s = self._get_statement(
+            "thread_conversation_squeak_entries",
+            self._build_thread_conversation_statement,
+        )
+        with self.get_connection() as connection:
+            result = connection.execute(
+                s,
+                self._get_page_params(
+                    limit,
+                    last_entry,
+                    squeak_hash=squeak_hash,
+                ),
+            )
             rows = result.fetchall()
             return [self._parse_squeak_entry(row) for row in rows]
 
-        # sql = """
-        # WITH RECURSIVE is_thread_ancestor(hash, depth) AS (
-        #     VALUES(%s, 1)
-        #   UNION\n
-        #     SELECT squeak.reply_hash AS hash, is_thread_ancestor.depth + 1 AS depth FROM squeak, is_thread_ancestor
-        #     WHERE squeak.hash=is_thread_ancestor.hash
-        #   )
-        #   SELECT * FROM squeak
-        #   JOIN is_thread_ancestor
-        #     ON squeak.hash=is_thread_ancestor.hash
-        #   LEFT JOIN profile
-        #     ON squeak.author_public_key=profile.address
-        #   WHERE squeak.block_header IS NOT NULL
-        #   ORDER BY is_thread_ancestor.depth DESC;
-        # """
-        # with self.get_cursor() as curs:
-        #     curs.execute(sql, (squeak_hash_str,))
-        #     rows = curs.fetchall()
-        #     return [self._parse_squeak_entry_with_profile(row) for row in rows]
+    def _build_thread_conversation_statement(self):
+        root_hash = (
+            select([self.thread_ancestors.c.ancestor_hash])
+            .where(self.thread_ancestors.c.descendant_hash == bindparam("squeak_hash"))
+            .order_by(self.thread_ancestors.c.depth.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        return self._paginate_squeak_entries(
+            self._select_squeak_entries(
+                self.squeaks.join(
+                    self.thread_descendants,
+                    self.thread_descendants.c.descendant_hash == self.squeaks.c.hash,
+                )
+            )
+            .where(self.thread_descendants.c.ancestor_hash == root_hash)
+        )
 
     def get_thread_reply_squeak_entries(
             self,
@@ -935,104 +994,31 @@ class SqueakDb:
             last_entry: Optional[SqueakEntry],
     ) -> List[SqueakEntry]:
         """ Get all replies for a squeak hash. """
-        last_block_height = last_entry.block_height if last_entry else MAX_INT
-        last_squeak_time = last_entry.squeak_time if last_entry else MAX_INT
-        last_squeak_hash = last_entry.squeak_hash if last_entry else MAX_HASH
-        logger.info("""Timeline db query with
+        params = self._get_page_params(
+            limit,
+            last_entry,
+            squeak_hash=squeak_hash,
+        )
+        logger.debug("""Timeline db query with
         limit: {}
         block_height: {}
         squeak_time: {}
         squeak_hash: {}
         """.format(
             limit,
-            last_block_height,
-            last_squeak_time,
-            last_squeak_hash.hex(),
+            params["last_block_height"],
+            params["last_squeak_time"],
+            params["last_squeak_hash"].hex(),
         ))
-        s = (
-            # select([self.squeaks, self.profiles])
-            select([
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-                func.count(distinct(self.reply_squeaks.c.hash)
-                           ).label("num_replies"),
-                func.count(distinct(self.resqueaked_reply_squeaks.c.hash)).label(
-                    "num_resqueak_replies"),
-                func.count(distinct(self.resqueaks.c.hash)
-                           ).label("num_resqueaks"),
-                func.count(distinct(self.resqueaked_resqueaks.c.hash)).label(
-                    "num_resqueak_resqueaks"),
-            ])
-            .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-                .outerjoin(
-                    self.reply_squeaks,
-                    self.reply_squeaks.c.reply_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaks,
-                    self.resqueaks.c.resqueak_hash == self.squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_squeaks,
-                    self.resqueaked_squeaks.c.hash == self.squeaks.c.resqueak_hash,
-                )
-                .outerjoin(
-                    self.resqueaked_author_profiles,
-                    self.resqueaked_author_profiles.c.public_key == self.resqueaked_squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.resqueaked_reply_squeaks,
-                    self.resqueaked_reply_squeaks.c.reply_hash == self.resqueaked_squeaks.c.hash,
-                )
-                .outerjoin(
-                    self.resqueaked_resqueaks,
-                    self.resqueaked_resqueaks.c.resqueak_hash == self.resqueaked_squeaks.c.hash,
-                )
-            )
-            .group_by(
-                self.squeaks,
-                self.author_profiles,
-                self.resqueaked_author_profiles,
-                self.recipient_profiles,
-                self.resqueaked_squeaks,
-            )
-            .where(self.squeaks.c.reply_hash == squeak_hash)
-            .where(
-                tuple_(
-                    self.squeaks.c.block_height,
-                    self.squeaks.c.time_s,
-                    self.squeaks.c.hash,
-                ) < tuple_(
-                    last_block_height,
-                    last_squeak_time,
-                    last_squeak_hash,
-                )
-            )
-            .order_by(
-                self.squeaks.c.block_height.desc(),
-                self.squeaks.c.time_s.desc(),
-                self.squeaks.c.hash.desc(),
-            )
-            .limit(limit)
+        s = self._get_statement(
+            "thread_reply_squeak_entries",
+            lambda: self._paginate_squeak_entries(
+                self._select_squeak_entries()
+                .where(self.squeaks.c.reply_hash == bindparam("squeak_hash"))
+            ),
         )
         with self.get_connection() as connection:
-            result = connection.execute(s)
+            result = connection.execute(s, params)
             rows = result.fetchall()
             return [self._parse_squeak_entry(row) for row in rows]
 
@@ -1112,14 +1098,55 @@ class SqueakDb:
                 func.count().label("num_squeaks"),
             ])
             .select_from(self.squeaks)
-            .where(self.squeaks.c.author_public_key == public_key.to_bytes())
-            .where(self.squeaks.c.block_height == block_height)
+            .where(self.squeaks.c.author_public_key == public_key.to_bytes())
+            .where(self.squeaks.c.block_height == block_height)
+        )
+        with self.get_connection() as connection:
+            result = connection.execute(s)
+            row = result.fetchone()
+            num_squeaks = row["num_squeaks"]
+            return num_squeaks
+
+    def get_number_of_squeaks_by_public_key_and_block_height(
+        self,
+        public_keys: Optional[List[SqueakPublicKey]],
+        min_block: int,
+        max_block: int,
+    ) -> Dict[Tuple[SqueakPublicKey, int], int]:
+        """ Get number of squeaks for each public key and block height
+        in the given block range.
+
+        If public_keys is None, squeaks from all authors are counted.
+        """
+        if public_keys is not None and not public_keys:
+            return {}
+        s = (
+            select([
+                self.squeaks.c.author_public_key,
+                self.squeaks.c.block_height,
+                func.count().label("num_squeaks"),
+            ])
+            .select_from(self.squeaks)
+            .where(self.squeaks.c.block_height >= min_block)
+            .where(self.squeaks.c.block_height <= max_block)
+            .group_by(
+                self.squeaks.c.author_public_key,
+                self.squeaks.c.block_height,
+            )
         )
+        if public_keys is not None:
+            public_key_bytes = [pubkey.to_bytes() for pubkey in public_keys]
+            s = s.where(self.squeaks.c.author_public_key.in_(public_key_bytes))
         with self.get_connection() as connection:
             result = connection.execute(s)
-            row = result.fetchone()
-            num_squeaks = row["num_squeaks"]
-            return num_squeaks
+            rows = result.fetchall()
+            return {
+                (
+                    SqueakPublicKey.from_bytes(row["author_public_key"]),
+                    row["block_height"],
+                ): row["num_squeaks"]
+                for row in rows
+            }
 
     def get_old_squeaks_to_delete(
             self,
@@ -1129,26 +1156,8 @@ class SqueakDb:
         criteria for deletion.
         """
         s = (
-            # select([self.squeaks, self.profiles])
-            select([self.squeaks, self.author_profiles, self.recipient_profiles])
-            .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-            )
-            .where(self.squeak_is_older_than_retention(interval_s))
-            .where(not_(self.profile_has_private_key(self.author_profiles)))
-            .where(not_(self.squeak_is_liked))
+            select([self.squeaks.c.hash])
+            .where(self._squeak_is_expired(interval_s))
         )
         with self.get_connection() as connection:
             result = connection.execute(s)
@@ -1156,6 +1165,33 @@ class SqueakDb:
             hashes = [(row["hash"]) for row in rows]
             return hashes
 
+    def _squeak_is_expired(self, interval_s: int):
+        """ Condition for squeaks that are older than retention and are
+        not liked or authored by a signing profile.
+        """
+        is_authored = exists().where(
+            self.profiles.c.public_key == self.squeaks.c.author_public_key
+        ).where(
+            self.profile_has_private_key(self.profiles)
+        )
+        return and_(
+            self.squeak_is_older_than_retention(interval_s),
+            not_(self.squeak_is_liked),
+            not_(is_authored),
+        )
+
+    def _select_profiles(self):
+        """ Select profiles together with their profile images. """
+        return (
+            select([self.profiles, self.profile_images])
+            .select_from(
+                self.profiles.outerjoin(
+                    self.profile_images,
+                    self.profile_images.c.image_hash == self.profiles.c.profile_image_hash,
+                )
+            )
+        )
+
     def insert_profile(self, squeak_profile: SqueakProfile) -> int:
         """ Insert a new squeak profile. """
         ins = self.profiles.insert().values(
@@ -1173,77 +1209,84 @@ class SqueakDb:
 
     def get_profiles(self) -> List[SqueakProfile]:
         """ Get all profiles. """
-        s = select([self.profiles])
+        s = self._select_profiles()
         with self.get_connection() as connection:
             result = connection.execute(s)
             rows = result.fetchall()
-            profiles = [self._parse_squeak_profile(row) for row in rows]
+            profiles = [self._parse_squeak_profile(
+                row, profile_images_table=self.profile_images) for row in rows]
             return profiles
 
     def get_signing_profiles(self) -> List[SqueakProfile]:
         """ Get all signing profiles. """
         s = (
-            select([self.profiles])
+            self._select_profiles()
             .where(self.profile_has_private_key(self.profiles))
         )
         with self.get_connection() as connection:
             result = connection.execute(s)
             rows = result.fetchall()
-            profiles = [self._parse_squeak_profile(row) for row in rows]
+            profiles = [self._parse_squeak_profile(
+                row, profile_images_table=self.profile_images) for row in rows]
             return profiles
 
     def get_contact_profiles(self) -> List[SqueakProfile]:
         """ Get all contact profiles. """
         s = (
-            select([self.profiles])
+            self._select_profiles()
             .where(not_(self.profile_has_private_key(self.profiles)))
         )
         with self.get_connection() as connection:
             result = connection.execute(s)
             rows = result.fetchall()
-            profiles = [self._parse_squeak_profile(row) for row in rows]
+            profiles = [self._parse_squeak_profile(
+                row, profile_images_table=self.profile_images) for row in rows]
             return profiles
 
     def get_following_profiles(self) -> List[SqueakProfile]:
         """ Get all following profiles. """
-        s = select([self.profiles]).where(self.profiles.c.following)
+        s = self._select_profiles().where(self.profiles.c.following)
         with self.get_connection() as connection:
             result = connection.execute(s)
             rows = result.fetchall()
-            profiles = [self._parse_squeak_profile(row) for row in rows]
+            profiles = [self._parse_squeak_profile(
+                row, profile_images_table=self.profile_images) for row in rows]
             return profiles
 
     def get_profile(self, profile_id: int) -> Optional[SqueakProfile]:
         """ Get a profile. """
-        s = select([self.profiles]).where(
+        s = self._select_profiles().where(
             self.profiles.c.profile_id == profile_id)
         with self.get_connection() as connection:
             result = connection.execute(s)
             row = result.fetchone()
             if row is None:
                 return None
-            return self._parse_squeak_profile(row)
+            return self._parse_squeak_profile(
+                row, profile_images_table=self.profile_images)
 
     def get_profile_by_public_key(self, public_key: SqueakPublicKey) -> Optional[SqueakProfile]:
         """ Get a profile by public key. """
-        s = select([self.profiles]).where(
+        s = self._select_profiles().where(
             self.profiles.c.public_key == public_key.to_bytes())
         with self.get_connection() as connection:
             result = connection.execute(s)
             row = result.fetchone()
             if row is None:
                 return None
-            return self._parse_squeak_profile(row)
+            return self._parse_squeak_profile(
+                row, profile_images_table=self.profile_images)
 
     def get_profile_by_name(self, name: str) -> Optional[SqueakProfile]:
         """ Get a profile by name. """
-        s = select([self.profiles]).where(self.profiles.c.profile_name == name)
+        s = self._select_profiles().where(self.profiles.c.profile_name == name)
         with self.get_connection() as connection:
             result = connection.execute(s)
             row = result.fetchone()
             if row is None:
                 return None
-            return self._parse_squeak_profile(row)
+            return self._parse_squeak_profile(
+                row, profile_images_table=self.profile_images)
 
     def set_profile_following(self, profile_id: int, following: bool) -> None:
         """ Set a profile is following. """
@@ -1270,18 +1313,52 @@ class SqueakDb:
         delete_profile_stmt = self.profiles.delete().where(
             self.profiles.c.profile_id == profile_id
         )
-        with self.get_connection() as connection:
+        with self.get_transaction() as connection:
             connection.execute(delete_profile_stmt)
+            self._delete_unused_profile_images(connection)
 
     def set_profile_image(self, profile_id: int, profile_image: Optional[bytes]) -> None:
         """ Set a profile image. """
+        profile_image_hash = get_profile_image_hash(
+            profile_image) if profile_image is not None else None
         stmt = (
             self.profiles.update()
             .where(self.profiles.c.profile_id == profile_id)
-            .values(profile_image=profile_image)
+            .values(profile_image_hash=profile_image_hash)
         )
-        with self.get_connection() as connection:
+        with self.get_transaction() as connection:
+            if profile_image is not None:
+                connection.execute(
+                    self._insert_ignore_duplicates(self.profile_images).values(
+                        image_hash=profile_image_hash,
+                        image=profile_image,
+                    )
+                )
             connection.execute(stmt)
+            self._delete_unused_profile_images(connection)
+
+    def get_profile_image(self, image_hash: bytes) -> Optional[bytes]:
+        """ Get a profile image by the hash of the image. """
+        s = select([self.profile_images.c.image]).where(
+            self.profile_images.c.image_hash == image_hash)
+        with self.get_connection() as connection:
+            result = connection.execute(s)
+            row = result.fetchone()
+            if row is None:
+                return None
+            return row["image"]
+
+    def _delete_unused_profile_images(self, connection) -> None:
+        """ Delete profile images that are not used by any profile. """
+        connection.execute(
+            self.profile_images.delete().where(
+                not_(
+                    exists().where(
+                        self.profiles.c.profile_image_hash == self.profile_images.c.image_hash
+                    )
+                )
+            )
+        )
 
     def set_squeak_secret_key(self, squeak_hash: bytes, secret_key: bytes) -> None:
         """ Set the secret key of a squeak. """
@@ -1300,8 +1377,45 @@ class SqueakDb:
             .where(self.squeaks.c.hash == squeak_hash)
             .values(content=content)
         )
-        with self.get_connection() as connection:
-            connection.execute(stmt)
+        with self.get_transaction() as connection:
+            res = connection.execute(stmt)
+            if self.has_search_index and res.rowcount > 0:
+                self._delete_from_search_index(connection, [squeak_hash])
+                connection.execute(
+                    self.squeak_search.insert().values(
+                        hash=squeak_hash,
+                        content=content,
+                    )
+                )
+
+    def _delete_from_search_index(self, connection, squeak_hashes: List[bytes]) -> None:
+        connection.execute(
+            self.squeak_search.delete().where(
+                self.squeak_search.c.hash.in_(squeak_hashes)
+            )
+        )
+
+    def rebuild_search_index(self) -> None:
+        """ Rebuild the full-text search index of squeak content. """
+        with self.get_transaction() as connection:
+            if self.has_search_index:
+                connection.execute(self.squeak_search.delete())
+                connection.execute(
+                    self.squeak_search.insert().from_select(
+                        ["hash", "content"],
+                        select([
+                            self.squeaks.c.hash,
+                            self.squeaks.c.content,
+                        ]).where(self.squeaks.c.content != None),  # noqa: E711
+                    )
+                )
+            elif self.engine.dialect.name == "postgresql":
+                index_name = "ix_squeak_content_trgm"
+                if self.schema:
+                    index_name = "{}.{}".format(self.schema, index_name)
+                connection.execute(
+                    sqlalchemy.text("REINDEX INDEX {}".format(index_name))
+                )
 
     def set_squeak_liked(self, squeak_hash: bytes) -> None:
         """ Set the squeak to be liked. """
@@ -1323,13 +1437,147 @@ class SqueakDb:
         with self.get_connection() as connection:
             connection.execute(stmt)
 
-    def delete_squeak(self, squeak_hash: bytes) -> None:
-        """ Delete a squeak. """
-        delete_squeak_stmt = self.squeaks.delete().where(
+    def delete_squeak(
+            self,
+            squeak_hash: bytes,
+    ) -> Optional[Tuple[SqueakPublicKey, int]]:
+        """ Delete a squeak.
+
+        Returns the author public key and block height of the deleted
+        squeak, or None if the squeak does not exist.
+        """
+        s = self._select_squeaks_to_delete().where(
             self.squeaks.c.hash == squeak_hash
         )
-        with self.get_connection() as connection:
-            connection.execute(delete_squeak_stmt)
+        with self.get_transaction() as connection:
+            rows = connection.execute(s).fetchall()
+            deleted_squeaks = self._delete_squeaks(connection, rows)
+        return deleted_squeaks[0] if deleted_squeaks else None
+
+    def delete_old_squeaks(
+            self,
+            interval_s: int,
+            limit: int,
+    ) -> List[Tuple[SqueakPublicKey, int]]:
+        """ Delete up to `limit` squeaks older than retention that meet
+        the criteria for deletion, in a single transaction.
+
+        Returns the author public key and block height of each deleted
+        squeak.
+        """
+        s = (
+            self._select_squeaks_to_delete()
+            .where(self._squeak_is_expired(interval_s))
+            .order_by(self.squeaks.c.created_time_ms)
+            .limit(limit)
+        )
+        with self.get_transaction() as connection:
+            rows = connection.execute(s).fetchall()
+            return self._delete_squeaks(connection, rows)
+
+    def _select_squeaks_to_delete(self):
+        """ Select the columns needed to delete squeaks. """
+        return select([
+            self.squeaks.c.hash,
+            self.squeaks.c.author_public_key,
+            self.squeaks.c.block_height,
+            self.squeaks.c.reply_hash,
+            self.squeaks.c.resqueak_hash,
+        ])
+
+    def _delete_squeaks(self, connection, rows) -> List[Tuple[SqueakPublicKey, int]]:
+        """ Delete the squeaks in the given rows, and update the tables
+        derived from them.
+        """
+        if not rows:
+            return []
+        squeak_hashes = [row["hash"] for row in rows]
+        connection.execute(
+            self.squeaks.delete().where(
+                self.squeaks.c.hash.in_(squeak_hashes)
+            )
+        )
+        self._remove_from_pubkey_payment_summaries(connection, rows)
+        if self.has_search_index:
+            self._delete_from_search_index(connection, squeak_hashes)
+        self._delete_from_thread_closure(
+            connection,
+            squeak_hashes,
+            [row["reply_hash"] for row in rows],
+        )
+        self._update_squeak_counts(
+            connection,
+            [row["reply_hash"] for row in rows]
+            + [row["resqueak_hash"] for row in rows],
+        )
+        return [
+            (
+                SqueakPublicKey.from_bytes(row["author_public_key"]),
+                row["block_height"],
+            )
+            for row in rows
+        ]
+
+    def repair_squeak_counts(self) -> None:
+        """ Recompute the reply and resqueak counts of all squeaks. """
+        with self.get_transaction() as connection:
+            self._update_squeak_counts(connection)
+
+    def rebuild_thread_closure(self) -> None:
+        """ Rebuild the thread closure table from the reply hashes of
+        all squeaks.
+        """
+        closure = (
+            select([
+                self.squeaks.c.hash.label("ancestor_hash"),
+                self.squeaks.c.hash.label("descendant_hash"),
+                literal(0).label("depth"),
+            ])
+            .cte(recursive=True)
+        )
+        closure_alias = closure.alias()
+        closure = closure.union_all(
+            select([
+                self.reply_squeaks.c.reply_hash,
+                closure_alias.c.descendant_hash,
+                closure_alias.c.depth + 1,
+            ])
+            .where(self.reply_squeaks.c.hash == closure_alias.c.ancestor_hash)
+            .where(self.reply_squeaks.c.reply_hash != None)  # noqa: E711
+        )
+        unsaved_parents = (
+            select([
+                self.squeaks.c.reply_hash,
+                self.squeaks.c.reply_hash,
+                literal(0),
+            ])
+            .distinct()
+            .where(self.squeaks.c.reply_hash != None)  # noqa: E711
+            .where(
+                self.squeaks.c.reply_hash.not_in(
+                    select([self.reply_squeaks.c.hash])
+                )
+            )
+        )
+        columns = ["ancestor_hash", "descendant_hash", "depth"]
+        with self.get_transaction() as connection:
+            connection.execute(self.squeak_thread_closure.delete())
+            connection.execute(
+                self.squeak_thread_closure.insert().from_select(
+                    columns,
+                    select([
+                        closure.c.ancestor_hash,
+                        closure.c.descendant_hash,
+                        closure.c.depth,
+                    ]),
+                )
+            )
+            connection.execute(
+                self.squeak_thread_closure.insert().from_select(
+                    columns,
+                    unsaved_parents,
+                )
+            )
 
     def insert_peer(self, squeak_peer: SqueakPeer) -> int:
         """ Insert a new squeak peer. """
@@ -1525,9 +1773,16 @@ class SqueakDb:
             node_pubkey=sent_payment.node_pubkey,
             valid=sent_payment.valid,
         )
-        with self.get_connection() as connection:
+        with self.get_transaction() as connection:
             res = connection.execute(ins)
             sent_payment_id = res.inserted_primary_key[0]
+            self._add_to_payment_summaries(
+                connection,
+                sent_payment.squeak_hash,
+                sent_payment.peer_address,
+                num_sent_payments=1,
+                total_amount_sent_msat=sent_payment.price_msat,
+            )
             return sent_payment_id
 
     def get_sent_payments(
@@ -1538,7 +1793,7 @@ class SqueakDb:
         """ Get all sent payments. """
         last_created_time = last_sent_payment.created_time_ms if last_sent_payment else self.timestamp_now_ms
         last_payment_hash = last_sent_payment.payment_hash if last_sent_payment else MAX_HASH
-        logger.info("""Get sent payments db query with
+        logger.debug("""Get sent payments db query with
         limit: {}
         last_created_time: {}
         last_payment_hash: {}
@@ -1580,7 +1835,7 @@ class SqueakDb:
         """ Get sent payments for a squeak. """
         last_created_time = last_sent_payment.created_time_ms if last_sent_payment else self.timestamp_now_ms
         last_payment_hash = last_sent_payment.payment_hash if last_sent_payment else MAX_HASH
-        logger.info("""Get sent payments db query with
+        logger.debug("""Get sent payments db query with
         limit: {}
         last_created_time: {}
         last_payment_hash: {}
@@ -1623,7 +1878,7 @@ class SqueakDb:
         """ Get sent payments for a pubkey. """
         last_created_time = last_sent_payment.created_time_ms if last_sent_payment else self.timestamp_now_ms
         last_payment_hash = last_sent_payment.payment_hash if last_sent_payment else MAX_HASH
-        logger.info("""Get sent payments db query with
+        logger.debug("""Get sent payments db query with
         public_key: {}
         limit: {}
         last_created_time: {}
@@ -1674,7 +1929,7 @@ class SqueakDb:
         """ Get sent payments for a peer. """
         last_created_time = last_sent_payment.created_time_ms if last_sent_payment else self.timestamp_now_ms
         last_payment_hash = last_sent_payment.payment_hash if last_sent_payment else MAX_HASH
-        logger.info("""Get sent payments db query with
+        logger.debug("""Get sent payments db query with
         peer_address: {}
         limit: {}
         last_created_time: {}
@@ -1687,9 +1942,9 @@ class SqueakDb:
         ))
         s = (
             select([self.sent_payments])
-            .where(self.received_payments.c.peer_network == peer_address.network.name)
-            .where(self.received_payments.c.peer_host == peer_address.host)
-            .where(self.received_payments.c.peer_port == peer_address.port)
+            .where(self.sent_payments.c.peer_network == peer_address.network.name)
+            .where(self.sent_payments.c.peer_host == peer_address.host)
+            .where(self.sent_payments.c.peer_port == peer_address.port)
             .where(
                 tuple_(
                     self.sent_payments.c.created_time_ms,
@@ -1831,15 +2086,22 @@ class SqueakDb:
             peer_host=received_payment.peer_address.host,
             peer_port=received_payment.peer_address.port,
         )
-        with self.get_connection() as connection:
-            try:
+        try:
+            with self.get_transaction() as connection:
                 res = connection.execute(ins)
                 received_payment_id = res.inserted_primary_key[0]
+                self._add_to_payment_summaries(
+                    connection,
+                    received_payment.squeak_hash,
+                    received_payment.peer_address,
+                    num_received_payments=1,
+                    total_amount_received_msat=received_payment.price_msat,
+                )
                 return received_payment_id
-            except sqlalchemy.exc.IntegrityError:
-                logger.debug(
-                    "Failed to insert received payment.", exc_info=True)
-                return None
+        except sqlalchemy.exc.IntegrityError:
+            logger.debug(
+                "Failed to insert received payment.", exc_info=True)
+            return None
 
     def get_received_payments(
             self,
@@ -1849,7 +2111,7 @@ class SqueakDb:
         """ Get all received payments. """
         last_created_time = last_received_payment.created_time_ms if last_received_payment else self.timestamp_now_ms
         last_payment_hash = last_received_payment.payment_hash if last_received_payment else MAX_HASH
-        logger.info("""Get received payments db query with
+        logger.debug("""Get received payments db query with
         limit: {}
         last_created_time: {}
         last_payment_hash: {}
@@ -1891,7 +2153,7 @@ class SqueakDb:
         """ Get received payments for a squeak. """
         last_created_time = last_received_payment.created_time_ms if last_received_payment else self.timestamp_now_ms
         last_payment_hash = last_received_payment.payment_hash if last_received_payment else MAX_HASH
-        logger.info("""Get received payments db query with
+        logger.debug("""Get received payments db query with
         limit: {}
         last_created_time: {}
         last_payment_hash: {}
@@ -1934,7 +2196,7 @@ class SqueakDb:
         """ Get received payments for a pubkey. """
         last_created_time = last_received_payment.created_time_ms if last_received_payment else self.timestamp_now_ms
         last_payment_hash = last_received_payment.payment_hash if last_received_payment else MAX_HASH
-        logger.info("""Get received payments db query with
+        logger.debug("""Get received payments db query with
         limit: {}
         last_created_time: {}
         last_payment_hash: {}
@@ -1983,7 +2245,7 @@ class SqueakDb:
         """ Get received payments for a squeak. """
         last_created_time = last_received_payment.created_time_ms if last_received_payment else self.timestamp_now_ms
         last_payment_hash = last_received_payment.payment_hash if last_received_payment else MAX_HASH
-        logger.info("""Get received payments db query with
+        logger.debug("""Get received payments db query with
         peer_address: {}
         limit: {}
         last_created_time: {}
@@ -2041,167 +2303,285 @@ class SqueakDb:
         with self.get_connection() as connection:
             connection.execute(stmt)
 
-    def yield_received_payments_from_index(self, start_index: int = 0) -> Iterator[ReceivedPayment]:
-        """ Get all received payments. """
+    def yield_received_payments_from_index(
+            self,
+            start_index: int = 0,
+            batch_size: int = RECEIVED_PAYMENTS_BATCH_SIZE,
+    ) -> Iterator[ReceivedPayment]:
+        """ Get all received payments after the given index.
+
+        Payments are read in batches, and the connection is released
+        in between batches, so the consumer can iterate slowly.
+        """
+        last_index = start_index
+        while True:
+            received_payments = self.get_received_payments_from_index(
+                last_index,
+                batch_size,
+            )
+            yield from received_payments
+            if len(received_payments) < batch_size:
+                return
+            last_payment_id = received_payments[-1].received_payment_id
+            assert last_payment_id is not None
+            last_index = last_payment_id
+
+    def get_received_payments_from_index(
+            self,
+            start_index: int,
+            limit: int,
+    ) -> List[ReceivedPayment]:
+        """ Get a batch of received payments after the given index. """
         s = (
             select([self.received_payments])
+            .where(self.received_payments.c.received_payment_id > start_index)
             .order_by(
                 self.received_payments.c.received_payment_id.asc(),
             )
-            .where(self.received_payments.c.received_payment_id > start_index)
+            .limit(limit)
         )
         with self.get_connection() as connection:
             result = connection.execute(s)
-            for row in result:
-                received_payment = self._parse_received_payment(row)
-                yield received_payment
+            rows = result.fetchall()
+            received_payments = [
+                self._parse_received_payment(row) for row in rows]
+            return received_payments
 
-    def get_received_payment_summary(self) -> ReceivedPaymentSummary:
-        """ Get received payment summary. """
-        s = select([
-            func.count().label("num_payments_received"),
-            func.sum(self.received_payments.c.price_msat).label(
-                "total_amount_received_msat"),
-        ]).select_from(self.received_payments)
+    def get_latest_received_payment_index(self) -> int:
+        """ Get the id of the most recent received payment. """
+        s = select(
+            [func.max(self.received_payments.c.received_payment_id)],
+        ).select_from(self.received_payments)
         with self.get_connection() as connection:
             result = connection.execute(s)
             row = result.fetchone()
-            received_payment_summary = self._parse_received_payment_summary(
-                row)
-            return received_payment_summary
+            return row[0] or 0
+
+    def get_received_payment_summary(self) -> ReceivedPaymentSummary:
+        """ Get received payment summary. """
+        row = self._get_payment_summary_row(
+            self.payment_summaries,
+            summary_id=PAYMENT_SUMMARY_ID,
+        )
+        return self._parse_received_payment_summary(row)
 
     def get_sent_payment_summary(self) -> SentPaymentSummary:
         """ Get sent payment summary. """
-        s = select([
-            func.count().label("num_payments_sent"),
-            func.sum(self.sent_payments.c.price_msat).label(
-                "total_amount_sent_msat"),
-        ]).select_from(self.sent_payments)
-        with self.get_connection() as connection:
-            result = connection.execute(s)
-            row = result.fetchone()
-            sent_payment_summary = self._parse_sent_payment_summary(row)
-            return sent_payment_summary
+        row = self._get_payment_summary_row(
+            self.payment_summaries,
+            summary_id=PAYMENT_SUMMARY_ID,
+        )
+        return self._parse_sent_payment_summary(row)
 
     def get_received_payment_summary_for_squeak(self, squeak_hash: bytes) -> ReceivedPaymentSummary:
         """ Get received payment summary for a single squeak. """
-        s = (
-            select([
-                func.count().label("num_payments_received"),
-                func.sum(self.received_payments.c.price_msat).label(
-                    "total_amount_received_msat"),
-            ])
-            .select_from(self.received_payments)
-            .where(self.received_payments.c.squeak_hash == squeak_hash)
+        row = self._get_payment_summary_row(
+            self.squeak_payment_summaries,
+            squeak_hash=squeak_hash,
         )
-        with self.get_connection() as connection:
-            result = connection.execute(s)
-            row = result.fetchone()
-            received_payment_summary = self._parse_received_payment_summary(
-                row)
-            return received_payment_summary
+        return self._parse_received_payment_summary(row)
 
     def get_sent_payment_summary_for_squeak(self, squeak_hash: bytes) -> SentPaymentSummary:
         """ Get sent payment summary for a squeak. """
-        s = (
-            select([
-                func.count().label("num_payments_sent"),
-                func.sum(self.sent_payments.c.price_msat).label(
-                    "total_amount_sent_msat"),
-            ])
-            .select_from(self.sent_payments)
-            .where(self.sent_payments.c.squeak_hash == squeak_hash)
+        row = self._get_payment_summary_row(
+            self.squeak_payment_summaries,
+            squeak_hash=squeak_hash,
         )
-        with self.get_connection() as connection:
-            result = connection.execute(s)
-            row = result.fetchone()
-            sent_payment_summary = self._parse_sent_payment_summary(row)
-            return sent_payment_summary
+        return self._parse_sent_payment_summary(row)
 
     def get_received_payment_summary_for_pubkey(self, public_key: SqueakPublicKey) -> ReceivedPaymentSummary:
         """ Get received payment summary for a single pubkey. """
-        s = (
-            select([
-                func.count().label("num_payments_received"),
-                func.sum(self.received_payments.c.price_msat).label(
-                    "total_amount_received_msat"),
-            ])
-            .select_from(
-                self.received_payments.outerjoin(
-                    self.squeaks,
-                    self.received_payments.c.squeak_hash == self.squeaks.c.hash,
-                )
-            )
-            .select_from(self.received_payments)
-            .where(self.squeaks.c.author_public_key == public_key.to_bytes())
+        row = self._get_payment_summary_row(
+            self.pubkey_payment_summaries,
+            public_key=public_key.to_bytes(),
         )
-        with self.get_connection() as connection:
-            result = connection.execute(s)
-            row = result.fetchone()
-            received_payment_summary = self._parse_received_payment_summary(
-                row)
-            return received_payment_summary
+        return self._parse_received_payment_summary(row)
 
     def get_sent_payment_summary_for_pubkey(self, public_key: SqueakPublicKey) -> SentPaymentSummary:
         """ Get sent payment summary for a pubkey. """
-        s = (
-            select([
-                func.count().label("num_payments_sent"),
-                func.sum(self.sent_payments.c.price_msat).label(
-                    "total_amount_sent_msat"),
-            ])
-            .select_from(
-                self.sent_payments.outerjoin(
-                    self.squeaks,
-                    self.sent_payments.c.squeak_hash == self.squeaks.c.hash,
-                )
-            )
-            .where(self.squeaks.c.author_public_key == public_key.to_bytes())
+        row = self._get_payment_summary_row(
+            self.pubkey_payment_summaries,
+            public_key=public_key.to_bytes(),
         )
-        with self.get_connection() as connection:
-            result = connection.execute(s)
-            row = result.fetchone()
-            sent_payment_summary = self._parse_sent_payment_summary(row)
-            return sent_payment_summary
+        return self._parse_sent_payment_summary(row)
 
     def get_received_payment_summary_for_peer(self, peer_address: PeerAddress) -> ReceivedPaymentSummary:
         """ Get received payment summary for a single peer. """
-        s = (
-            select([
-                func.count().label("num_payments_received"),
-                func.sum(self.received_payments.c.price_msat).label(
-                    "total_amount_received_msat"),
-            ])
-            .select_from(self.received_payments)
-            .where(self.received_payments.c.peer_network == peer_address.network.name)
-            .where(self.received_payments.c.peer_host == peer_address.host)
-            .where(self.received_payments.c.peer_port == peer_address.port)
+        row = self._get_payment_summary_row(
+            self.peer_payment_summaries,
+            **self._get_peer_payment_summary_key(peer_address),
         )
-        with self.get_connection() as connection:
-            result = connection.execute(s)
-            row = result.fetchone()
-            received_payment_summary = self._parse_received_payment_summary(
-                row)
-            return received_payment_summary
+        return self._parse_received_payment_summary(row)
 
     def get_sent_payment_summary_for_peer(self, peer_address: PeerAddress) -> SentPaymentSummary:
         """ Get sent payment summary for a peer. """
-        s = (
-            select([
-                func.count().label("num_payments_sent"),
-                func.sum(self.sent_payments.c.price_msat).label(
-                    "total_amount_sent_msat"),
-            ])
-            .select_from(self.sent_payments)
-            .where(self.received_payments.c.peer_network == peer_address.network.name)
-            .where(self.received_payments.c.peer_host == peer_address.host)
-            .where(self.received_payments.c.peer_port == peer_address.port)
+        row = self._get_payment_summary_row(
+            self.peer_payment_summaries,
+            **self._get_peer_payment_summary_key(peer_address),
         )
+        return self._parse_sent_payment_summary(row)
+
+    def _get_payment_summary_row(self, summary_table, **key):
+        s = select([summary_table])
+        for column_name, value in key.items():
+            s = s.where(summary_table.c[column_name] == value)
         with self.get_connection() as connection:
             result = connection.execute(s)
-            row = result.fetchone()
-            sent_payment_summary = self._parse_sent_payment_summary(row)
-            return sent_payment_summary
+            return result.fetchone()
+
+    def _get_peer_payment_summary_key(self, peer_address: PeerAddress) -> dict:
+        return dict(
+            peer_network=peer_address.network.name,
+            peer_host=peer_address.host,
+            peer_port=peer_address.port,
+        )
+
+    def _add_to_payment_summaries(
+            self,
+            connection,
+            squeak_hash: bytes,
+            peer_address: PeerAddress,
+            **amounts: int,
+    ) -> None:
+        """ Add the amounts of a new payment to the payment summaries of
+        all the rollups that it belongs to.
+        """
+        author_public_key = connection.execute(
+            select([self.squeaks.c.author_public_key])
+            .where(self.squeaks.c.hash == squeak_hash)
+        ).scalar()
+        summary_keys: List[Tuple[Table, Dict[str, Any]]] = [
+            (self.payment_summaries, dict(summary_id=PAYMENT_SUMMARY_ID)),
+            (self.squeak_payment_summaries, dict(squeak_hash=squeak_hash)),
+            (
+                self.peer_payment_summaries,
+                self._get_peer_payment_summary_key(peer_address),
+            ),
+        ]
+        if author_public_key is not None:
+            summary_keys.append(
+                (self.pubkey_payment_summaries, dict(
+                    public_key=author_public_key)),
+            )
+        for summary_table, key in summary_keys:
+            connection.execute(
+                self._insert_ignore_duplicates(summary_table).values(**key)
+            )
+            stmt = summary_table.update().values({
+                summary_table.c[column_name]: summary_table.c[column_name] + amount
+                for column_name, amount in amounts.items()
+            })
+            for column_name, value in key.items():
+                stmt = stmt.where(summary_table.c[column_name] == value)
+            connection.execute(stmt)
+
+    def _remove_from_pubkey_payment_summaries(self, connection, rows) -> None:
+        """ Remove the amounts of the payments for the given deleted
+        squeaks from the payment summaries of their authors, the same as
+        when the rollups are rebuilt without the squeaks.
+        """
+        author_public_keys = {
+            row["hash"]: row["author_public_key"] for row in rows
+        }
+        squeak_summary_rows = connection.execute(
+            select([self.squeak_payment_summaries])
+            .where(self.squeak_payment_summaries.c.squeak_hash.in_(
+                list(author_public_keys.keys())))
+        ).fetchall()
+        summary_table = self.pubkey_payment_summaries
+        for squeak_summary_row in squeak_summary_rows:
+            author_public_key = author_public_keys[squeak_summary_row["squeak_hash"]]
+            stmt = (
+                summary_table.update()
+                .where(summary_table.c.public_key == author_public_key)
+                .values({
+                    summary_table.c[column_name]: summary_table.c[column_name] - squeak_summary_row[column_name]
+                    for column_name in PAYMENT_SUMMARY_AMOUNT_COLUMN_NAMES
+                })
+            )
+            connection.execute(stmt)
+
+    def rebuild_payment_summaries(self) -> None:
+        """ Rebuild the payment summary rollups from the sent and
+        received payment tables.
+        """
+        payments = union_all(
+            select([
+                self.received_payments.c.squeak_hash,
+                self.received_payments.c.peer_network,
+                self.received_payments.c.peer_host,
+                self.received_payments.c.peer_port,
+                literal(1).label("num_received_payments"),
+                self.received_payments.c.price_msat.label(
+                    "total_amount_received_msat"),
+                literal(0).label("num_sent_payments"),
+                literal(0).label("total_amount_sent_msat"),
+            ]),
+            select([
+                self.sent_payments.c.squeak_hash,
+                self.sent_payments.c.peer_network,
+                self.sent_payments.c.peer_host,
+                self.sent_payments.c.peer_port,
+                literal(0).label("num_received_payments"),
+                literal(0).label("total_amount_received_msat"),
+                literal(1).label("num_sent_payments"),
+                self.sent_payments.c.price_msat.label(
+                    "total_amount_sent_msat"),
+            ]),
+        ).subquery()
+        amount_column_names = PAYMENT_SUMMARY_AMOUNT_COLUMN_NAMES
+        amounts = [
+            func.coalesce(func.sum(payments.c[column_name]), 0)
+            for column_name in amount_column_names
+        ]
+        payments_with_author = payments.join(
+            self.squeaks,
+            self.squeaks.c.hash == payments.c.squeak_hash,
+        )
+        rollups = [
+            (
+                self.payment_summaries,
+                ["summary_id"],
+                select([literal(PAYMENT_SUMMARY_ID)] + amounts)
+                .select_from(payments),
+            ),
+            (
+                self.squeak_payment_summaries,
+                ["squeak_hash"],
+                select([payments.c.squeak_hash] + amounts)
+                .group_by(payments.c.squeak_hash),
+            ),
+            (
+                self.pubkey_payment_summaries,
+                ["public_key"],
+                select([self.squeaks.c.author_public_key] + amounts)
+                .select_from(payments_with_author)
+                .group_by(self.squeaks.c.author_public_key),
+            ),
+            (
+                self.peer_payment_summaries,
+                ["peer_network", "peer_host", "peer_port"],
+                select([
+                    payments.c.peer_network,
+                    payments.c.peer_host,
+                    payments.c.peer_port,
+                ] + amounts)
+                .group_by(
+                    payments.c.peer_network,
+                    payments.c.peer_host,
+                    payments.c.peer_port,
+                ),
+            ),
+        ]
+        with self.get_transaction() as connection:
+            for summary_table, key_column_names, rollup in rollups:
+                connection.execute(summary_table.delete())
+                connection.execute(
+                    summary_table.insert().from_select(
+                        key_column_names + amount_column_names,
+                        rollup,
+                    )
+                )
 
     def insert_config(self, user_config: UserConfig) -> Optional[str]:
         """ Insert a new config.
@@ -2298,6 +2678,80 @@ class SqueakDb:
         with self.get_connection() as connection:
             connection.execute(delete_twitter_account_stmt)
 
+    def insert_block_infos(self, block_infos: List[BlockInfo]) -> None:
+        """ Insert a batch of block headers.
+
+        Heights that already have a stored header are skipped.
+        """
+        if not block_infos:
+            return
+        ins = self._insert_ignore_duplicates(self.block_headers)
+        with self.get_transaction() as connection:
+            connection.execute(ins, [
+                {
+                    "block_height": block_info.block_height,
+                    "block_hash": block_info.block_hash,
+                    "block_header": block_info.block_header.serialize(),
+                }
+                for block_info in block_infos
+            ])
+
+    def get_block_info(self, block_height: int) -> Optional[BlockInfo]:
+        """ Get the stored block header at the given height. """
+        s = select([self.block_headers]).where(
+            self.block_headers.c.block_height == block_height)
+        with self.get_connection() as connection:
+            result = connection.execute(s)
+            row = result.fetchone()
+            if row is None:
+                return None
+            return self._parse_block_info(row)
+
+    def get_block_infos(self, block_heights: List[int]) -> List[BlockInfo]:
+        """ Get the stored block headers at the given heights. """
+        s = select([self.block_headers]).where(
+            self.block_headers.c.block_height.in_(block_heights))
+        with self.get_connection() as connection:
+            result = connection.execute(s)
+            return [self._parse_block_info(row) for row in result]
+
+    def get_block_heights(self, min_block_height: int, max_block_height: int) -> List[int]:
+        """ Get the heights of the stored block headers in the given range
+        (inclusive).
+        """
+        s = (
+            select([self.block_headers.c.block_height])
+            .where(self.block_headers.c.block_height >= min_block_height)
+            .where(self.block_headers.c.block_height <= max_block_height)
+            .order_by(self.block_headers.c.block_height)
+        )
+        with self.get_connection() as connection:
+            result = connection.execute(s)
+            return [row["block_height"] for row in result]
+
+    def get_max_block_height(self) -> Optional[int]:
+        """ Get the height of the highest stored block header. """
+        s = select([func.max(self.block_headers.c.block_height)])
+        with self.get_connection() as connection:
+            result = connection.execute(s)
+            return result.scalar()
+
+    def delete_block_infos_from_height(self, block_height: int) -> None:
+        """ Delete the stored block headers at or above the given height. """
+        delete_stmt = self.block_headers.delete().where(
+            self.block_headers.c.block_height >= block_height
+        )
+        with self.get_connection() as connection:
+            connection.execute(delete_stmt)
+
+    def delete_block_infos_below_height(self, block_height: int) -> None:
+        """ Delete the stored block headers below the given height. """
+        delete_stmt = self.block_headers.delete().where(
+            self.block_headers.c.block_height < block_height
+        )
+        with self.get_connection() as connection:
+            connection.execute(delete_stmt)
+
     def _parse_squeak(self, row) -> CBaseSqueak:
         if row["resqueak_hash"]:
             return CResqueak.deserialize(row["squeak"])
@@ -2368,18 +2822,26 @@ class SqueakDb:
             is_unlocked=is_locked,
             secret_key=(row[self.resqueaked_squeaks.c.secret_key]),
             liked_time_ms=liked_time_ms,
-            # TODO: needs another join. row[self.resqueaked_squeaks.c.num_replies],
-            num_replies=row["num_resqueak_replies"],
-            num_resqueaks=row["num_resqueak_resqueaks"],
+            num_replies=row[self.resqueaked_squeaks.c.num_replies],
+            num_resqueaks=row[self.resqueaked_squeaks.c.num_resqueaks],
             content=row[self.resqueaked_squeaks.c.content],
             resqueaked_hash=row[self.resqueaked_squeaks.c.resqueak_hash],
             squeak_profile=profile,
             recipient_squeak_profile=recipient_profile,
         )
 
-    def _parse_squeak_profile(self, row, profiles_table=None) -> SqueakProfile:
+    def _parse_block_info(self, row) -> BlockInfo:
+        return BlockInfo(
+            block_height=row["block_height"],
+            block_hash=row["block_hash"],
+            block_header=CBlockHeader.deserialize(row["block_header"]),
+        )
+
+    def _parse_squeak_profile(self, row, profiles_table=None, profile_images_table=None) -> SqueakProfile:
         profiles_table = profiles_table if (
             profiles_table is not None) else self.profiles
+        profile_image = row[profile_images_table.c.image] if (
+            profile_images_table is not None) else None
 
         private_key_bytes = row[profiles_table.c.private_key]
         private_key = SqueakPrivateKey.from_bytes(
@@ -2391,7 +2853,8 @@ class SqueakDb:
             public_key=SqueakPublicKey.from_bytes(
                 row[profiles_table.c.public_key]),
             following=row[profiles_table.c.following],
-            profile_image=row[profiles_table.c.profile_image],
+            profile_image=profile_image,
+            profile_image_hash=row[profiles_table.c.profile_image_hash],
         )
 
     def _try_parse_squeak_profile(self, row, profiles_table=None) -> Optional[SqueakProfile]:
@@ -2490,14 +2953,24 @@ class SqueakDb:
         )
 
     def _parse_received_payment_summary(self, row) -> ReceivedPaymentSummary:
+        if row is None:
+            return ReceivedPaymentSummary(
+                num_received_payments=0,
+                total_amount_received_msat=0,
+            )
         return ReceivedPaymentSummary(
-            num_received_payments=row["num_payments_received"],
+            num_received_payments=row["num_received_payments"],
             total_amount_received_msat=row["total_amount_received_msat"],
         )
 
     def _parse_sent_payment_summary(self, row) -> SentPaymentSummary:
+        if row is None:
+            return SentPaymentSummary(
+                num_sent_payments=0,
+                total_amount_sent_msat=0,
+            )
         return SentPaymentSummary(
-            num_sent_payments=row["num_payments_sent"],
+            num_sent_payments=row["num_sent_payments"],
             total_amount_sent_msat=row["total_amount_sent_msat"],
         )
 
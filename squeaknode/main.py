@@ -28,6 +28,9 @@ from signal import SIGTERM
 from threading import Event
 
 from squeaknode.config.config import SqueaknodeConfig
+from squeaknode.db.db_engine import get_connection_string
+from squeaknode.db.db_engine import get_engine
+from squeaknode.db.squeak_db import SqueakDb
 from squeaknode.node.squeak_node import SqueakNode
 
 
@@ -59,6 +62,30 @@ def parse_args():
         help="Logging level",
     )
     parser.set_defaults(func=run_node)
+    subparsers = parser.add_subparsers(
+        title="database maintenance commands",
+    )
+    repair_squeak_counts_parser = subparsers.add_parser(
+        "repair-squeak-counts",
+        help="Recompute the reply and resqueak counts of all squeaks.",
+    )
+    repair_squeak_counts_parser.set_defaults(func=repair_squeak_counts)
+    rebuild_search_index_parser = subparsers.add_parser(
+        "rebuild-search-index",
+        help="Rebuild the full-text search index of squeak content.",
+    )
+    rebuild_search_index_parser.set_defaults(func=rebuild_search_index)
+    rebuild_thread_closure_parser = subparsers.add_parser(
+        "rebuild-thread-closure",
+        help="Rebuild the thread closure table of squeak replies.",
+    )
+    rebuild_thread_closure_parser.set_defaults(func=rebuild_thread_closure)
+    rebuild_payment_summaries_parser = subparsers.add_parser(
+        "rebuild-payment-summaries",
+        help="Rebuild the payment summary tables from all payments.",
+    )
+    rebuild_payment_summaries_parser.set_defaults(
+        func=rebuild_payment_summaries)
     return parser.parse_args()
 
 
@@ -93,5 +120,44 @@ def run_node(config):
     squeak_node.stop_running()
 
 
+def get_squeak_db(config):
+    connection_string = get_connection_string(
+        config,
+        config.node.network,
+    )
+    engine = get_engine(connection_string, config.db)
+    squeak_db = SqueakDb(engine)
+    squeak_db.init()
+    return squeak_db
+
+
+def repair_squeak_counts(config):
+    squeak_db = get_squeak_db(config)
+    logger.info("Repairing squeak counts...")
+    squeak_db.repair_squeak_counts()
+    logger.info("Finished repairing squeak counts.")
+
+
+def rebuild_search_index(config):
+    squeak_db = get_squeak_db(config)
+    logger.info("Rebuilding search index...")
+    squeak_db.rebuild_search_index()
+    logger.info("Finished rebuilding search index.")
+
+
+def rebuild_thread_closure(config):
+    squeak_db = get_squeak_db(config)
+    logger.info("Rebuilding thread closure...")
+    squeak_db.rebuild_thread_closure()
+    logger.info("Finished rebuilding thread closure.")
+
+
+def rebuild_payment_summaries(config):
+    squeak_db = get_squeak_db(config)
+    logger.info("Rebuilding payment summaries...")
+    squeak_db.rebuild_payment_summaries()
+    logger.info("Finished rebuilding payment summaries.")
+
+
 if __name__ == "__main__":
     main()
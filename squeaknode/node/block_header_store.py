@@ -0,0 +1,154 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+from typing import List
+
+from squeaknode.bitcoin.bitcoin_client import BitcoinClient
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.db.squeak_db import SqueakDb
+
+logger = logging.getLogger(__name__)
+
+
+class BlockHeaderStore(BitcoinClient):
+    """Bitcoin client that reads block headers from the local block header
+    table, and only asks the bitcoin daemon for heights that are not stored.
+
+    The table is filled in bulk for the interest range by `sync`, which
+    also extends it as the tip advances and rewinds it after a reorg.
+    """
+
+    def __init__(
+        self,
+        squeak_db: SqueakDb,
+        bitcoin_client: BitcoinClient,
+        interest_block_interval: int,
+        sync_batch_size: int,
+    ):
+        self.squeak_db = squeak_db
+        self.bitcoin_client = bitcoin_client
+        self.interest_block_interval = interest_block_interval
+        self.sync_batch_size = sync_batch_size
+        self.sync_lock = threading.Lock()
+
+    def get_best_block_info(self) -> BlockInfo:
+        return self.bitcoin_client.get_best_block_info()
+
+    def get_block_info_by_height(self, block_height: int) -> BlockInfo:
+        block_info = self.squeak_db.get_block_info(block_height)
+        if block_info is not None:
+            return block_info
+        block_info = self.bitcoin_client.get_block_info_by_height(
+            block_height)
+        self.squeak_db.insert_block_infos([block_info])
+        return block_info
+
+    def get_block_infos_by_heights(self, block_heights: List[int]) -> List[BlockInfo]:
+        block_infos = {
+            block_info.block_height: block_info
+            for block_info in self.squeak_db.get_block_infos(block_heights)
+        }
+        missing_heights = [
+            block_height for block_height in block_heights
+            if block_height not in block_infos
+        ]
+        if missing_heights:
+            fetched_block_infos = self.bitcoin_client.get_block_infos_by_heights(
+                missing_heights)
+            self.squeak_db.insert_block_infos(fetched_block_infos)
+            for block_info in fetched_block_infos:
+                block_infos[block_info.block_height] = block_info
+        return [
+            block_infos[block_height] for block_height in block_heights
+            if block_height in block_infos
+        ]
+
+    def sync(self) -> None:
+        """Store the headers of all blocks in the interest range that are
+        missing, after removing any headers that are no longer in the
+        best chain.
+        """
+        with self.sync_lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        best_block_info = self.bitcoin_client.get_best_block_info()
+        best_block_height = best_block_info.block_height
+        self.rewind_reorged_blocks(best_block_info)
+        min_block_height = max(
+            0, best_block_height - self.interest_block_interval)
+        self.squeak_db.delete_block_infos_below_height(min_block_height)
+        stored_heights = set(self.squeak_db.get_block_heights(
+            min_block_height,
+            best_block_height,
+        ))
+        missing_heights = [
+            block_height
+            for block_height in range(min_block_height, best_block_height + 1)
+            if block_height not in stored_heights
+        ]
+        if not missing_heights:
+            return
+        logger.info("Syncing {} block headers up to height {}.".format(
+            len(missing_heights),
+            best_block_height,
+        ))
+        for i in range(0, len(missing_heights), self.sync_batch_size):
+            batch_heights = missing_heights[i:i + self.sync_batch_size]
+            block_infos = self.bitcoin_client.get_block_infos_by_heights(
+                batch_heights)
+            self.squeak_db.insert_block_infos(block_infos)
+
+    def rewind_reorged_blocks(self, best_block_info: BlockInfo) -> None:
+        """Delete the stored headers that are not in the current best chain.
+
+        Stored heights are checked from the top down until one matches
+        the bitcoin daemon. Everything above it is deleted.
+        """
+        max_block_height = self.squeak_db.get_max_block_height()
+        if max_block_height is None:
+            return
+        stored_heights = self.squeak_db.get_block_heights(0, max_block_height)
+        reorg_height = None
+        for block_height in reversed(stored_heights):
+            if self._is_in_best_chain(block_height, best_block_info):
+                break
+            reorg_height = block_height
+        if reorg_height is not None:
+            logger.info("Deleting block headers from height {} after reorg.".format(
+                reorg_height,
+            ))
+            self.squeak_db.delete_block_infos_from_height(reorg_height)
+
+    def _is_in_best_chain(self, block_height: int, best_block_info: BlockInfo) -> bool:
+        if block_height > best_block_info.block_height:
+            return False
+        stored_block_info = self.squeak_db.get_block_info(block_height)
+        if stored_block_info is None:
+            return False
+        if block_height == best_block_info.block_height:
+            block_hash = best_block_info.block_hash
+        else:
+            block_hash = self.bitcoin_client.get_block_info_by_height(
+                block_height).block_hash
+        return stored_block_info.block_hash == block_hash
@@ -0,0 +1,54 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.node.block_header_store import BlockHeaderStore
+from squeaknode.node.periodic_worker import PeriodicWorker
+
+logger = logging.getLogger(__name__)
+
+
+class BlockHeaderSyncWorker(PeriodicWorker):
+    def __init__(
+        self,
+        block_header_store: BlockHeaderStore,
+        sync_interval_s: int,
+    ):
+        super().__init__()
+        self.block_header_store = block_header_store
+        self.sync_interval_s = sync_interval_s
+
+    def work_fn(self):
+        try:
+            self.block_header_store.sync()
+        except Exception:
+            logger.exception("Failed to sync block headers.")
+
+    def handle_new_block(self, block_info: BlockInfo) -> None:
+        self.trigger_work()
+
+    def get_interval_s(self):
+        return self.sync_interval_s
+
+    def get_name(self):
+        return "block_header_sync_worker"
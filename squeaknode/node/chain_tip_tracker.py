@@ -0,0 +1,115 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+from typing import List
+from typing import Optional
+
+from squeaknode.bitcoin.bitcoin_client import BitcoinClient
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.node.listener_subscription_client import EventListener
+
+logger = logging.getLogger(__name__)
+
+
+class ChainTipTracker(BitcoinClient):
+    """Bitcoin client that keeps the best block in memory.
+
+    A background thread polls bitcoind (or long-polls with
+    `waitfornewblock`) and publishes each new best block to
+    `new_block_listener`. Reading the best block needs no RPC once the
+    first tip is known.
+    """
+
+    def __init__(
+        self,
+        bitcoin_client: BitcoinClient,
+        poll_interval_s: int,
+        use_wait_for_new_block: bool,
+    ):
+        self.bitcoin_client = bitcoin_client
+        self.poll_interval_s = poll_interval_s
+        self.use_wait_for_new_block = use_wait_for_new_block
+        self.best_block_info: Optional[BlockInfo] = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.new_block_listener = EventListener()
+
+    def get_best_block_info(self) -> BlockInfo:
+        best_block_info = self.best_block_info
+        if best_block_info is None:
+            best_block_info = self.update()
+        return best_block_info
+
+    def get_block_info_by_height(self, block_height: int) -> BlockInfo:
+        return self.bitcoin_client.get_block_info_by_height(block_height)
+
+    def get_block_infos_by_heights(self, block_heights: List[int]) -> List[BlockInfo]:
+        return self.bitcoin_client.get_block_infos_by_heights(block_heights)
+
+    def update(self) -> BlockInfo:
+        """Get the best block from bitcoind, and notify the listeners if it
+        changed since the last update.
+        """
+        block_info = self.bitcoin_client.get_best_block_info()
+        with self.lock:
+            previous_block_info = self.best_block_info
+            self.best_block_info = block_info
+        # The first tip is not an event, because the workers already run
+        # once when they start.
+        if previous_block_info is not None and \
+                previous_block_info.block_hash != block_info.block_hash:
+            logger.info("New best block at height {}: {}".format(
+                block_info.block_height,
+                block_info.block_hash.hex(),
+            ))
+            self.new_block_listener.handle_new_item(block_info)
+        return block_info
+
+    def start_running(self):
+        threading.Thread(
+            target=self.track_chain_tip,
+            daemon=True,
+            name="chain_tip_tracker_thread",
+        ).start()
+
+    def stop_running(self):
+        self.stopped.set()
+
+    def track_chain_tip(self):
+        logger.info("Starting ChainTipTracker...")
+        while not self.stopped.is_set():
+            try:
+                self.update()
+            except Exception:
+                logger.exception("Failed to update chain tip.")
+            self.wait_for_next_update()
+        logger.info("Stopping ChainTipTracker...")
+
+    def wait_for_next_update(self):
+        if self.use_wait_for_new_block:
+            try:
+                self.bitcoin_client.wait_for_new_block(self.poll_interval_s)
+                return
+            except Exception:
+                logger.exception("Failed to wait for new block.")
+        self.stopped.wait(self.poll_interval_s)
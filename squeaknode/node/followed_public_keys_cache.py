@@ -0,0 +1,92 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+from typing import FrozenSet
+from typing import List
+from typing import Optional
+
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.core.cache_stats import CacheStats
+from squeaknode.db.squeak_db import SqueakDb
+
+
+class FollowedPublicKeysCache:
+    """Keeps the set of followed public keys in memory.
+
+    The set is loaded from the database on first use after each
+    invalidation, and the store invalidates it whenever the profiles
+    change.
+    """
+
+    def __init__(self, squeak_db: SqueakDb):
+        self.squeak_db = squeak_db
+        self.lock = threading.Lock()
+        self.followed_public_keys: Optional[FrozenSet[SqueakPublicKey]] = None
+        self.version = 0
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_invalidations = 0
+
+    def get_followed_public_keys(self) -> FrozenSet[SqueakPublicKey]:
+        with self.lock:
+            if self.followed_public_keys is not None:
+                self.num_hits += 1
+                return self.followed_public_keys
+            self.num_misses += 1
+            version = self.version
+        followed_public_keys = frozenset(
+            profile.public_key
+            for profile in self.squeak_db.get_following_profiles()
+        )
+        with self.lock:
+            # Only keep the loaded set if the profiles did not change
+            # while it was loading.
+            if version == self.version:
+                self.followed_public_keys = followed_public_keys
+        return followed_public_keys
+
+    def is_following(self, public_key: SqueakPublicKey) -> bool:
+        return public_key in self.get_followed_public_keys()
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self.version += 1
+            self.num_invalidations += 1
+            self.followed_public_keys = None
+
+    def get_stats(self) -> CacheStats:
+        with self.lock:
+            followed_public_keys: List[SqueakPublicKey] = list(
+                self.followed_public_keys or [])
+            return CacheStats(
+                cache_name="followed_public_keys",
+                num_hits=self.num_hits,
+                num_misses=self.num_misses,
+                num_evictions=0,
+                num_invalidations=self.num_invalidations,
+                num_entries=len(followed_public_keys),
+                num_bytes=sum(
+                    len(public_key.to_bytes())
+                    for public_key in followed_public_keys
+                ),
+            )
@@ -34,7 +34,7 @@ class EventListener:
         self.callbacks = {}
 
     def handle_new_item(self, item):
-        for callback in self.callbacks.values():
+        for callback in list(self.callbacks.values()):
             callback(item)
 
     def add_callback(self, name, callback):
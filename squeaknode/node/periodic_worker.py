@@ -37,6 +37,11 @@ class Worker(ABC):
 class PeriodicWorker(Worker):
     """Access a bitcoin daemon using RPC."""
 
+    def __init__(self):
+        self.trigger_lock = threading.Lock()
+        self.trigger_running = False
+        self.trigger_pending = False
+
     @abstractmethod
     def work_fn(self) -> None:
         pass
@@ -66,3 +71,32 @@ class PeriodicWorker(Worker):
             args=(),
         )
         thread.start()
+
+    def trigger_work(self) -> None:
+        """Run the work function now, outside of the interval.
+
+        Triggers that arrive while a triggered run is already in progress
+        are coalesced into one more run, so at most one triggered thread
+        is running.
+        """
+        with self.trigger_lock:
+            if self.trigger_running:
+                self.trigger_pending = True
+                return
+            self.trigger_running = True
+        threading.Thread(
+            target=self.run_triggered_work,
+            name="{}_triggered_thread".format(self.get_name()),
+        ).start()
+
+    def run_triggered_work(self) -> None:
+        while True:
+            try:
+                self.work_fn()
+            except Exception:
+                logger.exception("Failed to run triggered work.")
+            with self.trigger_lock:
+                if not self.trigger_pending:
+                    self.trigger_running = False
+                    return
+                self.trigger_pending = False
@@ -20,94 +20,104 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
-import queue
 import threading
-from contextlib import contextmanager
+from typing import Iterator
+from typing import Optional
 
+from squeaknode.core.received_payment import ReceivedPayment
+from squeaknode.node.listener_subscription_client import EventListener
 from squeaknode.node.squeak_store import SqueakStore
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_MAX_QUEUE_SIZE = 1000
 DEFAULT_UPDATE_INTERVAL_S = 1
 
 
-class ReceivedPaymentsSubscriptionClient:
-    """Class that can be used to get a subscription to a stream
+class ReceivedPaymentsPoller:
+    """Class that can be used to get subscriptions to a stream
     of received payments.
 
-    `initial_index` parameter refers to the `received_payment_id` that will be
-    the first in the result stream.
+    A single thread polls the database for new received payments while
+    there is at least one subscriber, and passes them to every
+    subscription.
     """
 
     def __init__(
         self,
-        # squeak_db,
         squeak_store: SqueakStore,
-        initial_index: int,
-        stopped: threading.Event,
-        max_queue_size=DEFAULT_MAX_QUEUE_SIZE,
         update_interval_s=DEFAULT_UPDATE_INTERVAL_S,
     ):
         self.squeak_store = squeak_store
-        self.initial_index = initial_index
-        self.stopped = stopped
         self.update_interval_s = update_interval_s
-        self.q: queue.Queue = queue.Queue(max_queue_size)
+        self.new_received_payment_listener = EventListener()
+        self.lock = threading.Lock()
+        self.num_subscribers = 0
+        self.stopped: Optional[threading.Event] = None
 
-    @contextmanager
-    def open_subscription(self):
-        # Start the thread to populate the queue.
-        threading.Thread(
-            target=self.populate_queue,
-        ).start()
-        try:
-            logger.info("Before yielding received payment client...")
-            yield self
-            logger.info("After yielding received payment client...")
-        finally:
-            logger.info("Stopping received payment client...")
-            self.stopped.set()
-            logger.info("Stopped received payment client...")
+    def subscribe(
+            self,
+            initial_index: int,
+            stopped: threading.Event,
+    ) -> Iterator[ReceivedPayment]:
+        """ Yield the received payments after `initial_index`, followed
+        by new received payments until `stopped` is set.
+        """
+        with self.new_received_payment_listener.get_subscription(stopped) as client:
+            self.add_subscriber()
+            try:
+                # Payments saved before the poller started are read from
+                # the database, and duplicates from the queue are skipped.
+                payment_index = initial_index
+                for payment in self.squeak_store.yield_received_payments_from_index(
+                        initial_index,
+                ):
+                    if stopped.is_set():
+                        return
+                    yield payment
+                    assert payment.received_payment_id is not None
+                    payment_index = payment.received_payment_id
+                for payment in client.get_item():
+                    if payment.received_payment_id <= payment_index:
+                        continue
+                    yield payment
+                    payment_index = payment.received_payment_id
+            finally:
+                self.remove_subscriber()
+
+    def add_subscriber(self):
+        with self.lock:
+            self.num_subscribers += 1
+            if self.stopped is None:
+                self.stopped = threading.Event()
+                payment_index = self.squeak_store.get_latest_received_payment_index()
+                threading.Thread(
+                    target=self.poll_received_payments,
+                    args=(payment_index, self.stopped),
+                    name="received_payments_poller_thread",
+                    daemon=True,
+                ).start()
 
-    def populate_queue(self):
-        payment_index = self.initial_index
-        while not self.stopped.is_set():
+    def remove_subscriber(self):
+        with self.lock:
+            self.num_subscribers -= 1
+            if self.num_subscribers == 0 and self.stopped is not None:
+                self.stopped.set()
+                self.stopped = None
+
+    def poll_received_payments(self, payment_index: int, stopped: threading.Event):
+        logger.info("Starting received payments poller.")
+        while not stopped.is_set():
             try:
-                for payment in self.get_latest_received_payments(payment_index):
-                    self.q.put(payment)
+                for payment in self.squeak_store.yield_received_payments_from_index(
+                        payment_index,
+                ):
+                    self.new_received_payment_listener.handle_new_item(payment)
+                    assert payment.received_payment_id is not None
                     payment_index = payment.received_payment_id
-                    logger.info(
-                        "Added payment to queue. Size: {}".format(
-                            self.q.qsize())
-                    )
             except Exception:
                 logger.error(
-                    "Exception while populating queue.",
+                    "Exception while polling received payments.",
                     exc_info=True,
                 )
-            self.stopped.wait(self.update_interval_s)
-        # Put the poison pill
-        logger.info("Putting poison pill in queue...")
-        self.q.put(None)
-
-    def get_latest_received_payments(self, payment_index):
-        # return self.squeak_db.yield_received_payments_from_index(
-        #     payment_index,
-        # )
-        return self.squeak_store.yield_received_payments_from_index(
-            payment_index,
-        )
-
-    def get_received_payments(self):
-        while True:
-            payment = self.q.get()
-            if payment is None:
-                logger.debug("Poison pill swallowed.")
-                return
-            yield payment
-            self.q.task_done()
-            logger.info(
-                "Removed payment from queue. Size: {}".format(
-                    self.q.qsize())
-            )
+            stopped.wait(self.update_interval_s)
+        logger.info("Stopped received payments poller.")
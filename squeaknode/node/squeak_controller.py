@@ -28,21 +28,25 @@ from squeak.core import CSqueak
 from squeak.core.keys import SqueakPrivateKey
 from squeak.core.keys import SqueakPublicKey
 
+from squeaknode.core.cache_stats import CacheStats
 from squeaknode.core.download_result import DownloadResult
 from squeaknode.core.lightning_address import LightningAddressHostPort
 from squeaknode.core.offer import Offer
 from squeaknode.core.payment_summary import PaymentSummary
 from squeaknode.core.peer_address import Network
 from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.peer_connection_stats import PeerConnectionStats
+from squeaknode.core.query_method_stats import QueryMethodStats
 from squeaknode.core.received_offer import ReceivedOffer
 from squeaknode.core.received_payment import ReceivedPayment
 from squeaknode.core.sent_payment import SentPayment
+from squeaknode.core.squeak_deletion_stats import SqueakDeletionStats
 from squeaknode.core.squeak_entry import SqueakEntry
 from squeaknode.core.squeak_peer import SqueakPeer
 from squeaknode.core.squeak_profile import SqueakProfile
 from squeaknode.core.squeaks import get_hash
 from squeaknode.core.twitter_account_entry import TwitterAccountEntry
-from squeaknode.node.received_payments_subscription_client import ReceivedPaymentsSubscriptionClient
+from squeaknode.node.received_payments_subscription_client import ReceivedPaymentsPoller
 from squeaknode.node.squeak_store import SqueakStore
 
 
@@ -69,6 +73,9 @@ class SqueakController:
         self.network_controller = network_controller
         self.node_settings = node_settings
         self.config = config
+        self.received_payments_poller = ReceivedPaymentsPoller(
+            squeak_store,
+        )
 
     def make_squeak(
             self,
@@ -183,6 +190,9 @@ class SqueakController:
     def clear_squeak_profile_image(self, profile_id: int) -> None:
         return self.squeak_store.clear_squeak_profile_image(profile_id)
 
+    def get_profile_image(self, image_hash: bytes) -> Optional[bytes]:
+        return self.squeak_store.get_profile_image(image_hash)
+
     def get_squeak_profile_private_key(self, profile_id: int) -> bytes:
         return self.squeak_store.get_squeak_profile_private_key(profile_id)
 
@@ -325,12 +335,10 @@ class SqueakController:
         self.squeak_store.delete_all_expired_offers()
 
     def subscribe_received_payments(self, initial_index: int, stopped: threading.Event):
-        with ReceivedPaymentsSubscriptionClient(
-            self.squeak_store,
+        yield from self.received_payments_poller.subscribe(
             initial_index,
             stopped,
-        ).open_subscription() as client:
-            yield from client.get_received_payments()
+        )
 
     def get_network(self) -> str:
         return self.config.node.network
@@ -413,6 +421,30 @@ class SqueakController:
             last_entry,
         )
 
+    def get_descendant_squeak_entries(
+            self,
+            squeak_hash: bytes,
+            limit: int,
+            last_entry: Optional[SqueakEntry],
+    ) -> List[SqueakEntry]:
+        return self.squeak_store.get_descendant_squeak_entries(
+            squeak_hash,
+            limit,
+            last_entry,
+        )
+
+    def get_conversation_squeak_entries(
+            self,
+            squeak_hash: bytes,
+            limit: int,
+            last_entry: Optional[SqueakEntry],
+    ) -> List[SqueakEntry]:
+        return self.squeak_store.get_conversation_squeak_entries(
+            squeak_hash,
+            limit,
+            last_entry,
+        )
+
     def get_payment_summary(self) -> PaymentSummary:
         received_payment_summary = self.squeak_store.get_received_payment_summary()
         sent_payment_summary = self.squeak_store.get_sent_payment_summary()
@@ -526,8 +558,7 @@ class SqueakController:
 
     def subscribe_timeline_squeak_entries(self, stopped: threading.Event):
         for item in self.squeak_store.subscribe_new_squeaks(stopped):
-            followed_public_keys = self.squeak_store.get_followed_public_keys()
-            if item.GetPubKey() in set(followed_public_keys):
+            if self.squeak_store.is_following(item.GetPubKey()):
                 squeak_hash = get_hash(item)
                 yield self.get_squeak_entry(squeak_hash)
 
@@ -579,3 +610,16 @@ class SqueakController:
     def delete_twitter_account(self, twitter_account_id: int) -> None:
         self.squeak_store.delete_twitter_account(twitter_account_id)
         self.tweet_forwarder.restart()
+
+    def get_db_query_stats(self) -> List[QueryMethodStats]:
+        return self.squeak_store.get_db_query_stats()
+
+    def get_cache_stats(self) -> List[CacheStats]:
+        return self.squeak_store.get_cache_stats() + \
+            self.network_controller.get_cache_stats()
+
+    def get_peer_connection_stats(self) -> List[PeerConnectionStats]:
+        return self.network_controller.get_peer_connection_stats()
+
+    def get_squeak_deletion_stats(self) -> SqueakDeletionStats:
+        return self.squeak_store.get_squeak_deletion_stats()
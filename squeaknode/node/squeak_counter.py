@@ -0,0 +1,228 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.db.squeak_db import SqueakDb
+
+
+logger = logging.getLogger(__name__)
+
+
+class SqueakCounter:
+    """Keeps the number of squeaks in memory, so that the squeak limits
+    can be checked without counting rows on every insert.
+
+    Counts per public key are kept for each block height in a sliding
+    window ending at the highest block height seen. Heights below the
+    window are counted in the database.
+
+    Inserts and deletes are wrapped in `pending_write`, so that counts
+    read from the database are only kept if no write overlapped the read.
+    The database is read without holding the lock.
+    """
+
+    def __init__(
+        self,
+        squeak_db: SqueakDb,
+        block_window: int,
+    ):
+        self.squeak_db = squeak_db
+        self.block_window = block_window
+        self.lock = threading.Lock()
+        self.num_squeaks: Optional[int] = None
+        self.max_block_height: Optional[int] = None
+        self.block_counts: Dict[int, Dict[SqueakPublicKey, int]] = {}
+        self.num_pending_writes = 0
+        self.write_generation = 0
+
+    def load(self) -> None:
+        """ Seed the total count from the database. """
+        num_squeaks = self.squeak_db.get_number_of_squeaks()
+        with self.lock:
+            self.num_squeaks = num_squeaks
+            self.block_counts = {}
+        logger.info("Loaded squeak counter with {} squeaks.".format(
+            self.num_squeaks,
+        ))
+
+    def get_number_of_squeaks(self) -> int:
+        with self.lock:
+            return self._get_number_of_squeaks()
+
+    def get_number_of_squeaks_with_public_key_with_block_height(
+            self,
+            public_key: SqueakPublicKey,
+            block_height: int,
+    ) -> int:
+        with self.lock:
+            if block_height in self.block_counts:
+                return self.block_counts[block_height].get(public_key, 0)
+            self._update_max_block_height(block_height)
+            in_window = self._is_in_window(block_height)
+            read_generation = self._get_read_generation()
+        if not in_window:
+            return self.squeak_db.number_of_squeaks_with_public_key_with_block_height(
+                public_key,
+                block_height,
+            )
+        block_counts = self._load_block_counts(
+            block_height,
+            block_height,
+        ).get(block_height, {})
+        with self.lock:
+            if (
+                self._is_read_valid(read_generation)
+                and self._is_in_window(block_height)
+                and block_height not in self.block_counts
+            ):
+                self.block_counts[block_height] = block_counts
+        return block_counts.get(public_key, 0)
+
+    @contextmanager
+    def pending_write(self) -> Iterator[None]:
+        """ Wrap a squeak insert or delete, together with the matching
+        `add_squeak` or `remove_squeak` calls.
+        """
+        with self.lock:
+            self.num_pending_writes += 1
+            self.write_generation += 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.num_pending_writes -= 1
+
+    def add_squeak(self, public_key: SqueakPublicKey, block_height: int) -> None:
+        with self.lock:
+            if self.num_squeaks is not None:
+                self.num_squeaks += 1
+            block_counts = self.block_counts.get(block_height)
+            if block_counts is not None:
+                block_counts[public_key] = block_counts.get(public_key, 0) + 1
+
+    def remove_squeak(self, public_key: SqueakPublicKey, block_height: int) -> None:
+        with self.lock:
+            if self.num_squeaks is not None:
+                self.num_squeaks = max(self.num_squeaks - 1, 0)
+            block_counts = self.block_counts.get(block_height)
+            if block_counts is not None and public_key in block_counts:
+                block_counts[public_key] -= 1
+                if block_counts[public_key] <= 0:
+                    del block_counts[public_key]
+
+    def reconcile(self) -> None:
+        """ Replace the counts in memory with the counts in the database,
+        and log any drift.
+
+        Skipped if a squeak is inserted or deleted during the reconcile.
+        """
+        with self.lock:
+            read_generation = self._get_read_generation()
+            block_heights = list(self.block_counts)
+        if read_generation is None:
+            logger.debug("Skipping squeak counter reconcile during a write.")
+            return
+        num_squeaks = self.squeak_db.get_number_of_squeaks()
+        block_counts: Dict[int, Dict[SqueakPublicKey, int]] = {}
+        if block_heights:
+            block_counts = self._load_block_counts(
+                min(block_heights),
+                max(block_heights),
+            )
+        with self.lock:
+            if not self._is_read_valid(read_generation):
+                logger.debug(
+                    "Skipping squeak counter reconcile after a write.")
+                return
+            if self.num_squeaks is not None and self.num_squeaks != num_squeaks:
+                logger.warning(
+                    "Squeak count drifted from {} to {}.".format(
+                        self.num_squeaks,
+                        num_squeaks,
+                    ))
+            self.num_squeaks = num_squeaks
+            for block_height in block_heights:
+                if block_height not in self.block_counts:
+                    continue
+                counts = block_counts.get(block_height, {})
+                if self.block_counts[block_height] != counts:
+                    logger.warning(
+                        "Squeak counts for block height {} drifted.".format(
+                            block_height,
+                        ))
+                self.block_counts[block_height] = counts
+
+    def _get_number_of_squeaks(self) -> int:
+        if self.num_squeaks is None:
+            self.num_squeaks = self.squeak_db.get_number_of_squeaks()
+        return self.num_squeaks
+
+    def _get_read_generation(self) -> Optional[int]:
+        # A read that starts during a write may or may not include it.
+        if self.num_pending_writes > 0:
+            return None
+        return self.write_generation
+
+    def _is_read_valid(self, read_generation: Optional[int]) -> bool:
+        return (
+            read_generation is not None
+            and self.num_pending_writes == 0
+            and self.write_generation == read_generation
+        )
+
+    def _update_max_block_height(self, block_height: int) -> None:
+        if self.max_block_height is None or block_height > self.max_block_height:
+            self.max_block_height = block_height
+            self._evict_block_counts()
+
+    def _is_in_window(self, block_height: int) -> bool:
+        assert self.max_block_height is not None
+        return block_height > self.max_block_height - self.block_window
+
+    def _load_block_counts(
+            self,
+            min_block: int,
+            max_block: int,
+    ) -> Dict[int, Dict[SqueakPublicKey, int]]:
+        squeak_counts = self.squeak_db.get_number_of_squeaks_by_public_key_and_block_height(
+            None,
+            min_block,
+            max_block,
+        )
+        block_counts: Dict[int, Dict[SqueakPublicKey, int]] = {}
+        for (public_key, block_height), num_squeaks in squeak_counts.items():
+            block_counts.setdefault(block_height, {})[public_key] = num_squeaks
+        return block_counts
+
+    def _evict_block_counts(self) -> None:
+        assert self.max_block_height is not None
+        min_block_height = self.max_block_height - self.block_window
+        for block_height in list(self.block_counts):
+            if block_height <= min_block_height:
+                del self.block_counts[block_height]
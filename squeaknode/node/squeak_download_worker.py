@@ -21,7 +21,8 @@
 # SOFTWARE.
 import logging
 
-from squeaknode.client.network_controller import NetworkController
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.client.network_controller import BaseNetworkController
 from squeaknode.node.periodic_worker import PeriodicWorker
 from squeaknode.node.squeak_store import SqueakStore
 
@@ -32,10 +33,11 @@ class SqueakDownloadWorker(PeriodicWorker):
     def __init__(
         self,
         squeak_store: SqueakStore,
-        network_controller: NetworkController,
+        network_controller: BaseNetworkController,
         download_timeline_interval_s: int,
         interest_block_interval: int,
     ):
+        super().__init__()
         self.squeak_store = squeak_store
         self.download_timeline_interval_s = download_timeline_interval_s
         self.interest_block_interval = interest_block_interval
@@ -46,6 +48,9 @@ class SqueakDownloadWorker(PeriodicWorker):
             self.interest_block_interval,
         )
 
+    def handle_new_block(self, block_info: BlockInfo) -> None:
+        self.trigger_work()
+
     def get_interval_s(self):
         return self.download_timeline_interval_s
 
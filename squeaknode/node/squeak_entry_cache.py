@@ -0,0 +1,146 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+from collections import OrderedDict
+from typing import Dict
+from typing import Optional
+from typing import Set
+
+from squeaknode.core.cache_stats import CacheStats
+from squeaknode.core.squeak_entry import SqueakEntry
+
+
+# Rough size of the fields of a squeak entry other than the serialized
+# squeak and the content, used for the byte limit.
+SQUEAK_ENTRY_OVERHEAD_BYTES = 1024
+
+
+def get_squeak_entry_size(squeak_entry: SqueakEntry) -> int:
+    size = SQUEAK_ENTRY_OVERHEAD_BYTES + len(squeak_entry.serialized_squeak)
+    if squeak_entry.content is not None:
+        size += len(squeak_entry.content.encode())
+    if squeak_entry.resqueaked_squeak is not None:
+        size += get_squeak_entry_size(squeak_entry.resqueaked_squeak)
+    return size
+
+
+class SqueakEntryCache:
+    """LRU cache of squeak entries by squeak hash, limited by the number
+    of entries and by their approximate size in bytes.
+
+    A resqueak entry includes the entry of the resqueaked squeak, so
+    invalidating a squeak also invalidates the cached resqueaks of it.
+
+    Readers take the version before loading an entry from the database,
+    and the entry is only stored if nothing was invalidated in the
+    meantime, so that a slow read cannot put back a stale entry.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[bytes, SqueakEntry] = OrderedDict()
+        self.entry_sizes: Dict[bytes, int] = {}
+        self.resqueak_hashes: Dict[bytes, Set[bytes]] = {}
+        self.num_bytes = 0
+        self.version = 0
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+        self.num_invalidations = 0
+
+    def get(self, squeak_hash: bytes) -> Optional[SqueakEntry]:
+        with self.lock:
+            squeak_entry = self.entries.get(squeak_hash)
+            if squeak_entry is None:
+                self.num_misses += 1
+                return None
+            self.entries.move_to_end(squeak_hash)
+            self.num_hits += 1
+            return squeak_entry
+
+    def get_version(self) -> int:
+        with self.lock:
+            return self.version
+
+    def put(self, squeak_entry: SqueakEntry, version: int) -> None:
+        size = get_squeak_entry_size(squeak_entry)
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self.lock:
+            if version != self.version:
+                return
+            self._remove(squeak_entry.squeak_hash)
+            self.entries[squeak_entry.squeak_hash] = squeak_entry
+            self.entry_sizes[squeak_entry.squeak_hash] = size
+            self.num_bytes += size
+            if squeak_entry.resqueaked_hash is not None:
+                self.resqueak_hashes.setdefault(
+                    squeak_entry.resqueaked_hash, set(),
+                ).add(squeak_entry.squeak_hash)
+            while len(self.entries) > self.max_entries or self.num_bytes > self.max_bytes:
+                evicted_hash = next(iter(self.entries))
+                self._remove(evicted_hash)
+                self.num_evictions += 1
+
+    def invalidate(self, squeak_hash: bytes) -> None:
+        with self.lock:
+            self.version += 1
+            self.num_invalidations += 1
+            self._remove(squeak_hash)
+            for resqueak_hash in self.resqueak_hashes.pop(squeak_hash, set()):
+                self._remove(resqueak_hash)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.version += 1
+            self.num_invalidations += 1
+            self.entries.clear()
+            self.entry_sizes.clear()
+            self.resqueak_hashes.clear()
+            self.num_bytes = 0
+
+    def get_stats(self) -> CacheStats:
+        with self.lock:
+            return CacheStats(
+                cache_name="squeak_entry",
+                num_hits=self.num_hits,
+                num_misses=self.num_misses,
+                num_evictions=self.num_evictions,
+                num_invalidations=self.num_invalidations,
+                num_entries=len(self.entries),
+                num_bytes=self.num_bytes,
+            )
+
+    def _remove(self, squeak_hash: bytes) -> None:
+        squeak_entry = self.entries.pop(squeak_hash, None)
+        if squeak_entry is None:
+            return
+        self.num_bytes -= self.entry_sizes.pop(squeak_hash)
+        if squeak_entry.resqueaked_hash is not None:
+            resqueak_hashes = self.resqueak_hashes.get(
+                squeak_entry.resqueaked_hash)
+            if resqueak_hashes is not None:
+                resqueak_hashes.discard(squeak_hash)
+                if not resqueak_hashes:
+                    del self.resqueak_hashes[squeak_entry.resqueaked_hash]
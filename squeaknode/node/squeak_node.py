@@ -36,11 +36,15 @@ from squeaknode.db.db_engine import get_engine
 from squeaknode.db.squeak_db import SqueakDb
 from squeaknode.lightning.clightning_lightning_client import CLightningClient
 from squeaknode.lightning.lnd_lightning_client import LNDLightningClient
+from squeaknode.node.block_header_store import BlockHeaderStore
+from squeaknode.node.block_header_sync_worker import BlockHeaderSyncWorker
+from squeaknode.node.chain_tip_tracker import ChainTipTracker
 from squeaknode.node.node_settings import NodeSettings
 from squeaknode.node.payment_processor import PaymentProcessor
 from squeaknode.node.process_forward_tweets_worker import ProcessForwardTweetsWorker
 from squeaknode.node.process_received_payments_worker import ProcessReceivedPaymentsWorker
 from squeaknode.node.squeak_controller import SqueakController
+from squeaknode.node.squeak_counter_reconcile_worker import SqueakCounterReconcileWorker
 from squeaknode.node.squeak_deletion_worker import SqueakDeletionWorker
 from squeaknode.node.squeak_download_worker import SqueakDownloadWorker
 from squeaknode.node.squeak_offer_expiry_worker import SqueakOfferExpiryWorker
@@ -62,6 +66,8 @@ class SqueakNode:
         self.create_node_settings()
         self.create_lightning_client()
         self.create_bitcoin_client()
+        self.create_chain_tip_tracker()
+        self.create_block_header_store()
         self.create_squeak_core()
         self.create_squeak_store()
         self.create_payment_processor()
@@ -77,13 +83,17 @@ class SqueakNode:
         self.create_admin_web_server()
         self.create_received_payment_processor_worker()
         self.create_squeak_deletion_worker()
+        self.create_squeak_counter_reconcile_worker()
+        self.create_block_header_sync_worker()
         self.create_squeak_download_worker()
         self.create_offer_expiry_worker()
         self.create_forward_tweets_processor_worker()
 
     def start_running(self):
         self.squeak_db.init_with_retries()
+        self.squeak_store.load_squeak_counter()
         self.lightning_client.init()
+        self.chain_tip_tracker.start_running()
 
         if self.config.rpc.enabled:
             self.admin_rpc_server.start()
@@ -92,6 +102,8 @@ class SqueakNode:
         self.peer_web_server.start()
         self.received_payment_processor_worker.start_running()
         self.squeak_deletion_worker.start()
+        self.squeak_counter_reconcile_worker.start()
+        self.block_header_sync_worker.start()
         self.squeak_download_worker.start()
         self.offer_expiry_worker.start()
         self.forward_tweets_processor_worker.start_running()
@@ -101,6 +113,9 @@ class SqueakNode:
         self.admin_rpc_server.stop()
         self.peer_web_server.stop()
         self.received_payment_processor_worker.stop_running()
+        self.chain_tip_tracker.stop_running()
+        self.squeak_store.squeak_verifier.shutdown()
+        self.network_controller.close()
         self.forward_tweets_processor_worker.stop_running()
 
     def set_network_params(self):
@@ -113,7 +128,7 @@ class SqueakNode:
         )
         logger.info("Using connection string: {}".format(
             connection_string))
-        engine = get_engine(connection_string)
+        engine = get_engine(connection_string, self.config.db)
         self.squeak_db = SqueakDb(engine)
 
     def create_node_settings(self):
@@ -146,9 +161,24 @@ class SqueakNode:
             self.config.bitcoin.rpc_ssl_cert,
         )
 
+    def create_chain_tip_tracker(self):
+        self.chain_tip_tracker = ChainTipTracker(
+            self.bitcoin_client,
+            self.config.bitcoin.chain_tip_poll_interval_s,
+            self.config.bitcoin.chain_tip_use_waitfornewblock,
+        )
+
+    def create_block_header_store(self):
+        self.block_header_store = BlockHeaderStore(
+            self.squeak_db,
+            self.chain_tip_tracker,
+            self.config.node.interest_block_interval,
+            self.config.node.block_header_sync_batch_size,
+        )
+
     def create_squeak_core(self):
         self.squeak_core = SqueakCore(
-            self.bitcoin_client,
+            self.block_header_store,
             self.lightning_client,
         )
 
@@ -161,6 +191,13 @@ class SqueakNode:
             self.config.node.squeak_retention_s,
             self.config.node.received_offer_retention_s,
             self.config.node.sent_offer_retention_s,
+            self.config.node.squeak_counter_block_window,
+            self.config.node.squeak_deletion_batch_size,
+            self.config.node.squeak_deletion_max_rows,
+            self.config.node.squeak_deletion_max_time_ms,
+            self.config.node.squeak_entry_cache_size,
+            self.config.node.squeak_entry_cache_max_bytes,
+            self.config.node.squeak_verifier_workers,
         )
 
     def create_payment_processor(self):
@@ -177,11 +214,35 @@ class SqueakNode:
         )
 
     def create_network_controller(self):
-        self.network_controller = NetworkController(
+        network_controller_args = [
             self.squeak_store,
             self.config.tor.proxy_ip,
             self.config.tor.proxy_port,
-        )
+            self.config.node.verified_squeak_cache_size,
+            self.config.node.rejected_squeak_cache_size,
+            self.config.node.rejected_squeak_cache_ttl_s,
+        ]
+        if self.config.node.sync_engine == 'threads':
+            self.network_controller = NetworkController(
+                *network_controller_args,
+                self.config.node.peer_session_pool_size,
+                self.config.node.peer_max_connections,
+                self.config.node.peer_keep_alive_s,
+                self.config.node.peer_max_retries,
+                self.config.node.peer_retry_backoff_s,
+            )
+        elif self.config.node.sync_engine == 'asyncio':
+            # Imported here because aiohttp is an optional dependency.
+            from squeaknode.client.async_network_controller import AsyncNetworkController
+            self.network_controller = AsyncNetworkController(
+                *network_controller_args,
+                self.config.node.sync_max_concurrent_requests,
+                self.config.node.sync_max_requests_per_peer,
+            )
+        else:
+            raise Exception('Invalid sync engine: {}'.format(
+                self.config.node.sync_engine,
+            ))
 
     def create_squeak_controller(self):
         self.squeak_controller = SqueakController(
@@ -243,6 +304,22 @@ class SqueakNode:
             self.config.node.squeak_deletion_interval_s,
         )
 
+    def create_squeak_counter_reconcile_worker(self):
+        self.squeak_counter_reconcile_worker = SqueakCounterReconcileWorker(
+            self.squeak_store,
+            self.config.node.squeak_counter_reconcile_interval_s,
+        )
+
+    def create_block_header_sync_worker(self):
+        self.block_header_sync_worker = BlockHeaderSyncWorker(
+            self.block_header_store,
+            self.config.node.block_header_sync_interval_s,
+        )
+        self.chain_tip_tracker.new_block_listener.add_callback(
+            "block_header_sync_worker",
+            self.block_header_sync_worker.handle_new_block,
+        )
+
     def create_squeak_download_worker(self):
         self.squeak_download_worker = SqueakDownloadWorker(
             self.squeak_store,
@@ -250,6 +327,10 @@ class SqueakNode:
             self.config.node.peer_download_interval_s,
             self.config.node.interest_block_interval,
         )
+        self.chain_tip_tracker.new_block_listener.add_callback(
+            "squeak_download_worker",
+            self.squeak_download_worker.handle_new_block,
+        )
 
     def create_offer_expiry_worker(self):
         self.offer_expiry_worker = SqueakOfferExpiryWorker(
@@ -34,6 +34,7 @@ class SqueakOfferExpiryWorker(PeriodicWorker):
         squeak_store: SqueakStore,
         clean_interval_s: int,
     ):
+        super().__init__()
         self.squeak_store = squeak_store
         self.clean_interval_s = clean_interval_s
 
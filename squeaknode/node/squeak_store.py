@@ -21,10 +21,15 @@
 # SOFTWARE.
 import logging
 import threading
+import time
+from functools import lru_cache
+from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 
+from bitcoin.core import CBlockHeader
 from squeak.core import CBaseSqueak
 from squeak.core import CheckSqueak
 from squeak.core import CheckSqueakSecretKey
@@ -33,6 +38,8 @@ from squeak.core import CSqueak
 from squeak.core.keys import SqueakPrivateKey
 from squeak.core.keys import SqueakPublicKey
 
+from squeaknode.bitcoin.exception import BitcoinRequestError
+from squeaknode.core.cache_stats import CacheStats
 from squeaknode.core.lightning_address import LightningAddressHostPort
 from squeaknode.core.offer import Offer
 from squeaknode.core.peer_address import PeerAddress
@@ -40,26 +47,42 @@ from squeaknode.core.peers import create_saved_peer
 from squeaknode.core.profiles import create_contact_profile
 from squeaknode.core.profiles import create_signing_profile
 from squeaknode.core.profiles import get_profile_private_key
+from squeaknode.core.query_method_stats import QueryMethodStats
 from squeaknode.core.received_offer import ReceivedOffer
 from squeaknode.core.received_payment import ReceivedPayment
 from squeaknode.core.received_payment_summary import ReceivedPaymentSummary
+from squeaknode.core.rejected_squeak import RejectedSqueak
 from squeaknode.core.sent_offer import SentOffer
 from squeaknode.core.sent_payment import SentPayment
 from squeaknode.core.sent_payment_summary import SentPaymentSummary
 from squeaknode.core.squeak_core import SqueakCore
+from squeaknode.core.squeak_deletion_stats import SqueakDeletionStats
 from squeaknode.core.squeak_entry import SqueakEntry
 from squeaknode.core.squeak_peer import SqueakPeer
 from squeaknode.core.squeak_profile import SqueakProfile
+from squeaknode.core.squeaks import get_hash
 from squeaknode.core.twitter_account import TwitterAccount
 from squeaknode.core.twitter_account_entry import TwitterAccountEntry
 from squeaknode.core.update_subscriptions_event import UpdateSubscriptionsEvent
 from squeaknode.db.squeak_db import SqueakDb
+from squeaknode.node.followed_public_keys_cache import FollowedPublicKeysCache
 from squeaknode.node.listener_subscription_client import EventListener
+from squeaknode.node.squeak_counter import SqueakCounter
+from squeaknode.node.squeak_entry_cache import SqueakEntryCache
+from squeaknode.node.squeak_verifier import SqueakVerifier
 
 
 logger = logging.getLogger(__name__)
 
 
+PROFILE_IMAGE_CACHE_SIZE = 256
+REJECT_REASON_INVALID_SIGNATURE = "invalid signature"
+REJECT_REASON_INVALID_BLOCK_HASH = "invalid block hash"
+REJECT_REASON_MAX_SQUEAKS = "exceeded max number of squeaks"
+REJECT_REASON_MAX_SQUEAKS_PER_PUBLIC_KEY_PER_BLOCK = \
+    "exceeded max number of squeaks per public key per block"
+
+
 class SqueakStore:
 
     def __init__(
@@ -71,6 +94,13 @@ class SqueakStore:
         squeak_retention_s,
         received_offer_retention_s,
         sent_offer_retention_s,
+        squeak_counter_block_window,
+        squeak_deletion_batch_size,
+        squeak_deletion_max_rows,
+        squeak_deletion_max_time_ms,
+        squeak_entry_cache_size,
+        squeak_entry_cache_max_bytes,
+        squeak_verifier_workers,
     ):
         self.squeak_db = squeak_db
         self.squeak_core = squeak_core
@@ -79,11 +109,36 @@ class SqueakStore:
         self.squeak_retention_s = squeak_retention_s
         self.received_offer_retention_s = received_offer_retention_s
         self.sent_offer_retention_s = sent_offer_retention_s
+        self.squeak_deletion_batch_size = squeak_deletion_batch_size
+        self.squeak_deletion_max_rows = squeak_deletion_max_rows
+        self.squeak_deletion_max_time_ms = squeak_deletion_max_time_ms
+        self.squeak_deletion_stats_lock = threading.Lock()
+        self.squeak_deletion_stats = SqueakDeletionStats(
+            num_runs=0,
+            num_deleted=0,
+            num_batches=0,
+            total_time_ms=0.0,
+            num_budget_exhausted=0,
+        )
+        self.squeak_counter = SqueakCounter(
+            squeak_db,
+            squeak_counter_block_window,
+        )
+        self.squeak_entry_cache = SqueakEntryCache(
+            squeak_entry_cache_size,
+            squeak_entry_cache_max_bytes,
+        )
+        self.followed_public_keys_cache = FollowedPublicKeysCache(squeak_db)
+        self.squeak_verifier = SqueakVerifier(squeak_verifier_workers)
         self.new_squeak_listener = EventListener()
+        self.rejected_squeak_listener = EventListener()
         self.new_received_offer_listener = EventListener()
         self.new_secret_key_listener = EventListener()
         self.new_follow_listener = EventListener()
         self.twitter_stream_change_listener = EventListener()
+        self._get_cached_profile_image = lru_cache(
+            maxsize=PROFILE_IMAGE_CACHE_SIZE,
+        )(self._load_profile_image)
 
     def make_squeak(
             self,
@@ -144,38 +199,161 @@ class SqueakStore:
 
     def save_squeak(self, base_squeak: CBaseSqueak) -> Optional[bytes]:
         # Check if the squeak is valid context free.
-        CheckSqueak(base_squeak)
+        try:
+            CheckSqueak(base_squeak)
+        except Exception:
+            self._reject_squeak(base_squeak, REJECT_REASON_INVALID_SIGNATURE)
+            raise
         # Get the block header.
-        block_header = self.squeak_core.get_block_header(base_squeak)
+        try:
+            block_header = self.squeak_core.get_block_header(base_squeak)
+        except BitcoinRequestError:
+            raise
+        except Exception:
+            self._reject_squeak(base_squeak, REJECT_REASON_INVALID_BLOCK_HASH)
+            raise
         # Check if limit exceeded.
-        if self.squeak_db.get_number_of_squeaks() >= self.max_squeaks:
+        if self.squeak_counter.get_number_of_squeaks() >= self.max_squeaks:
+            self._reject_squeak(base_squeak, REJECT_REASON_MAX_SQUEAKS)
             raise Exception("Exceeded max number of squeaks.")
-        # TODO: Check if limit per public key per block is exceeded.
-        if self.squeak_db.number_of_squeaks_with_public_key_with_block_height(
+        if self.squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
                 base_squeak.GetPubKey(),
                 base_squeak.nBlockHeight,
         ) >= self.max_squeaks_per_public_key_per_block:
+            self._reject_squeak(
+                base_squeak, REJECT_REASON_MAX_SQUEAKS_PER_PUBLIC_KEY_PER_BLOCK)
             raise Exception(
                 "Exceeded max number of squeaks per public key per block.")
         # Insert the squeak in db.
-        if isinstance(base_squeak, CSqueak):
-            inserted_squeak_hash = self.squeak_db.insert_squeak(
-                base_squeak,
-                block_header,
-            )
-        elif isinstance(base_squeak, CResqueak):
-            inserted_squeak_hash = self.squeak_db.insert_resqueak(
-                base_squeak,
-                block_header,
+        with self.squeak_counter.pending_write():
+            if isinstance(base_squeak, CSqueak):
+                inserted_squeak_hash = self.squeak_db.insert_squeak(
+                    base_squeak,
+                    block_header,
+                )
+            elif isinstance(base_squeak, CResqueak):
+                inserted_squeak_hash = self.squeak_db.insert_resqueak(
+                    base_squeak,
+                    block_header,
+                )
+            if inserted_squeak_hash is None:
+                return None
+            self.squeak_counter.add_squeak(
+                base_squeak.GetPubKey(),
+                base_squeak.nBlockHeight,
             )
-        if inserted_squeak_hash is None:
-            return None
+        self._invalidate_parent_squeak_entries(base_squeak)
         logger.info("Saved squeak: {}".format(
             inserted_squeak_hash.hex(),
         ))
         self.new_squeak_listener.handle_new_item(base_squeak)
         return inserted_squeak_hash
 
+    def save_squeaks(self, base_squeaks: List[CBaseSqueak]) -> List[bytes]:
+        """ Save a batch of squeaks in a single transaction.
+
+        Squeaks that are invalid or that would exceed a limit are
+        skipped. Listeners are notified after the batch is committed.
+
+        Returns the hashes of the squeaks that were inserted.
+        """
+        # Check if the squeaks are valid context free.
+        checked_squeaks = self.squeak_verifier.verify_squeaks(base_squeaks)
+        if len(checked_squeaks) < len(base_squeaks):
+            checked_squeak_ids = {id(base_squeak) for base_squeak in checked_squeaks}
+            for base_squeak in base_squeaks:
+                if id(base_squeak) not in checked_squeak_ids:
+                    self._reject_squeak(
+                        base_squeak, REJECT_REASON_INVALID_SIGNATURE)
+        if not checked_squeaks:
+            return []
+        # Get the block headers of all the squeaks at once.
+        block_infos = self.squeak_core.get_block_infos(checked_squeaks)
+        squeaks_with_block_headers = []
+        for base_squeak in checked_squeaks:
+            block_info = block_infos.get(base_squeak.nBlockHeight)
+            if block_info is None:
+                # The block is not known yet, so the squeak is skipped
+                # without being rejected and can be saved later.
+                logger.debug("Skipped squeak {} above the best block.".format(
+                    get_hash(base_squeak).hex(),
+                ))
+                continue
+            if base_squeak.hashBlock != block_info.block_hash:
+                self._reject_squeak(
+                    base_squeak, REJECT_REASON_INVALID_BLOCK_HASH)
+                continue
+            squeaks_with_block_headers.append(
+                (base_squeak, block_info.block_header),
+            )
+        if not squeaks_with_block_headers:
+            return []
+        # Check the limits once for the whole batch.
+        num_remaining = self.max_squeaks - self.squeak_counter.get_number_of_squeaks()
+        squeak_counts: Dict[Tuple[SqueakPublicKey, int], int] = {}
+        squeaks_to_insert: List[Tuple[CBaseSqueak, CBlockHeader]] = []
+        for i, (base_squeak, block_header) in enumerate(squeaks_with_block_headers):
+            if len(squeaks_to_insert) >= num_remaining:
+                logger.warning("Exceeded max number of squeaks.")
+                for base_squeak, _ in squeaks_with_block_headers[i:]:
+                    self._reject_squeak(base_squeak, REJECT_REASON_MAX_SQUEAKS)
+                break
+            count_key = (base_squeak.GetPubKey(), base_squeak.nBlockHeight)
+            if count_key not in squeak_counts:
+                squeak_counts[count_key] = self.squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+                    base_squeak.GetPubKey(),
+                    base_squeak.nBlockHeight,
+                )
+            num_squeaks = squeak_counts[count_key]
+            if num_squeaks >= self.max_squeaks_per_public_key_per_block:
+                self._reject_squeak(
+                    base_squeak, REJECT_REASON_MAX_SQUEAKS_PER_PUBLIC_KEY_PER_BLOCK)
+                continue
+            squeak_counts[count_key] = num_squeaks + 1
+            squeaks_to_insert.append((base_squeak, block_header))
+        # Insert the squeaks in db.
+        with self.squeak_counter.pending_write():
+            inserted_squeak_hashes = self.squeak_db.insert_squeaks(
+                squeaks_to_insert,
+            )
+            inserted_squeaks = []
+            unnotified_squeak_hashes = set(inserted_squeak_hashes)
+            for base_squeak, _ in squeaks_to_insert:
+                squeak_hash = get_hash(base_squeak)
+                if squeak_hash in unnotified_squeak_hashes:
+                    unnotified_squeak_hashes.remove(squeak_hash)
+                    self.squeak_counter.add_squeak(
+                        base_squeak.GetPubKey(),
+                        base_squeak.nBlockHeight,
+                    )
+                    inserted_squeaks.append(base_squeak)
+        logger.info("Saved {} squeaks.".format(
+            len(inserted_squeak_hashes),
+        ))
+        for base_squeak in inserted_squeaks:
+            self._invalidate_parent_squeak_entries(base_squeak)
+            self.new_squeak_listener.handle_new_item(base_squeak)
+        return inserted_squeak_hashes
+
+    def _reject_squeak(self, base_squeak: CBaseSqueak, reason: str) -> None:
+        squeak_hash = get_hash(base_squeak)
+        logger.debug("Rejected squeak {}: {}".format(
+            squeak_hash.hex(),
+            reason,
+        ))
+        self.rejected_squeak_listener.handle_new_item(
+            RejectedSqueak(squeak_hash=squeak_hash, reason=reason),
+        )
+
+    def _invalidate_parent_squeak_entries(self, base_squeak: CBaseSqueak) -> None:
+        """ Invalidate the cached entries whose reply or resqueak counts
+        change when the given squeak is saved.
+        """
+        if base_squeak.is_reply:
+            self.squeak_entry_cache.invalidate(base_squeak.hashReplySqk)
+        if isinstance(base_squeak, CResqueak):
+            self.squeak_entry_cache.invalidate(base_squeak.hashResqueakSqk)
+
     def save_secret_key(self, squeak_hash: bytes, secret_key: bytes):
         squeak = self.squeak_db.get_squeak(squeak_hash)
         if squeak is None:
@@ -185,6 +363,7 @@ class SqueakStore:
             squeak_hash,
             secret_key,
         )
+        self.squeak_entry_cache.invalidate(squeak_hash)
         logger.info("Saved squeak secret key: {}".format(
             squeak_hash.hex(),
         ))
@@ -234,6 +413,7 @@ class SqueakStore:
             squeak_hash,
             decrypted_content,
         )
+        self.squeak_entry_cache.invalidate(squeak_hash)
         logger.info("Unlocked squeak content: {}".format(
             squeak_hash.hex(),
         ))
@@ -269,7 +449,13 @@ class SqueakStore:
         return self.squeak_db.get_squeak_secret_key(squeak_hash)
 
     def delete_squeak(self, squeak_hash: bytes) -> None:
-        self.squeak_db.delete_squeak(squeak_hash)
+        with self.squeak_counter.pending_write():
+            deleted_squeak = self.squeak_db.delete_squeak(squeak_hash)
+            if deleted_squeak is not None:
+                self.squeak_counter.remove_squeak(*deleted_squeak)
+        if deleted_squeak is not None:
+            # The reply and resqueak counts of other squeaks may change.
+            self.squeak_entry_cache.clear()
 
     def save_sent_offer(self, sent_offer: SentOffer) -> int:
         return self.squeak_db.insert_sent_offer(sent_offer)
@@ -322,6 +508,7 @@ class SqueakStore:
             profile_name,
         )
         profile_id = self.squeak_db.insert_profile(squeak_profile)
+        self.squeak_entry_cache.clear()
         self.create_update_subscriptions_event()
         return profile_id
 
@@ -331,6 +518,7 @@ class SqueakStore:
             private_key,
         )
         profile_id = self.squeak_db.insert_profile(squeak_profile)
+        self.squeak_entry_cache.clear()
         self.create_update_subscriptions_event()
         return profile_id
 
@@ -340,6 +528,7 @@ class SqueakStore:
             public_key,
         )
         profile_id = self.squeak_db.insert_profile(squeak_profile)
+        self.squeak_entry_cache.clear()
         self.create_update_subscriptions_event()
         return profile_id
 
@@ -363,24 +552,32 @@ class SqueakStore:
 
     def set_squeak_profile_following(self, profile_id: int, following: bool) -> None:
         self.squeak_db.set_profile_following(profile_id, following)
+        self.squeak_entry_cache.clear()
         self.create_update_subscriptions_event()
 
     def rename_squeak_profile(self, profile_id: int, profile_name: str) -> None:
         self.squeak_db.set_profile_name(profile_id, profile_name)
+        self.squeak_entry_cache.clear()
 
     def delete_squeak_profile(self, profile_id: int) -> None:
         self.squeak_db.delete_profile(profile_id)
+        self.squeak_entry_cache.clear()
         self.create_update_subscriptions_event()
 
     def set_squeak_profile_image(self, profile_id: int, profile_image: bytes) -> None:
         self.squeak_db.set_profile_image(profile_id, profile_image)
+        self.squeak_entry_cache.clear()
 
     def clear_squeak_profile_image(self, profile_id: int) -> None:
         self.squeak_db.set_profile_image(profile_id, None)
+        self.squeak_entry_cache.clear()
 
     def yield_received_payments_from_index(self, start_index: int = 0) -> Iterator[ReceivedPayment]:
         yield from self.squeak_db.yield_received_payments_from_index(start_index=start_index)
 
+    def get_latest_received_payment_index(self) -> int:
+        return self.squeak_db.get_latest_received_payment_index()
+
     def get_squeak_profile_private_key(self, profile_id: int) -> bytes:
         profile = self.get_squeak_profile(profile_id)
         if profile is None:
@@ -554,27 +751,42 @@ class SqueakStore:
             )
 
     def get_squeak_entry(self, squeak_hash: bytes) -> Optional[SqueakEntry]:
-        return self.squeak_db.get_squeak_entry(squeak_hash)
+        squeak_entry = self.squeak_entry_cache.get(squeak_hash)
+        if squeak_entry is None:
+            cache_version = self.squeak_entry_cache.get_version()
+            squeak_entry = self.squeak_db.get_squeak_entry(squeak_hash)
+            if squeak_entry is None:
+                return None
+            self.squeak_entry_cache.put(squeak_entry, cache_version)
+        return self._add_profile_images(squeak_entry)
 
     def get_timeline_squeak_entries(
             self,
             limit: int,
             last_entry: Optional[SqueakEntry],
     ) -> List[SqueakEntry]:
-        return self.squeak_db.get_timeline_squeak_entries(
+        squeak_entries = self.squeak_db.get_timeline_squeak_entries(
             limit,
             last_entry,
         )
+        return [
+            self._add_profile_images(squeak_entry)
+            for squeak_entry in squeak_entries
+        ]
 
     def get_liked_squeak_entries(
             self,
             limit: int,
             last_entry: Optional[SqueakEntry],
     ) -> List[SqueakEntry]:
-        return self.squeak_db.get_liked_squeak_entries(
+        squeak_entries = self.squeak_db.get_liked_squeak_entries(
             limit,
             last_entry,
         )
+        return [
+            self._add_profile_images(squeak_entry)
+            for squeak_entry in squeak_entries
+        ]
 
     def get_squeak_entries_for_public_key(
             self,
@@ -582,11 +794,15 @@ class SqueakStore:
             limit: int,
             last_entry: Optional[SqueakEntry],
     ) -> List[SqueakEntry]:
-        return self.squeak_db.get_squeak_entries_for_public_key(
+        squeak_entries = self.squeak_db.get_squeak_entries_for_public_key(
             public_key,
             limit,
             last_entry,
         )
+        return [
+            self._add_profile_images(squeak_entry)
+            for squeak_entry in squeak_entries
+        ]
 
     def get_squeak_entries_for_text_search(
             self,
@@ -594,16 +810,24 @@ class SqueakStore:
             limit: int,
             last_entry: Optional[SqueakEntry],
     ) -> List[SqueakEntry]:
-        return self.squeak_db.get_squeak_entries_for_text_search(
+        squeak_entries = self.squeak_db.get_squeak_entries_for_text_search(
             search_text,
             limit,
             last_entry,
         )
+        return [
+            self._add_profile_images(squeak_entry)
+            for squeak_entry in squeak_entries
+        ]
 
     def get_ancestor_squeak_entries(self, squeak_hash: bytes) -> List[SqueakEntry]:
-        return self.squeak_db.get_thread_ancestor_squeak_entries(
+        squeak_entries = self.squeak_db.get_thread_ancestor_squeak_entries(
             squeak_hash,
         )
+        return [
+            self._add_profile_images(squeak_entry)
+            for squeak_entry in squeak_entries
+        ]
 
     def get_reply_squeak_entries(
             self,
@@ -611,11 +835,86 @@ class SqueakStore:
             limit: int,
             last_entry: Optional[SqueakEntry],
     ) -> List[SqueakEntry]:
-        return self.squeak_db.get_thread_reply_squeak_entries(
+        squeak_entries = self.squeak_db.get_thread_reply_squeak_entries(
             squeak_hash,
             limit,
             last_entry,
         )
+        return [
+            self._add_profile_images(squeak_entry)
+            for squeak_entry in squeak_entries
+        ]
+
+    def get_descendant_squeak_entries(
+            self,
+            squeak_hash: bytes,
+            limit: int,
+            last_entry: Optional[SqueakEntry],
+    ) -> List[SqueakEntry]:
+        squeak_entries = self.squeak_db.get_thread_descendant_squeak_entries(
+            squeak_hash,
+            limit,
+            last_entry,
+        )
+        return [
+            self._add_profile_images(squeak_entry)
+            for squeak_entry in squeak_entries
+        ]
+
+    def get_conversation_squeak_entries(
+            self,
+            squeak_hash: bytes,
+            limit: int,
+            last_entry: Optional[SqueakEntry],
+    ) -> List[SqueakEntry]:
+        squeak_entries = self.squeak_db.get_thread_conversation_squeak_entries(
+            squeak_hash,
+            limit,
+            last_entry,
+        )
+        return [
+            self._add_profile_images(squeak_entry)
+            for squeak_entry in squeak_entries
+        ]
+
+    def get_profile_image(self, image_hash: bytes) -> Optional[bytes]:
+        try:
+            return self._get_cached_profile_image(image_hash)
+        except KeyError:
+            return None
+
+    def _load_profile_image(self, image_hash: bytes) -> bytes:
+        # Raise instead of returning None, so that missing images are
+        # not cached.
+        profile_image = self.squeak_db.get_profile_image(image_hash)
+        if profile_image is None:
+            raise KeyError(image_hash)
+        return profile_image
+
+    def _add_profile_image(self, squeak_profile: Optional[SqueakProfile]) -> Optional[SqueakProfile]:
+        if squeak_profile is None or squeak_profile.profile_image_hash is None:
+            return squeak_profile
+        return squeak_profile._replace(
+            profile_image=self.get_profile_image(
+                squeak_profile.profile_image_hash),
+        )
+
+    def _add_profile_images(self, squeak_entry: SqueakEntry) -> SqueakEntry:
+        """ Add the profile images to a squeak entry.
+
+        Squeak entries from the database only include the hashes of
+        the profile images, and the images are loaded from a cache.
+        """
+        return squeak_entry._replace(
+            squeak_profile=self._add_profile_image(
+                squeak_entry.squeak_profile),
+            recipient_squeak_profile=self._add_profile_image(
+                squeak_entry.recipient_squeak_profile),
+            resqueaked_squeak=(
+                self._add_profile_images(squeak_entry.resqueaked_squeak)
+                if squeak_entry.resqueaked_squeak else None
+            ),
+        )
 
     def save_received_offer(self, received_offer: ReceivedOffer) -> Optional[int]:
         received_offer_id = self.squeak_db.insert_received_offer(
@@ -637,8 +936,10 @@ class SqueakStore:
         self.save_received_offer(received_offer)
 
     def get_followed_public_keys(self) -> List[SqueakPublicKey]:
-        followed_profiles = self.squeak_db.get_following_profiles()
-        return [profile.public_key for profile in followed_profiles]
+        return list(self.followed_public_keys_cache.get_followed_public_keys())
+
+    def is_following(self, public_key: SqueakPublicKey) -> bool:
+        return self.followed_public_keys_cache.is_following(public_key)
 
     def get_received_payment_summary(self) -> ReceivedPaymentSummary:
         return self.squeak_db.get_received_payment_summary()
@@ -667,17 +968,80 @@ class SqueakStore:
     def clear_received_payment_settle_indices(self) -> None:
         self.squeak_db.clear_received_payment_settle_indices()
 
-    def delete_old_squeaks(self):
-        squeaks_to_delete = self.squeak_db.get_old_squeaks_to_delete(
-            self.squeak_retention_s,
+    def delete_old_squeaks(self) -> int:
+        """ Delete squeaks older than retention in batches, until none are
+        left or the row or time budget of the run is used up.
+
+        Returns the number of squeaks deleted.
+        """
+        start_time = time.monotonic()
+        num_deleted = 0
+        num_batches = 0
+        budget_exhausted = True
+        while num_deleted < self.squeak_deletion_max_rows:
+            batch_size = min(
+                self.squeak_deletion_batch_size,
+                self.squeak_deletion_max_rows - num_deleted,
+            )
+            with self.squeak_counter.pending_write():
+                deleted_squeaks = self.squeak_db.delete_old_squeaks(
+                    self.squeak_retention_s,
+                    batch_size,
+                )
+                for public_key, block_height in deleted_squeaks:
+                    self.squeak_counter.remove_squeak(
+                        public_key, block_height)
+            num_deleted += len(deleted_squeaks)
+            num_batches += 1
+            if len(deleted_squeaks) < batch_size:
+                budget_exhausted = False
+                break
+            elapsed_ms = (time.monotonic() - start_time) * 1000
+            if elapsed_ms >= self.squeak_deletion_max_time_ms:
+                break
+        elapsed_ms = (time.monotonic() - start_time) * 1000
+        self._add_squeak_deletion_stats(
+            num_deleted,
+            num_batches,
+            elapsed_ms,
+            budget_exhausted,
         )
-        for squeak_hash in squeaks_to_delete:
-            self.squeak_db.delete_squeak(
-                squeak_hash,
+        if num_deleted:
+            self.squeak_entry_cache.clear()
+            logger.info(
+                "Deleted {} old squeaks in {} batches in {:.1f} ms.".format(
+                    num_deleted,
+                    num_batches,
+                    elapsed_ms,
+                ))
+        return num_deleted
+
+    def _add_squeak_deletion_stats(
+            self,
+            num_deleted: int,
+            num_batches: int,
+            elapsed_ms: float,
+            budget_exhausted: bool,
+    ) -> None:
+        with self.squeak_deletion_stats_lock:
+            stats = self.squeak_deletion_stats
+            self.squeak_deletion_stats = SqueakDeletionStats(
+                num_runs=stats.num_runs + 1,
+                num_deleted=stats.num_deleted + num_deleted,
+                num_batches=stats.num_batches + num_batches,
+                total_time_ms=stats.total_time_ms + elapsed_ms,
+                num_budget_exhausted=stats.num_budget_exhausted + int(budget_exhausted),
             )
-            logger.info("Deleted squeak: {}".format(
-                squeak_hash.hex(),
-            ))
+
+    def get_squeak_deletion_stats(self) -> SqueakDeletionStats:
+        with self.squeak_deletion_stats_lock:
+            return self.squeak_deletion_stats
+
+    def load_squeak_counter(self) -> None:
+        self.squeak_counter.load()
+
+    def reconcile_squeak_counter(self) -> None:
+        self.squeak_counter.reconcile()
 
     def like_squeak(self, squeak_hash: bytes):
         logger.info("Liking squeak: {}".format(
@@ -686,6 +1050,7 @@ class SqueakStore:
         self.squeak_db.set_squeak_liked(
             squeak_hash,
         )
+        self.squeak_entry_cache.invalidate(squeak_hash)
 
     def unlike_squeak(self, squeak_hash: bytes):
         logger.info("Unliking squeak: {}".format(
@@ -694,6 +1059,7 @@ class SqueakStore:
         self.squeak_db.set_squeak_unliked(
             squeak_hash,
         )
+        self.squeak_entry_cache.invalidate(squeak_hash)
 
     def lookup_squeaks(
             self,
@@ -734,6 +1100,7 @@ class SqueakStore:
         yield from self.new_follow_listener.yield_items(stopped)
 
     def create_update_subscriptions_event(self):
+        self.followed_public_keys_cache.invalidate()
         self.new_follow_listener.handle_new_item(UpdateSubscriptionsEvent())
 
     def subscribe_received_offers_for_squeak(self, squeak_hash: bytes, stopped: threading.Event):
@@ -756,5 +1123,14 @@ class SqueakStore:
     def delete_twitter_account(self, twitter_account_id: int) -> None:
         self.squeak_db.delete_twitter_account(twitter_account_id)
 
+    def get_db_query_stats(self) -> List[QueryMethodStats]:
+        return self.squeak_db.query_stats.get_method_stats()
+
+    def get_cache_stats(self) -> List[CacheStats]:
+        return [
+            self.squeak_entry_cache.get_stats(),
+            self.followed_public_keys_cache.get_stats(),
+        ]
+
     def get_latest_block(self) -> int:
         return self.squeak_core.get_best_block_height()
@@ -0,0 +1,136 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+from typing import Optional
+
+from squeak.core import CBaseSqueak
+from squeak.core import CheckSqueak
+
+from squeaknode.core.squeaks import deserialize_squeak
+
+logger = logging.getLogger(__name__)
+
+
+# The workers can only be spawned instead of forked in python 3.7+, where
+# ProcessPoolExecutor takes the mp_context argument.
+CAN_SPAWN_WORKERS = sys.version_info >= (3, 7)
+
+
+def check_serialized_squeaks(serialized_squeaks: List[bytes]) -> List[bool]:
+    """ Check the signatures of a batch of serialized squeaks. Runs in the
+    worker processes, so the arguments and the results are plain values.
+    """
+    results = []
+    for squeak_bytes in serialized_squeaks:
+        try:
+            CheckSqueak(deserialize_squeak(squeak_bytes))
+            results.append(True)
+        except Exception:
+            results.append(False)
+    return results
+
+
+def get_num_workers(num_workers: int) -> int:
+    """ Get the number of worker processes, where 0 means one per core. """
+    if num_workers > 0:
+        return num_workers
+    return os.cpu_count() or 1
+
+
+class SqueakVerifier:
+    """ Check squeak signatures in a pool of worker processes, so that
+    batches of downloaded squeaks are verified in parallel instead of one
+    at a time under the GIL.
+
+    With a single worker the squeaks are checked in the calling thread.
+    """
+
+    def __init__(self, num_workers: int):
+        self.num_workers = get_num_workers(num_workers)
+        if not CAN_SPAWN_WORKERS and self.num_workers > 1:
+            logger.warning(
+                "Squeak verifier workers need python 3.7+. Verifying in the calling thread.")
+            self.num_workers = 1
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.lock = threading.Lock()
+
+    def verify_serialized_squeaks(self, serialized_squeaks: List[bytes]) -> List[CBaseSqueak]:
+        """ Return the deserialized squeaks that have valid signatures, in
+        the same order.
+        """
+        valid_flags = self._check_serialized_squeaks(serialized_squeaks)
+        return [
+            deserialize_squeak(squeak_bytes)
+            for squeak_bytes, is_valid in zip(serialized_squeaks, valid_flags)
+            if is_valid
+        ]
+
+    def verify_squeaks(self, base_squeaks: List[CBaseSqueak]) -> List[CBaseSqueak]:
+        """ Return the squeaks that have valid signatures, in the same
+        order.
+        """
+        valid_flags = self._check_serialized_squeaks(
+            [base_squeak.serialize() for base_squeak in base_squeaks]
+        )
+        return [
+            base_squeak
+            for base_squeak, is_valid in zip(base_squeaks, valid_flags)
+            if is_valid
+        ]
+
+    def shutdown(self) -> None:
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+
+    def _check_serialized_squeaks(self, serialized_squeaks: List[bytes]) -> List[bool]:
+        if self.num_workers == 1 or len(serialized_squeaks) <= 1:
+            return check_serialized_squeaks(serialized_squeaks)
+        # Split the batch evenly so that every worker gets a share.
+        chunk_size = -(-len(serialized_squeaks) // self.num_workers)
+        chunks = [
+            serialized_squeaks[i:i + chunk_size]
+            for i in range(0, len(serialized_squeaks), chunk_size)
+        ]
+        results = self._get_executor().map(check_serialized_squeaks, chunks)
+        return [is_valid for chunk_results in results for is_valid in chunk_results]
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                logger.info("Starting squeak verifier with {} workers.".format(
+                    self.num_workers,
+                ))
+                # Spawn the workers instead of forking, because the node
+                # process has many threads (and grpc) running.
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.num_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self.executor
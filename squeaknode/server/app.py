@@ -28,6 +28,10 @@ from flask import jsonify
 from flask import request
 from werkzeug.serving import make_server
 
+from squeaknode.core.batch_stream import decode_hashes
+from squeaknode.core.batch_stream import encode_items
+from squeaknode.core.batch_stream import MAX_BATCH_SIZE_HEADER
+from squeaknode.server.squeak_peer_server_handler import BatchTooLargeError
 from squeaknode.server.squeak_peer_server_handler import NotFoundError
 from squeaknode.server.squeak_peer_server_handler import PaymentRequiredError
 
@@ -74,6 +78,41 @@ def create_app(handler):
             return "Payment required", 402
         return secret_key_bytes
 
+    @app.route('/squeaks', methods=["POST"])
+    def squeaks():
+        try:
+            squeak_hashes = decode_hashes(request.get_data())
+            squeaks_bytes = handler.handle_get_squeaks_bytes(squeak_hashes)
+        except ValueError:
+            return "Invalid squeak hashes", 400
+        except BatchTooLargeError:
+            return "Too many squeak hashes", 413
+        return encode_items(squeaks_bytes), 200, {
+            "Content-Type": "application/octet-stream",
+        }
+
+    @app.route('/secretkeys', methods=["POST"])
+    def secret_keys():
+        try:
+            squeak_hashes = decode_hashes(request.get_data())
+            secret_keys = handler.handle_get_secret_keys(squeak_hashes)
+        except ValueError:
+            return "Invalid squeak hashes", 400
+        except BatchTooLargeError:
+            return "Too many squeak hashes", 413
+        except PaymentRequiredError:
+            return "Payment required", 402
+        return encode_items(secret_keys), 200, {
+            "Content-Type": "application/octet-stream",
+        }
+
+    @app.after_request
+    def add_max_batch_size_header(response):
+        # Advertise the batch endpoints to the peers.
+        response.headers[MAX_BATCH_SIZE_HEADER] = str(
+            handler.get_max_batch_size())
+        return response
+
     @app.route('/offer/<hash>')
     def offer(hash):
         client_host = request.remote_addr
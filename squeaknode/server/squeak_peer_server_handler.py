@@ -22,6 +22,7 @@
 import logging
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from squeak.core.keys import SqueakPublicKey
 
@@ -41,6 +42,10 @@ class NotFoundError(Exception):
     pass
 
 
+class BatchTooLargeError(Exception):
+    pass
+
+
 class SqueakPeerServerHandler(object):
     """Handles peer server commands."""
 
@@ -75,6 +80,41 @@ class SqueakPeerServerHandler(object):
             raise NotFoundError()
         return secret_key
 
+    def handle_get_squeaks_bytes(self, squeak_hashes: List[bytes]) -> List[Tuple[bytes, bytes]]:
+        """Return the hash and the serialized bytes of each of the given
+        squeaks that exists.
+        """
+        self.check_batch_size(squeak_hashes)
+        squeaks_bytes = []
+        for squeak_hash in squeak_hashes:
+            squeak = self.squeak_controller.get_squeak(squeak_hash)
+            if squeak:
+                squeaks_bytes.append((squeak_hash, squeak.serialize()))
+        return squeaks_bytes
+
+    def handle_get_secret_keys(self, squeak_hashes: List[bytes]) -> List[Tuple[bytes, bytes]]:
+        """Return the hash and the secret key of each of the given squeaks
+        that has a secret key.
+        """
+        self.check_batch_size(squeak_hashes)
+        price_msat = self.squeak_controller.get_sell_price_msat()
+        if price_msat > 0:
+            raise PaymentRequiredError()
+        secret_keys = []
+        for squeak_hash in squeak_hashes:
+            secret_key = self.squeak_controller.get_squeak_secret_key(
+                squeak_hash)
+            if secret_key:
+                secret_keys.append((squeak_hash, secret_key))
+        return secret_keys
+
+    def get_max_batch_size(self) -> int:
+        return self.config.server.max_batch_size
+
+    def check_batch_size(self, squeak_hashes: List[bytes]) -> None:
+        if len(squeak_hashes) > self.get_max_batch_size():
+            raise BatchTooLargeError()
+
     def handle_get_offer(self, squeak_hash_str, client_host, client_port) -> Offer:
         squeak_hash = bytes.fromhex(squeak_hash_str)
         client_addr = PeerAddress(
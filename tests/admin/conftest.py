@@ -23,6 +23,7 @@ import pytest
 
 from proto import squeak_admin_pb2
 from squeaknode.admin.messages import DEFAULT_PROFILE_IMAGE
+from squeaknode.admin.messages import DEFAULT_PROFILE_IMAGE_ID
 from squeaknode.admin.profile_image_util import bytes_to_base64_string
 
 
@@ -55,6 +56,7 @@ def signing_profile_msg(
         following=True,
         profile_image=img_base64_str,
         has_custom_profile_image=False,
+        profile_image_id=DEFAULT_PROFILE_IMAGE_ID,
     )
 
 
@@ -73,6 +75,7 @@ def recipient_profile_msg(
         following=True,
         profile_image=img_base64_str,
         has_custom_profile_image=False,
+        profile_image_id=DEFAULT_PROFILE_IMAGE_ID,
     )
 
 
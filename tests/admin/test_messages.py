@@ -19,6 +19,8 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+from squeaknode.admin.messages import cache_stats_to_message
+from squeaknode.admin.messages import DEFAULT_PROFILE_IMAGE_ID
 from squeaknode.admin.messages import download_result_to_message
 from squeaknode.admin.messages import message_to_peer_address
 from squeaknode.admin.messages import message_to_received_payment
@@ -32,13 +34,23 @@ from squeaknode.admin.messages import optional_squeak_peer_to_message
 from squeaknode.admin.messages import optional_squeak_profile_to_message
 from squeaknode.admin.messages import payment_summary_to_message
 from squeaknode.admin.messages import peer_address_to_message
+from squeaknode.admin.messages import peer_connection_stats_to_message
+from squeaknode.admin.messages import profile_image_to_message
+from squeaknode.admin.messages import query_method_stats_to_message
 from squeaknode.admin.messages import received_offer_to_message
 from squeaknode.admin.messages import received_payment_to_message
 from squeaknode.admin.messages import sent_offer_to_message
 from squeaknode.admin.messages import sent_payment_to_message
+from squeaknode.admin.messages import squeak_deletion_stats_to_message
 from squeaknode.admin.messages import squeak_entry_to_message
 from squeaknode.admin.messages import squeak_peer_to_message
 from squeaknode.admin.messages import squeak_profile_to_message
+from squeaknode.admin.profile_image_util import bytes_to_base64_string
+from squeaknode.core.cache_stats import CacheStats
+from squeaknode.core.peer_connection_stats import PeerConnectionStats
+from squeaknode.core.profiles import get_profile_image_hash
+from squeaknode.core.query_method_stats import QueryMethodStats
+from squeaknode.core.squeak_deletion_stats import SqueakDeletionStats
 
 
 def test_peer_address_to_message(peer_address, peer_address_message):
@@ -76,6 +88,52 @@ def test_profile_to_message(signing_profile, signing_profile_msg):
     assert msg == signing_profile_msg
 
 
+def test_profile_to_message_by_reference(signing_profile, signing_profile_msg):
+    msg = squeak_profile_to_message(
+        signing_profile,
+        profile_image_by_reference=True,
+    )
+
+    assert msg.profile_image == ""
+    assert msg.profile_image_id == DEFAULT_PROFILE_IMAGE_ID
+
+
+def test_profile_with_image_to_message(signing_profile):
+    profile_image = bytes.fromhex("deadbeef")
+    profile_image_hash = get_profile_image_hash(profile_image)
+    msg = squeak_profile_to_message(
+        signing_profile._replace(
+            profile_image=profile_image,
+            profile_image_hash=profile_image_hash,
+        )
+    )
+
+    assert msg.profile_image == bytes_to_base64_string(profile_image)
+    assert msg.profile_image_id == profile_image_hash.hex()
+    assert msg.has_custom_profile_image
+
+
+def test_squeak_entry_to_message_by_reference(squeak_entry_locked):
+    msg = squeak_entry_to_message(
+        squeak_entry_locked,
+        profile_images_by_reference=True,
+    )
+
+    assert msg.author.profile_image == ""
+    assert msg.author.profile_image_id == DEFAULT_PROFILE_IMAGE_ID
+    assert msg.recipient.profile_image == ""
+    assert msg.recipient.profile_image_id == DEFAULT_PROFILE_IMAGE_ID
+
+
+def test_profile_image_to_message():
+    profile_image = bytes.fromhex("deadbeef")
+    profile_image_id = get_profile_image_hash(profile_image).hex()
+    msg = profile_image_to_message(profile_image_id, profile_image)
+
+    assert msg.profile_image_id == profile_image_id
+    assert msg.profile_image == bytes_to_base64_string(profile_image)
+
+
 def test_peer_to_message(peer, peer_msg):
     msg = squeak_peer_to_message(peer)
 
@@ -211,3 +269,72 @@ def test_optional_sent_payment_to_message(sent_payment, sent_payment_msg):
     msg = optional_sent_payment_to_message(sent_payment)
 
     assert msg == sent_payment_msg
+
+
+def test_query_method_stats_to_message():
+    query_method_stats = QueryMethodStats(
+        method_name="get_squeak",
+        num_calls=3,
+        num_rows=2,
+        total_time_ms=4.5,
+        max_time_ms=2.5,
+        bucket_counts=[2, 1, 0],
+    )
+    msg = query_method_stats_to_message(query_method_stats)
+
+    assert msg.method_name == "get_squeak"
+    assert msg.num_calls == 3
+    assert msg.num_rows == 2
+    assert msg.total_time_ms == 4.5
+    assert msg.max_time_ms == 2.5
+    assert list(msg.bucket_counts) == [2, 1, 0]
+
+
+def test_cache_stats_to_message():
+    cache_stats = CacheStats(
+        cache_name="squeak_entry",
+        num_hits=3,
+        num_misses=1,
+        num_evictions=2,
+        num_invalidations=5,
+        num_entries=10,
+        num_bytes=2048,
+    )
+    msg = cache_stats_to_message(cache_stats)
+
+    assert msg.cache_name == "squeak_entry"
+    assert msg.hit_rate == 0.75
+    assert msg.num_entries == 10
+    assert msg.num_bytes == 2048
+
+
+def test_peer_connection_stats_to_message(peer_address, peer_address_message):
+    peer_connection_stats = PeerConnectionStats(
+        peer_address=peer_address,
+        num_requests=4,
+        num_connections=1,
+    )
+    msg = peer_connection_stats_to_message(peer_connection_stats)
+
+    assert msg.peer_address == peer_address_message
+    assert msg.num_requests == 4
+    assert msg.num_connections == 1
+    assert msg.num_reused_connections == 3
+    assert msg.reuse_rate == 0.75
+
+
+def test_squeak_deletion_stats_to_message():
+    squeak_deletion_stats = SqueakDeletionStats(
+        num_runs=2,
+        num_deleted=150,
+        num_batches=3,
+        total_time_ms=12.5,
+        num_budget_exhausted=1,
+    )
+    msg = squeak_deletion_stats_to_message(squeak_deletion_stats)
+
+    assert msg.num_runs == 2
+    assert msg.num_deleted == 150
+    assert msg.num_batches == 3
+    assert msg.total_time_ms == 12.5
+    assert msg.num_budget_exhausted == 1
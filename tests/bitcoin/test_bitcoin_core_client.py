@@ -142,7 +142,7 @@ def mock_invalid_status_response():
 
 
 def test_make_request(bitcoin_host, bitcoin_port, bitcoin_user, bitcoin_pass, bitcoin_core_client, mock_empty_response):
-    with mock.patch('squeaknode.bitcoin.bitcoin_core_client.requests.post', autospec=True) as mock_post:
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
         mock_post.return_value = mock_empty_response
         retrieved_json_response = bitcoin_core_client.make_request({})
         (bitcoin_address,) = mock_post.call_args.args
@@ -157,7 +157,7 @@ def test_make_request(bitcoin_host, bitcoin_port, bitcoin_user, bitcoin_pass, bi
 
 
 def test_make_request_invalid_status(bitcoin_core_client, mock_invalid_status_response):
-    with mock.patch('squeaknode.bitcoin.bitcoin_core_client.requests.post', autospec=True) as mock_post:
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
         mock_post.return_value = mock_invalid_status_response
 
         with pytest.raises(BitcoinRequestError):
@@ -165,7 +165,7 @@ def test_make_request_invalid_status(bitcoin_core_client, mock_invalid_status_re
 
 
 def test_make_request_connection_error(bitcoin_core_client, mock_invalid_status_response):
-    with mock.patch('squeaknode.bitcoin.bitcoin_core_client.requests.post', autospec=True) as mock_post:
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
         mock_post.side_effect = ConnectionError()
 
         with pytest.raises(BitcoinRequestError):
@@ -173,7 +173,7 @@ def test_make_request_connection_error(bitcoin_core_client, mock_invalid_status_
 
 
 def test_make_request_timeout_error(bitcoin_core_client, mock_invalid_status_response):
-    with mock.patch('squeaknode.bitcoin.bitcoin_core_client.requests.post', autospec=True) as mock_post:
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
         mock_post.side_effect = Timeout()
 
         with pytest.raises(BitcoinRequestError):
@@ -181,7 +181,7 @@ def test_make_request_timeout_error(bitcoin_core_client, mock_invalid_status_res
 
 
 def test_make_request_request_exception(bitcoin_core_client, mock_invalid_status_response):
-    with mock.patch('squeaknode.bitcoin.bitcoin_core_client.requests.post', autospec=True) as mock_post:
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
         mock_post.side_effect = RequestException()
 
         with pytest.raises(BitcoinRequestError):
@@ -251,3 +251,68 @@ def test_get_best_block_info(bitcoin_core_client, block_count, block_info):
         assert mock_get_block_info_by_height.call_args == mock.call(
             block_count)
         assert retrieved_block_info == block_info
+
+
+def test_make_batch_request(bitcoin_core_client):
+    with mock.patch.object(bitcoin_core_client, 'make_request', autospec=True) as mock_make_request:
+        mock_make_request.return_value = [
+            {'result': 'b', 'error': None, 'id': 1},
+            {'result': 'a', 'error': None, 'id': 0},
+        ]
+        retrieved_json_responses = bitcoin_core_client.make_batch_request([
+            {'method': 'a', 'id': 0},
+            {'method': 'b', 'id': 1},
+        ])
+
+        assert mock_make_request.call_count == 1
+        assert [json_response['result'] for json_response in retrieved_json_responses] == \
+            ['a', 'b']
+
+
+def test_get_block_hashes(bitcoin_core_client, block_count, block_hash_str, block_hash):
+    with mock.patch.object(bitcoin_core_client, 'make_request', autospec=True) as mock_make_request:
+        mock_make_request.return_value = [
+            {'result': block_hash_str, 'error': None, 'id': 0},
+            {'result': None, 'error': {'code': -8, 'message': 'Block height out of range'}, 'id': 1},
+        ]
+        retrieved_block_hashes = bitcoin_core_client.get_block_hashes(
+            [block_count, block_count + 1])
+        (payloads,) = mock_make_request.call_args.args
+
+        assert [payload['method'] for payload in payloads] == \
+            ['getblockhash', 'getblockhash']
+        assert [payload['params'] for payload in payloads] == \
+            [[block_count], [block_count + 1]]
+        assert retrieved_block_hashes == [block_hash, None]
+
+
+def test_get_block_infos_by_heights(bitcoin_core_client, block_count, block_hash, block_header):
+    with mock.patch.object(bitcoin_core_client, 'get_block_hashes', autospec=True) as mock_get_block_hashes, \
+            mock.patch.object(bitcoin_core_client, 'get_block_headers', autospec=True) as mock_get_block_headers:
+        mock_get_block_hashes.return_value = [block_hash, None]
+        mock_get_block_headers.return_value = [block_header]
+        retrieved_block_infos = bitcoin_core_client.get_block_infos_by_heights(
+            [block_count, block_count + 1])
+
+        assert mock_get_block_hashes.call_args == mock.call(
+            [block_count, block_count + 1])
+        assert mock_get_block_headers.call_args == mock.call(
+            [block_hash])
+        assert retrieved_block_infos == [
+            BlockInfo(
+                block_height=block_count,
+                block_hash=block_hash,
+                block_header=block_header,
+            ),
+        ]
+
+
+def test_wait_for_new_block(bitcoin_core_client):
+    with mock.patch.object(bitcoin_core_client, 'make_request', autospec=True) as mock_make_request:
+        mock_make_request.return_value = {'result': {}}
+        bitcoin_core_client.wait_for_new_block(30)
+        (payload,) = mock_make_request.call_args.args
+
+        assert payload['method'] == 'waitfornewblock'
+        assert payload['params'] == [30000]
+        assert mock_make_request.call_args.kwargs['timeout'] > 30
@@ -0,0 +1,147 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+
+import mock
+import pytest
+from werkzeug.serving import make_server
+
+from squeaknode.core.peer_address import Network
+from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.squeak_peer import SqueakPeer
+from squeaknode.node.listener_subscription_client import EventListener
+from squeaknode.node.squeak_store import SqueakStore
+from squeaknode.server.app import create_app
+from squeaknode.server.squeak_peer_server_handler import NotFoundError
+from squeaknode.server.squeak_peer_server_handler import SqueakPeerServerHandler
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("aiohttp_socks")
+
+from squeaknode.client.async_network_controller import AsyncNetworkController  # noqa: E402
+
+
+def make_peer(peer_name, port):
+    return SqueakPeer(
+        peer_id=None,
+        peer_name=peer_name,
+        address=PeerAddress(
+            network=Network.IPV4,
+            host="127.0.0.1",
+            port=port,
+        ),
+        autoconnect=True,
+        share_for_free=False,
+    )
+
+
+@pytest.fixture
+def peer_handler(squeak, squeak_hash):
+    def get_squeak_bytes(squeak_hash_str):
+        if squeak_hash_str != squeak_hash.hex():
+            raise NotFoundError()
+        return squeak.serialize()
+
+    peer_handler = mock.Mock(spec=SqueakPeerServerHandler)
+    peer_handler.get_max_batch_size.return_value = 0
+    peer_handler.handle_get_squeak_bytes.side_effect = get_squeak_bytes
+    peer_handler.handle_get_secret_key.side_effect = NotFoundError()
+    peer_handler.handle_get_offer.side_effect = NotFoundError()
+    peer_handler.handle_lookup_squeaks.return_value = [squeak_hash]
+    return peer_handler
+
+
+@pytest.fixture
+def peer_server(peer_handler):
+    server = make_server(
+        "127.0.0.1",
+        0,
+        create_app(peer_handler),
+        threaded=True,
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def online_peer(peer_server):
+    return make_peer("online_peer", peer_server.server_port)
+
+
+@pytest.fixture
+def offline_peer():
+    # Nothing is listening on port 1.
+    return make_peer("offline_peer", 1)
+
+
+@pytest.fixture
+def squeak_store(squeak):
+    squeak_store = mock.Mock(spec=SqueakStore)
+    squeak_store.new_squeak_listener = EventListener()
+    squeak_store.rejected_squeak_listener = EventListener()
+    squeak_store.get_squeak.return_value = None
+    squeak_store.get_latest_block.return_value = squeak.nBlockHeight
+    squeak_store.get_followed_public_keys.return_value = [squeak.GetPubKey()]
+    return squeak_store
+
+
+@pytest.fixture
+def network_controller(squeak_store):
+    network_controller = AsyncNetworkController(
+        squeak_store, None, None, 100, 100, 60, 10, 2)
+    yield network_controller
+    network_controller.close()
+
+
+def test_download_single_squeak(network_controller, squeak_store, online_peer, offline_peer, squeak, squeak_hash):
+    squeak_store.get_autoconnect_peers.return_value = [
+        offline_peer,
+        online_peer,
+    ]
+
+    network_controller.download_single_squeak(squeak_hash)
+
+    squeak_store.save_squeak.assert_called_once_with(squeak)
+
+
+def test_download_single_squeak_not_found(network_controller, squeak_store, online_peer, reply_squeak_hash):
+    squeak_store.get_autoconnect_peers.return_value = [online_peer]
+
+    network_controller.download_single_squeak(reply_squeak_hash)
+
+    squeak_store.save_squeak.assert_not_called()
+
+
+def test_download_timeline(network_controller, squeak_store, online_peer, squeak):
+    squeak_store.get_autoconnect_peers.return_value = [online_peer]
+
+    network_controller.download_timeline(10)
+
+    squeak_store.save_squeaks.assert_called_once_with([squeak])
+
+
+def test_no_peer_session_pool(network_controller):
+    # The async engine uses its own aiohttp sessions.
+    assert not hasattr(network_controller, "peer_session_pool")
+    assert network_controller.get_peer_connection_stats() == []
@@ -0,0 +1,62 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.client.network_controller import NetworkController
+from squeaknode.core.rejected_squeak import RejectedSqueak
+from squeaknode.node.listener_subscription_client import EventListener
+from squeaknode.node.squeak_store import SqueakStore
+
+
+@pytest.fixture
+def squeak_store():
+    squeak_store = mock.Mock(spec=SqueakStore)
+    squeak_store.new_squeak_listener = EventListener()
+    squeak_store.rejected_squeak_listener = EventListener()
+    return squeak_store
+
+
+@pytest.fixture
+def network_controller(squeak_store):
+    return NetworkController(
+        squeak_store, None, None, 100, 100, 60, 10, 10, 300, 0, 0)
+
+
+def test_rejected_squeak(network_controller, squeak_store, squeak, squeak_hash):
+    squeak_store.rejected_squeak_listener.handle_new_item(
+        RejectedSqueak(squeak_hash=squeak_hash, reason="invalid block hash"),
+    )
+
+    assert network_controller.rejected_squeak_hashes.get(squeak_hash) == \
+        "invalid block hash"
+    assert not network_controller.verified_squeak_hashes.contains(squeak_hash)
+
+
+def test_new_squeak(network_controller, squeak_store, squeak, squeak_hash):
+    squeak_store.rejected_squeak_listener.handle_new_item(
+        RejectedSqueak(squeak_hash=squeak_hash, reason="exceeded max number of squeaks"),
+    )
+    squeak_store.new_squeak_listener.handle_new_item(squeak)
+
+    assert network_controller.verified_squeak_hashes.contains(squeak_hash)
+    assert not network_controller.rejected_squeak_hashes.contains(squeak_hash)
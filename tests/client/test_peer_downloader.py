@@ -0,0 +1,156 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+import requests
+
+from squeaknode.client.peer_downloader import PeerDownloader
+from squeaknode.client.squeak_hash_cache import SqueakHashCache
+from squeaknode.core.batch_stream import MAX_BATCH_SIZE_HEADER
+from squeaknode.node.squeak_store import SqueakStore
+
+
+@pytest.fixture
+def squeak_store():
+    squeak_store = mock.Mock(spec=SqueakStore)
+    squeak_store.get_squeak.return_value = None
+    squeak_store.get_squeak_secret_key.return_value = None
+    squeak_store.get_received_offers.return_value = []
+    return squeak_store
+
+
+@pytest.fixture
+def session():
+    return mock.Mock(spec=requests.Session)
+
+
+@pytest.fixture
+def peer_downloader(peer, squeak_store, session):
+    return PeerDownloader(
+        peer,
+        squeak_store,
+        None,
+        None,
+        SqueakHashCache("verified", 100),
+        SqueakHashCache("rejected", 100),
+        session,
+    )
+
+
+def make_lookup_response(squeak_hashes, headers):
+    response = mock.Mock(spec=requests.Response)
+    response.headers = headers
+    response.json.return_value = [
+        squeak_hash.hex() for squeak_hash in squeak_hashes
+    ]
+    return response
+
+
+def test_download_interest_range_batched(peer_downloader, squeak_store, session, squeak, squeak_hash, resqueak, resqueak_hash, public_key, block_count):
+    session.get.return_value = make_lookup_response(
+        [squeak_hash, resqueak_hash],
+        {MAX_BATCH_SIZE_HEADER: "1"},
+    )
+    with mock.patch.object(peer_downloader.client, 'get_squeaks', autospec=True) as mock_get_squeaks, \
+            mock.patch.object(peer_downloader.client, 'get_squeak', autospec=True) as mock_get_squeak:
+        mock_get_squeaks.side_effect = [
+            {squeak_hash: squeak},
+            {resqueak_hash: resqueak},
+        ]
+        peer_downloader.download_interest_range(
+            block_count, block_count, [public_key])
+
+        assert peer_downloader.client.max_batch_size == 1
+        assert mock_get_squeaks.call_args_list == [
+            mock.call([squeak_hash]),
+            mock.call([resqueak_hash]),
+        ]
+        assert mock_get_squeak.call_count == 0
+        assert squeak_store.save_squeaks.call_args_list == [
+            mock.call([squeak]),
+            mock.call([resqueak]),
+        ]
+
+
+def test_download_interest_range_without_batch_header(peer_downloader, squeak_store, session, squeak, squeak_hash, resqueak, resqueak_hash, public_key, block_count):
+    session.get.return_value = make_lookup_response(
+        [squeak_hash, resqueak_hash],
+        {},
+    )
+    with mock.patch.object(peer_downloader.client, 'get_squeaks', autospec=True) as mock_get_squeaks, \
+            mock.patch.object(peer_downloader.client, 'get_squeak', autospec=True) as mock_get_squeak:
+        mock_get_squeak.side_effect = [squeak, resqueak]
+        peer_downloader.download_interest_range(
+            block_count, block_count, [public_key])
+
+        assert peer_downloader.client.max_batch_size == 0
+        assert mock_get_squeaks.call_count == 0
+        assert mock_get_squeak.call_args_list == [
+            mock.call(squeak_hash),
+            mock.call(resqueak_hash),
+        ]
+        squeak_store.save_squeaks.assert_called_once_with([squeak, resqueak])
+
+
+def test_download_squeaks_batched_skips_invalid_squeaks(peer_downloader, squeak_store, squeak, squeak_hash, resqueak, resqueak_hash, public_key, block_count):
+    peer_downloader.client.max_batch_size = 2
+    with mock.patch.object(peer_downloader.client, 'get_squeaks', autospec=True) as mock_get_squeaks:
+        # The resqueak is returned for the wrong hash.
+        mock_get_squeaks.return_value = {
+            squeak_hash: squeak,
+            resqueak_hash: squeak,
+        }
+        peer_downloader.download_squeaks_batched(
+            [squeak_hash, resqueak_hash], block_count, block_count, [public_key])
+
+        squeak_store.save_squeaks.assert_called_once_with([squeak])
+
+
+def test_download_squeaks_batched_skips_saved_squeaks(peer_downloader, squeak_store, squeak, squeak_hash, resqueak, resqueak_hash, public_key, block_count):
+    peer_downloader.client.max_batch_size = 2
+    peer_downloader.verified_squeak_hashes.add(squeak_hash)
+    with mock.patch.object(peer_downloader.client, 'get_squeaks', autospec=True) as mock_get_squeaks:
+        mock_get_squeaks.return_value = {resqueak_hash: resqueak}
+        peer_downloader.download_squeaks_batched(
+            [squeak_hash, resqueak_hash], block_count, block_count, [public_key])
+
+        mock_get_squeaks.assert_called_once_with([resqueak_hash])
+        squeak_store.save_squeaks.assert_called_once_with([resqueak])
+
+
+def test_download_secret_keys(peer_downloader, squeak_store, squeak, squeak_hash, resqueak, resqueak_hash, secret_key):
+    squeak_store.get_squeak.side_effect = {
+        squeak_hash: squeak,
+        resqueak_hash: resqueak,
+    }.get
+    with mock.patch.object(peer_downloader.client, 'get_secret_keys', autospec=True) as mock_get_secret_keys, \
+            mock.patch.object(peer_downloader.client, 'get_offer', autospec=True) as mock_get_offer:
+        mock_get_secret_keys.return_value = {squeak_hash: secret_key}
+        mock_get_offer.return_value = None
+        peer_downloader.download_secret_keys([squeak_hash, resqueak_hash])
+
+        mock_get_secret_keys.assert_called_once_with(
+            [squeak_hash, resqueak_hash])
+        squeak_store.save_secret_key.assert_called_once_with(
+            squeak_hash, secret_key)
+        # Fall back to an offer for the squeak without a secret key.
+        mock_get_offer.assert_called_once_with(resqueak_hash)
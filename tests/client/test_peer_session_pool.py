@@ -0,0 +1,119 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from squeaknode.client.peer_session_pool import PeerSessionPool
+from squeaknode.core.peer_address import Network
+from squeaknode.core.peer_address import PeerAddress
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def peer_address(http_server):
+    yield PeerAddress(
+        network=Network.IPV4,
+        host="127.0.0.1",
+        port=http_server.server_address[1],
+    )
+
+
+@pytest.fixture
+def peer_session_pool():
+    peer_session_pool = PeerSessionPool(10, 1, 300, 0, 0)
+    yield peer_session_pool
+    peer_session_pool.close()
+
+
+def get_url(peer_address):
+    return f"http://{peer_address.host}:{peer_address.port}/"
+
+
+def test_get_same_session(peer_session_pool, peer_address):
+    session = peer_session_pool.get_session(peer_address)
+
+    assert peer_session_pool.get_session(peer_address) is session
+
+
+def test_connection_reuse(peer_session_pool, peer_address):
+    for _ in range(3):
+        session = peer_session_pool.get_session(peer_address)
+        session.get(get_url(peer_address), timeout=10)
+
+    stats = peer_session_pool.get_stats()
+
+    assert len(stats) == 1
+    assert stats[0].peer_address == peer_address
+    assert stats[0].num_requests == 3
+    assert stats[0].num_connections == 1
+    assert stats[0].num_reused_connections == 2
+
+
+def test_evict_least_recently_used(peer_address):
+    peer_session_pool = PeerSessionPool(1, 1, 300, 0, 0)
+    other_peer_address = peer_address._replace(port=peer_address.port + 1)
+    session = peer_session_pool.get_session(peer_address)
+    session.get(get_url(peer_address), timeout=10)
+
+    peer_session_pool.get_session(other_peer_address)
+
+    assert peer_session_pool.get_session(peer_address) is not session
+    # The stats of the closed session are kept.
+    stats = {
+        s.peer_address: s
+        for s in peer_session_pool.get_stats()
+    }
+    assert stats[peer_address].num_requests == 1
+    assert stats[peer_address].num_connections == 1
+
+
+def test_close_idle_session(peer_address):
+    peer_session_pool = PeerSessionPool(10, 1, 0, 0, 0)
+    session = peer_session_pool.get_session(peer_address)
+
+    assert peer_session_pool.get_session(peer_address) is not session
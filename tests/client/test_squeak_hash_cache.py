@@ -0,0 +1,91 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.client.squeak_hash_cache import SqueakHashCache
+from tests.utils import gen_random_hash
+
+
+@pytest.fixture
+def squeak_hash_cache():
+    return SqueakHashCache("test", 2, 60)
+
+
+def test_add_and_get(squeak_hash_cache, squeak_hash):
+    assert squeak_hash_cache.get(squeak_hash) is None
+    squeak_hash_cache.add(squeak_hash, "invalid signature")
+
+    assert squeak_hash_cache.get(squeak_hash) == "invalid signature"
+    assert squeak_hash_cache.contains(squeak_hash)
+    assert squeak_hash_cache.get_stats().num_hits == 2
+    assert squeak_hash_cache.get_stats().num_misses == 1
+
+
+def test_evict_least_recently_used(squeak_hash_cache):
+    squeak_hashes = [gen_random_hash() for _ in range(3)]
+    squeak_hash_cache.add(squeak_hashes[0])
+    squeak_hash_cache.add(squeak_hashes[1])
+    squeak_hash_cache.get(squeak_hashes[0])
+    squeak_hash_cache.add(squeak_hashes[2])
+
+    assert squeak_hash_cache.contains(squeak_hashes[0])
+    assert not squeak_hash_cache.contains(squeak_hashes[1])
+    assert squeak_hash_cache.contains(squeak_hashes[2])
+    assert squeak_hash_cache.get_stats().num_evictions == 1
+
+
+def test_expire(squeak_hash_cache, squeak_hash):
+    with mock.patch('squeaknode.client.squeak_hash_cache.time.time', autospec=True) as mock_time:
+        mock_time.return_value = 1000
+        squeak_hash_cache.add(squeak_hash, "invalid block hash")
+        mock_time.return_value = 1059
+        assert squeak_hash_cache.contains(squeak_hash)
+        mock_time.return_value = 1061
+        assert not squeak_hash_cache.contains(squeak_hash)
+
+    assert squeak_hash_cache.get_stats().num_entries == 0
+
+
+def test_no_ttl(squeak_hash):
+    squeak_hash_cache = SqueakHashCache("test", 10)
+    with mock.patch('squeaknode.client.squeak_hash_cache.time.time', autospec=True) as mock_time:
+        mock_time.return_value = 1000
+        squeak_hash_cache.add(squeak_hash)
+        mock_time.return_value = 10 ** 9
+
+        assert squeak_hash_cache.contains(squeak_hash)
+
+
+def test_invalidate(squeak_hash_cache, squeak_hash):
+    squeak_hash_cache.add(squeak_hash)
+    squeak_hash_cache.invalidate(squeak_hash)
+
+    assert not squeak_hash_cache.contains(squeak_hash)
+    assert squeak_hash_cache.get_stats().num_invalidations == 1
+
+
+def test_disabled(squeak_hash):
+    squeak_hash_cache = SqueakHashCache("test", 0)
+    squeak_hash_cache.add(squeak_hash)
+
+    assert not squeak_hash_cache.contains(squeak_hash)
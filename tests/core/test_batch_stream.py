@@ -0,0 +1,78 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from squeaknode.core.batch_stream import decode_hashes
+from squeaknode.core.batch_stream import decode_items
+from squeaknode.core.batch_stream import encode_hashes
+from squeaknode.core.batch_stream import encode_items
+from tests.utils import gen_random_hash
+
+
+@pytest.fixture
+def squeak_hashes():
+    yield [gen_random_hash() for _ in range(5)]
+
+
+def test_encode_decode_hashes(squeak_hashes):
+    encoded = encode_hashes(squeak_hashes)
+
+    assert decode_hashes(encoded) == squeak_hashes
+
+
+def test_encode_invalid_hash():
+    with pytest.raises(ValueError):
+        encode_hashes([b"abc"])
+
+
+def test_decode_invalid_hashes(squeak_hashes):
+    encoded = encode_hashes(squeak_hashes)
+
+    with pytest.raises(ValueError):
+        decode_hashes(encoded[:-1])
+
+
+def test_encode_decode_items(squeak_hashes):
+    items = [
+        (squeak_hash, b"payload" * i)
+        for i, squeak_hash in enumerate(squeak_hashes)
+    ]
+    encoded = encode_items(items)
+
+    assert decode_items(encoded) == dict(items)
+
+
+def test_decode_empty_items():
+    assert decode_items(b"") == {}
+
+
+def test_decode_truncated_items(squeak_hashes):
+    items = [
+        (squeak_hash, b"payload")
+        for squeak_hash in squeak_hashes
+    ]
+    encoded = encode_items(items)
+
+    with pytest.raises(ValueError):
+        decode_items(encoded[:-1])
+    with pytest.raises(ValueError):
+        decode_items(encoded[:10])
@@ -382,6 +382,19 @@ def test_get_block_header_invalid_block_hash(
     assert "Block hash incorrect." in str(excinfo.value)
 
 
+def test_get_block_infos(
+        squeak_core,
+        squeak,
+        other_squeak,
+        block_info,
+):
+    block_infos = squeak_core.get_block_infos([squeak, other_squeak])
+
+    assert block_infos == {
+        block_info.block_height: block_info,
+    }
+
+
 def test_check_squeak(squeak_core, squeak):
     squeak_core.check_squeak(squeak)
 
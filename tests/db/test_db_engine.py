@@ -0,0 +1,135 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+
+import pytest
+
+from squeaknode.config.config import SqueaknodeConfig
+from squeaknode.db.db_engine import add_slow_query_log
+from squeaknode.db.db_engine import get_engine
+from squeaknode.db.squeak_db import SqueakDb
+
+
+@pytest.fixture
+def config():
+    squeaknode_config = SqueaknodeConfig()
+    squeaknode_config.read()
+    return squeaknode_config
+
+
+@pytest.fixture
+def sqlite_connection_string(tmp_path):
+    yield "sqlite:///{}".format(tmp_path / "test.db")
+
+
+def get_pragma(engine, name):
+    with engine.connect() as connection:
+        return connection.exec_driver_sql(
+            "PRAGMA {}".format(name)).scalar()
+
+
+def test_get_engine_sqlite_pragmas(config, sqlite_connection_string):
+    engine = get_engine(sqlite_connection_string, config.db)
+
+    assert get_pragma(engine, "journal_mode") == "wal"
+    assert get_pragma(engine, "synchronous") == 1  # NORMAL
+    assert get_pragma(engine, "busy_timeout") == 5000
+    assert get_pragma(engine, "cache_size") == -65536
+    assert get_pragma(engine, "temp_store") == 2  # MEMORY
+
+
+def test_get_engine_sqlite_custom_pragmas(sqlite_connection_string):
+    config = SqueaknodeConfig(
+        dict_config={'db': {
+            'sqlite_journal_mode': 'delete',
+            'sqlite_busy_timeout_ms': '1000',
+        }}
+    )
+    config.read()
+    engine = get_engine(sqlite_connection_string, config.db)
+
+    assert get_pragma(engine, "journal_mode") == "delete"
+    assert get_pragma(engine, "busy_timeout") == 1000
+
+
+def test_get_engine_sqlite_pool_overflow(sqlite_connection_string):
+    config = SqueaknodeConfig(
+        dict_config={'db': {
+            'pool_size': '1',
+            'max_overflow': '0',
+        }}
+    )
+    config.read()
+    engine = get_engine(sqlite_connection_string, config.db)
+
+    # More connections than the pool size can be checked out at once
+    # without waiting for the pool timeout.
+    connections = [engine.connect() for _ in range(60)]
+    for connection in connections:
+        connection.close()
+    assert engine.pool.size() == 1
+
+
+def test_get_engine_without_config(sqlite_connection_string):
+    engine = get_engine(sqlite_connection_string)
+
+    assert get_pragma(engine, "journal_mode") == "delete"
+
+
+def test_init_squeak_db_with_performance_profile(config, sqlite_connection_string):
+    engine = get_engine(sqlite_connection_string, config.db)
+    squeak_db = SqueakDb(engine)
+    squeak_db.init()
+
+    assert squeak_db.get_number_of_squeaks() == 0
+
+
+def test_slow_query_log(sqlite_connection_string, caplog):
+    engine = get_engine(sqlite_connection_string)
+    add_slow_query_log(engine, 0, explain=True)
+    squeak_db = SqueakDb(engine)
+    squeak_db.init()
+    caplog.clear()
+
+    with caplog.at_level(logging.WARNING):
+        squeak_db.get_number_of_squeaks()
+
+    assert "Slow query" in caplog.text
+    assert "FROM squeak" in caplog.text
+    assert "Query plan:" in caplog.text
+
+
+def test_slow_query_log_disabled(sqlite_connection_string, caplog):
+    config = SqueaknodeConfig(
+        dict_config={'db': {
+            'slow_query_threshold_ms': '0',
+        }}
+    )
+    config.read()
+    engine = get_engine(sqlite_connection_string, config.db)
+    squeak_db = SqueakDb(engine)
+    squeak_db.init()
+
+    with caplog.at_level(logging.WARNING):
+        squeak_db.get_number_of_squeaks()
+
+    assert "Slow query" not in caplog.text
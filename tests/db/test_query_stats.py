@@ -0,0 +1,132 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from squeaknode.db.query_stats import get_bucket_index
+from squeaknode.db.query_stats import QUERY_LATENCY_BUCKETS_MS
+from squeaknode.db.query_stats import QueryStats
+from squeaknode.db.query_stats import timed_queries
+from squeaknode.db.query_stats import untimed
+
+
+@timed_queries
+class FakeDb:
+    def __init__(self):
+        self.query_stats = QueryStats()
+
+    def get_items(self, n):
+        return list(range(n))
+
+    def get_item(self):
+        return 5
+
+    def get_missing_item(self):
+        return None
+
+    def yield_items(self, n):
+        for i in range(n):
+            yield i
+
+    @untimed
+    def make_filter(self):
+        return "filter"
+
+
+def get_stats_by_name(fake_db):
+    return {
+        stats.method_name: stats
+        for stats in fake_db.query_stats.get_method_stats()
+    }
+
+
+def test_get_bucket_index():
+    assert get_bucket_index(0.5) == 0
+    assert get_bucket_index(1) == 0
+    assert get_bucket_index(3) == 1
+    assert get_bucket_index(1000000) == len(QUERY_LATENCY_BUCKETS_MS)
+
+
+def test_record():
+    query_stats = QueryStats()
+    query_stats.record("get_items", 3, 2)
+    query_stats.record("get_items", 7, 4)
+
+    stats, = query_stats.get_method_stats()
+
+    assert stats.method_name == "get_items"
+    assert stats.num_calls == 2
+    assert stats.num_rows == 6
+    assert stats.total_time_ms == 10
+    assert stats.max_time_ms == 7
+    assert stats.bucket_counts[1] == 1
+    assert stats.bucket_counts[2] == 1
+    assert sum(stats.bucket_counts) == 2
+
+
+def test_reset():
+    query_stats = QueryStats()
+    query_stats.record("get_items", 3, 2)
+    query_stats.reset()
+
+    assert query_stats.get_method_stats() == []
+
+
+def test_timed_queries():
+    fake_db = FakeDb()
+    fake_db.get_items(3)
+    fake_db.get_items(4)
+    fake_db.get_item()
+    fake_db.get_missing_item()
+
+    stats_by_name = get_stats_by_name(fake_db)
+
+    assert stats_by_name["get_items"].num_calls == 2
+    assert stats_by_name["get_items"].num_rows == 7
+    assert stats_by_name["get_item"].num_rows == 1
+    assert stats_by_name["get_missing_item"].num_rows == 0
+
+
+def test_timed_queries_generator():
+    fake_db = FakeDb()
+    items = list(fake_db.yield_items(5))
+
+    stats_by_name = get_stats_by_name(fake_db)
+
+    assert items == [0, 1, 2, 3, 4]
+    assert stats_by_name["yield_items"].num_calls == 1
+    assert stats_by_name["yield_items"].num_rows == 5
+
+
+def test_timed_queries_generator_closed_early():
+    fake_db = FakeDb()
+    items = fake_db.yield_items(5)
+    next(items)
+    items.close()
+
+    stats_by_name = get_stats_by_name(fake_db)
+
+    assert stats_by_name["yield_items"].num_rows == 1
+
+
+def test_timed_queries_untimed():
+    fake_db = FakeDb()
+    fake_db.make_filter()
+
+    assert get_stats_by_name(fake_db) == {}
@@ -25,6 +25,8 @@ import mock
 import pytest
 from sqlalchemy import create_engine
 
+from squeaknode.core.profiles import get_profile_image_hash
+from squeaknode.core.squeaks import get_hash
 from squeaknode.core.twitter_account import TwitterAccount
 from squeaknode.db.exception import SqueakDatabaseError
 from squeaknode.db.squeak_db import SqueakDb
@@ -162,6 +164,43 @@ def inserted_squeak_hashes(squeak_db, private_key):
     yield ret
 
 
+@pytest.fixture
+def thread_squeaks_with_block_headers(private_key):
+    """ Return a reply chain of four squeaks, followed by a second
+    reply to the root squeak.
+    """
+    ret = []
+    reply_hash = None
+    for i in range(4):
+        squeak, header = gen_squeak_with_block_header(
+            private_key, i, replyto_hash=reply_hash)
+        reply_hash = get_hash(squeak)
+        ret.append((squeak, header))
+    root_squeak, _ = ret[0]
+    ret.append(gen_squeak_with_block_header(
+        private_key, 4, replyto_hash=get_hash(root_squeak)))
+    yield ret
+
+
+@pytest.fixture
+def thread_squeak_hashes(thread_squeaks_with_block_headers):
+    yield [
+        get_hash(squeak)
+        for squeak, _ in thread_squeaks_with_block_headers
+    ]
+
+
+@pytest.fixture
+def inserted_thread_squeak_hashes(
+        squeak_db,
+        thread_squeaks_with_block_headers,
+        thread_squeak_hashes,
+):
+    for squeak, header in thread_squeaks_with_block_headers:
+        squeak_db.insert_squeak(squeak, header)
+    yield thread_squeak_hashes
+
+
 @pytest.fixture
 def followed_squeak_hashes(
         squeak_db,
@@ -180,6 +219,16 @@ def authored_squeak_hashes(
     yield inserted_squeak_hashes
 
 
+@pytest.fixture
+def searchable_squeak_hashes(squeak_db, inserted_squeak_hashes):
+    for i, squeak_hash in enumerate(inserted_squeak_hashes):
+        squeak_db.set_squeak_decrypted_content(
+            squeak_hash,
+            "searchable squeak number {}".format(i),
+        )
+    yield inserted_squeak_hashes
+
+
 @pytest.fixture
 def unfollowed_squeak_hashes(
         squeak_db,
@@ -623,6 +672,70 @@ def test_get_resqueak_entry(
     assert retrieved_resqueak_entry.resqueaked_squeak.num_resqueaks == 1
 
 
+def test_get_squeak_entry_num_replies(
+        squeak_db,
+        inserted_squeak_hash,
+        inserted_reply_squeak_hash,
+):
+    retrieved_squeak_entry = squeak_db.get_squeak_entry(inserted_squeak_hash)
+
+    assert retrieved_squeak_entry.num_replies == 1
+
+
+def test_get_squeak_entry_num_replies_reply_inserted_first(
+        squeak_db,
+        squeak,
+        block_header,
+        inserted_reply_squeak_hash,
+):
+    squeak_hash = squeak_db.insert_squeak(squeak, block_header)
+    retrieved_squeak_entry = squeak_db.get_squeak_entry(squeak_hash)
+
+    assert retrieved_squeak_entry.num_replies == 1
+
+
+def test_get_squeak_entry_num_replies_after_delete_reply(
+        squeak_db,
+        inserted_squeak_hash,
+        inserted_reply_squeak_hash,
+):
+    squeak_db.delete_squeak(inserted_reply_squeak_hash)
+    retrieved_squeak_entry = squeak_db.get_squeak_entry(inserted_squeak_hash)
+
+    assert retrieved_squeak_entry.num_replies == 0
+
+
+def test_get_squeak_entry_num_resqueaks_after_delete_resqueak(
+        squeak_db,
+        inserted_squeak_hash,
+        inserted_resqueak_hash,
+):
+    squeak_db.delete_squeak(inserted_resqueak_hash)
+    retrieved_squeak_entry = squeak_db.get_squeak_entry(inserted_squeak_hash)
+
+    assert retrieved_squeak_entry.num_resqueaks == 0
+
+
+def test_repair_squeak_counts(
+        squeak_db,
+        inserted_squeak_hash,
+        inserted_reply_squeak_hash,
+        inserted_resqueak_hash,
+):
+    with squeak_db.get_connection() as connection:
+        connection.execute(
+            squeak_db.squeaks.update().values(
+                num_replies=0,
+                num_resqueaks=0,
+            )
+        )
+    squeak_db.repair_squeak_counts()
+    retrieved_squeak_entry = squeak_db.get_squeak_entry(inserted_squeak_hash)
+
+    assert retrieved_squeak_entry.num_replies == 1
+    assert retrieved_squeak_entry.num_resqueaks == 1
+
+
 def test_get_timeline_squeak_entries(squeak_db, followed_squeak_hashes):
     timeline_squeak_entries = squeak_db.get_timeline_squeak_entries(
         limit=2,
@@ -632,6 +745,37 @@ def test_get_timeline_squeak_entries(squeak_db, followed_squeak_hashes):
     assert len(timeline_squeak_entries) == 2
 
 
+def test_get_timeline_squeak_entries_paginated(squeak_db, followed_squeak_hashes):
+    first_page = squeak_db.get_timeline_squeak_entries(
+        limit=2,
+        last_entry=None,
+    )
+    statement = squeak_db._statements["timeline_squeak_entries"]
+    second_page = squeak_db.get_timeline_squeak_entries(
+        limit=100,
+        last_entry=first_page[-1],
+    )
+
+    assert squeak_db._statements["timeline_squeak_entries"] is statement
+    assert len(first_page) + len(second_page) == len(followed_squeak_hashes)
+    assert set(
+        entry.squeak_hash for entry in first_page + second_page
+    ) == set(followed_squeak_hashes)
+
+
+def test_get_query_stats(squeak_db, followed_squeak_hashes):
+    squeak_db.query_stats.reset()
+    squeak_db.get_timeline_squeak_entries(limit=2, last_entry=None)
+    stats_by_name = {
+        stats.method_name: stats
+        for stats in squeak_db.query_stats.get_method_stats()
+    }
+
+    assert stats_by_name.keys() == {"get_timeline_squeak_entries"}
+    assert stats_by_name["get_timeline_squeak_entries"].num_calls == 1
+    assert stats_by_name["get_timeline_squeak_entries"].num_rows == 2
+
+
 def test_get_timeline_squeak_entries_all_unfollowed(squeak_db, unfollowed_squeak_hashes):
     timeline_squeak_entries = squeak_db.get_timeline_squeak_entries(
         limit=2,
@@ -665,6 +809,55 @@ def test_set_profile_image(squeak_db, profile_with_image_id, profile_image_bytes
     assert profile.profile_image == profile_image_bytes
 
 
+def test_set_profile_image_hash(squeak_db, profile_with_image_id, profile_image_bytes):
+    profile = squeak_db.get_profile(profile_with_image_id)
+
+    assert profile.profile_image_hash == get_profile_image_hash(
+        profile_image_bytes)
+    assert squeak_db.get_profile_image(
+        profile.profile_image_hash) == profile_image_bytes
+
+
+def test_clear_profile_image(squeak_db, profile_with_image_id, profile_image_bytes):
+    squeak_db.set_profile_image(profile_with_image_id, None)
+    profile = squeak_db.get_profile(profile_with_image_id)
+
+    assert profile.profile_image is None
+    assert profile.profile_image_hash is None
+    assert squeak_db.get_profile_image(
+        get_profile_image_hash(profile_image_bytes)) is None
+
+
+def test_set_same_profile_image_on_two_profiles(
+        squeak_db,
+        profile_with_image_id,
+        recipient_contact_profile,
+        profile_image_bytes,
+):
+    other_profile_id = squeak_db.insert_profile(recipient_contact_profile)
+    squeak_db.set_profile_image(other_profile_id, profile_image_bytes)
+    squeak_db.delete_profile(profile_with_image_id)
+    profile = squeak_db.get_profile(other_profile_id)
+
+    assert profile.profile_image == profile_image_bytes
+
+
+def test_get_squeak_entry_with_profile_image(
+        squeak_db,
+        inserted_squeak_hash,
+        inserted_signing_profile_id,
+        profile_image_bytes,
+):
+    squeak_db.set_profile_image(
+        inserted_signing_profile_id, profile_image_bytes)
+    retrieved_squeak_entry = squeak_db.get_squeak_entry(inserted_squeak_hash)
+
+    # Squeak entries only include the hash of the profile image.
+    assert retrieved_squeak_entry.squeak_profile.profile_image is None
+    assert retrieved_squeak_entry.squeak_profile.profile_image_hash == \
+        get_profile_image_hash(profile_image_bytes)
+
+
 def test_deleted_profile(squeak_db, deleted_profile_id):
     profile = squeak_db.get_profile(deleted_profile_id)
 
@@ -792,6 +985,97 @@ def test_get_search_squeak_entries_other_text(
     assert len(squeak_entries) == 0
 
 
+def test_get_search_squeak_entries_word_prefix(
+        squeak_db,
+        unlocked_squeak_hash,
+):
+    # Get the search squeak entries.
+    squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+        search_text="HEL",
+        limit=200,
+        last_entry=None,
+    )
+
+    assert len(squeak_entries) == 1
+
+
+def test_get_search_squeak_entries_deleted_squeak(
+        squeak_db,
+        unlocked_squeak_hash,
+):
+    squeak_db.delete_squeak(unlocked_squeak_hash)
+    # Get the search squeak entries.
+    squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+        search_text="hello",
+        limit=200,
+        last_entry=None,
+    )
+
+    assert len(squeak_entries) == 0
+
+
+def test_get_search_squeak_entries_content_set_twice(
+        squeak_db,
+        unlocked_squeak_hash,
+        squeak_content,
+):
+    squeak_db.set_squeak_decrypted_content(
+        unlocked_squeak_hash, squeak_content)
+    # Get the search squeak entries.
+    squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+        search_text="hello",
+        limit=200,
+        last_entry=None,
+    )
+
+    with squeak_db.get_connection() as connection:
+        rows = connection.execute(
+            squeak_db.squeak_search.select()
+        ).fetchall()
+    assert len(squeak_entries) == 1
+    assert len(rows) == 1
+
+
+def test_get_search_squeak_entries_paginated(
+        squeak_db,
+        searchable_squeak_hashes,
+):
+    retrieved_hashes = []
+    last_entry = None
+    while True:
+        squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+            search_text="searchable squeak",
+            limit=30,
+            last_entry=last_entry,
+        )
+        if not squeak_entries:
+            break
+        retrieved_hashes.extend(
+            entry.squeak_hash for entry in squeak_entries
+        )
+        last_entry = squeak_entries[-1]
+
+    assert len(retrieved_hashes) == 100
+    assert set(retrieved_hashes) == set(searchable_squeak_hashes)
+
+
+def test_rebuild_search_index(
+        squeak_db,
+        unlocked_squeak_hash,
+):
+    with squeak_db.get_connection() as connection:
+        connection.execute(squeak_db.squeak_search.delete())
+    squeak_db.rebuild_search_index()
+    # Get the search squeak entries.
+    squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+        search_text="hello",
+        limit=200,
+        last_entry=None,
+    )
+
+    assert len(squeak_entries) == 1
+
+
 def test_get_ancestor_squeak_entries(
         squeak_db,
         inserted_squeak_hash,
@@ -828,6 +1112,195 @@ def test_get_ancestor_squeak_entries_no_ancestors_or_root(
     assert len(squeak_entries) == 0
 
 
+def test_get_ancestor_squeak_entries_thread(
+        squeak_db,
+        inserted_thread_squeak_hashes,
+):
+    squeak_entries = squeak_db.get_thread_ancestor_squeak_entries(
+        squeak_hash=inserted_thread_squeak_hashes[3],
+    )
+
+    assert [entry.squeak_hash for entry in squeak_entries] == \
+        inserted_thread_squeak_hashes[:4]
+
+
+def test_get_ancestor_squeak_entries_parents_inserted_last(
+        squeak_db,
+        thread_squeaks_with_block_headers,
+        thread_squeak_hashes,
+):
+    for squeak, header in reversed(thread_squeaks_with_block_headers):
+        squeak_db.insert_squeak(squeak, header)
+    squeak_entries = squeak_db.get_thread_ancestor_squeak_entries(
+        squeak_hash=thread_squeak_hashes[3],
+    )
+
+    assert [entry.squeak_hash for entry in squeak_entries] == \
+        thread_squeak_hashes[:4]
+
+
+def test_get_ancestor_squeak_entries_bulk_inserted(
+        squeak_db,
+        thread_squeaks_with_block_headers,
+        thread_squeak_hashes,
+):
+    squeak_db.insert_squeaks(list(reversed(thread_squeaks_with_block_headers)))
+    squeak_entries = squeak_db.get_thread_ancestor_squeak_entries(
+        squeak_hash=thread_squeak_hashes[3],
+    )
+
+    assert [entry.squeak_hash for entry in squeak_entries] == \
+        thread_squeak_hashes[:4]
+
+
+def test_get_ancestor_squeak_entries_after_delete_parent(
+        squeak_db,
+        inserted_thread_squeak_hashes,
+):
+    squeak_db.delete_squeak(inserted_thread_squeak_hashes[1])
+    squeak_entries = squeak_db.get_thread_ancestor_squeak_entries(
+        squeak_hash=inserted_thread_squeak_hashes[3],
+    )
+
+    assert [entry.squeak_hash for entry in squeak_entries] == \
+        inserted_thread_squeak_hashes[2:4]
+
+
+def test_get_ancestor_squeak_entries_after_delete_and_insert_parent(
+        squeak_db,
+        thread_squeaks_with_block_headers,
+        inserted_thread_squeak_hashes,
+):
+    squeak, header = thread_squeaks_with_block_headers[1]
+    squeak_db.delete_squeak(inserted_thread_squeak_hashes[1])
+    squeak_db.insert_squeak(squeak, header)
+    squeak_entries = squeak_db.get_thread_ancestor_squeak_entries(
+        squeak_hash=inserted_thread_squeak_hashes[3],
+    )
+
+    assert [entry.squeak_hash for entry in squeak_entries] == \
+        inserted_thread_squeak_hashes[:4]
+
+
+def test_get_descendant_squeak_entries(
+        squeak_db,
+        inserted_thread_squeak_hashes,
+):
+    squeak_entries = squeak_db.get_thread_descendant_squeak_entries(
+        squeak_hash=inserted_thread_squeak_hashes[1],
+        limit=200,
+        last_entry=None,
+    )
+
+    assert [entry.squeak_hash for entry in squeak_entries] == [
+        inserted_thread_squeak_hashes[3],
+        inserted_thread_squeak_hashes[2],
+    ]
+
+
+def test_get_descendant_squeak_entries_with_limit(
+        squeak_db,
+        inserted_thread_squeak_hashes,
+):
+    squeak_entries = squeak_db.get_thread_descendant_squeak_entries(
+        squeak_hash=inserted_thread_squeak_hashes[0],
+        limit=2,
+        last_entry=None,
+    )
+    next_squeak_entries = squeak_db.get_thread_descendant_squeak_entries(
+        squeak_hash=inserted_thread_squeak_hashes[0],
+        limit=200,
+        last_entry=squeak_entries[-1],
+    )
+
+    assert [entry.squeak_hash for entry in squeak_entries] == [
+        inserted_thread_squeak_hashes[4],
+        inserted_thread_squeak_hashes[3],
+    ]
+    assert [entry.squeak_hash for entry in next_squeak_entries] == [
+        inserted_thread_squeak_hashes[2],
+        inserted_thread_squeak_hashes[1],
+    ]
+
+
+def test_get_conversation_squeak_entries(
+        squeak_db,
+        inserted_thread_squeak_hashes,
+):
+    squeak_entries = squeak_db.get_thread_conversation_squeak_entries(
+        squeak_hash=inserted_thread_squeak_hashes[3],
+        limit=200,
+        last_entry=None,
+    )
+
+    assert [entry.squeak_hash for entry in squeak_entries] == \
+        list(reversed(inserted_thread_squeak_hashes))
+
+
+def test_get_conversation_squeak_entries_missing_root(
+        squeak_db,
+        thread_squeaks_with_block_headers,
+        thread_squeak_hashes,
+):
+    for squeak, header in thread_squeaks_with_block_headers[1:]:
+        squeak_db.insert_squeak(squeak, header)
+    squeak_entries = squeak_db.get_thread_conversation_squeak_entries(
+        squeak_hash=thread_squeak_hashes[2],
+        limit=200,
+        last_entry=None,
+    )
+
+    assert [entry.squeak_hash for entry in squeak_entries] == \
+        list(reversed(thread_squeak_hashes[1:]))
+
+
+def test_get_conversation_squeak_entries_not_found(
+        squeak_db,
+        inserted_thread_squeak_hashes,
+):
+    squeak_entries = squeak_db.get_thread_conversation_squeak_entries(
+        squeak_hash=gen_random_hash(),
+        limit=200,
+        last_entry=None,
+    )
+
+    assert len(squeak_entries) == 0
+
+
+def test_delete_squeak_removes_thread_closure_rows(
+        squeak_db,
+        inserted_thread_squeak_hashes,
+):
+    for squeak_hash in inserted_thread_squeak_hashes:
+        squeak_db.delete_squeak(squeak_hash)
+
+    with squeak_db.get_connection() as connection:
+        rows = connection.execute(
+            squeak_db.squeak_thread_closure.select()
+        ).fetchall()
+    assert len(rows) == 0
+
+
+def test_rebuild_thread_closure(
+        squeak_db,
+        thread_squeaks_with_block_headers,
+        thread_squeak_hashes,
+):
+    # Insert all squeaks except for the root.
+    for squeak, header in reversed(thread_squeaks_with_block_headers[1:]):
+        squeak_db.insert_squeak(squeak, header)
+    select_closure = squeak_db.squeak_thread_closure.select()
+    with squeak_db.get_connection() as connection:
+        rows = set(connection.execute(select_closure).fetchall())
+
+    squeak_db.rebuild_thread_closure()
+
+    with squeak_db.get_connection() as connection:
+        rebuilt_rows = set(connection.execute(select_closure).fetchall())
+    assert rebuilt_rows == rows
+    assert len(rows) == 4 + 3 + 2 + 1 + 2
+
+
 def test_get_reply_squeak_entries(
         squeak_db,
         inserted_squeak_hash,
@@ -1022,6 +1495,92 @@ def test_number_of_squeaks_with_public_key_with_block_height(
     assert num_squeaks == 1
 
 
+def test_get_number_of_squeaks_by_public_key_and_block_height(
+        squeak_db,
+        public_key,
+        inserted_squeak_hashes,
+):
+    squeak_counts = squeak_db.get_number_of_squeaks_by_public_key_and_block_height(
+        public_keys=[public_key],
+        min_block=40,
+        max_block=49,
+    )
+
+    assert squeak_counts == {
+        (public_key, block_height): 1
+        for block_height in range(40, 50)
+    }
+
+
+def test_get_number_of_squeaks_by_block_height_all_public_keys(
+        squeak_db,
+        public_key,
+        inserted_squeak_hashes,
+):
+    squeak_counts = squeak_db.get_number_of_squeaks_by_public_key_and_block_height(
+        public_keys=None,
+        min_block=40,
+        max_block=49,
+    )
+
+    assert squeak_counts == {
+        (public_key, block_height): 1
+        for block_height in range(40, 50)
+    }
+
+
+def test_delete_squeak_returns_author_and_block_height(
+        squeak_db,
+        squeak,
+        public_key,
+        inserted_squeak_hash,
+):
+    deleted_squeak = squeak_db.delete_squeak(inserted_squeak_hash)
+
+    assert deleted_squeak == (public_key, squeak.nBlockHeight)
+    assert squeak_db.delete_squeak(inserted_squeak_hash) is None
+
+
+def test_insert_squeaks(
+        squeak_db,
+        private_key,
+        squeak,
+        block_header,
+        reply_squeak,
+        resqueak,
+        inserted_squeak_hash,
+):
+    squeaks_with_block_headers = [
+        gen_squeak_with_block_header(private_key, i)
+        for i in range(10)
+    ] + [
+        (squeak, block_header),
+        (reply_squeak, block_header),
+        (resqueak, block_header),
+        (resqueak, block_header),
+    ]
+    inserted_hashes = squeak_db.insert_squeaks(squeaks_with_block_headers)
+    retrieved_squeak_entry = squeak_db.get_squeak_entry(inserted_squeak_hash)
+
+    assert len(inserted_hashes) == 12
+    assert inserted_squeak_hash not in inserted_hashes
+    assert squeak_db.get_number_of_squeaks() == 13
+    assert retrieved_squeak_entry.num_replies == 1
+    assert retrieved_squeak_entry.num_resqueaks == 1
+
+
+def test_insert_squeaks_all_existing(
+        squeak_db,
+        squeak,
+        block_header,
+        inserted_squeak_hash,
+):
+    inserted_hashes = squeak_db.insert_squeaks([(squeak, block_header)])
+
+    assert inserted_hashes == []
+    assert squeak_db.get_number_of_squeaks() == 1
+
+
 def test_get_old_squeaks_to_delete(
         squeak_db,
         followed_squeak_hashes,
@@ -1109,6 +1668,74 @@ def test_get_old_squeaks_to_delete_none_liked(
         assert len(hashes_to_delete) == 0
 
 
+def test_delete_old_squeaks(
+        squeak_db,
+        public_key,
+        followed_squeak_hashes,
+):
+    current_time_ms = int(time.time() * 1000)
+    time_elapsed_s = 56789
+    fake_current_time_ms = current_time_ms + 1000 * time_elapsed_s
+
+    with mock.patch.object(SqueakDb, 'timestamp_now_ms', new_callable=mock.PropertyMock) as mock_timestamp_ms:
+        mock_timestamp_ms.return_value = fake_current_time_ms
+
+        interval_s = time_elapsed_s - 10
+        deleted_squeaks = squeak_db.delete_old_squeaks(
+            interval_s=interval_s,
+            limit=30,
+        )
+
+        assert len(deleted_squeaks) == 30
+        assert all(
+            deleted_public_key == public_key
+            for deleted_public_key, _ in deleted_squeaks
+        )
+        assert squeak_db.get_number_of_squeaks() == 70
+
+
+def test_delete_old_squeaks_none_liked(
+        squeak_db,
+        liked_squeak_hashes,
+):
+    current_time_ms = int(time.time() * 1000)
+    time_elapsed_s = 56789
+    fake_current_time_ms = current_time_ms + 1000 * time_elapsed_s
+
+    with mock.patch.object(SqueakDb, 'timestamp_now_ms', new_callable=mock.PropertyMock) as mock_timestamp_ms:
+        mock_timestamp_ms.return_value = fake_current_time_ms
+
+        interval_s = time_elapsed_s - 10
+        deleted_squeaks = squeak_db.delete_old_squeaks(
+            interval_s=interval_s,
+            limit=30,
+        )
+
+        assert deleted_squeaks == []
+        assert squeak_db.get_number_of_squeaks() == 100
+
+
+def test_delete_old_squeaks_removes_thread_closure_rows(
+        squeak_db,
+        inserted_thread_squeak_hashes,
+):
+    current_time_ms = int(time.time() * 1000)
+    fake_current_time_ms = current_time_ms + 1000 * 100
+
+    with mock.patch.object(SqueakDb, 'timestamp_now_ms', new_callable=mock.PropertyMock) as mock_timestamp_ms:
+        mock_timestamp_ms.return_value = fake_current_time_ms
+        squeak_db.delete_old_squeaks(
+            interval_s=10,
+            limit=100,
+        )
+
+    with squeak_db.get_connection() as connection:
+        rows = connection.execute(
+            squeak_db.squeak_thread_closure.select()
+        ).fetchall()
+    assert len(rows) == 0
+
+
 def test_get_profiles(
         squeak_db,
         inserted_contact_profile_ids,
@@ -1416,6 +2043,22 @@ def test_get_sent_payments_for_squeak(squeak_db, squeak_hash, inserted_sent_paym
     assert len(retrieved_sent_payments) == len(inserted_sent_payment_ids)
 
 
+def test_get_sent_payments_for_peer(squeak_db, peer_address, inserted_sent_payment_ids):
+    retrieved_sent_payments = squeak_db.get_sent_payments_for_peer(
+        peer_address,
+        limit=1000,
+        last_sent_payment=None,
+    )
+    other_peer_sent_payments = squeak_db.get_sent_payments_for_peer(
+        peer_address._replace(port=peer_address.port + 1),
+        limit=1000,
+        last_sent_payment=None,
+    )
+
+    assert len(retrieved_sent_payments) == len(inserted_sent_payment_ids)
+    assert len(other_peer_sent_payments) == 0
+
+
 def test_get_sent_payments_for_pubkey(squeak_db, public_key, inserted_squeak_hash, inserted_sent_payment_ids):
     retrieved_sent_payments = squeak_db.get_sent_payments_for_pubkey(
         public_key,
@@ -1635,6 +2278,28 @@ def test_yield_received_payments_from_other_settle_index(squeak_db, inserted_rec
         inserted_received_payment_ids) - index
 
 
+def test_yield_received_payments_from_index_in_batches(squeak_db, inserted_received_payment_ids):
+    payments = list(squeak_db.yield_received_payments_from_index(
+        start_index=0,
+        batch_size=10,
+    ))
+
+    assert [payment.received_payment_id for payment in payments] == \
+        sorted(inserted_received_payment_ids)
+
+
+def test_get_latest_received_payment_index(squeak_db, inserted_received_payment_ids):
+    latest_index = squeak_db.get_latest_received_payment_index()
+
+    assert latest_index == max(inserted_received_payment_ids)
+
+
+def test_get_latest_received_payment_index_none(squeak_db):
+    latest_index = squeak_db.get_latest_received_payment_index()
+
+    assert latest_index == 0
+
+
 def test_get_latest_settle_index(squeak_db, inserted_received_payment_ids):
     latest_settle_index = squeak_db.get_latest_settle_index()
 
@@ -1706,6 +2371,80 @@ def test_get_sent_payment_summary_for_pubkey(squeak_db, public_key, inserted_squ
         len(inserted_sent_payment_ids)
 
 
+def test_get_received_payment_summary_for_peer(squeak_db, peer_address, inserted_received_payment_ids, price_msat):
+    received_payment_summary = squeak_db.get_received_payment_summary_for_peer(
+        peer_address)
+
+    assert received_payment_summary.num_received_payments == len(
+        inserted_received_payment_ids)
+    assert received_payment_summary.total_amount_received_msat == price_msat * \
+        len(inserted_received_payment_ids)
+
+
+def test_get_sent_payment_summary_for_peer(squeak_db, peer_address, inserted_sent_payment_ids, inserted_received_payment_ids, price_msat):
+    sent_payment_summary = squeak_db.get_sent_payment_summary_for_peer(
+        peer_address)
+
+    assert sent_payment_summary.num_sent_payments == len(
+        inserted_sent_payment_ids)
+    assert sent_payment_summary.total_amount_sent_msat == price_msat * \
+        len(inserted_sent_payment_ids)
+
+
+def test_get_payment_summary_empty(squeak_db, squeak_hash):
+    received_payment_summary = squeak_db.get_received_payment_summary_for_squeak(
+        squeak_hash)
+    sent_payment_summary = squeak_db.get_sent_payment_summary()
+
+    assert received_payment_summary.num_received_payments == 0
+    assert received_payment_summary.total_amount_received_msat == 0
+    assert sent_payment_summary.num_sent_payments == 0
+    assert sent_payment_summary.total_amount_sent_msat == 0
+
+
+def test_get_received_payment_summary_duplicate_payment(squeak_db, received_payment, inserted_received_payment_id, price_msat):
+    squeak_db.insert_received_payment(received_payment)
+    received_payment_summary = squeak_db.get_received_payment_summary()
+
+    assert received_payment_summary.num_received_payments == 1
+    assert received_payment_summary.total_amount_received_msat == price_msat
+
+
+def test_rebuild_payment_summaries(squeak_db, public_key, inserted_squeak_hash, inserted_sent_payment_ids, inserted_received_payment_ids, price_msat):
+    with squeak_db.get_connection() as connection:
+        connection.execute(squeak_db.pubkey_payment_summaries.delete())
+        connection.execute(squeak_db.payment_summaries.delete())
+
+    squeak_db.rebuild_payment_summaries()
+    sent_payment_summary = squeak_db.get_sent_payment_summary_for_pubkey(
+        public_key)
+    received_payment_summary = squeak_db.get_received_payment_summary()
+
+    assert sent_payment_summary.num_sent_payments == len(
+        inserted_sent_payment_ids)
+    assert received_payment_summary.total_amount_received_msat == price_msat * \
+        len(inserted_received_payment_ids)
+
+
+def test_rebuild_payment_summaries_after_delete_squeak(squeak_db, public_key, inserted_squeak_hash, inserted_sent_payment_ids, inserted_received_payment_ids):
+    squeak_db.delete_squeak(inserted_squeak_hash)
+    sent_payment_summary = squeak_db.get_sent_payment_summary_for_pubkey(
+        public_key)
+    received_payment_summary = squeak_db.get_received_payment_summary_for_pubkey(
+        public_key)
+
+    squeak_db.rebuild_payment_summaries()
+    rebuilt_sent_payment_summary = squeak_db.get_sent_payment_summary_for_pubkey(
+        public_key)
+    rebuilt_received_payment_summary = squeak_db.get_received_payment_summary_for_pubkey(
+        public_key)
+
+    assert sent_payment_summary.num_sent_payments == 0
+    assert received_payment_summary.num_received_payments == 0
+    assert sent_payment_summary == rebuilt_sent_payment_summary
+    assert received_payment_summary == rebuilt_received_payment_summary
+
+
 def test_get_config(squeak_db, user_config, inserted_user_config_username):
     retrieved_config = squeak_db.get_config(inserted_user_config_username)
 
@@ -1756,3 +2495,36 @@ def test_get_twitter_account_all_deleted(squeak_db, twitter_account, deleted_twi
     retrieved_twitter_accounts = squeak_db.get_twitter_accounts()
 
     assert len(retrieved_twitter_accounts) == 0
+
+
+def test_get_block_info(squeak_db, block_info):
+    squeak_db.insert_block_infos([block_info])
+    retrieved_block_info = squeak_db.get_block_info(block_info.block_height)
+
+    assert retrieved_block_info.block_hash == block_info.block_hash
+    assert retrieved_block_info.block_header.serialize() == \
+        block_info.block_header.serialize()
+    assert squeak_db.get_block_info(block_info.block_height + 1) is None
+
+
+def test_insert_duplicate_block_info(squeak_db, block_info):
+    squeak_db.insert_block_infos([block_info])
+    squeak_db.insert_block_infos([
+        block_info._replace(block_hash=gen_random_hash()),
+    ])
+    retrieved_block_info = squeak_db.get_block_info(block_info.block_height)
+
+    assert retrieved_block_info.block_hash == block_info.block_hash
+
+
+def test_delete_block_infos(squeak_db, block_info):
+    squeak_db.insert_block_infos([
+        block_info._replace(block_height=block_height)
+        for block_height in range(10)
+    ])
+    squeak_db.delete_block_infos_from_height(8)
+    squeak_db.delete_block_infos_below_height(2)
+
+    assert squeak_db.get_block_heights(0, 100) == list(range(2, 8))
+    assert squeak_db.get_block_heights(3, 5) == [3, 4, 5]
+    assert squeak_db.get_max_block_height() == 7
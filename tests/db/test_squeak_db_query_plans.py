@@ -0,0 +1,174 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import event
+
+from squeaknode.db.squeak_db import SqueakDb
+from tests.utils import gen_random_hash
+
+
+POSTGRES_CONNECTION_STRING = os.environ.get(
+    "SQUEAKNODE_TEST_POSTGRES_CONNECTION_STRING")
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def db_engine(request):
+    if request.param == "postgresql":
+        if not POSTGRES_CONNECTION_STRING:
+            pytest.skip("No postgres connection string configured.")
+        yield create_engine(POSTGRES_CONNECTION_STRING)
+    else:
+        yield create_engine('sqlite://')
+
+
+@pytest.fixture
+def squeak_db(db_engine):
+    db = SqueakDb(db_engine)
+    db.init()
+    yield db
+
+
+@pytest.fixture
+def executed_statements(db_engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db_engine, "before_cursor_execute", before_cursor_execute)
+
+
+def get_query_plan(engine, statement, parameters):
+    with engine.connect() as connection:
+        cursor = connection.connection.cursor()
+        if engine.dialect.name == "postgresql":
+            # Tables in the test database are too small for the planner
+            # to choose an index scan unless sequential scans are disabled.
+            cursor.execute("SET enable_seqscan = off")
+            cursor.execute("EXPLAIN " + statement, parameters)
+        else:
+            cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+        return "\n".join(str(row[-1]) for row in cursor.fetchall())
+
+
+def get_last_query_plan(squeak_db, executed_statements):
+    statement, parameters = executed_statements[-1]
+    return get_query_plan(squeak_db.engine, statement, parameters)
+
+
+def test_timeline_query_plan(squeak_db, executed_statements):
+    squeak_db.get_timeline_squeak_entries(limit=10, last_entry=None)
+    query_plan = get_last_query_plan(squeak_db, executed_statements)
+
+    assert "ix_squeak_block_height_time_s_hash" in query_plan
+
+
+def test_liked_query_plan(squeak_db, executed_statements):
+    squeak_db.get_liked_squeak_entries(limit=10, last_entry=None)
+    query_plan = get_last_query_plan(squeak_db, executed_statements)
+
+    assert "ix_squeak_liked_time_ms_hash" in query_plan
+
+
+def test_public_key_query_plan(squeak_db, executed_statements, public_key):
+    squeak_db.get_squeak_entries_for_public_key(
+        public_key, limit=10, last_entry=None)
+    query_plan = get_last_query_plan(squeak_db, executed_statements)
+
+    assert "ix_squeak_author_public_key_block_height_time_s_hash" in query_plan
+
+
+def test_thread_replies_query_plan(squeak_db, executed_statements):
+    squeak_db.get_thread_reply_squeak_entries(
+        gen_random_hash(), limit=10, last_entry=None)
+    query_plan = get_last_query_plan(squeak_db, executed_statements)
+
+    assert "ix_squeak_reply_hash_block_height_time_s_hash" in query_plan
+
+
+def test_lookup_by_block_range_query_plan(squeak_db, executed_statements):
+    squeak_db.lookup_squeaks(
+        public_keys=[],
+        min_block=100,
+        max_block=200,
+        reply_to_hash=None,
+    )
+    query_plan = get_last_query_plan(squeak_db, executed_statements)
+
+    assert "ix_squeak_block_height_time_s_hash" in query_plan
+
+
+def test_lookup_by_public_key_query_plan(squeak_db, executed_statements, public_key):
+    squeak_db.lookup_squeaks(
+        public_keys=[public_key],
+        min_block=100,
+        max_block=200,
+        reply_to_hash=None,
+    )
+    query_plan = get_last_query_plan(squeak_db, executed_statements)
+
+    assert "ix_squeak_author_public_key_block_height_time_s_hash" in query_plan
+
+
+def test_number_of_squeaks_with_public_key_query_plan(squeak_db, executed_statements, public_key):
+    squeak_db.number_of_squeaks_with_public_key_with_block_height(
+        public_key, 100)
+    query_plan = get_last_query_plan(squeak_db, executed_statements)
+
+    assert "ix_squeak_author_public_key_block_height_time_s_hash" in query_plan
+
+
+def test_update_squeak_counts_query_plan(squeak_db, executed_statements):
+    with squeak_db.get_connection() as connection:
+        squeak_db._update_squeak_counts(connection, [gen_random_hash()])
+    query_plan = get_last_query_plan(squeak_db, executed_statements)
+
+    assert "ix_squeak_reply_hash_block_height_time_s_hash" in query_plan
+    assert "ix_squeak_resqueak_hash" in query_plan
+
+
+def test_thread_ancestors_query_plan(squeak_db, executed_statements):
+    squeak_db.get_thread_ancestor_squeak_entries(gen_random_hash())
+    query_plan = get_last_query_plan(squeak_db, executed_statements)
+
+    assert "ix_squeak_thread_closure_descendant_hash_depth" in query_plan
+
+
+def test_thread_descendants_query_plan(squeak_db, executed_statements):
+    squeak_db.get_thread_descendant_squeak_entries(
+        gen_random_hash(), limit=10, last_entry=None)
+    query_plan = get_last_query_plan(squeak_db, executed_statements)
+
+    assert "pk_squeak_thread_closure" in query_plan or \
+        "sqlite_autoindex_squeak_thread_closure_1" in query_plan
+
+
+def test_delete_old_squeaks_query_plan(squeak_db, executed_statements):
+    squeak_db.delete_old_squeaks(interval_s=10, limit=100)
+    query_plan = get_last_query_plan(squeak_db, executed_statements)
+
+    assert "ix_squeak_liked_time_ms_created_time_ms" in query_plan
@@ -0,0 +1,125 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+from sqlalchemy import create_engine
+
+from squeaknode.bitcoin.bitcoin_client import BitcoinClient
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.db.squeak_db import SqueakDb
+from squeaknode.node.block_header_store import BlockHeaderStore
+from tests.utils import gen_random_hash
+
+
+class MockBitcoinClient(BitcoinClient):
+
+    def __init__(self, block_header, num_blocks):
+        self.block_header = block_header
+        self.block_hashes = [gen_random_hash() for _ in range(num_blocks)]
+        self.num_requests = 0
+
+    def get_best_block_info(self) -> BlockInfo:
+        return self.get_block_info_by_height(len(self.block_hashes) - 1)
+
+    def get_block_info_by_height(self, block_height: int) -> BlockInfo:
+        self.num_requests += 1
+        return BlockInfo(
+            block_height=block_height,
+            block_hash=self.block_hashes[block_height],
+            block_header=self.block_header,
+        )
+
+    def reorg(self, fork_height, num_blocks):
+        self.block_hashes = self.block_hashes[:fork_height] + [
+            gen_random_hash() for _ in range(num_blocks)
+        ]
+
+
+@pytest.fixture
+def squeak_db():
+    db = SqueakDb(create_engine('sqlite://'))
+    db.init()
+    yield db
+
+
+@pytest.fixture
+def bitcoin_client(block_header):
+    yield MockBitcoinClient(block_header, 100)
+
+
+@pytest.fixture
+def block_header_store(squeak_db, bitcoin_client):
+    yield BlockHeaderStore(squeak_db, bitcoin_client, 20, 7)
+
+
+def test_sync(block_header_store, squeak_db, bitcoin_client):
+    block_header_store.sync()
+
+    assert squeak_db.get_block_heights(0, 1000) == list(range(79, 100))
+
+
+def test_get_block_info_by_height_synced(block_header_store, bitcoin_client):
+    block_header_store.sync()
+    bitcoin_client.num_requests = 0
+    block_info = block_header_store.get_block_info_by_height(90)
+
+    assert block_info.block_hash == bitcoin_client.block_hashes[90]
+    assert bitcoin_client.num_requests == 0
+
+
+def test_get_block_info_by_height_not_synced(block_header_store, squeak_db, bitcoin_client):
+    block_info = block_header_store.get_block_info_by_height(50)
+
+    assert block_info.block_hash == bitcoin_client.block_hashes[50]
+    assert bitcoin_client.num_requests == 1
+    assert squeak_db.get_block_info(50) == block_info
+
+
+def test_sync_new_blocks(block_header_store, squeak_db, bitcoin_client):
+    block_header_store.sync()
+    bitcoin_client.reorg(100, 3)
+    bitcoin_client.num_requests = 0
+    block_header_store.sync()
+
+    assert squeak_db.get_block_heights(0, 1000) == list(range(82, 103))
+    # The best block, the old tip, and the three new blocks.
+    assert bitcoin_client.num_requests == 1 + 1 + 3
+
+
+def test_sync_reorg(block_header_store, squeak_db, bitcoin_client):
+    block_header_store.sync()
+    bitcoin_client.reorg(95, 4)
+    block_header_store.sync()
+
+    assert squeak_db.get_block_heights(0, 1000) == list(range(78, 99))
+    for block_height in range(78, 99):
+        assert squeak_db.get_block_info(block_height).block_hash == \
+            bitcoin_client.block_hashes[block_height]
+
+
+def test_get_block_infos_by_heights(block_header_store, squeak_db, bitcoin_client):
+    block_header_store.get_block_info_by_height(50)
+    block_infos = block_header_store.get_block_infos_by_heights([50, 51, 52])
+
+    assert [block_info.block_hash for block_info in block_infos] == \
+        bitcoin_client.block_hashes[50:53]
+    assert bitcoin_client.num_requests == 3
+    assert squeak_db.get_block_heights(0, 1000) == [50, 51, 52]
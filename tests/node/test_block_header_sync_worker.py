@@ -0,0 +1,83 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+
+import mock
+import pytest
+
+from squeaknode.node.block_header_store import BlockHeaderStore
+from squeaknode.node.block_header_sync_worker import BlockHeaderSyncWorker
+
+
+@pytest.fixture
+def sync_started():
+    yield threading.Event()
+
+
+@pytest.fixture
+def sync_released():
+    yield threading.Event()
+
+
+@pytest.fixture
+def block_header_store(sync_started, sync_released):
+    store = mock.Mock(spec=BlockHeaderStore)
+
+    def sync():
+        sync_started.set()
+        assert sync_released.wait(timeout=5)
+
+    store.sync.side_effect = sync
+    yield store
+
+
+@pytest.fixture
+def block_header_sync_worker(block_header_store):
+    yield BlockHeaderSyncWorker(block_header_store, 0)
+
+
+def wait_for_idle(worker):
+    for thread in threading.enumerate():
+        if thread.name == "{}_triggered_thread".format(worker.get_name()):
+            thread.join(timeout=5)
+
+
+def test_handle_new_block(block_header_sync_worker, block_header_store, sync_released, block_info):
+    sync_released.set()
+    block_header_sync_worker.handle_new_block(block_info)
+    wait_for_idle(block_header_sync_worker)
+
+    assert block_header_store.sync.call_count == 1
+    assert not block_header_sync_worker.trigger_running
+
+
+def test_handle_new_blocks_coalesced(block_header_sync_worker, block_header_store, sync_started, sync_released, block_info):
+    block_header_sync_worker.handle_new_block(block_info)
+    assert sync_started.wait(timeout=5)
+    for _ in range(10):
+        block_header_sync_worker.handle_new_block(block_info)
+    sync_released.set()
+    wait_for_idle(block_header_sync_worker)
+
+    assert block_header_store.sync.call_count == 2
+    assert not block_header_sync_worker.trigger_running
+    assert not block_header_sync_worker.trigger_pending
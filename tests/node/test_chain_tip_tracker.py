@@ -0,0 +1,87 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.bitcoin.bitcoin_client import BitcoinClient
+from squeaknode.node.chain_tip_tracker import ChainTipTracker
+from tests.utils import gen_random_hash
+
+
+@pytest.fixture
+def bitcoin_client(block_info):
+    bitcoin_client = mock.Mock(spec=BitcoinClient)
+    bitcoin_client.get_best_block_info.return_value = block_info
+    return bitcoin_client
+
+
+@pytest.fixture
+def chain_tip_tracker(bitcoin_client):
+    return ChainTipTracker(bitcoin_client, 10, False)
+
+
+@pytest.fixture
+def next_block_info(block_info):
+    return block_info._replace(
+        block_height=block_info.block_height + 1,
+        block_hash=gen_random_hash(),
+    )
+
+
+def test_get_best_block_info(chain_tip_tracker, bitcoin_client, block_info):
+    assert chain_tip_tracker.get_best_block_info() == block_info
+    assert chain_tip_tracker.get_best_block_info() == block_info
+    assert bitcoin_client.get_best_block_info.call_count == 1
+
+
+def test_update_new_block(chain_tip_tracker, bitcoin_client, next_block_info):
+    new_block_callback = mock.Mock()
+    chain_tip_tracker.new_block_listener.add_callback(
+        "test", new_block_callback)
+    chain_tip_tracker.update()
+    chain_tip_tracker.update()
+    bitcoin_client.get_best_block_info.return_value = next_block_info
+    chain_tip_tracker.update()
+
+    assert chain_tip_tracker.get_best_block_info() == next_block_info
+    new_block_callback.assert_called_once_with(next_block_info)
+
+
+def test_track_chain_tip(chain_tip_tracker, bitcoin_client, block_info):
+    def get_best_block_info():
+        chain_tip_tracker.stop_running()
+        return block_info
+
+    bitcoin_client.get_best_block_info.side_effect = get_best_block_info
+    chain_tip_tracker.track_chain_tip()
+
+    assert chain_tip_tracker.get_best_block_info() == block_info
+    assert bitcoin_client.get_best_block_info.call_count == 1
+
+
+def test_track_chain_tip_wait_for_new_block(bitcoin_client, block_info):
+    chain_tip_tracker = ChainTipTracker(bitcoin_client, 10, True)
+    bitcoin_client.wait_for_new_block.side_effect = \
+        lambda timeout_s: chain_tip_tracker.stop_running()
+    chain_tip_tracker.track_chain_tip()
+
+    bitcoin_client.wait_for_new_block.assert_called_once_with(10)
@@ -0,0 +1,74 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.db.squeak_db import SqueakDb
+from squeaknode.node.followed_public_keys_cache import FollowedPublicKeysCache
+
+
+@pytest.fixture
+def squeak_db(contact_profile):
+    squeak_db = mock.Mock(spec=SqueakDb)
+    squeak_db.get_following_profiles.return_value = [contact_profile]
+    return squeak_db
+
+
+@pytest.fixture
+def followed_public_keys_cache(squeak_db):
+    return FollowedPublicKeysCache(squeak_db)
+
+
+def test_is_following(followed_public_keys_cache, squeak_db, public_key, recipient_public_key):
+    assert followed_public_keys_cache.is_following(public_key)
+    assert not followed_public_keys_cache.is_following(recipient_public_key)
+    assert squeak_db.get_following_profiles.call_count == 1
+
+
+def test_invalidate(followed_public_keys_cache, squeak_db, public_key):
+    followed_public_keys_cache.is_following(public_key)
+    squeak_db.get_following_profiles.return_value = []
+    followed_public_keys_cache.invalidate()
+
+    assert not followed_public_keys_cache.is_following(public_key)
+    assert squeak_db.get_following_profiles.call_count == 2
+
+
+def test_invalidate_while_loading(followed_public_keys_cache, squeak_db, contact_profile, public_key):
+    def get_following_profiles():
+        # The profiles change while the set is loading.
+        followed_public_keys_cache.invalidate()
+        return [contact_profile]
+    squeak_db.get_following_profiles.side_effect = get_following_profiles
+    followed_public_keys_cache.is_following(public_key)
+
+    assert followed_public_keys_cache.followed_public_keys is None
+
+
+def test_get_stats(followed_public_keys_cache, public_key):
+    followed_public_keys_cache.is_following(public_key)
+    followed_public_keys_cache.is_following(public_key)
+    stats = followed_public_keys_cache.get_stats()
+
+    assert stats.num_hits == 1
+    assert stats.num_misses == 1
+    assert stats.num_entries == 1
@@ -0,0 +1,90 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+
+import mock
+import pytest
+
+from squeaknode.node.received_payments_subscription_client import ReceivedPaymentsPoller
+from squeaknode.node.squeak_store import SqueakStore
+from tests.utils import gen_received_payment
+
+
+@pytest.fixture
+def squeak_store():
+    return mock.Mock(spec=SqueakStore)
+
+
+@pytest.fixture
+def received_payments(peer_address, squeak_hash, price_msat):
+    return [
+        gen_received_payment(
+            peer_address,
+            squeak_hash,
+            price_msat,
+            i,
+        )._replace(received_payment_id=i + 1)
+        for i in range(5)
+    ]
+
+
+@pytest.fixture
+def received_payments_poller(squeak_store):
+    return ReceivedPaymentsPoller(squeak_store, update_interval_s=0.01)
+
+
+def test_subscribe(received_payments_poller, squeak_store, received_payments):
+    stopped = threading.Event()
+    squeak_store.get_latest_received_payment_index.return_value = 2
+    squeak_store.yield_received_payments_from_index.side_effect = lambda index: iter([
+        payment for payment in received_payments
+        if payment.received_payment_id > index
+    ])
+
+    payments = received_payments_poller.subscribe(1, stopped)
+    received_payment_ids = [
+        next(payments).received_payment_id for _ in range(4)
+    ]
+    stopped.set()
+
+    assert received_payment_ids == [2, 3, 4, 5]
+    assert list(payments) == []
+    assert received_payments_poller.num_subscribers == 0
+
+
+def test_subscribe_shares_poller(received_payments_poller, squeak_store):
+    squeak_store.get_latest_received_payment_index.return_value = 0
+    squeak_store.yield_received_payments_from_index.return_value = iter([])
+
+    received_payments_poller.add_subscriber()
+    received_payments_poller.add_subscriber()
+    poller_stopped = received_payments_poller.stopped
+    received_payments_poller.remove_subscriber()
+
+    assert received_payments_poller.stopped is poller_stopped
+    assert not poller_stopped.is_set()
+
+    received_payments_poller.remove_subscriber()
+
+    assert poller_stopped.is_set()
+    assert received_payments_poller.stopped is None
+    squeak_store.get_latest_received_payment_index.assert_called_once_with()
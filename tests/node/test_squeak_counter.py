@@ -0,0 +1,155 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.db.squeak_db import SqueakDb
+from squeaknode.node.squeak_counter import SqueakCounter
+
+
+@pytest.fixture
+def squeak_db():
+    return mock.Mock(spec=SqueakDb)
+
+
+@pytest.fixture
+def block_window():
+    return 10
+
+
+@pytest.fixture
+def squeak_counter(squeak_db, block_window):
+    return SqueakCounter(squeak_db, block_window)
+
+
+def test_get_number_of_squeaks(squeak_counter, squeak_db):
+    squeak_db.get_number_of_squeaks.return_value = 7
+
+    assert squeak_counter.get_number_of_squeaks() == 7
+    assert squeak_counter.get_number_of_squeaks() == 7
+    assert squeak_db.get_number_of_squeaks.call_count == 1
+
+
+def test_add_and_remove_squeak(squeak_counter, squeak_db, public_key):
+    squeak_db.get_number_of_squeaks.return_value = 7
+    squeak_db.get_number_of_squeaks_by_public_key_and_block_height.return_value = {
+        (public_key, 100): 3,
+    }
+    squeak_counter.load()
+
+    assert squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+        public_key, 100) == 3
+    squeak_counter.add_squeak(public_key, 100)
+    squeak_counter.add_squeak(public_key, 100)
+    squeak_counter.remove_squeak(public_key, 100)
+
+    assert squeak_counter.get_number_of_squeaks() == 8
+    assert squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+        public_key, 100) == 4
+    squeak_db.get_number_of_squeaks_by_public_key_and_block_height.assert_called_once_with(
+        None, 100, 100)
+
+
+def test_block_height_below_window(squeak_counter, squeak_db, public_key, block_window):
+    squeak_db.get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
+    squeak_db.number_of_squeaks_with_public_key_with_block_height.return_value = 5
+    squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+        public_key, 100)
+
+    old_block_height = 100 - block_window
+    squeak_counter.add_squeak(public_key, old_block_height)
+
+    assert squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+        public_key, old_block_height) == 5
+    squeak_db.number_of_squeaks_with_public_key_with_block_height.assert_called_once_with(
+        public_key, old_block_height)
+
+
+def test_block_counts_slide(squeak_counter, squeak_db, public_key, block_window):
+    squeak_db.get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
+    squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+        public_key, 100)
+    squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+        public_key, 100 + block_window)
+
+    assert list(squeak_counter.block_counts) == [100 + block_window]
+
+
+def test_reconcile(squeak_counter, squeak_db, public_key):
+    squeak_db.get_number_of_squeaks.return_value = 7
+    squeak_db.get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
+    squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+        public_key, 100)
+    squeak_counter.add_squeak(public_key, 100)
+
+    squeak_db.get_number_of_squeaks.return_value = 9
+    squeak_db.get_number_of_squeaks_by_public_key_and_block_height.return_value = {
+        (public_key, 100): 2,
+    }
+    squeak_counter.reconcile()
+
+    assert squeak_counter.get_number_of_squeaks() == 9
+    assert squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+        public_key, 100) == 2
+
+
+def test_reconcile_during_write(squeak_counter, squeak_db, public_key):
+    squeak_db.get_number_of_squeaks.return_value = 7
+    squeak_counter.load()
+
+    with squeak_counter.pending_write():
+        # The squeak is inserted, but not yet added to the counter.
+        squeak_db.get_number_of_squeaks.return_value = 8
+        squeak_counter.reconcile()
+        squeak_counter.add_squeak(public_key, 100)
+
+    assert squeak_counter.get_number_of_squeaks() == 8
+
+
+def test_reconcile_after_write(squeak_counter, squeak_db, public_key):
+    squeak_db.get_number_of_squeaks.return_value = 7
+    squeak_counter.load()
+
+    def get_number_of_squeaks():
+        # Another squeak is saved while the count is read.
+        with squeak_counter.pending_write():
+            squeak_counter.add_squeak(public_key, 100)
+        return 8
+    squeak_db.get_number_of_squeaks.side_effect = get_number_of_squeaks
+    squeak_counter.reconcile()
+
+    assert squeak_counter.get_number_of_squeaks() == 8
+
+
+def test_block_counts_not_cached_during_write(squeak_counter, squeak_db, public_key):
+    with squeak_counter.pending_write():
+        # The squeak is inserted, but not yet added to the counter.
+        squeak_db.get_number_of_squeaks_by_public_key_and_block_height.return_value = {
+            (public_key, 100): 1,
+        }
+        assert squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+            public_key, 100) == 1
+        squeak_counter.add_squeak(public_key, 100)
+
+    assert squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+        public_key, 100) == 1
+    assert squeak_db.get_number_of_squeaks_by_public_key_and_block_height.call_count == 2
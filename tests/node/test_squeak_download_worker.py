@@ -0,0 +1,91 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+
+import mock
+import pytest
+
+from squeaknode.client.network_controller import NetworkController
+from squeaknode.node.squeak_download_worker import SqueakDownloadWorker
+from squeaknode.node.squeak_store import SqueakStore
+
+
+@pytest.fixture
+def download_started():
+    yield threading.Event()
+
+
+@pytest.fixture
+def download_released():
+    yield threading.Event()
+
+
+@pytest.fixture
+def network_controller(download_started, download_released):
+    network_controller = mock.Mock(spec=NetworkController)
+
+    def download_timeline(interest_block_interval):
+        download_started.set()
+        assert download_released.wait(timeout=5)
+
+    network_controller.download_timeline.side_effect = download_timeline
+    yield network_controller
+
+
+@pytest.fixture
+def squeak_download_worker(network_controller):
+    yield SqueakDownloadWorker(
+        mock.Mock(spec=SqueakStore),
+        network_controller,
+        0,
+        10,
+    )
+
+
+def wait_for_idle(worker):
+    for thread in threading.enumerate():
+        if thread.name == "{}_triggered_thread".format(worker.get_name()):
+            thread.join(timeout=5)
+
+
+def test_handle_new_blocks_coalesced(squeak_download_worker, network_controller, download_started, download_released, block_info):
+    squeak_download_worker.handle_new_block(block_info)
+    assert download_started.wait(timeout=5)
+    for _ in range(10):
+        squeak_download_worker.handle_new_block(block_info)
+    download_released.set()
+    wait_for_idle(squeak_download_worker)
+
+    assert network_controller.download_timeline.call_count == 2
+    assert not squeak_download_worker.trigger_running
+    assert not squeak_download_worker.trigger_pending
+
+
+def test_handle_new_block_after_failure(squeak_download_worker, network_controller, block_info):
+    network_controller.download_timeline.side_effect = Exception("failed")
+    squeak_download_worker.handle_new_block(block_info)
+    wait_for_idle(squeak_download_worker)
+    squeak_download_worker.handle_new_block(block_info)
+    wait_for_idle(squeak_download_worker)
+
+    assert network_controller.download_timeline.call_count == 2
+    assert not squeak_download_worker.trigger_running
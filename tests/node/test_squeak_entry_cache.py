@@ -0,0 +1,126 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from squeaknode.node.squeak_entry_cache import get_squeak_entry_size
+from squeaknode.node.squeak_entry_cache import SqueakEntryCache
+
+
+@pytest.fixture
+def squeak_entry_cache():
+    return SqueakEntryCache(max_entries=2, max_bytes=1000000)
+
+
+def make_entry(squeak_entry, i, resqueaked_entry=None):
+    return squeak_entry._replace(
+        squeak_hash=bytes([i]) * 32,
+        resqueaked_hash=(
+            resqueaked_entry.squeak_hash if resqueaked_entry else None
+        ),
+        resqueaked_squeak=resqueaked_entry,
+    )
+
+
+def test_get_miss(squeak_entry_cache, squeak_entry_locked):
+    assert squeak_entry_cache.get(squeak_entry_locked.squeak_hash) is None
+    assert squeak_entry_cache.get_stats().num_misses == 1
+
+
+def test_put_and_get(squeak_entry_cache, squeak_entry_locked):
+    version = squeak_entry_cache.get_version()
+    squeak_entry_cache.put(squeak_entry_locked, version)
+
+    assert squeak_entry_cache.get(
+        squeak_entry_locked.squeak_hash) == squeak_entry_locked
+    stats = squeak_entry_cache.get_stats()
+    assert stats.num_hits == 1
+    assert stats.num_entries == 1
+    assert stats.num_bytes == get_squeak_entry_size(squeak_entry_locked)
+    assert stats.hit_rate == 1.0
+
+
+def test_evict_least_recently_used(squeak_entry_cache, squeak_entry_locked):
+    entries = [make_entry(squeak_entry_locked, i) for i in range(3)]
+    squeak_entry_cache.put(entries[0], 0)
+    squeak_entry_cache.put(entries[1], 0)
+    squeak_entry_cache.get(entries[0].squeak_hash)
+    squeak_entry_cache.put(entries[2], 0)
+
+    assert squeak_entry_cache.get(entries[0].squeak_hash) is not None
+    assert squeak_entry_cache.get(entries[1].squeak_hash) is None
+    assert squeak_entry_cache.get(entries[2].squeak_hash) is not None
+    assert squeak_entry_cache.get_stats().num_evictions == 1
+
+
+def test_evict_over_max_bytes(squeak_entry_locked):
+    size = get_squeak_entry_size(squeak_entry_locked)
+    squeak_entry_cache = SqueakEntryCache(
+        max_entries=10, max_bytes=size * 2)
+    entries = [make_entry(squeak_entry_locked, i) for i in range(3)]
+    for entry in entries:
+        squeak_entry_cache.put(entry, 0)
+
+    stats = squeak_entry_cache.get_stats()
+    assert stats.num_entries == 2
+    assert stats.num_bytes == size * 2
+
+
+def test_invalidate(squeak_entry_cache, squeak_entry_locked):
+    squeak_entry_cache.put(squeak_entry_locked, 0)
+    squeak_entry_cache.invalidate(squeak_entry_locked.squeak_hash)
+
+    assert squeak_entry_cache.get(squeak_entry_locked.squeak_hash) is None
+    assert squeak_entry_cache.get_stats().num_bytes == 0
+
+
+def test_invalidate_resqueaked_squeak(squeak_entry_cache, squeak_entry_locked):
+    resqueaked_entry = make_entry(squeak_entry_locked, 1)
+    resqueak_entry = make_entry(squeak_entry_locked, 2, resqueaked_entry)
+    squeak_entry_cache.put(resqueaked_entry, 0)
+    squeak_entry_cache.put(resqueak_entry, 0)
+    squeak_entry_cache.invalidate(resqueaked_entry.squeak_hash)
+
+    assert squeak_entry_cache.get(resqueak_entry.squeak_hash) is None
+    assert squeak_entry_cache.get_stats().num_entries == 0
+
+
+def test_put_after_invalidate_is_ignored(squeak_entry_cache, squeak_entry_locked):
+    version = squeak_entry_cache.get_version()
+    squeak_entry_cache.invalidate(squeak_entry_locked.squeak_hash)
+    squeak_entry_cache.put(squeak_entry_locked, version)
+
+    assert squeak_entry_cache.get(squeak_entry_locked.squeak_hash) is None
+
+
+def test_clear(squeak_entry_cache, squeak_entry_locked):
+    squeak_entry_cache.put(squeak_entry_locked, 0)
+    squeak_entry_cache.clear()
+
+    assert squeak_entry_cache.get(squeak_entry_locked.squeak_hash) is None
+    assert squeak_entry_cache.get_stats().num_entries == 0
+
+
+def test_disabled(squeak_entry_locked):
+    squeak_entry_cache = SqueakEntryCache(max_entries=0, max_bytes=1000000)
+    squeak_entry_cache.put(squeak_entry_locked, 0)
+
+    assert squeak_entry_cache.get(squeak_entry_locked.squeak_hash) is None
@@ -22,10 +22,16 @@
 import mock
 import pytest
 
+from squeaknode.bitcoin.block_info import BlockInfo
 from squeaknode.core.lightning_address import LightningAddressHostPort
+from squeaknode.core.profiles import get_profile_image_hash
+from squeaknode.core.rejected_squeak import RejectedSqueak
 from squeaknode.core.squeak_core import SqueakCore
+from squeaknode.core.squeaks import get_hash
 from squeaknode.db.squeak_db import SqueakDb
+from squeaknode.node.squeak_store import REJECT_REASON_INVALID_BLOCK_HASH
 from squeaknode.node.squeak_store import SqueakStore
+from tests.utils import gen_random_hash
 
 
 @pytest.fixture
@@ -73,6 +79,41 @@ def sent_offer_retention_s():
     return 7200
 
 
+@pytest.fixture
+def squeak_counter_block_window():
+    return 100
+
+
+@pytest.fixture
+def squeak_deletion_batch_size():
+    return 2
+
+
+@pytest.fixture
+def squeak_deletion_max_rows():
+    return 5
+
+
+@pytest.fixture
+def squeak_deletion_max_time_ms():
+    return 60000
+
+
+@pytest.fixture
+def squeak_entry_cache_size():
+    return 100
+
+
+@pytest.fixture
+def squeak_entry_cache_max_bytes():
+    return 1000000
+
+
+@pytest.fixture
+def squeak_verifier_workers():
+    return 1
+
+
 @pytest.fixture
 def inserted_signing_profile_id(squeak_db, signing_profile):
     yield squeak_db.insert_profile(signing_profile)
@@ -87,6 +128,13 @@ def squeak_store(
     squeak_retention_s,
     received_offer_retention_s,
     sent_offer_retention_s,
+    squeak_counter_block_window,
+    squeak_deletion_batch_size,
+    squeak_deletion_max_rows,
+    squeak_deletion_max_time_ms,
+    squeak_entry_cache_size,
+    squeak_entry_cache_max_bytes,
+    squeak_verifier_workers,
 ):
     return SqueakStore(
         squeak_db,
@@ -96,17 +144,24 @@ def squeak_store(
         squeak_retention_s,
         received_offer_retention_s,
         sent_offer_retention_s,
+        squeak_counter_block_window,
+        squeak_deletion_batch_size,
+        squeak_deletion_max_rows,
+        squeak_deletion_max_time_ms,
+        squeak_entry_cache_size,
+        squeak_entry_cache_max_bytes,
+        squeak_verifier_workers,
     )
 
 
 def test_save_squeak(squeak_store, squeak_db, squeak_core, block_header, squeak, squeak_hash):
     with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
-            mock.patch.object(squeak_db, 'number_of_squeaks_with_public_key_with_block_height', autospec=True) as mock_number_of_squeaks_with_public_key_with_block_height, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
             mock.patch.object(squeak_db, 'insert_squeak', autospec=True) as mock_insert_squeak, \
             mock.patch.object(squeak_store.new_squeak_listener, 'handle_new_item', autospec=True) as mock_handle_new_squeak, \
             mock.patch.object(squeak_core, 'get_block_header', autospec=True) as mock_get_block_header:
         mock_get_number_of_squeaks.return_value = 0
-        mock_number_of_squeaks_with_public_key_with_block_height.return_value = 0
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
         mock_get_block_header.return_value = block_header
         mock_insert_squeak.return_value = squeak_hash
         squeak_store.save_squeak(squeak)
@@ -117,12 +172,12 @@ def test_save_squeak(squeak_store, squeak_db, squeak_core, block_header, squeak,
 
 def test_save_squeak_above_max(squeak_store, squeak_db, squeak_core, block_header, squeak, squeak_hash, max_squeaks):
     with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
-            mock.patch.object(squeak_db, 'number_of_squeaks_with_public_key_with_block_height', autospec=True) as mock_number_of_squeaks_with_public_key_with_block_height, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
             mock.patch.object(squeak_db, 'insert_squeak', autospec=True) as mock_insert_squeak, \
             mock.patch.object(squeak_store.new_squeak_listener, 'handle_new_item', autospec=True) as mock_handle_new_squeak, \
             mock.patch.object(squeak_core, 'get_block_header', autospec=True) as mock_get_block_header:
         mock_get_number_of_squeaks.return_value = max_squeaks + 1
-        mock_number_of_squeaks_with_public_key_with_block_height.return_value = 0
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
         mock_get_block_header.return_value = block_header
         mock_insert_squeak.return_value = squeak_hash
 
@@ -133,14 +188,16 @@ def test_save_squeak_above_max(squeak_store, squeak_db, squeak_core, block_heade
         assert mock_handle_new_squeak.call_count == 0
 
 
-def test_save_squeak_above_max_per_pubkey(squeak_store, squeak_db, squeak_core, block_header, squeak, squeak_hash, max_squeaks_per_public_key_per_block):
+def test_save_squeak_above_max_per_pubkey(squeak_store, squeak_db, squeak_core, block_header, squeak, squeak_hash, public_key, max_squeaks_per_public_key_per_block):
     with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
-            mock.patch.object(squeak_db, 'number_of_squeaks_with_public_key_with_block_height', autospec=True) as mock_number_of_squeaks_with_public_key_with_block_height, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
             mock.patch.object(squeak_db, 'insert_squeak', autospec=True) as mock_insert_squeak, \
             mock.patch.object(squeak_store.new_squeak_listener, 'handle_new_item', autospec=True) as mock_handle_new_squeak, \
             mock.patch.object(squeak_core, 'get_block_header', autospec=True) as mock_get_block_header:
         mock_get_number_of_squeaks.return_value = 0
-        mock_number_of_squeaks_with_public_key_with_block_height.return_value = max_squeaks_per_public_key_per_block + 1
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {
+            (public_key, squeak.nBlockHeight): max_squeaks_per_public_key_per_block,
+        }
         mock_get_block_header.return_value = block_header
         mock_insert_squeak.return_value = squeak_hash
 
@@ -151,6 +208,168 @@ def test_save_squeak_above_max_per_pubkey(squeak_store, squeak_db, squeak_core,
         assert mock_handle_new_squeak.call_count == 0
 
 
+def test_save_squeak_updates_counter(squeak_store, squeak_db, squeak_core, block_header, squeak, squeak_hash, public_key):
+    with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
+            mock.patch.object(squeak_db, 'insert_squeak', autospec=True) as mock_insert_squeak, \
+            mock.patch.object(squeak_core, 'get_block_header', autospec=True) as mock_get_block_header:
+        mock_get_number_of_squeaks.return_value = 0
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
+        mock_get_block_header.return_value = block_header
+        mock_insert_squeak.return_value = squeak_hash
+        squeak_store.save_squeak(squeak)
+        squeak_store.save_squeak(squeak)
+
+        assert mock_get_number_of_squeaks.call_count == 1
+        assert mock_get_number_of_squeaks_by_public_key_and_block_height.call_count == 1
+        assert squeak_store.squeak_counter.get_number_of_squeaks() == 2
+        assert squeak_store.squeak_counter.get_number_of_squeaks_with_public_key_with_block_height(
+            public_key,
+            squeak.nBlockHeight,
+        ) == 2
+
+
+def test_delete_squeak_updates_counter(squeak_store, squeak_db, squeak, squeak_hash, public_key):
+    with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
+            mock.patch.object(squeak_db, 'delete_squeak', autospec=True) as mock_delete_squeak:
+        mock_get_number_of_squeaks.return_value = 5
+        mock_delete_squeak.return_value = (public_key, squeak.nBlockHeight)
+        squeak_store.load_squeak_counter()
+        squeak_store.delete_squeak(squeak_hash)
+
+        mock_delete_squeak.assert_called_once_with(squeak_hash)
+        assert squeak_store.squeak_counter.get_number_of_squeaks() == 4
+
+
+def test_delete_old_squeaks(squeak_store, squeak_db, squeak, public_key, squeak_retention_s):
+    deleted_squeak = (public_key, squeak.nBlockHeight)
+    with mock.patch.object(squeak_db, 'delete_old_squeaks', autospec=True) as mock_delete_old_squeaks:
+        mock_delete_old_squeaks.side_effect = [
+            [deleted_squeak, deleted_squeak],
+            [deleted_squeak],
+        ]
+        num_deleted = squeak_store.delete_old_squeaks()
+
+        assert num_deleted == 3
+        assert mock_delete_old_squeaks.call_args_list == [
+            mock.call(squeak_retention_s, 2),
+            mock.call(squeak_retention_s, 2),
+        ]
+        deletion_stats = squeak_store.get_squeak_deletion_stats()
+        assert deletion_stats.num_runs == 1
+        assert deletion_stats.num_deleted == 3
+        assert deletion_stats.num_batches == 2
+        assert deletion_stats.num_budget_exhausted == 0
+
+
+def test_delete_old_squeaks_max_rows(squeak_store, squeak_db, squeak, public_key, squeak_retention_s):
+    deleted_squeak = (public_key, squeak.nBlockHeight)
+    with mock.patch.object(squeak_db, 'delete_old_squeaks', autospec=True) as mock_delete_old_squeaks:
+        mock_delete_old_squeaks.side_effect = [
+            [deleted_squeak, deleted_squeak],
+            [deleted_squeak, deleted_squeak],
+            [deleted_squeak],
+        ]
+        num_deleted = squeak_store.delete_old_squeaks()
+
+        assert num_deleted == 5
+        assert mock_delete_old_squeaks.call_args_list[-1] == mock.call(
+            squeak_retention_s, 1)
+        deletion_stats = squeak_store.get_squeak_deletion_stats()
+        assert deletion_stats.num_batches == 3
+        assert deletion_stats.num_budget_exhausted == 1
+
+
+def test_delete_old_squeaks_max_time(squeak_store, squeak_db, squeak, public_key):
+    deleted_squeak = (public_key, squeak.nBlockHeight)
+    squeak_store.squeak_deletion_max_time_ms = 0
+    with mock.patch.object(squeak_db, 'delete_old_squeaks', autospec=True) as mock_delete_old_squeaks:
+        mock_delete_old_squeaks.return_value = [deleted_squeak, deleted_squeak]
+        num_deleted = squeak_store.delete_old_squeaks()
+
+        assert num_deleted == 2
+        assert mock_delete_old_squeaks.call_count == 1
+        assert squeak_store.get_squeak_deletion_stats().num_budget_exhausted == 1
+
+
+def test_delete_old_squeaks_stats_cumulative(squeak_store, squeak_db, squeak, public_key):
+    deleted_squeak = (public_key, squeak.nBlockHeight)
+    with mock.patch.object(squeak_db, 'delete_old_squeaks', autospec=True) as mock_delete_old_squeaks:
+        mock_delete_old_squeaks.side_effect = [
+            [deleted_squeak],
+            [],
+        ]
+        squeak_store.delete_old_squeaks()
+        squeak_store.delete_old_squeaks()
+
+        deletion_stats = squeak_store.get_squeak_deletion_stats()
+        assert deletion_stats.num_runs == 2
+        assert deletion_stats.num_deleted == 1
+        assert deletion_stats.num_batches == 2
+        assert deletion_stats.num_budget_exhausted == 0
+        assert deletion_stats.total_time_ms >= 0
+
+
+def test_save_squeaks(squeak_store, squeak_db, squeak_core, block_header, block_info, squeak, squeak_hash, resqueak, resqueak_hash):
+    with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
+            mock.patch.object(squeak_db, 'insert_squeaks', autospec=True) as mock_insert_squeaks, \
+            mock.patch.object(squeak_store.new_squeak_listener, 'handle_new_item', autospec=True) as mock_handle_new_squeak, \
+            mock.patch.object(squeak_core, 'get_block_infos', autospec=True) as mock_get_block_infos:
+        mock_get_number_of_squeaks.return_value = 0
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
+        mock_get_block_infos.return_value = {
+            block_info.block_height: block_info,
+        }
+        mock_insert_squeaks.return_value = [resqueak_hash]
+        inserted_hashes = squeak_store.save_squeaks([squeak, resqueak])
+
+        assert inserted_hashes == [resqueak_hash]
+        assert mock_get_block_infos.call_count == 1
+        mock_insert_squeaks.assert_called_once_with(
+            [(squeak, block_header), (resqueak, block_header)],
+        )
+        mock_handle_new_squeak.assert_called_once_with(resqueak)
+
+
+def test_save_squeaks_above_max(squeak_store, squeak_db, squeak_core, block_header, block_info, squeak, resqueak, max_squeaks):
+    with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
+            mock.patch.object(squeak_db, 'insert_squeaks', autospec=True) as mock_insert_squeaks, \
+            mock.patch.object(squeak_core, 'get_block_infos', autospec=True) as mock_get_block_infos:
+        mock_get_number_of_squeaks.return_value = max_squeaks - 1
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
+        mock_get_block_infos.return_value = {
+            block_info.block_height: block_info,
+        }
+        mock_insert_squeaks.return_value = []
+        squeak_store.save_squeaks([squeak, resqueak])
+
+        mock_insert_squeaks.assert_called_once_with(
+            [(squeak, block_header)],
+        )
+
+
+def test_save_squeaks_above_max_per_pubkey(squeak_store, squeak_db, squeak_core, block_header, block_info, squeak, resqueak, public_key, max_squeaks_per_public_key_per_block):
+    with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
+            mock.patch.object(squeak_db, 'insert_squeaks', autospec=True) as mock_insert_squeaks, \
+            mock.patch.object(squeak_core, 'get_block_infos', autospec=True) as mock_get_block_infos:
+        mock_get_number_of_squeaks.return_value = 0
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {
+            (public_key, squeak.nBlockHeight): max_squeaks_per_public_key_per_block - 1,
+        }
+        mock_get_block_infos.return_value = {
+            block_info.block_height: block_info,
+        }
+        mock_insert_squeaks.return_value = []
+        squeak_store.save_squeaks([squeak, resqueak])
+
+        mock_insert_squeaks.assert_called_once_with(
+            [(squeak, block_header)],
+        )
+
+
 def test_save_secret_key(squeak_store, squeak_db, squeak_core, squeak, squeak_hash, secret_key):
     with mock.patch.object(squeak_db, 'get_squeak', autospec=True) as mock_get_squeak, \
             mock.patch.object(squeak_db, 'set_squeak_secret_key', autospec=True) as mock_set_squeak_secret_key, \
@@ -321,3 +540,144 @@ def test_get_received_offer(squeak_store, squeak_db, received_offer):
 #     assert retrieved_received_offer == received_offer._replace(
 #         received_offer_id=received_offer_id,
 #     )
+
+
+def test_get_squeak_entry_with_profile_image(squeak_store, squeak_db, squeak_entry_locked, squeak_hash, signing_profile):
+    profile_image = bytes.fromhex("deadbeef")
+    profile_image_hash = get_profile_image_hash(profile_image)
+    squeak_entry = squeak_entry_locked._replace(
+        squeak_profile=signing_profile._replace(
+            profile_image_hash=profile_image_hash),
+    )
+    with mock.patch.object(squeak_db, 'get_squeak_entry', autospec=True) as mock_get_squeak_entry, \
+            mock.patch.object(squeak_db, 'get_profile_image', autospec=True) as mock_get_profile_image:
+        mock_get_squeak_entry.return_value = squeak_entry
+        mock_get_profile_image.return_value = profile_image
+        retrieved_squeak_entry = squeak_store.get_squeak_entry(squeak_hash)
+        squeak_store.get_squeak_entry(squeak_hash)
+
+        assert retrieved_squeak_entry.squeak_profile.profile_image == profile_image
+        assert retrieved_squeak_entry.recipient_squeak_profile.profile_image is None
+        # The image is loaded from the database only once.
+        mock_get_profile_image.assert_called_once_with(profile_image_hash)
+
+
+def test_get_squeak_entry_cached(squeak_store, squeak_db, squeak_entry_locked, squeak_hash):
+    with mock.patch.object(squeak_db, 'get_squeak_entry', autospec=True) as mock_get_squeak_entry:
+        mock_get_squeak_entry.return_value = squeak_entry_locked
+        squeak_store.get_squeak_entry(squeak_hash)
+        retrieved_squeak_entry = squeak_store.get_squeak_entry(squeak_hash)
+
+        assert retrieved_squeak_entry.squeak_hash == squeak_hash
+        mock_get_squeak_entry.assert_called_once_with(squeak_hash)
+        assert squeak_store.get_cache_stats()[0].num_hits == 1
+
+
+def test_get_squeak_entry_missing_not_cached(squeak_store, squeak_db, squeak_hash):
+    with mock.patch.object(squeak_db, 'get_squeak_entry', autospec=True) as mock_get_squeak_entry:
+        mock_get_squeak_entry.return_value = None
+        squeak_store.get_squeak_entry(squeak_hash)
+        squeak_store.get_squeak_entry(squeak_hash)
+
+        assert mock_get_squeak_entry.call_count == 2
+
+
+def test_like_squeak_invalidates_squeak_entry(squeak_store, squeak_db, squeak_entry_locked, squeak_hash):
+    with mock.patch.object(squeak_db, 'get_squeak_entry', autospec=True) as mock_get_squeak_entry:
+        mock_get_squeak_entry.return_value = squeak_entry_locked
+        squeak_store.get_squeak_entry(squeak_hash)
+        squeak_store.like_squeak(squeak_hash)
+        squeak_store.get_squeak_entry(squeak_hash)
+
+        assert mock_get_squeak_entry.call_count == 2
+
+
+def test_save_reply_invalidates_parent_squeak_entry(squeak_store, squeak_db, squeak_core, block_header, squeak_entry_locked, reply_squeak, reply_squeak_hash):
+    parent_hash = reply_squeak.hashReplySqk
+    with mock.patch.object(squeak_db, 'get_squeak_entry', autospec=True) as mock_get_squeak_entry, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
+            mock.patch.object(squeak_db, 'insert_squeak', autospec=True) as mock_insert_squeak:
+        mock_get_squeak_entry.return_value = squeak_entry_locked._replace(
+            squeak_hash=parent_hash)
+        mock_get_number_of_squeaks.return_value = 0
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
+        mock_insert_squeak.return_value = reply_squeak_hash
+        squeak_core.get_block_header.return_value = block_header
+        squeak_store.get_squeak_entry(parent_hash)
+        squeak_store.save_squeak(reply_squeak)
+        squeak_store.get_squeak_entry(parent_hash)
+
+        assert mock_get_squeak_entry.call_count == 2
+
+
+def test_follow_invalidates_followed_public_keys(squeak_store, squeak_db, contact_profile, public_key):
+    with mock.patch.object(squeak_db, 'get_following_profiles', autospec=True) as mock_get_following_profiles:
+        mock_get_following_profiles.return_value = []
+        assert not squeak_store.is_following(public_key)
+        mock_get_following_profiles.return_value = [contact_profile]
+        squeak_store.set_squeak_profile_following(1, True)
+
+        assert squeak_store.is_following(public_key)
+        assert squeak_store.is_following(public_key)
+        assert mock_get_following_profiles.call_count == 2
+
+
+def test_get_missing_profile_image(squeak_store, squeak_db):
+    profile_image_hash = get_profile_image_hash(bytes.fromhex("deadbeef"))
+    with mock.patch.object(squeak_db, 'get_profile_image', autospec=True) as mock_get_profile_image:
+        mock_get_profile_image.return_value = None
+        squeak_store.get_profile_image(profile_image_hash)
+        profile_image = squeak_store.get_profile_image(profile_image_hash)
+
+        assert profile_image is None
+        # Missing images are not cached.
+        assert mock_get_profile_image.call_count == 2
+
+
+def test_save_squeaks_rejects_invalid_block_hash(squeak_store, squeak_db, squeak_core, block_info, squeak, resqueak, resqueak_hash):
+    rejected_squeak_callback = mock.Mock()
+    squeak_store.rejected_squeak_listener.add_callback(
+        "test", rejected_squeak_callback)
+    with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
+            mock.patch.object(squeak_db, 'insert_squeaks', autospec=True) as mock_insert_squeaks, \
+            mock.patch.object(squeak_core, 'get_block_infos', autospec=True) as mock_get_block_infos:
+        mock_get_number_of_squeaks.return_value = 0
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
+        mock_get_block_infos.return_value = {
+            block_info.block_height: BlockInfo(
+                block_height=block_info.block_height,
+                block_hash=gen_random_hash(),
+                block_header=block_info.block_header,
+            ),
+        }
+        squeak_store.save_squeaks([squeak, resqueak])
+
+        assert mock_insert_squeaks.call_count == 0
+        assert rejected_squeak_callback.call_args_list == [
+            mock.call(RejectedSqueak(
+                squeak_hash=get_hash(squeak),
+                reason=REJECT_REASON_INVALID_BLOCK_HASH,
+            )),
+            mock.call(RejectedSqueak(
+                squeak_hash=resqueak_hash,
+                reason=REJECT_REASON_INVALID_BLOCK_HASH,
+            )),
+        ]
+
+
+def test_save_squeaks_above_best_block(squeak_store, squeak_db, squeak_core, squeak, resqueak):
+    rejected_squeak_callback = mock.Mock()
+    squeak_store.rejected_squeak_listener.add_callback(
+        "test", rejected_squeak_callback)
+    with mock.patch.object(squeak_db, 'insert_squeaks', autospec=True) as mock_insert_squeaks, \
+            mock.patch.object(squeak_core, 'get_block_infos', autospec=True) as mock_get_block_infos:
+        mock_get_block_infos.return_value = {}
+        inserted_hashes = squeak_store.save_squeaks([squeak, resqueak])
+
+        assert inserted_hashes == []
+        assert mock_insert_squeaks.call_count == 0
+        # Squeaks above the best block are not rejected, so they are not
+        # skipped when they are downloaded again.
+        assert rejected_squeak_callback.call_count == 0
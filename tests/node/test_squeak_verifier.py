@@ -0,0 +1,76 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.core.squeaks import get_hash
+from squeaknode.node.squeak_verifier import check_serialized_squeaks
+from squeaknode.node.squeak_verifier import SqueakVerifier
+
+
+@pytest.fixture
+def invalid_squeak_bytes(squeak, reply_squeak):
+    # A squeak with the signature of another squeak.
+    squeak_bytes = squeak.serialize()
+    signature_length = len(squeak.sig)
+    return squeak_bytes[:-signature_length] + reply_squeak.sig
+
+
+def test_check_serialized_squeaks(squeak, resqueak, invalid_squeak_bytes):
+    assert check_serialized_squeaks([
+        squeak.serialize(),
+        resqueak.serialize(),
+        invalid_squeak_bytes,
+        b'',
+    ]) == [True, True, False, False]
+
+
+def test_verify_squeaks(squeak, resqueak, reply_squeak):
+    squeak_verifier = SqueakVerifier(1)
+
+    assert squeak_verifier.verify_squeaks([squeak, resqueak, reply_squeak]) == \
+        [squeak, resqueak, reply_squeak]
+
+
+def test_verify_serialized_squeaks_worker_processes(squeak, resqueak, invalid_squeak_bytes):
+    squeak_verifier = SqueakVerifier(2)
+    try:
+        verified_squeaks = squeak_verifier.verify_serialized_squeaks([
+            squeak.serialize(),
+            invalid_squeak_bytes,
+            resqueak.serialize(),
+        ])
+    finally:
+        squeak_verifier.shutdown()
+
+    assert [get_hash(verified_squeak) for verified_squeak in verified_squeaks] == \
+        [get_hash(squeak), get_hash(resqueak)]
+
+
+def test_verify_squeaks_without_spawn(squeak, resqueak):
+    with mock.patch('squeaknode.node.squeak_verifier.CAN_SPAWN_WORKERS', False):
+        squeak_verifier = SqueakVerifier(2)
+
+    assert squeak_verifier.num_workers == 1
+    assert squeak_verifier.verify_squeaks([squeak, resqueak]) == \
+        [squeak, resqueak]
+    assert squeak_verifier.executor is None
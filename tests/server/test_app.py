@@ -0,0 +1,130 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.core.batch_stream import decode_items
+from squeaknode.core.batch_stream import encode_hashes
+from squeaknode.core.batch_stream import MAX_BATCH_SIZE_HEADER
+from squeaknode.node.squeak_controller import SqueakController
+from squeaknode.server.app import create_app
+from squeaknode.server.squeak_peer_server_handler import SqueakPeerServerHandler
+from tests.utils import gen_random_hash
+
+
+@pytest.fixture
+def max_batch_size():
+    yield 2
+
+
+@pytest.fixture
+def config(max_batch_size):
+    config = mock.Mock()
+    config.server.max_batch_size = max_batch_size
+    yield config
+
+
+@pytest.fixture
+def squeak_controller():
+    squeak_controller = mock.Mock(spec=SqueakController)
+    squeak_controller.get_sell_price_msat.return_value = 0
+    squeak_controller.get_squeak.return_value = None
+    squeak_controller.get_squeak_secret_key.return_value = None
+    yield squeak_controller
+
+
+@pytest.fixture
+def client(squeak_controller, config):
+    handler = SqueakPeerServerHandler(squeak_controller, None, config)
+    app = create_app(handler)
+    app.config.update(TESTING=True)
+    yield app.test_client()
+
+
+def test_get_squeaks(client, squeak_controller, squeak, squeak_hash, squeak_bytes, max_batch_size):
+    squeak_controller.get_squeak.side_effect = \
+        lambda squeak_hash_arg: squeak if squeak_hash_arg == squeak_hash else None
+    response = client.post(
+        "/squeaks",
+        data=encode_hashes([squeak_hash, gen_random_hash()]),
+    )
+
+    assert response.status_code == 200
+    assert response.headers[MAX_BATCH_SIZE_HEADER] == str(max_batch_size)
+    assert decode_items(response.data) == {squeak_hash: squeak_bytes}
+
+
+def test_get_squeaks_invalid_hashes(client, squeak_controller):
+    response = client.post("/squeaks", data=b"not a squeak hash")
+
+    assert response.status_code == 400
+    assert squeak_controller.get_squeak.call_count == 0
+
+
+def test_get_squeaks_too_many(client, squeak_controller, max_batch_size):
+    squeak_hashes = [gen_random_hash() for _ in range(max_batch_size + 1)]
+    response = client.post("/squeaks", data=encode_hashes(squeak_hashes))
+
+    assert response.status_code == 413
+    assert response.headers[MAX_BATCH_SIZE_HEADER] == str(max_batch_size)
+    assert squeak_controller.get_squeak.call_count == 0
+
+
+def test_get_secret_keys(client, squeak_controller, squeak_hash, secret_key):
+    squeak_controller.get_squeak_secret_key.side_effect = \
+        lambda squeak_hash_arg: secret_key if squeak_hash_arg == squeak_hash else None
+    response = client.post(
+        "/secretkeys",
+        data=encode_hashes([squeak_hash, gen_random_hash()]),
+    )
+
+    assert response.status_code == 200
+    assert decode_items(response.data) == {squeak_hash: secret_key}
+
+
+def test_get_secret_keys_invalid_hashes(client):
+    response = client.post("/secretkeys", data=b"not a squeak hash")
+
+    assert response.status_code == 400
+
+
+def test_get_secret_keys_too_many(client, max_batch_size):
+    squeak_hashes = [gen_random_hash() for _ in range(max_batch_size + 1)]
+    response = client.post("/secretkeys", data=encode_hashes(squeak_hashes))
+
+    assert response.status_code == 413
+
+
+def test_get_secret_keys_payment_required(client, squeak_controller, squeak_hash, price_msat):
+    squeak_controller.get_sell_price_msat.return_value = price_msat
+    response = client.post("/secretkeys", data=encode_hashes([squeak_hash]))
+
+    assert response.status_code == 402
+    assert squeak_controller.get_squeak_secret_key.call_count == 0
+
+
+def test_lookup_max_batch_size_header(client, max_batch_size):
+    response = client.get("/lookup")
+
+    assert response.status_code == 200
+    assert response.headers[MAX_BATCH_SIZE_HEADER] == str(max_batch_size)
+    assert response.get_json() == []
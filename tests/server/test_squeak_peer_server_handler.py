@@ -0,0 +1,101 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.node.squeak_controller import SqueakController
+from squeaknode.server.squeak_peer_server_handler import BatchTooLargeError
+from squeaknode.server.squeak_peer_server_handler import PaymentRequiredError
+from squeaknode.server.squeak_peer_server_handler import SqueakPeerServerHandler
+from tests.utils import gen_random_hash
+
+
+@pytest.fixture
+def max_batch_size():
+    yield 2
+
+
+@pytest.fixture
+def config(max_batch_size):
+    config = mock.Mock()
+    config.server.max_batch_size = max_batch_size
+    yield config
+
+
+@pytest.fixture
+def squeak_controller():
+    squeak_controller = mock.Mock(spec=SqueakController)
+    squeak_controller.get_sell_price_msat.return_value = 0
+    yield squeak_controller
+
+
+@pytest.fixture
+def handler(squeak_controller, config):
+    yield SqueakPeerServerHandler(squeak_controller, None, config)
+
+
+def test_handle_get_squeaks_bytes(handler, squeak_controller, squeak, squeak_hash, squeak_bytes):
+    missing_squeak_hash = gen_random_hash()
+    squeak_controller.get_squeak.side_effect = \
+        lambda squeak_hash_arg: squeak if squeak_hash_arg == squeak_hash else None
+    squeaks_bytes = handler.handle_get_squeaks_bytes(
+        [squeak_hash, missing_squeak_hash])
+
+    assert squeaks_bytes == [(squeak_hash, squeak_bytes)]
+
+
+def test_handle_get_squeaks_bytes_too_many(handler, squeak_controller, max_batch_size):
+    squeak_hashes = [gen_random_hash() for _ in range(max_batch_size + 1)]
+
+    with pytest.raises(BatchTooLargeError):
+        handler.handle_get_squeaks_bytes(squeak_hashes)
+    assert squeak_controller.get_squeak.call_count == 0
+
+
+def test_handle_get_secret_keys(handler, squeak_controller, squeak_hash, secret_key):
+    missing_squeak_hash = gen_random_hash()
+    squeak_controller.get_squeak_secret_key.side_effect = \
+        lambda squeak_hash_arg: secret_key if squeak_hash_arg == squeak_hash else None
+    secret_keys = handler.handle_get_secret_keys(
+        [squeak_hash, missing_squeak_hash])
+
+    assert secret_keys == [(squeak_hash, secret_key)]
+
+
+def test_handle_get_secret_keys_payment_required(handler, squeak_controller, squeak_hash, price_msat):
+    squeak_controller.get_sell_price_msat.return_value = price_msat
+
+    with pytest.raises(PaymentRequiredError):
+        handler.handle_get_secret_keys([squeak_hash])
+    assert squeak_controller.get_squeak_secret_key.call_count == 0
+
+
+def test_handle_get_secret_keys_too_many(handler, squeak_controller, max_batch_size):
+    squeak_hashes = [gen_random_hash() for _ in range(max_batch_size + 1)]
+
+    with pytest.raises(BatchTooLargeError):
+        handler.handle_get_secret_keys(squeak_hashes)
+    assert squeak_controller.get_squeak_secret_key.call_count == 0
+
+
+def test_get_max_batch_size(handler, max_batch_size):
+    assert handler.get_max_batch_size() == max_batch_size